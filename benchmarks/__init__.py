@@ -0,0 +1,19 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Performance regression benchmarks for pysat, run using airspeed velocity.
+
+Note
+----
+Run from the repository root with ``asv run``, or against the current
+environment with ``asv run --python=same``.  The benchmark sizes are set by
+the `PYSAT_BENCHMARK_SCALE` environment variable, see `benchmarks.common`.
+
+"""
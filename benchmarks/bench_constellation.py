@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Benchmarks for the pysat Constellation class."""
+
+import pysat
+
+from . import common
+
+
+class ConstellationToInst(object):
+    """Time combining Constellation data into a single Instrument."""
+
+    params = common.sizes('num_samples')
+    param_names = ['num_samples']
+
+    def setup(self, num_samples):
+        """Create and load a Constellation of the test Instruments."""
+        self.const = pysat.Constellation(instruments=[
+            pysat.Instrument('pysat', name, num_samples=num_samples,
+                             data_dir=common.data_dir())
+            for name in ['testing', 'ndtesting']])
+        self.const.load(date=self.const.instruments[0].inst_module._test_dates[
+            ''][''])
+        return
+
+    def teardown(self, num_samples):
+        """Clean up the benchmark environment."""
+        del self.const
+        return
+
+    def time_to_inst(self, num_samples):
+        """Time converting the Constellation to an Instrument."""
+        self.const.to_inst()
+        return
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Benchmarks for the pysat Files class."""
+
+import datetime as dt
+import os
+import pandas as pds
+
+import pysat
+from pysat.instruments.methods import testing as mm_test
+
+from . import common
+
+
+class FilesFromOS(object):
+    """Time parsing a directory of data files into a file list."""
+
+    params = common.sizes('num_files')
+    param_names = ['num_files']
+    timeout = 3600
+
+    format_str = ''.join(['bench_{year:04d}{month:02d}{day:02d}_',
+                          '{hour:02d}{minute:02d}.nc'])
+
+    def setup_cache(self):
+        """Create a directory of placeholder files for each benchmark size.
+
+        Returns
+        -------
+        data_paths : dict
+            Directory containing the files, keyed by the number of files
+
+        """
+        start = dt.datetime(2000, 1, 1)
+        data_paths = dict()
+        for num_files in self.params:
+            inst = pysat.Instrument('pysat', 'testing',
+                                    data_dir=common.data_dir(),
+                                    directory_format='from_os_{:d}'.format(
+                                        num_files))
+            data_paths[num_files] = inst.files.data_path
+
+            # Only create the files once, as this can be slow for large sets
+            os.makedirs(data_paths[num_files], exist_ok=True)
+            if len(os.listdir(data_paths[num_files])) != num_files:
+                stop = start + dt.timedelta(minutes=num_files - 1)
+                mm_test.create_archive(inst, start, stop, freq='1min',
+                                       root_fname=self.format_str,
+                                       workers=common.workers)
+
+        return data_paths
+
+    def time_from_os(self, data_paths, num_files):
+        """Time creating a file list from the local file system."""
+        pysat.Files.from_os(data_path=data_paths[num_files],
+                            format_str=self.format_str)
+        return
+
+    def time_stat_files(self, data_paths, num_files):
+        """Time getting the statistics of every file in a directory."""
+        pysat.utils.files.stat_files(os.listdir(data_paths[num_files]),
+                                     root_dir=data_paths[num_files])
+        return
+
+
+class FilesArchive(object):
+    """Time refreshing the file list of a versioned archive with empty files."""
+
+    params = ([False, True], common.sizes('num_files'))
+    param_names = ['ignore_empty_files', 'num_files']
+    timeout = 3600
+
+    format_str = ''.join(['bench_{year:04d}{month:02d}{day:02d}_',
+                          '{hour:02d}{minute:02d}_v{version:02d}.nc'])
+
+    def setup_cache(self):
+        """Create an archive with two versions of each file time.
+
+        Returns
+        -------
+        data_paths : dict
+            Directory containing the files, keyed by the number of files
+
+        Note
+        ----
+        About 5% of the file times are missing and 1% of the files are empty.
+
+        """
+        start = dt.datetime(2000, 1, 1)
+        data_paths = dict()
+        for num_files in self.params[1]:
+            inst = self.create_inst(False, num_files)
+            data_paths[num_files] = inst.files.data_path
+            if not os.path.isdir(data_paths[num_files]):
+                stop = start + dt.timedelta(minutes=10 * (num_files // 2 - 1))
+                mm_test.create_archive(inst, start, stop, freq='10min',
+                                       root_fname=self.format_str,
+                                       versions=[1, 2], missing_fraction=0.05,
+                                       empty_fraction=0.01, content='data',
+                                       seed=0, workers=common.workers)
+
+        return data_paths
+
+    def create_inst(self, ignore_empty_files, num_files):
+        """Create an Instrument for the archive.
+
+        Parameters
+        ----------
+        ignore_empty_files : bool
+            Passed to the Instrument
+        num_files : int
+            Number of files in the archive
+
+        Returns
+        -------
+        pysat.Instrument
+            Instrument for the archive
+
+        """
+        return pysat.Instrument('pysat', 'netcdf', data_dir=common.data_dir(),
+                                file_format=self.format_str,
+                                ignore_empty_files=ignore_empty_files,
+                                directory_format='archive_{:d}'.format(
+                                    num_files))
+
+    def setup(self, data_paths, ignore_empty_files, num_files):
+        """Create the Instrument for the archive."""
+        self.inst = self.create_inst(ignore_empty_files, num_files)
+        return
+
+    def teardown(self, data_paths, ignore_empty_files, num_files):
+        """Clean up the benchmark environment."""
+        del self.inst
+        return
+
+    def time_refresh(self, data_paths, ignore_empty_files, num_files):
+        """Time refreshing the file list with the latest file versions."""
+        self.inst.files.refresh()
+        return
+
+
+class FilesRefresh(object):
+    """Time refreshing and indexing the Files of an Instrument."""
+
+    params = common.sizes('num_files')
+    param_names = ['num_files']
+    timeout = 600
+
+    def setup(self, num_files):
+        """Create a test Instrument with a file every minute."""
+        self.start = dt.datetime(2009, 1, 1)
+        file_dates = pds.date_range(self.start, periods=num_files, freq='1min')
+        self.inst = pysat.Instrument('pysat', 'testing',
+                                     data_dir=common.data_dir(),
+                                     file_date_range=file_dates)
+        self.stop = file_dates[num_files // 2]
+        return
+
+    def teardown(self, num_files):
+        """Clean up the benchmark environment."""
+        del self.inst, self.start, self.stop
+        return
+
+    def time_refresh(self, num_files):
+        """Time refreshing the Instrument file list."""
+        self.inst.files.refresh()
+        return
+
+    def time_getitem_date_slice(self, num_files):
+        """Time selecting files by a datetime slice."""
+        self.inst.files[self.start:self.stop]
+        return
+
+    def time_getitem_date(self, num_files):
+        """Time selecting a file by a datetime."""
+        self.inst.files[self.stop]
+        return
+
+    def time_get_index_range(self, num_files):
+        """Time locating the file positions in a range of times."""
+        self.inst.files.get_index_range(self.start, self.stop)
+        return
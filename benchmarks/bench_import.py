@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Benchmarks for the time needed to import pysat."""
+
+
+class ImportPysat(object):
+    """Time importing pysat in a new interpreter.
+
+    Note
+    ----
+    `timeraw_` benchmarks return code that asv runs in a separate process,
+    so modules imported by earlier benchmarks are not cached.
+
+    """
+
+    def timeraw_import_pysat(self):
+        """Time the top-level pysat import."""
+        return "import pysat"
+
+    def timeraw_import_pysat_instrument(self):
+        """Time importing pysat and creating a test Instrument."""
+        return "\n".join(["import pysat",
+                          "pysat.Instrument('pysat', 'testing')"])
+
+    def timeraw_import_pysat_constellation(self):
+        """Time importing pysat and the lazily loaded Constellation."""
+        return "\n".join(["import pysat", "pysat.Constellation"])
+
+    def timeraw_import_pysat_io(self):
+        """Time importing pysat and the lazily loaded file I/O utilities."""
+        return "\n".join(["import pysat", "pysat.utils.io"])
@@ -0,0 +1,419 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Benchmarks for loading and iterating over Instrument data."""
+
+import datetime as dt
+import os
+
+import pysat
+from pysat.instruments.methods import testing as mm_test
+
+from . import common
+
+
+class InstrumentLoad(object):
+    """Time loading a day of data for the synthetic test Instruments."""
+
+    params = (['testing', 'ndtesting', 'testmodel'],
+              common.sizes('num_samples'), [None, 5])
+    param_names = ['name', 'num_samples', 'pad_minutes']
+
+    def setup(self, name, num_samples, pad_minutes):
+        """Create the test Instrument."""
+        pad = None if pad_minutes is None else {'minutes': pad_minutes}
+        self.inst = pysat.Instrument('pysat', name, num_samples=num_samples,
+                                     pad=pad, data_dir=common.data_dir())
+        self.date = self.inst.inst_module._test_dates['']['']
+        return
+
+    def teardown(self, name, num_samples, pad_minutes):
+        """Clean up the benchmark environment."""
+        del self.inst, self.date
+        return
+
+    def time_load(self, name, num_samples, pad_minutes):
+        """Time loading a day of data."""
+        self.inst.load(date=self.date)
+        return
+
+    def peakmem_load(self, name, num_samples, pad_minutes):
+        """Measure the peak memory used while loading a day of data."""
+        self.inst.load(date=self.date)
+        return
+
+
+class ModelLoad(object):
+    """Time loading a day of 4D model data on grids of increasing size."""
+
+    params = (['', 'pressure_levels'], [1, 2])
+    param_names = ['tag', 'grid_scale']
+
+    def setup(self, tag, grid_scale):
+        """Create the test model Instrument with a scaled grid."""
+        self.inst = pysat.Instrument('pysat', 'testmodel', tag=tag,
+                                     num_latitude=36 * grid_scale,
+                                     num_longitude=72 * grid_scale,
+                                     num_levels=50 * grid_scale,
+                                     data_dir=common.data_dir())
+        self.date = self.inst.inst_module._test_dates[''][tag]
+        return
+
+    def teardown(self, tag, grid_scale):
+        """Clean up the benchmark environment."""
+        del self.inst, self.date
+        return
+
+    def time_load(self, tag, grid_scale):
+        """Time loading a day of model data."""
+        self.inst.load(date=self.date)
+        return
+
+
+class InstrumentIteration(object):
+    """Time iterating over the days or files of a test Instrument."""
+
+    params = (['date', 'file'], common.sizes('num_days'))
+    param_names = ['iterate_by', 'num_days']
+
+    def setup(self, iterate_by, num_days):
+        """Create the test Instrument and set the iteration bounds."""
+        self.inst = pysat.Instrument('pysat', 'testing', num_samples=8640,
+                                     data_dir=common.data_dir())
+        start = self.inst.inst_module._test_dates['']['']
+        stop = start + dt.timedelta(days=num_days - 1)
+
+        if iterate_by == 'date':
+            self.inst.bounds = (start, stop)
+        else:
+            self.inst.bounds = (self.inst.files[start],
+                                self.inst.files[stop])
+        return
+
+    def teardown(self, iterate_by, num_days):
+        """Clean up the benchmark environment."""
+        del self.inst
+        return
+
+    def time_iterate(self, iterate_by, num_days):
+        """Time loading each day or file within the bounds."""
+        for _ in self.inst:
+            pass
+        return
+
+
+class ArchiveIteration(object):
+    """Time iterating over an archive of hourly netCDF files with padding."""
+
+    params = ([None, 5], common.sizes('num_days'))
+    param_names = ['pad_minutes', 'num_days']
+    timeout = 1200
+
+    format_str = ''.join(['bench_{year:04d}{month:02d}{day:02d}_',
+                          '{hour:02d}_v{version:02d}.nc'])
+    start = dt.datetime(2009, 1, 1)
+
+    def setup_cache(self):
+        """Create an archive with 1 s data and two versions of each file.
+
+        Returns
+        -------
+        data_path : str
+            Directory containing the files
+
+        Note
+        ----
+        A six hour gap in the files is placed on the second day.
+
+        """
+        num_days = max(self.params[1])
+        inst = pysat.Instrument('pysat', 'netcdf', data_dir=common.data_dir(),
+                                file_format=self.format_str,
+                                directory_format='archive_hourly_{:d}'.format(
+                                    num_days))
+
+        # Only create the files once, as this can be slow for large sets
+        if not os.path.isdir(inst.files.data_path):
+            gap_start = self.start + dt.timedelta(days=1, hours=9)
+            mm_test.create_archive(
+                inst, self.start,
+                self.start + dt.timedelta(days=num_days, hours=23), freq='1h',
+                root_fname=self.format_str, versions=[1, 2], num_samples=3600,
+                num_vars=10, gaps=[(gap_start,
+                                    gap_start + dt.timedelta(hours=6))],
+                workers=common.workers)
+
+        return inst.files.data_path
+
+    def setup(self, data_path, pad_minutes, num_days):
+        """Create the Instrument and set the iteration bounds."""
+        pad = None if pad_minutes is None else {'minutes': pad_minutes}
+        self.inst = pysat.Instrument(
+            'pysat', 'netcdf', data_dir=common.data_dir(),
+            file_format=self.format_str, pad=pad,
+            directory_format=os.path.basename(os.path.dirname(data_path)))
+        self.inst.bounds = (self.start,
+                            self.start + dt.timedelta(days=num_days - 1))
+        return
+
+    def teardown(self, data_path, pad_minutes, num_days):
+        """Clean up the benchmark environment."""
+        del self.inst
+        return
+
+    def time_iterate(self, data_path, pad_minutes, num_days):
+        """Time loading each day within the bounds."""
+        for _ in self.inst:
+            pass
+        return
+
+
+class OrbitIteration(object):
+    """Time iterating over the orbits of a test Instrument."""
+
+    params = (['local time', 'longitude', 'polar', 'orbit'],
+              common.sizes('num_days'))
+    param_names = ['kind', 'num_days']
+
+    orbit_index = {'local time': 'mlt', 'longitude': 'longitude',
+                   'polar': 'latitude', 'orbit': 'orbit_num'}
+
+    def setup(self, kind, num_days):
+        """Create the test Instrument and set the iteration bounds."""
+        orbit_info = {'index': self.orbit_index[kind], 'kind': kind}
+        self.inst = pysat.Instrument('pysat', 'testing', orbit_info=orbit_info,
+                                     data_dir=common.data_dir())
+        start = self.inst.inst_module._test_dates['']['']
+        self.inst.bounds = (start, start + dt.timedelta(days=num_days - 1))
+        return
+
+    def teardown(self, kind, num_days):
+        """Clean up the benchmark environment."""
+        del self.inst
+        return
+
+    def time_iterate(self, kind, num_days):
+        """Time loading each orbit within the bounds."""
+        for _ in self.inst.orbits:
+            pass
+        return
+
+
+class OrbitStepping(object):
+    """Time stepping back and forth across a day boundary by orbit."""
+
+    params = (['local time', 'polar'], [1, 10])
+    param_names = ['kind', 'num_steps']
+
+    def setup(self, kind, num_steps):
+        """Load the test Instrument at the first orbit ending on a new day."""
+        orbit_info = {'index': OrbitIteration.orbit_index[kind], 'kind': kind}
+        self.inst = pysat.Instrument('pysat', 'testing', orbit_info=orbit_info,
+                                     data_dir=common.data_dir())
+        start = self.inst.inst_module._test_dates['']['']
+        self.inst.load(date=start)
+        self.inst.orbits.next()
+        while self.inst.date == start:
+            self.inst.orbits.next()
+        return
+
+    def teardown(self, kind, num_steps):
+        """Clean up the benchmark environment."""
+        del self.inst
+        return
+
+    def time_step(self, kind, num_steps):
+        """Time moving two orbits back and forward again."""
+        for _ in range(num_steps):
+            self.inst.orbits.prev()
+            self.inst.orbits.prev()
+            self.inst.orbits.next()
+            self.inst.orbits.next()
+        return
+
+
+class InstrumentGetItem(object):
+    """Time selecting times from xarray data with secondary time indexes."""
+
+    params = (['name', 'row slice', 'date slice', 'date'], [0, 2])
+    param_names = ['key', 'num_extra_time_coords']
+
+    def setup(self, key, num_extra_time_coords):
+        """Load the test Instrument and create the selection key."""
+        self.inst = pysat.Instrument(
+            'pysat', 'ndtesting', num_samples=86400, sample_rate='1s',
+            num_extra_time_coords=num_extra_time_coords,
+            data_dir=common.data_dir())
+        self.inst.load(date=self.inst.inst_module._test_dates[''][''])
+
+        start = self.inst.index[3600]
+        stop = self.inst.index[7200]
+        self.key = {'name': 'mlt', 'row slice': slice(3600, 7200),
+                    'date slice': slice(start, stop), 'date': start}[key]
+        return
+
+    def teardown(self, key, num_extra_time_coords):
+        """Clean up the benchmark environment."""
+        del self.inst, self.key
+        return
+
+    def time_getitem(self, key, num_extra_time_coords):
+        """Time selecting data with the key."""
+        self.inst[self.key]
+        return
+
+
+def orbit_mean(inst, var):
+    """Calculate the mean of a variable over an orbit.
+
+    Parameters
+    ----------
+    inst : pysat.Instrument
+        Instrument with the orbit data loaded
+    var : str
+        Variable name
+
+    Returns
+    -------
+    float
+        Mean of the variable
+
+    """
+    return float(inst[var].mean())
+
+
+class OrbitMap(object):
+    """Time applying a function to each orbit with several processes."""
+
+    params = ([1, 4], common.sizes('num_days'))
+    param_names = ['workers', 'num_days']
+    timeout = 1200
+
+    def setup(self, workers, num_days):
+        """Create the test Instrument and set the iteration bounds."""
+        self.inst = pysat.Instrument('pysat', 'testing',
+                                     orbit_info={'index': 'mlt'},
+                                     data_dir=common.data_dir())
+        start = self.inst.inst_module._test_dates['']['']
+        self.inst.bounds = (start, start + dt.timedelta(days=num_days - 1))
+        return
+
+    def teardown(self, workers, num_days):
+        """Clean up the benchmark environment."""
+        del self.inst
+        return
+
+    def time_map(self, workers, num_days):
+        """Time calculating the mean of a variable for each orbit."""
+        self.inst.orbits.map(orbit_mean, 'mlt', workers=workers)
+        return
+
+
+class InstrumentSetItem(object):
+    """Time assigning a variable to 10 Hz multi-dimensional xarray data."""
+
+    params = ([False, True], common.sizes('num_samples'))
+    param_names = ['copy', 'num_samples']
+
+    def setup(self, copy, num_samples):
+        """Load the test Instrument and create the data to assign."""
+        self.inst = pysat.Instrument('pysat', 'ndtesting',
+                                     num_samples=num_samples,
+                                     sample_rate='100ms',
+                                     data_dir=common.data_dir())
+        self.inst.load(date=self.inst.inst_module._test_dates[''][''])
+        self.new_data = (self.inst['profiles'].dims,
+                         self.inst['profiles'].values + 1.0)
+        return
+
+    def teardown(self, copy, num_samples):
+        """Clean up the benchmark environment."""
+        del self.inst, self.new_data
+        return
+
+    def time_set_data(self, copy, num_samples):
+        """Time assigning a profile variable."""
+        self.inst.set_data('new_profiles', self.new_data, copy=copy)
+        return
+
+    def time_set_data_with_meta(self, copy, num_samples):
+        """Time assigning a profile variable with metadata."""
+        self.inst.set_data('new_profiles', {'data': self.new_data,
+                                            'units': 'm-3'}, copy=copy)
+        return
+
+    def peakmem_set_data(self, copy, num_samples):
+        """Measure the peak memory used while assigning a profile variable."""
+        self.inst.set_data('new_profiles', self.new_data, copy=copy)
+        return
+
+
+class InstrumentAssign(object):
+    """Time adding many derived variables with and without bulk assignment."""
+
+    params = (['testing', 'ndtesting'], [20, 50])
+    param_names = ['name', 'num_vars']
+
+    def setup(self, name, num_vars):
+        """Load the test Instrument and create the data to assign."""
+        self.inst = pysat.Instrument('pysat', name, num_samples=86400,
+                                     data_dir=common.data_dir())
+        self.inst.load(date=self.inst.inst_module._test_dates[''][''])
+        self.new_data = {'derived{:d}'.format(i): self.inst['mlt'].values * i
+                         for i in range(num_vars)}
+        self.new_meta = {var: {'units': 'hours', 'long_name': var}
+                         for var in self.new_data.keys()}
+        return
+
+    def teardown(self, name, num_vars):
+        """Clean up the benchmark environment."""
+        del self.inst, self.new_data, self.new_meta
+        return
+
+    def time_assign(self, name, num_vars):
+        """Time assigning all variables at once."""
+        self.inst.assign(self.new_data, meta=self.new_meta)
+        return
+
+    def time_setitem(self, name, num_vars):
+        """Time assigning each variable by name."""
+        for var in self.new_data.keys():
+            self.inst[var] = {'data': self.new_data[var],
+                              **self.new_meta[var]}
+        return
+
+
+class InstrumentCreation(object):
+    """Time creating Instruments for each tag of a test Instrument module."""
+
+    params = ['init', 'clone']
+    param_names = ['method']
+
+    def setup(self, method):
+        """Create the reference Instrument."""
+        self.inst = pysat.Instrument('pysat', 'testing',
+                                     data_dir=common.data_dir())
+        self.tags = [tag for tag in self.inst.inst_module.inst_ids['']]
+        return
+
+    def teardown(self, method):
+        """Clean up the benchmark environment."""
+        del self.inst, self.tags
+        return
+
+    def time_create_instruments(self, method):
+        """Time creating an Instrument for every tag."""
+        for tag in self.tags:
+            if method == 'clone':
+                self.inst.clone(tag=tag)
+            else:
+                pysat.Instrument('pysat', 'testing', tag=tag,
+                                 data_dir=common.data_dir())
+        return
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Benchmarks for pysat netCDF file input and output."""
+
+import os
+import shutil
+import tempfile
+
+import pysat
+
+from . import common
+
+
+class NetCDFRoundTrip(object):
+    """Time writing and reading netCDF files for the test Instruments."""
+
+    params = (['testing', 'ndtesting'], common.sizes('num_samples'))
+    param_names = ['name', 'num_samples']
+
+    def setup(self, name, num_samples):
+        """Load test data and write it to a file for the `pysat_netcdf` load."""
+        self.tempdir = tempfile.mkdtemp(dir=common.data_dir())
+        self.inst = pysat.Instrument('pysat', name, num_samples=num_samples,
+                                     data_dir=self.tempdir)
+        self.date = self.inst.inst_module._test_dates['']['']
+        self.inst.load(date=self.date)
+        self.out_fname = os.path.join(self.tempdir, 'bench_output.nc')
+
+        # Write the data in the location expected by the `pysat_netcdf`
+        # Instrument, which is used to time the full Instrument load
+        self.file_inst = pysat.Instrument(
+            'pysat', 'netcdf', data_dir=self.tempdir,
+            pandas_format=self.inst.pandas_format)
+        os.makedirs(self.file_inst.files.data_path, exist_ok=True)
+        self.fname = os.path.join(
+            self.file_inst.files.data_path,
+            self.file_inst.inst_module.format_str.format(
+                year=self.date.year, month=self.date.month,
+                day=self.date.day))
+        pysat.utils.io.inst_to_netcdf(self.inst, self.fname)
+        self.file_inst.files.refresh()
+        return
+
+    def teardown(self, name, num_samples):
+        """Clean up the benchmark environment."""
+        shutil.rmtree(self.tempdir, ignore_errors=True)
+        del self.tempdir, self.inst, self.date, self.out_fname
+        del self.file_inst, self.fname
+        return
+
+    def time_inst_to_netcdf(self, name, num_samples):
+        """Time writing Instrument data to a netCDF file."""
+        pysat.utils.io.inst_to_netcdf(self.inst, self.out_fname)
+        return
+
+    def time_load_netcdf(self, name, num_samples):
+        """Time reading a netCDF file."""
+        pysat.utils.io.load_netcdf(self.fname,
+                                   pandas_format=self.inst.pandas_format)
+        return
+
+    def time_netcdf_instrument_load(self, name, num_samples):
+        """Time loading a netCDF file through the `pysat_netcdf` Instrument."""
+        self.file_inst.load(date=self.date)
+        return
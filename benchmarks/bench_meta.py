@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Benchmarks for the pysat Meta class."""
+
+import datetime as dt
+import numpy as np
+
+import pysat
+
+from . import common
+
+
+class MetaAssignment(object):
+    """Time assigning and exporting metadata for many variables."""
+
+    params = common.sizes('num_vars')
+    param_names = ['num_vars']
+
+    def setup(self, num_vars):
+        """Create the metadata to assign."""
+        self.meta = pysat.Meta()
+        self.var_names = ['var{:d}'.format(i) for i in range(num_vars)]
+        self.bulk_meta = {self.meta.labels.units: ['m'] * num_vars,
+                          self.meta.labels.name: self.var_names,
+                          self.meta.labels.min_val: np.zeros(num_vars),
+                          self.meta.labels.max_val: np.ones(num_vars)}
+
+        self.full_meta = pysat.Meta()
+        self.full_meta[self.var_names] = self.bulk_meta
+        return
+
+    def teardown(self, num_vars):
+        """Clean up the benchmark environment."""
+        del self.meta, self.var_names, self.bulk_meta, self.full_meta
+        return
+
+    def time_bulk_assign(self, num_vars):
+        """Time assigning metadata for all variables at once."""
+        self.meta[self.var_names] = self.bulk_meta
+        return
+
+    def time_single_assign(self, num_vars):
+        """Time assigning metadata one variable at a time."""
+        for i, var in enumerate(self.var_names):
+            self.meta[var] = {label: self.bulk_meta[label][i]
+                              for label in self.bulk_meta.keys()}
+        return
+
+    def time_to_dict(self, num_vars):
+        """Time converting the metadata to a dict."""
+        self.full_meta.to_dict()
+        return
+
+
+class MetaExport(object):
+    """Time preparing the file metadata for many variables."""
+
+    params = common.sizes('num_vars')
+    param_names = ['num_vars']
+
+    def setup(self, num_vars):
+        """Create a test Instrument with many variables."""
+        self.inst = pysat.Instrument('pysat', 'testing', num_samples=10,
+                                     data_dir=common.data_dir())
+        self.inst.load(date=dt.datetime(2009, 1, 1))
+        var_names = ['var{:d}'.format(i) for i in range(num_vars)]
+        self.inst.assign(
+            {var: np.arange(len(self.inst.index), dtype=float)
+             for var in var_names},
+            meta={var: {self.inst.meta.labels.units: 'm',
+                        self.inst.meta.labels.min_val: 0.0,
+                        self.inst.meta.labels.max_val: 100.0}
+                  for var in var_names})
+        self.epoch_name = self.inst.index.name
+        return
+
+    def teardown(self, num_vars):
+        """Clean up the benchmark environment."""
+        del self.inst, self.epoch_name
+        return
+
+    def time_compile_export_meta(self, num_vars):
+        """Time creating the translated netCDF metadata for all variables."""
+        pysat.utils.io.compile_export_meta(self.inst, self.epoch_name)
+        return
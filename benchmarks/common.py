@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Settings shared by the pysat benchmarks.
+
+Attributes
+----------
+scale : str
+    Benchmark scale, set by the `PYSAT_BENCHMARK_SCALE` environment variable.
+    Accepts 'quick' (default), for fast local checks, or 'full', for
+    tracking results across releases.
+scale_sizes : dict
+    Benchmark sizes for each scale, keyed by the size name
+workers : int
+    Number of processes used to create benchmark data archives, set by the
+    `PYSAT_BENCHMARK_WORKERS` environment variable (default=4)
+
+Note
+----
+Benchmarks use the synthetic pysat test Instruments, so no downloads are
+required.  Data and file lists are written to the directory set by the
+`PYSAT_BENCHMARK_DIR` environment variable, defaulting to a 'pysat_benchmarks'
+directory in the system temporary directory.
+
+"""
+
+import os
+import tempfile
+
+scale = os.environ.get('PYSAT_BENCHMARK_SCALE', 'quick').lower()
+
+scale_sizes = {'quick': {'num_files': [1000, 10000],
+                         'num_samples': [864, 8640],
+                         'num_days': [2],
+                         'num_vars': [100, 1000]},
+               'full': {'num_files': [10000, 100000, 1000000],
+                        'num_samples': [8640, 86400, 864000],
+                        'num_days': [7, 30],
+                        'num_vars': [100, 1000, 10000]}}
+
+workers = int(os.environ.get('PYSAT_BENCHMARK_WORKERS', 4))
+
+
+def sizes(size_name):
+    """Get the benchmark sizes for the current scale.
+
+    Parameters
+    ----------
+    size_name : str
+        One of 'num_files', 'num_samples', 'num_days', or 'num_vars'
+
+    Returns
+    -------
+    list
+        Benchmark sizes, used as `params` for asv benchmarks
+
+    Raises
+    ------
+    ValueError
+        If the `PYSAT_BENCHMARK_SCALE` environment variable is unknown
+
+    """
+    if scale not in scale_sizes.keys():
+        raise ValueError(''.join(['unknown PYSAT_BENCHMARK_SCALE "', scale,
+                                  '", expected one of: ',
+                                  repr(list(scale_sizes.keys()))]))
+
+    return list(scale_sizes[scale][size_name])
+
+
+def data_dir():
+    """Get the benchmark data directory, creating it if needed.
+
+    Returns
+    -------
+    bench_dir : str
+        Directory for benchmark data files
+
+    """
+    bench_dir = os.environ.get('PYSAT_BENCHMARK_DIR',
+                               os.path.join(tempfile.gettempdir(),
+                                            'pysat_benchmarks'))
+    os.makedirs(bench_dir, exist_ok=True)
+
+    return bench_dir
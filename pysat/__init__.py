@@ -34,6 +34,7 @@ Main Features
 
 """
 
+import importlib
 from importlib import metadata
 from importlib import resources
 
@@ -112,7 +113,6 @@ else:
 from pysat import utils  # noqa: E402 F401
 
 # Import the remainder of the modules.
-from pysat._constellation import Constellation  # noqa: E402 F401
 from pysat._files import Files  # noqa: E402 F401
 from pysat._instrument import Instrument  # noqa: E402 F401
 from pysat._meta import Meta  # noqa: E402 F401
@@ -123,5 +123,24 @@ from pysat import instruments  # noqa: E402 F401
 
 __all__ = ['instruments', 'utils']
 
+# Attributes imported on first use, to reduce the time needed to import pysat
+_lazy_attrs = {'Constellation': 'pysat._constellation'}
+
+
+def __getattr__(name):
+    """Import lazily loaded pysat attributes on first access."""
+    if name in _lazy_attrs:
+        value = getattr(importlib.import_module(_lazy_attrs[name]), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError("module 'pysat' has no attribute '{:s}'".format(name))
+
+
+def __dir__():
+    """List the module attributes, including lazily loaded attributes."""
+    return sorted(set(globals()).union(_lazy_attrs))
+
+
 # Clean up
 del settings_file, resources
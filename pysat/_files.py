@@ -11,8 +11,11 @@
 import copy
 import datetime as dt
 from functools import partial
+import json
 import numpy as np
 import os
+import threading
+import time
 import weakref
 
 import pandas as pds
@@ -82,6 +85,10 @@ class Files(object):
     inst_info : dict
         Contains pysat.Instrument parameters 'platform', 'name', 'tag',
         and 'inst_id', identifying the source of the files.
+    inventory : pysat.utils.inventory.FileInventory or NoneType
+        Persistent record of the size, modification time, checksum, and time
+        coverage of each file, kept when `pysat.params['file_inventory']` is
+        True and the file list is written to disk, or None otherwise.
     list_files_creator : functools.partial or NoneType
         Experimental feature for Instruments that internally generate data
         and thus don't have a defined supported date range.
@@ -91,6 +98,9 @@ class Files(object):
     multi_file_day : bool
         Flag copied from associated pysat.Instrument object that indicates
         when data for day n may be found in files for days n-1, or n+1
+    directory_files : bool
+        Flag copied from associated pysat.Instrument object that indicates
+        when each data file is a directory, such as a Zarr store
     start_date : datetime or NoneType
         Date of first file, used as default start bound for instrument
         object, or None if no files are loaded.
@@ -172,6 +182,10 @@ class Files(object):
         self.stop_date = None
         self.files = pds.Series(None, dtype='object')
 
+        # Sorted file times as int64 nanoseconds, paired with the file list
+        # they were calculated from
+        self._file_times = (None, np.array([], dtype=np.int64))
+
         # Grab Instrument information
         self.inst_info = {'platform': inst.platform, 'name': inst.name,
                           'tag': inst.tag, 'inst_id': inst.inst_id,
@@ -179,6 +193,7 @@ class Files(object):
                           'inst': weakref.proxy(inst)}
 
         self.multi_file_day = inst.multi_file_day
+        self.directory_files = inst.directory_files
 
         # Begin with presumption that the `list_files_rtn` is a typical
         # function that returns a Series of filenames. Some generated
@@ -245,12 +260,24 @@ class Files(object):
         # Set the preference to ignore or include empty files
         self.ignore_empty_files = ignore_empty_files
 
+        # Keep a persistent file inventory, if enabled
+        self.inventory = None
+        if self.write_to_disk and pysat.params['file_inventory'] \
+                and self.inst_info['platform'] != '':
+            self.inventory = pysat.utils.inventory.FileInventory(
+                os.path.join(self.home_path, 'inventory', '_'.join((
+                    self.inst_info['platform'], self.inst_info['name'],
+                    self.inst_info['tag'], self.inst_info['inst_id'],
+                    'file_inventory.db'))))
+
         if self.inst_info['platform'] != '':
             # Only load filenames if this is associated with a real
             # `pysat.Instrument` instance, not `pysat.Instrument()`
             if self.update_files:
-                # Refresh filenames as directed by user
-                self.refresh()
+                # Refresh filenames as directed by user, reusing a file list
+                # stored by another process within the last
+                # `pysat.params['file_list_ttl']` seconds
+                self.refresh(use_cache=True)
             else:
                 # Load stored file info. Note if there is a stored `data_path`
                 # that is still in `self.data_paths` then stored value will
@@ -261,7 +288,7 @@ class Files(object):
                     # Didn't find stored information. Search local system.
                     # If list_files_rtn returns a dict to create
                     # filenames as needed that is handled in refresh.
-                    self.refresh()
+                    self.refresh(use_cache=True)
                 else:
                     # Attach the files data loaded
                     self._attach_files(file_info)
@@ -327,8 +354,11 @@ class Files(object):
             # Confirm each object has the same keys
             if key in other.__dict__.keys():
                 # Define default comparison
-                if key not in ['files', '_previous_file_list',
-                               '_current_file_list', 'inst_info']:
+                if key == '_file_times':
+                    # Cached values calculated from `files`
+                    continue
+                elif key not in ['files', '_previous_file_list',
+                                 '_current_file_list', 'inst_info']:
                     test = np.all(self.__dict__[key] == other.__dict__[key])
                     checks.append(test)
 
@@ -407,6 +437,12 @@ class Files(object):
             # Return filename generated on demand
             out = self.list_files_creator(key)
 
+        elif isinstance(key, slice) and isinstance(key.start, dt.datetime) \
+                and isinstance(key.stop, dt.datetime) \
+                and self.files.index.is_monotonic_increasing:
+            # Locate the files in the exclusive datetime range by position
+            start_idx, stop_idx = self.get_index_range(key.start, key.stop)
+            out = self.files.iloc[start_idx:stop_idx]
         elif isinstance(key, slice):
             try:
                 try:
@@ -451,17 +487,18 @@ class Files(object):
 
         """
 
-        keep_index = []
-        for i, fname in enumerate(self.files):
-            # Create full path for each file
-            full_fname = os.path.join(path, fname)
+        # Get the file statistics with one scan of each directory
+        file_info = futils.stat_files(self.files.values, root_dir=path)
+        keep = file_info['is_file'] & (file_info['size'] > 0)
+
+        # Data stored as directories is kept if the directory is not empty
+        if self.directory_files:
+            for i in np.where(file_info['exists'] & ~keep)[0]:
+                full_fname = os.path.join(path, self.files.iloc[i])
+                if os.path.isdir(full_fname) and len(os.listdir(full_fname)):
+                    keep[i] = True
 
-            # Ensure the file exists
-            if os.path.isfile(full_fname):
-                # Check for size
-                if os.path.getsize(full_fname) > 0:
-                    # Store if not empty
-                    keep_index.append(i)
+        keep_index, = np.where(keep)
 
         # Remove filenames as needed
         dropped_num = len(self.files.index) - len(keep_index)
@@ -489,7 +526,9 @@ class Files(object):
         """
 
         if not files_info.empty:
-            # Attach data
+            # Attach data, ensuring the times are sorted
+            if not files_info.index.is_monotonic_increasing:
+                files_info = files_info.sort_index(kind='mergesort')
             self.files = files_info
 
             # Ensure times are unique
@@ -577,14 +616,12 @@ class Files(object):
             if self.write_to_disk:
                 # Save the previous data in a backup file
                 prev_name = os.path.join(self.home_path, 'archive', stored_name)
-                stored_files.to_csv(prev_name,
-                                    date_format='%Y-%m-%d %H:%M:%S.%f',
-                                    header=[self.data_path])
+                self._write_file_list(stored_files, prev_name)
 
                 # Overwrite the old reference file with the new file info
-                self.files.to_csv(os.path.join(self.home_path, stored_name),
-                                  date_format='%Y-%m-%d %H:%M:%S.%f',
-                                  header=[self.data_path])
+                self._write_file_list(self.files,
+                                      os.path.join(self.home_path,
+                                                   stored_name))
             else:
                 # Update the hidden `File` attributes
                 self._previous_file_list = stored_files
@@ -592,6 +629,109 @@ class Files(object):
 
         return
 
+    def _write_file_list(self, file_list, fname):
+        """Write a file list to disk, replacing any existing file at once.
+
+        Parameters
+        ----------
+        file_list : pds.Series
+            File path names, indexed by datetime
+        fname : str
+            Output filename
+
+        Note
+        ----
+        The list is written to a temporary file that then replaces `fname`, so
+        other processes never read a partially written file list.
+
+        """
+        temp_name = '.'.join([fname, str(os.getpid()),
+                              str(threading.get_ident()), 'tmp'])
+        file_list.to_csv(temp_name, date_format='%Y-%m-%d %H:%M:%S.%f',
+                         header=[self.data_path])
+        os.replace(temp_name, fname)
+        return
+
+    def _list_settings(self):
+        """Get the settings used to search for the files.
+
+        Returns
+        -------
+        dict
+            Data path, file format, directory format, and empty file setting
+
+        """
+        return {'data_path': self.data_path, 'file_format': self.file_format,
+                'directory_format': self.directory_format,
+                'ignore_empty_files': self.ignore_empty_files}
+
+    def _write_list_settings(self):
+        """Write the search settings next to the stored file list.
+
+        Note
+        ----
+        The settings are written to a temporary file that then replaces the
+        stored settings, like the stored file list.
+
+        """
+        fname = os.path.join(self.home_path,
+                             '.'.join([self.stored_file_name, 'json']))
+        temp_name = '.'.join([fname, str(os.getpid()),
+                              str(threading.get_ident()), 'tmp'])
+        with open(temp_name, 'w') as fout:
+            json.dump(self._list_settings(), fout)
+        os.replace(temp_name, fname)
+        return
+
+    def _remove_list_settings(self):
+        """Remove the search settings stored next to the stored file list."""
+        fname = os.path.join(self.home_path,
+                             '.'.join([self.stored_file_name, 'json']))
+        try:
+            os.remove(fname)
+        except FileNotFoundError:
+            pass
+
+        return
+
+    def _stored_list_is_current(self):
+        """Determine whether the stored file list may be reused.
+
+        Returns
+        -------
+        bool
+            True if the file list is written to disk, and the stored list
+            exists, is not empty, was written or confirmed within the last
+            `pysat.params['file_list_ttl']` seconds, and was found using the
+            same file format, directory format, and empty file setting from a
+            directory in `self.data_paths`
+
+        """
+        ttl = pysat.params['file_list_ttl']
+        fname = os.path.join(self.home_path, self.stored_file_name)
+        settings_name = '.'.join([fname, 'json'])
+
+        if not self.write_to_disk or ttl is None or ttl <= 0 \
+                or not os.path.isfile(fname) \
+                or not os.path.isfile(settings_name):
+            return False
+
+        fstat = os.stat(fname)
+        if fstat.st_size == 0 or (time.time() - fstat.st_mtime) >= ttl:
+            return False
+
+        # Instruments with the same name may search for different files
+        try:
+            with open(settings_name, 'r') as fin:
+                stored = json.load(fin)
+        except ValueError:
+            return False
+
+        settings = self._list_settings()
+        return stored.get('data_path') in self.data_paths and all(
+            [stored.get(key) == settings[key] for key in settings.keys()
+             if key != 'data_path'])
+
     def _load(self, prev_version=False, update_path=True):
         """Load stored filelist.
 
@@ -657,6 +797,85 @@ class Files(object):
 
         return
 
+    def _refresh(self):
+        """Search the data directories and store the list of files found."""
+
+        # Let interested users know pysat is searching for
+        info_str = '{platform} {name} {tag} {inst_id}'.format(
+            **self.inst_info)
+        info_str = " ".join(("pysat is searching for", info_str, "files."))
+        info_str = " ".join(info_str.split())  # Remove duplicate whitespace
+        pysat.logger.info(info_str)
+
+        # Check all potential directory locations for files, stopping as soon
+        # as we find some.
+        for path in self.data_paths:
+            list_files_rtn = self.inst_info['inst']._list_files_rtn
+            kwarg_inputs = self.inst_info['inst'].kwargs['list_files']
+            new_files = list_files_rtn(tag=self.inst_info['tag'],
+                                       inst_id=self.inst_info['inst_id'],
+                                       data_path=path,
+                                       format_str=self.file_format,
+                                       **kwarg_inputs)
+
+            # Check if `list_files_rtn` is actually returning filename or a
+            # dict to be passed to filename creator function
+            if isinstance(new_files, dict):
+                self.list_files_creator = partial(general.filename_creator,
+                                                  **new_files)
+
+                # Instrument iteration methods require a date range.
+                self.start_date = filter_datetime_input(new_files['start_date'])
+                self.stop_date = filter_datetime_input(new_files['stop_date'])
+
+                # To really support iteration, we may need to create a generator
+                # function that'll create a fake list of files as needed.
+                # It would have to function in place of self.files. Is
+                # there truly a point to this?
+                return
+
+            # Ensure the name of returned Series is None for consistency
+            new_files.name = None
+
+            # If we find some files, this is the one directory we store.
+            # If I don't remove the directory paths then loading by filename
+            # becomes more of a challenge. Plus, more memory to store, more
+            # difficult for a human to parse when browsing a list, etc. The
+            # approach here provides for most of the potential functionality
+            # of multiple directories while still leaving the 'single' directory
+            # focus and features of the original pysat intact.
+            if not new_files.empty:
+                self.data_path = path
+                new_files = self._remove_data_dir_path(new_files)
+                break
+
+        # Feedback to info on number of files located
+        pysat.logger.info('Found {:d} local files.'.format(len(new_files)))
+
+        if not new_files.empty:
+            # Sort files to ensure they are in order
+            new_files = new_files.sort_index()
+        elif pysat.params['warn_empty_file_list']:
+            # Warn user if no files found, if `pysat.params` set
+            pstrs = "\n".join(self.data_paths)
+            estr = "".join(("Unable to find any files that match the supplied ",
+                            "template: ", self.file_format, "\n",
+                            "In the following directories: \n", pstrs))
+            pysat.logger.warning(estr)
+
+        # Attach Series of files to the class object
+        self._attach_files(new_files)
+
+        # Store to disk, if enabled for this class
+        self._store()
+
+        # Update the file sizes and modification times in the inventory
+        if self.inventory is not None:
+            self.inventory.sync(
+                self.data_path, self.files.values,
+                checksum=pysat.params['file_inventory_checksum'])
+        return
+
     def _remove_data_dir_path(self, file_series=None):
         """Remove the data directory path from filenames.
 
@@ -719,9 +938,16 @@ class Files(object):
         files_copy.inst_info['inst_module'] = self.inst_info['inst_module']
         return files_copy
 
-    def refresh(self):
+    def refresh(self, use_cache=False):
         """Update list of files, if there are changes.
 
+        Parameters
+        ----------
+        use_cache : bool
+            If True, reuse the stored file list instead of searching the data
+            directories if the stored list was written or confirmed within the
+            last `pysat.params['file_list_ttl']` seconds (default=False)
+
         Note
         ----
         Calls underlying list_files_rtn for the particular science instrument.
@@ -729,76 +955,52 @@ class Files(object):
         pysat_data_dir/platform/name/tag/inst_id, where pysat_data_dir is set by
         `pysat.params['data_dirs'] = path`.
 
-        """
-
-        # Let interested users know pysat is searching for
-        info_str = '{platform} {name} {tag} {inst_id}'.format(
-            **self.inst_info)
-        info_str = " ".join(("pysat is searching for", info_str, "files."))
-        info_str = " ".join(info_str.split())  # Remove duplicate whitespace
-        pysat.logger.info(info_str)
-
-        # Check all potential directory locations for files, stopping as soon
-        # as we find some.
-        for path in self.data_paths:
-            list_files_rtn = self.inst_info['inst']._list_files_rtn
-            kwarg_inputs = self.inst_info['inst'].kwargs['list_files']
-            new_files = list_files_rtn(tag=self.inst_info['tag'],
-                                       inst_id=self.inst_info['inst_id'],
-                                       data_path=path,
-                                       format_str=self.file_format,
-                                       **kwarg_inputs)
-
-            # Check if `list_files_rtn` is actually returning filename or a
-            # dict to be passed to filename creator function
-            if isinstance(new_files, dict):
-                self.list_files_creator = partial(general.filename_creator,
-                                                  **new_files)
-
-                # Instrument iteration methods require a date range.
-                self.start_date = filter_datetime_input(new_files['start_date'])
-                self.stop_date = filter_datetime_input(new_files['stop_date'])
-
-                # To really support iteration, we may need to create a generator
-                # function that'll create a fake list of files as needed.
-                # It would have to function in place of self.files. Is
-                # there truly a point to this?
-                return
-
-            # Ensure the name of returned Series is None for consistency
-            new_files.name = None
+        When `use_cache` is True, the file list is written to disk, and
+        `pysat.params['file_list_ttl']` is positive, the update holds a
+        `pysat.utils.NetworkLock` on a lock file next to the stored list.
+        Processes refreshing the same Instrument at the same time then
+        search the data directories one at a time, and the waiting processes
+        reuse the list stored by the first if it was found with the same
+        settings.  Processes wait up to `pysat.params['file_list_timeout']`
+        seconds for the lock.  Otherwise, the data directories are searched
+        without waiting for other processes.
 
-            # If we find some files, this is the one directory we store.
-            # If I don't remove the directory paths then loading by filename
-            # becomes more of a challenge. Plus, more memory to store, more
-            # difficult for a human to parse when browsing a list, etc. The
-            # approach here provides for most of the potential functionality
-            # of multiple directories while still leaving the 'single' directory
-            # focus and features of the original pysat intact.
-            if not new_files.empty:
-                self.data_path = path
-                new_files = self._remove_data_dir_path(new_files)
-                break
-
-        # Feedback to info on number of files located
-        pysat.logger.info('Found {:d} local files.'.format(len(new_files)))
+        """
+        ttl = pysat.params['file_list_ttl']
+        if not self.write_to_disk or not use_cache or ttl is None or ttl <= 0:
+            self._refresh()
+            if self.write_to_disk:
+                if ttl is not None and ttl > 0:
+                    self._write_list_settings()
+                else:
+                    # The settings are only read when reusing a stored list,
+                    # remove any that no longer match the stored list
+                    self._remove_list_settings()
+            return
+
+        lock_name = os.path.join(self.home_path,
+                                 '.'.join([self.stored_file_name, 'lock']))
+        with pysat.utils.NetworkLock(
+                lock_name, 'w', timeout=pysat.params['file_list_timeout']):
+            if self._stored_list_is_current():
+                file_info = self._load()
+                if not file_info.empty:
+                    pysat.logger.info(''.join(['Using the file list stored ',
+                                               'within the last ',
+                                               repr(pysat.params[
+                                                   'file_list_ttl']),
+                                               ' seconds.']))
+                    self._attach_files(file_info)
+                    return
 
-        if not new_files.empty:
-            # Sort files to ensure they are in order
-            new_files = new_files.sort_index()
-        elif pysat.params['warn_empty_file_list']:
-            # Warn user if no files found, if `pysat.params` set
-            pstrs = "\n".join(self.data_paths)
-            estr = "".join(("Unable to find any files that match the supplied ",
-                            "template: ", self.file_format, "\n",
-                            "In the following directories: \n", pstrs))
-            pysat.logger.warning(estr)
+            self._refresh()
+            self._write_list_settings()
 
-        # Attach Series of files to the class object
-        self._attach_files(new_files)
+            # Mark the stored list as current, even if it did not change
+            stored_name = os.path.join(self.home_path, self.stored_file_name)
+            if os.path.isfile(stored_name):
+                os.utime(stored_name)
 
-        # Store to disk, if enabled for this class
-        self._store()
         return
 
     def set_top_level_directory(self, path):
@@ -860,8 +1062,10 @@ class Files(object):
         new_file_series = self._load(update_path=False)
         old_file_series = self._load(prev_version=True, update_path=False)
 
-        # Select files that are in the new series and not the old series
-        new_files = new_file_series[-new_file_series.isin(old_file_series)]
+        # Select files at new times or with new names at existing times
+        file_diff = futils.diff_file_lists(old_file_series, new_file_series)
+        new_files = pds.concat([file_diff['new'],
+                                file_diff['updated']]).sort_index()
 
         return new_files
 
@@ -901,6 +1105,51 @@ class Files(object):
         # index warnings.
         return idx[0]
 
+    def get_index_range(self, start, stop):
+        """Return the positions of files within a range of times.
+
+        Parameters
+        ----------
+        start : dt.datetime
+            Starting time of the range (inclusive)
+        stop : dt.datetime
+            Ending time of the range (exclusive)
+
+        Returns
+        -------
+        start_idx : int
+            Position of the first file at or after `start`
+        stop_idx : int
+            Position after the last file before `stop`. If no files are in
+            the range, `stop_idx` is less than or equal to `start_idx`.
+
+        Raises
+        ------
+        ValueError
+            If the file times are not in increasing order
+
+        Note
+        ----
+        Uses a binary search of the file times, so ``self.files.iloc[
+        start_idx:stop_idx]`` selects the same files as a datetime slice.
+
+        """
+        if self._file_times[0] is not self.files:
+            if not self.files.index.is_monotonic_increasing:
+                raise ValueError('File times are not in increasing order.')
+
+            # Calculate the file times, reused until `files` changes
+            times = np.asarray(self.files.index.values,
+                               dtype='datetime64[ns]').view(np.int64)
+            self._file_times = (self.files, times)
+
+        times = self._file_times[1]
+        start_idx, stop_idx = np.searchsorted(
+            times, np.array([start, stop], dtype='datetime64[ns]').view(
+                np.int64), side='left')
+
+        return int(start_idx), int(stop_idx)
+
     def get_file_array(self, start, stop):
         """Return a list of filenames between and including start and stop.
 
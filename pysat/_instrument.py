@@ -10,13 +10,15 @@
 # ----------------------------------------------------------------------------
 """Class for single instruments."""
 
-import copy
+import contextlib
+import copy as copy_mod
 import datetime as dt
 import errno
 import functools
 import importlib
 import inspect
 import os
+import sqlite3
 import sys
 import types
 import warnings
@@ -102,6 +104,10 @@ class Instrument(object):
     custom : list or NoneType
         Input list containing dicts of inputs for `custom_attach` method inputs
         that may be applied or None (default=None)
+    memory_policy : str
+        Memory policy applied to loaded data, one of 'default' to keep the data
+        types provided by the load routine or 'compact' to reduce the memory
+        used by the data as it is loaded (default='default')
 
     Attributes
     ----------
@@ -150,6 +156,12 @@ class Instrument(object):
         day
     meta : pysat.Meta
         Class holding the instrument metadata
+    memory_policy
+    memory_report : dict or NoneType
+        Original and compacted data types and bytes for each variable, as
+        described by `pysat.utils.memory.compact_data`, summed over the files
+        read by the last load with a 'compact' memory policy, or None
+        otherwise
     meta_kwargs : dict
         Dict containing defaults for Meta data
     orbits : pysat.Orbits
@@ -157,6 +169,11 @@ class Instrument(object):
     pandas_format : bool
         Flag indicating whether `data` is stored as a pandas.DataFrame (True)
         or an xarray.Dataset (False)
+    profile : bool
+        Flag indicating whether calls to `load` are timed stage-by-stage
+    profiler : pysat.utils.profiling.LoadProfiler or NoneType
+        Timing and data size records for profiled loads, None if profiling
+        has never been enabled
     today : dt.datetime
         Date and time for the current day in UT
     tomorrow : dt.datetime
@@ -256,7 +273,7 @@ class Instrument(object):
                  directory_format=None, file_format=None,
                  temporary_file_list=False, strict_time_flag=True,
                  ignore_empty_files=False, meta_kwargs=None,
-                 custom=None, **kwargs):
+                 custom=None, memory_policy='default', **kwargs):
         """Initialize `pysat.Instrument` object."""
 
         # Set default tag, inst_id, and Instrument module
@@ -317,7 +334,8 @@ class Instrument(object):
 
         # Expected function keywords
         exp_keys = ['list_files', 'load', 'preprocess', 'download',
-                    'list_remote_files', 'clean', 'init', 'concat_data']
+                    'list_remote_files', 'clean', 'init', 'concat_data',
+                    'inspect']
         for fkey in exp_keys:
             func_name = _kwargs_keys_to_func_name(fkey)
             func = getattr(self, func_name)
@@ -517,6 +535,13 @@ class Instrument(object):
         # Start with a daily increment for loading
         self.load_step = dt.timedelta(days=1)
 
+        # Load profiling is disabled by default
+        self.profiler = None
+
+        # Set the memory policy for loaded data
+        self.memory_policy = memory_policy
+        self.memory_report = None
+
         # Store base attributes, used in particular by Meta class
         self._base_attr = dir(self)
 
@@ -562,7 +587,7 @@ class Instrument(object):
         partial_funcs = ['_init_rtn', '_clean_rtn', '_preprocess_rtn',
                          '_list_files_rtn', '_download_rtn',
                          '_list_remote_files_rtn', '_load_rtn',
-                         '_concat_data_rtn']
+                         '_concat_data_rtn', '_inspect_rtn']
 
         # If the type is the same then check everything that is attached to
         # the Instrument object. Includes attributes, methods, variables, etc.
@@ -868,18 +893,12 @@ class Instrument(object):
         if data is None:
             data = self.data
 
-        # Find the standard epoch index name(s)
-        epoch_names = self._get_epoch_name_from_data(data=data)
-        if len(epoch_names) == 0:
+        # Find the standard epoch and secondary time indexes
+        epoch_indexes = self._get_epoch_indexes(data)
+        if len(epoch_indexes) == 0:
             return xr.Dataset(None)
 
-        # Find secondary time indexes that may need to be sliced
-        if len(data.indexes) > 1:
-            for ind in data.indexes.keys():
-                if all([ind != epoch_names[0],
-                        data.indexes[ind].dtype
-                        == data.indexes[epoch_names[0]].dtype]):
-                    epoch_names.append(ind)
+        epoch_names = list(epoch_indexes.keys())
 
         if isinstance(key, tuple):
             if len(key) == 2:
@@ -892,6 +911,13 @@ class Instrument(object):
                     data_subset = data[key[1]]
 
                 # If the input is a tuple, `key[0]` must be linked to the epoch.
+                # Times given by position or datetime are selected directly.
+                indexers = self._get_time_indexers(key[0], epoch_indexes)
+                if indexers is not None:
+                    return data_subset.isel(
+                        {ind: indexers[ind] for ind in indexers.keys()
+                         if ind in data_subset.dims})
+
                 key_dict = {'indexers': {epoch_name: key[0]
                                          for epoch_name in epoch_names}}
                 try:
@@ -936,6 +962,11 @@ class Instrument(object):
 
                 return data[var_name][indict]
         else:
+            # Times given by position or datetime are selected directly
+            indexers = self._get_time_indexers(key, epoch_indexes)
+            if indexers is not None:
+                return data.isel(indexers)
+
             try:
                 # Grab a particular variable by name
                 return data[key]
@@ -991,172 +1022,18 @@ class Instrument(object):
                             'long_name':long_name,
                             'units':units}
 
-        Raises
-        ------
-        ValueError
-            If underlying data's datetime index not stored as `Epoch` or `time`.
-            If tuple not used when assigning dimensions for new multidimensional
-            data.
-
-        Warnings
-        --------
-        If a single new value is set, the value will be broadcast over time.
-
         Note
         ----
-        If no metadata provided and if metadata for 'name' not already stored
-        then default meta information is also added,
-        long_name = 'name', and units = ''.
-
-        """
-
-        new = copy.deepcopy(new_data)
-
-        # Initialize as empty dict.
-        if self.meta._data_types is None:
-            mutable = self.meta.mutable
-            self.meta.mutable = True
-            self.meta._data_types = {}
-            self.meta.mutable = mutable
-
-        # Add data to main pandas.DataFrame, depending upon the input
-        # slice, and a name
-        if self.pandas_format:
-            if isinstance(key, tuple):
-                try:
-                    # Pass directly through to loc. This line raises a
-                    # FutureWarning if key[0] is a slice. The future behavior
-                    # is TypeError, which is already handled correctly below.
-                    self.data.loc[key[0], key[1]] = new
-                except (KeyError, TypeError):
-                    # TypeError for single integer, slice (pandas 2.0). KeyError
-                    # for list, array. Assume key[0] is integer
-                    # (including list or slice).
-                    self.data.loc[self.data.index[key[0]], key[1]] = new
-
-                self._update_data_types(key[1])
-                self.meta[key[1]] = {}
-                return
-            elif not isinstance(new, dict):
-                # Make it a dict to simplify downstream processing
-                new = {'data': new}
-
-            # Input dict must have data in 'data',
-            # the rest of the keys are presumed to be metadata
-            in_data = new.pop('data')
-
-            # Assign data and any extra metadata
-            self.data[key] = in_data
-            self._update_data_types(key)
-
-            self.meta[key] = new
-
-        else:
-            # xarray format chosen for Instrument object
-            if not isinstance(new, dict):
-                new = {'data': new}
-            in_data = new.pop('data')
-
-            epoch_names = self._get_epoch_name_from_data()
-            if len(epoch_names) == 0:
-                raise ValueError(' '.join(('Unsupported time index name,',
-                                           '"Epoch" or "time".')))
-            else:
-                if len(epoch_names) > 1:
-                    pysat.logger.error("".join(["Multiple standard time index ",
-                                                "names found, defaulting to ",
-                                                epoch_names[0]]))
-                epoch_name = epoch_names[0]
-
-            if isinstance(key, tuple):
-                # User provided more than one thing in assignment location
-                # something like, index integers and a variable name,
-                # self[idx, 'variable'] = stuff
-                # or, self[idx1, idx2, idx3, 'variable'] = stuff.
-                # Construct dictionary of dimensions and locations for
-                # xarray standards.
-                indict = {}
-                for i, dim in enumerate(self[key[-1]].dims):
-                    indict[dim] = key[i]
-                try:
-                    # Try loading as values
-                    self.data[key[-1]].loc[indict] = in_data
-                except (TypeError, KeyError):
-                    # Try loading indexed as integers
-                    self.data[key[-1]][indict] = in_data
-
-                self._update_data_types(key[-1])
-                self.meta[key[-1]] = new
-                return
-            elif isinstance(key, str):
-                # Assigning basic variables
-                if isinstance(in_data, (xr.DataArray, tuple)):
-                    # If xarray or tuple input, take as is
-                    self.data[key] = in_data
-                elif len(np.shape(in_data)) <= 1:
-                    # If not an xarray input, but still iterable, then we
-                    # go through to process the input
-                    if key in self.variables and (
-                            np.shape(in_data) == np.shape(self.data[key])):
-                        # The ND input has the same shape as the current data
-                        # and can be assigned directly without adjusting the
-                        # dimensions. Only works with existing data.
-                        self.data[key] = (self.data[key].dims, in_data)
-                    elif np.shape(in_data) == np.shape(self.index):
-                        # 1D input has the correct length for storage along
-                        # 'Epoch'.
-                        self.data[key] = (epoch_name, in_data)
-                    elif len(np.shape(in_data)) == 0 or len(in_data) == 1:
-                        # Only a single number, or single in iterable.
-                        if key in self.variables:
-                            # If it already exists, assign as defined.
-                            in_data = np.squeeze(in_data)
-                            if np.shape(self.data[key]) == np.shape(in_data):
-                                self.data[key] = in_data
-                            else:
-                                raise ValueError(' '.join(('Shape of input',
-                                                           'does not match',
-                                                           'existing shape of',
-                                                           key)))
-                        else:
-                            # Otherwise broadcast over time.
-                            warnings.warn(' '.join(('Input for {:}'.format(key),
-                                                    'is a single value.',
-                                                    'Broadcast over epoch.')))
-                            in_data = pysat.utils.listify(in_data)
-                            self.data[key] = (epoch_name,
-                                              in_data * len(self.index))
-                    elif len(in_data) == 0:
-                        # Provided an empty iterable, make everything NaN
-                        warnings.warn(' '.join(('Input for {:} is'.format(key),
-                                                'empty. Setting to broadcast',
-                                                'as NaN over epoch.')))
-                        self.data[key] = (epoch_name,
-                                          [np.nan] * len(self.index))
-                    else:
-                        raise ValueError(' '.join(('Input for {:}'.format(key),
-                                                   'does not match expected',
-                                                   'dimensions. Value not',
-                                                   'set.')))
-                else:
-                    # Multidimensional input that is not an xarray.  The user
-                    # needs to provide everything that is required for success.
-                    # Passes the data through to get appropriate error from
-                    # xarray.
-                    self.data[key] = in_data
+        The input data is not copied before assignment, see `set_data` for
+        details and for assigning a copy of the input.
 
-            elif hasattr(key, '__iter__'):
-                # Multiple input strings (keys) are provided, but not in tuple
-                # form. Recurse back into this function, setting each input
-                # individually.
-                for keyname in key:
-                    self.data[keyname] = in_data[keyname]
-                    self.meta._data_types[keyname] = self.data[
-                        keyname].values.dtype.type
+        See Also
+        --------
+        pysat.Instrument.set_data
 
-            # Attach metadata
-            self.meta[key] = new
+        """
 
+        self.set_data(key, new_data)
         return
 
     def __delitem__(self, key):
@@ -1200,40 +1077,37 @@ class Instrument(object):
 
         """
 
-        if self._iter_type == 'file':
-            width = self._iter_width
-            for fname in self._iter_list:
-                # Without a copy, a = [inst for inst in inst] leads to
-                # every item being the last day loaded.
-                # With the copy, behavior is as expected. Making a copy
-                # of an empty object is going to be faster than a full one.
-                self.data = self._null_data
-                local_inst = self.copy()
-
-                # Load range of files. Get location for second file,
-                # width of 1 loads only one file.
-                nfid = self.files.get_index(fname) + width - 1
-                local_inst.load(fname=fname, stop_fname=self.files[nfid])
-                yield local_inst
-
-        elif self._iter_type == 'date':
-            # Iterate over dates. A list of dates is generated whenever
-            # bounds are set.
-
-            if len(self._iter_list) == 0:
-                raise IndexError('No dates to iterate over, check bounds')
-
-            for date in self._iter_list:
-                # Use a copy trick, starting with null data in object
-                self.data = self._null_data
-                local_inst = self.copy()
-
-                # Set the user-specified range of dates
-                end_date = date + self._iter_width
-
+        if self._iter_type == 'date' and len(self._iter_list) == 0:
+            raise IndexError('No dates to iterate over, check bounds')
+
+        # Each load is listed in the iteration plan, which identifies loads
+        # that may reuse the data cache of the previous load
+        local_inst = None
+        for start, stop, reuse in self.iteration_plan:
+            # Without a copy, a = [inst for inst in inst] leads to
+            # every item being the last day loaded.
+            # With the copy, behavior is as expected. Making a copy
+            # of an empty object is going to be faster than a full one.
+            self.data = self._null_data
+            prev_inst = local_inst
+            local_inst = self.copy()
+
+            if reuse:
+                # Data padding and multi-file days keep the neighbouring data
+                # in a cache, shift it forward instead of reloading it
+                for attr in ['_prev_data', '_prev_meta', '_curr_data',
+                             '_curr_meta', '_next_data', '_next_meta',
+                             '_prev_data_track', '_next_data_track']:
+                    setattr(local_inst, attr, getattr(prev_inst, attr))
+            del prev_inst
+
+            if self._iter_type == 'file':
+                # Load range of files, width of 1 loads only one file
+                local_inst.load(fname=start, stop_fname=stop)
+            else:
                 # Load the range of dates
-                local_inst.load(date=date, end_date=end_date)
-                yield local_inst
+                local_inst.load(date=start, end_date=stop)
+            yield local_inst
 
         # Add last loaded data/metadata from local_inst into the original object
         # Making copy here to ensure there are no left over references
@@ -1275,6 +1149,186 @@ class Instrument(object):
 
         return epoch_names
 
+    def _get_clone_kwargs(self):
+        """Get the keyword arguments that recreate this Instrument.
+
+        Returns
+        -------
+        in_kwargs : dict
+            Keyword arguments for `Instrument`, other than `tag` and
+            `inst_id`, with the current instrument module, custom functions,
+            keyword arguments, and other settings
+
+        Note
+        ----
+        Directory and file formats are only included if they differ from the
+        instrument module defaults, since these may depend on `tag` and
+        `inst_id`.
+
+        """
+        # Get the user-supplied keywords for all routines
+        in_kwargs = dict()
+        for fkey in self.kwargs.keys():
+            in_kwargs.update(self.kwargs[fkey])
+
+        # Re-attach the custom functions in their current order
+        custom = [{'function': func, 'args': list(args),
+                   'kwargs': dict(kwargs)}
+                  for func, args, kwargs in zip(self.custom_functions,
+                                                self.custom_args,
+                                                self.custom_kwargs)]
+
+        # Only pass on formats that were set by the user
+        directory_format = getattr(self.inst_module, 'directory_format', None)
+        if callable(directory_format):
+            directory_format = directory_format(self.tag, self.inst_id)
+        if directory_format is None:
+            directory_format = pysat.params['directory_format']
+        if self.directory_format == directory_format:
+            directory_format = None
+        else:
+            directory_format = self.directory_format
+
+        file_format = self.file_format
+        if file_format == getattr(self.inst_module, 'file_format', None):
+            file_format = None
+
+        # Use the instrument module when available, avoiding a second lookup
+        if self.inst_module is None:
+            in_kwargs['platform'] = self.platform
+            in_kwargs['name'] = self.name
+
+        in_kwargs.update({
+            'inst_module': self.inst_module, 'clean_level': self.clean_level,
+            'update_files': self.files.update_files, 'pad': self.pad,
+            'orbit_info': dict(self.orbit_info),
+            'data_dir': '' if self.data_dir is None else self.data_dir,
+            'directory_format': directory_format, 'file_format': file_format,
+            'temporary_file_list': not self.files.write_to_disk,
+            'strict_time_flag': self.strict_time_flag,
+            'ignore_empty_files': self.files.ignore_empty_files,
+            'meta_kwargs': copy_mod.deepcopy(self.meta_kwargs),
+            'custom': custom if len(custom) > 0 else None,
+            'memory_policy': self.memory_policy})
+
+        return in_kwargs
+
+    def _get_epoch_indexes(self, data):
+        """Get the time indexes used to select times in xarray data.
+
+        Parameters
+        ----------
+        data : xr.Dataset
+            Data object to select from
+
+        Returns
+        -------
+        epoch_indexes : dict
+            Time indexes keyed by dimension name, starting with the standard
+            epoch and followed by any secondary indexes of the same type
+
+        """
+        xindexes = data.xindexes
+        epoch_names = [ename for ename in ['Epoch', 'time']
+                       if ename in xindexes]
+        if len(epoch_names) == 0:
+            return dict()
+
+        # The pandas indexes are kept by xarray, so properties like
+        # monotonicity are only calculated once for each index
+        epoch_indexes = {epoch_names[0]:
+                         xindexes[epoch_names[0]].to_pandas_index()}
+        for ind, xind in xindexes.items():
+            if ind not in epoch_indexes:
+                pind = xind.to_pandas_index()
+                if pind.dtype == epoch_indexes[epoch_names[0]].dtype:
+                    epoch_indexes[ind] = pind
+
+        return epoch_indexes
+
+    def _get_time_indexers(self, key, epoch_indexes):
+        """Get the positional indexers for a time selection.
+
+        Parameters
+        ----------
+        key : any
+            Integer, datetime, slice of either, or list or array of integers
+            or booleans, used to select times
+        epoch_indexes : dict
+            Time indexes keyed by dimension name, as returned by
+            `_get_epoch_indexes`
+
+        Returns
+        -------
+        indexers : dict or NoneType
+            Positional indexers for `isel`, keyed by dimension name, or None
+            if `key` must be handled by label based selection
+
+        Note
+        ----
+        Datetimes are located using a binary search of monotonic, unique
+        time indexes.  Slices of datetimes include both end points.  If a
+        single datetime is not present in a secondary time index, only the
+        standard epoch is selected.
+
+        """
+        datetime_types = (dt.datetime, np.datetime64)
+
+        if isinstance(key, (int, np.integer)):
+            return {ind: key for ind in epoch_indexes.keys()}
+
+        if isinstance(key, slice):
+            bounds = [key.start, key.stop, key.step]
+            if all([bound is None or isinstance(bound, (int, np.integer))
+                    for bound in bounds]):
+                return {ind: key for ind in epoch_indexes.keys()}
+
+            if key.step is not None or not all([
+                    bound is None or isinstance(bound, datetime_types)
+                    for bound in bounds[:2]]):
+                return None
+
+            indexers = dict()
+            for ind, pind in epoch_indexes.items():
+                if pind.dtype.kind != 'M' or not pind.is_monotonic_increasing:
+                    return None
+
+                start = 0 if key.start is None else pind.searchsorted(
+                    key.start, side='left')
+                stop = len(pind) if key.stop is None else pind.searchsorted(
+                    key.stop, side='right')
+                indexers[ind] = slice(start, stop)
+            return indexers
+
+        if isinstance(key, datetime_types):
+            indexers = dict()
+            for ind, pind in epoch_indexes.items():
+                if any([pind.dtype.kind != 'M', not pind.is_unique,
+                        not pind.is_monotonic_increasing]):
+                    return None
+
+                loc = pind.searchsorted(key)
+                if loc < len(pind) and pind[loc] == key:
+                    indexers[ind] = loc
+                elif len(indexers) == 0:
+                    # Not in the standard epoch, raise a label error
+                    return None
+                else:
+                    # Not in a secondary index, only select the standard epoch
+                    epoch_names = list(epoch_indexes.keys())
+                    pysat.logger.warning(
+                        ''.join(['Removing ', repr(epoch_names[1:]),
+                                 ' dimensions from data selection']))
+                    return {epoch_names[0]: indexers[epoch_names[0]]}
+            return indexers
+
+        # Empty lists select variables, not times
+        if isinstance(key, (list, np.ndarray, pds.Index)) and len(key) > 0:
+            if np.asarray(key).dtype.kind in 'biu':
+                return {ind: key for ind in epoch_indexes.keys()}
+
+        return None
+
     def _empty(self, data=None):
         """Determine whether or not data has been loaded.
 
@@ -1368,10 +1422,10 @@ class Instrument(object):
         methods
             init, preprocess, and clean
         functions
-            load, list_files, download, and list_remote_files, concat_data
+            load, list_files, download, list_remote_files, and inspect
         attributes
-            directory_format, file_format, multi_file_day, orbit_info, and
-            pandas_format
+            directory_format, directory_files, file_format, multi_file_day,
+            orbit_info, and pandas_format
         test attributes
             _test_download, _test_download_ci, _new_tests, and _password_req
 
@@ -1380,10 +1434,10 @@ class Instrument(object):
         inst_methods = {'required': ['init', 'clean'],
                         'optional': ['preprocess', 'concat_data']}
         inst_funcs = {'required': ['load', 'list_files', 'download'],
-                      'optional': ['list_remote_files']}
-        inst_attrs = {'directory_format': None, 'file_format': None,
-                      'multi_file_day': False, 'orbit_info': None,
-                      'pandas_format': True}
+                      'optional': ['list_remote_files', 'inspect']}
+        inst_attrs = {'directory_format': None, 'directory_files': False,
+                      'file_format': None, 'multi_file_day': False,
+                      'orbit_info': None, 'pandas_format': True}
         test_attrs = {'_test_download': True, '_test_download_ci': True,
                       '_new_tests': True, '_password_req': False}
 
@@ -1602,6 +1656,7 @@ class Instrument(object):
                 setattr(self, attr, astr.join(cattr))
         return
 
+    @pysat.utils.profiling.profile_method
     def _load_data(self, date=None, fid=None, inc=None, load_kwargs=None):
         """Load data for an instrument on given date or filename index.
 
@@ -1632,7 +1687,7 @@ class Instrument(object):
         """
         # Set default `load_kwargs`
         if load_kwargs is None:
-            load_kwargs = copy.deepcopy(self.kwargs['load'])
+            load_kwargs = copy_mod.deepcopy(self.kwargs['load'])
 
         if inc is None:
             raise ValueError('Must supply value for `inc`.')
@@ -1646,31 +1701,52 @@ class Instrument(object):
 
         date = pysat.utils.time.filter_datetime_input(date)
 
-        if fid is not None:
-            # Get filename based off of index value. Inclusive loading on
-            # filenames per construction below.
-            fname = self.files[fid:(fid + inc + 1)]
-        elif date is not None:
-            fname = self.files[date:(date + inc)]
-        else:
-            raise ValueError('Must supply either a date or file id number.')
+        with self._profile_stage('file_lookup', measure=False):
+            if fid is not None:
+                # Get filename based off of index value. Inclusive loading on
+                # filenames per construction below.
+                fname = self.files[fid:(fid + inc + 1)]
+            elif date is not None:
+                fname = self.files[date:(date + inc)]
+            else:
+                raise ValueError(
+                    'Must supply either a date or file id number.')
 
         if len(fname) > 0:
             load_fname = [os.path.join(self.files.data_path, f) for f in fname]
             try:
-                data, mdata = self._load_rtn(load_fname, tag=self.tag,
-                                             inst_id=self.inst_id,
-                                             **load_kwargs)
+                with self._profile_stage('load_rtn', measure=False) as record:
+                    data, mdata = self._load_rtn(load_fname, tag=self.tag,
+                                                 inst_id=self.inst_id,
+                                                 **load_kwargs)
+                    if record is not None:
+                        record['data'] = data
 
                 # Ensure units and name are named consistently in new Meta
                 # object as specified by user upon Instrument instantiation
-                mdata.accept_default_labels(self.meta)
+                with self._profile_stage('meta_labels', measure=False):
+                    mdata.accept_default_labels(self.meta)
                 bad_datetime = False
             except pds.errors.OutOfBoundsDatetime:
                 bad_datetime = True
                 data = self._null_data.copy()
                 mdata = pysat.Meta(**self.meta_kwargs)
 
+            # Record the time coverage of a single file in the inventory. The
+            # inventory is optional, so database errors don't stop the load.
+            if self.files.inventory is not None and len(fname) == 1 \
+                    and not bad_datetime \
+                    and isinstance(data, self._data_library) \
+                    and not self._empty(data):
+                index = self._index(data)
+                try:
+                    self.files.inventory.record_coverage(
+                        fname.iloc[0], index.min(), index.max(), len(index))
+                except sqlite3.Error as serr:
+                    pysat.logger.warning(''.join([
+                        'Unable to record the file coverage in the ',
+                        'inventory: ', str(serr)]))
+
         else:
             bad_datetime = False
             data = self._null_data.copy()
@@ -1690,6 +1766,18 @@ class Instrument(object):
         if not isinstance(mdata, pysat.Meta):
             raise TypeError('Metadata returned must be a pysat.Meta object')
 
+        # Reduce the memory used by the data as each file is loaded, before
+        # padding, cleaning, or custom functions are applied
+        if self.memory_policy == 'compact' and not self._empty(data):
+            with self._profile_stage('compact', measure=False):
+                data, report = pysat.utils.memory.compact_data(data, mdata)
+
+            for var, var_report in report.items():
+                if var in self.memory_report:
+                    for label in ['original_bytes', 'bytes', 'bytes_saved']:
+                        var_report[label] += self.memory_report[var][label]
+                self.memory_report[var] = var_report
+
         # Let user know whether or not data was returned
         ind = data.index if self.pandas_format else data.indexes
         if len(ind) > 0:
@@ -1911,9 +1999,53 @@ class Instrument(object):
 
         return data, data_type, datetime_flag
 
+    def _profile_stage(self, stage, measure=True):
+        """Provide a context for timing a load stage.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the load stage
+        measure : bool
+            If True, measure the Instrument data at the end of the stage
+            (default=True)
+
+        Returns
+        -------
+        context : contextlib.AbstractContextManager
+            `LoadProfiler.stage` context if profiling is enabled, otherwise a
+            null context that yields None
+
+        """
+        if self.profiler is None or not self.profiler.enabled:
+            return contextlib.nullcontext()
+
+        return self.profiler.stage(stage, inst=self if measure else None)
+
     # -----------------------------------------------------------------------
     # Define all accessible methods
 
+    @property
+    def iteration_plan(self):
+        """Plan of the data loads performed when iterating over the bounds.
+
+        Returns
+        -------
+        pysat.utils.iteration.IterationPlan
+            Sorted, unique loads for the current `bounds`, with the files read
+            by each load and the loads that reuse the data cache
+
+        Note
+        ----
+        The plan is created from the current `bounds`, `pad`, and
+        `multi_file_day` values each time this attribute is accessed.
+
+        """
+        return pysat.utils.iteration.IterationPlan(
+            self._iter_type, self._iter_list, self._iter_width,
+            self.files.files,
+            cache=(self.pad is not None) or self.multi_file_day)
+
     @property
     def bounds(self):
         """Boundaries for iterating over instrument object by date or file.
@@ -2123,7 +2255,7 @@ class Instrument(object):
                 if self._iter_width is None:
                     self._iter_width = 1
 
-                self._iter_list = []
+                iter_inds = []
                 for istart, istop in zip(starts, stops):
                     # Ensure istart begins before istop. Get the index of
                     # the file start/stop times from main file list.
@@ -2138,12 +2270,15 @@ class Instrument(object):
                     # Account for width of load. Don't extend past bound.
                     stop_idx = stop_idx - self._iter_width + 1
 
-                    # Stop index is exclusive when called this way, pad by 1
-                    itemp = self.files.files.values[start_idx:(stop_idx + 1)]
+                    # Stop index is exclusive when called this way, pad by 1,
+                    # and downselect based on step size
+                    iter_inds.extend(np.arange(start_idx, stop_idx + 1,
+                                               self._iter_step))
 
-                    # Downselect based on step size
-                    itemp = itemp[::self._iter_step]
-                    self._iter_list.extend(itemp)
+                # Overlapping seasons may repeat files, iterate over each
+                # file once and in order
+                self._iter_list = list(
+                    self.files.files.values[np.unique(iter_inds).astype(int)])
 
             elif isinstance(starts[0], dt.datetime) or isinstance(stops[0],
                                                                   dt.datetime):
@@ -2208,8 +2343,11 @@ class Instrument(object):
                 else:
                     self._iter_list = []
 
-                # Convert the date range back to a time index format
-                self._iter_list = pds.DatetimeIndex(self._iter_list)
+                # Convert the date range back to a time index format.
+                # Overlapping seasons may repeat dates, iterate over each date
+                # once and in order.
+                self._iter_list = pds.DatetimeIndex(
+                    self._iter_list).unique().sort_values()
 
             else:
                 raise ValueError(' '.join(('Input is not a known type: string',
@@ -2265,24 +2403,82 @@ class Instrument(object):
         return
 
     @property
-    def variables(self):
-        """List of variables for the loaded data."""
+    def profile(self):
+        """Boolean flag for load profiling, True if loads are being profiled.
 
-        if self.pandas_format:
-            return self.data.columns
-        else:
-            return list(self.data.variables.keys())
+        Note
+        ----
+        Setting to True attaches a `pysat.utils.profiling.LoadProfiler` to
+        `profiler` if one is not already present. Setting to False pauses
+        profiling, but retains the recorded results.
 
-    @property
-    def vars_no_time(self):
-        """List of variables for the loaded data, excluding time index."""
+        """
+        return self.profiler is not None and self.profiler.enabled
+
+    @profile.setter
+    def profile(self, new_value):
+        # Set the profile property, see property docstring for details
+        if new_value:
+            if self.profiler is None:
+                self.profiler = pysat.utils.profiling.LoadProfiler()
+            self.profiler.enabled = True
+        elif self.profiler is not None:
+            self.profiler.enabled = False
 
-        if self.pandas_format:
-            return self.data.columns
-        else:
-            return pysat.utils.io.xarray_vars_no_time(self.data)
+        return
 
-    def copy(self):
+    @property
+    def memory_policy(self):
+        """Get or set the memory policy applied to loaded data.
+
+        Note
+        ----
+        May be set to 'default', which keeps the data types provided by the
+        load routine, or 'compact'.  The 'compact' policy casts float64 data to
+        float32 when no precision is lost and stores repeated pandas strings as
+        categoricals.  Integer types are not changed.  Data are compacted as
+        each file is loaded, so the data cache, cleaning, and custom functions
+        all use the compacted data.  The bytes saved for each variable are
+        available through `memory_report` after loading.
+
+        See Also
+        --------
+        pysat.utils.memory.compact_data
+
+        """
+        return self._memory_policy
+
+    @memory_policy.setter
+    def memory_policy(self, new_value):
+        # Set the memory policy property, see property docstring for details
+        policies = ['default', 'compact']
+        if new_value not in policies:
+            raise ValueError(''.join(['unknown memory policy ',
+                                      repr(new_value), ', expected one of ',
+                                      repr(policies)]))
+
+        self._memory_policy = new_value
+        return
+
+    @property
+    def variables(self):
+        """List of variables for the loaded data."""
+
+        if self.pandas_format:
+            return self.data.columns
+        else:
+            return list(self.data.variables.keys())
+
+    @property
+    def vars_no_time(self):
+        """List of variables for the loaded data, excluding time index."""
+
+        if self.pandas_format:
+            return self.data.columns
+        else:
+            return pysat.utils.io.xarray_vars_no_time(self.data)
+
+    def copy(self):
         """Create a deep copy of the entire Instrument object.
 
         Returns
@@ -2304,7 +2500,7 @@ class Instrument(object):
         self.orbits = None
 
         # Copy non-problematic parameters
-        inst_copy = copy.deepcopy(self)
+        inst_copy = copy_mod.deepcopy(self)
 
         # Restore links to the instrument support functions module
         inst_copy.inst_module = saved_module
@@ -2330,6 +2526,45 @@ class Instrument(object):
 
         return inst_copy
 
+    def clone(self, tag=None, inst_id=None):
+        """Create a new Instrument with the same settings and no data.
+
+        Parameters
+        ----------
+        tag : str or NoneType
+            Tag for the new Instrument, or None to use the current tag
+            (default=None)
+        inst_id : str or NoneType
+            Instrument ID for the new Instrument, or None to use the current
+            inst_id (default=None)
+
+        Returns
+        -------
+        pysat.Instrument
+            New Instrument with the current instrument module, custom
+            functions, keyword arguments, and other settings
+
+        See Also
+        --------
+        copy
+
+        Note
+        ----
+        The instrument module and the supported keywords of its routines are
+        reused, so no module lookup is needed.  The file list is created for
+        the new `tag` and `inst_id`.  Directory and file formats are only
+        passed on if they differ from the instrument module defaults, since
+        these may depend on `tag` and `inst_id`.
+
+        """
+        tag = self.tag if tag is None else tag
+        inst_id = self.inst_id if inst_id is None else inst_id
+
+        inst_clone = Instrument(tag=tag, inst_id=inst_id,
+                                **self._get_clone_kwargs())
+
+        return inst_clone
+
     def concat_data(self, new_data, prepend=False, include=None, **kwargs):
         """Concatonate data to self.data for xarray or pandas as needed.
 
@@ -2560,6 +2795,360 @@ class Instrument(object):
                         [name for name in names if name not in good_names]))
         return
 
+    def assign(self, variables, meta=None, copy=False):
+        """Assign multiple data variables and their metadata at once.
+
+        Parameters
+        ----------
+        variables : dict
+            Dict with variable names as keys and data as values. The data may
+            be any input `set_data` accepts for a single variable, other than
+            a dict of data and metadata or a single value for xarray data.
+        meta : dict or NoneType
+            Dict with variable names as keys and dicts of metadata labels and
+            values as values, or None to only assign default metadata to new
+            variables (default=None)
+        copy : bool
+            If True, a deep copy of `variables` is assigned (default=False)
+
+        Raises
+        ------
+        ValueError
+            If `meta` contains variables not present in `variables`, if the
+            underlying xarray epoch name is not `Epoch` or `time`, or if an
+            xarray input does not match the expected dimensions.
+
+        Note
+        ----
+        The data object is updated with a single concatenation or
+        `xarray.Dataset.assign` call, and metadata is set with one `Meta`
+        update per metadata label, instead of once per variable.
+
+        Examples
+        --------
+        ::
+
+            inst.assign({'double_mlt': 2.0 * inst['mlt'],
+                         'triple_mlt': 3.0 * inst['mlt']},
+                        meta={'double_mlt': {'units': 'hours',
+                                             'long_name': 'double MLT'},
+                              'triple_mlt': {'units': 'hours'}})
+
+        See Also
+        --------
+        pysat.Instrument.set_data
+
+        """
+        if meta is None:
+            meta = {}
+
+        bad_vars = [var for var in meta.keys() if var not in variables.keys()]
+        if len(bad_vars) > 0:
+            raise ValueError(''.join(['Metadata provided for variables ',
+                                      'without data: ', repr(bad_vars)]))
+
+        if len(variables) == 0:
+            return
+
+        if copy:
+            variables = copy_mod.deepcopy(variables)
+
+        names = list(variables.keys())
+
+        if self.pandas_format:
+            # Build all new columns in one DataFrame, aligned with any
+            # existing data.  The data is copied once, either here for an
+            # empty Instrument or when concatenating with the existing data.
+            new_frame = pds.DataFrame(variables,
+                                      index=None if self.empty else self.index,
+                                      copy=self.empty)
+
+            if self.empty:
+                self.data = new_frame
+            else:
+                old_names = [var for var in names if var in self.data.columns]
+                new_names = [var for var in names
+                             if var not in self.data.columns]
+
+                if len(old_names) > 0:
+                    self.data[old_names] = new_frame[old_names]
+
+                if len(new_names) > 0:
+                    if len(old_names) > 0:
+                        new_frame = new_frame[new_names]
+                    self.data = pds.concat([self.data, new_frame], axis=1,
+                                           copy=False)
+        else:
+            epoch_names = self._get_epoch_name_from_data()
+            if len(epoch_names) == 0:
+                raise ValueError(' '.join(('Unsupported time index name,',
+                                           '"Epoch" or "time".')))
+            epoch_name = epoch_names[0]
+
+            # Cast each input as a DataArray or a (dims, data) tuple
+            new_vars = dict()
+            for var in names:
+                in_data = variables[var]
+                # Copy data taken from this Instrument, so that two variables
+                # never share the same memory
+                in_data = self._copy_shared_data(in_data)
+                if isinstance(in_data, (xr.DataArray, tuple)):
+                    new_vars[var] = in_data
+                elif var in self.variables and (
+                        np.shape(in_data) == np.shape(self.data[var])):
+                    new_vars[var] = (self.data[var].dims, in_data)
+                elif np.shape(in_data) == np.shape(self.index):
+                    new_vars[var] = (epoch_name, in_data)
+                else:
+                    raise ValueError(' '.join(('Input for {:}'.format(var),
+                                               'does not match expected',
+                                               'dimensions. Value not',
+                                               'set.')))
+
+            self.data = self.data.assign(new_vars)
+
+        # Update the data types before setting the metadata, since the default
+        # fill values depend upon the data type
+        if self.meta._data_types is None:
+            mutable = self.meta.mutable
+            self.meta.mutable = True
+            self.meta._data_types = {}
+            self.meta.mutable = mutable
+
+        self.meta._data_types.update({var: self.data[var].values.dtype.type
+                                      for var in names})
+
+        # Assign default metadata to all new variables at once, then set the
+        # provided metadata one label at a time
+        self.meta[names] = {}
+
+        label_vals = dict()
+        for var in meta.keys():
+            for label in meta[var].keys():
+                if label not in label_vals.keys():
+                    label_vals[label] = ([], [])
+                label_vals[label][0].append(var)
+                label_vals[label][1].append(meta[var][label])
+
+        for label in label_vals.keys():
+            self.meta[label_vals[label][0]] = {label: label_vals[label][1]}
+
+        return
+
+    def set_data(self, key, new_data, copy=False):
+        """Set data in `pysat.Instrument` object.
+
+        Parameters
+        ----------
+        key : str, tuple, dict
+            String label, or dict or tuple of indices for new data
+        new_data : dict, pandas.DataFrame, or xarray.Dataset
+            New data as a dict (assigned with key 'data'), DataFrame, or
+            Dataset
+        copy : bool
+            If True, a deep copy of `new_data` is assigned.  If False, the
+            input is assigned without an intermediate copy. pandas data always
+            stores its own copy of the input, while xarray data may view
+            the input array. (default=False)
+
+        Examples
+        --------
+        ::
+
+            # Simple assignment, default metadata assigned
+            # 'long_name' = 'name'
+            # 'units' = ''
+            inst['name'] = newData
+
+            # Assignment with Metadata
+            inst['name'] = {'data':new_data,
+                            'long_name':long_name,
+                            'units':units}
+
+            # Assign an isolated copy of the data
+            inst.set_data('name', new_data, copy=True)
+
+        Raises
+        ------
+        ValueError
+            If underlying data's datetime index not stored as `Epoch` or `time`.
+            If tuple not used when assigning dimensions for new multidimensional
+            data.
+
+        Warnings
+        --------
+        If a single new value is set, the value will be broadcast over time.
+
+        Note
+        ----
+        If no metadata provided and if metadata for 'name' not already stored
+        then default meta information is also added,
+        long_name = 'name', and units = ''.
+
+        Without `copy`, changing the input array in place after assigning it to
+        xarray data also changes the Instrument data.  Input that shares
+        memory with data already in this Instrument is always copied.
+
+        """
+
+        if copy:
+            new = copy_mod.deepcopy(new_data)
+        elif isinstance(new_data, dict):
+            # Shallow copy, so removing 'data' below leaves the input intact
+            new = dict(new_data)
+        else:
+            new = new_data
+
+        # Initialize as empty dict.
+        if self.meta._data_types is None:
+            mutable = self.meta.mutable
+            self.meta.mutable = True
+            self.meta._data_types = {}
+            self.meta.mutable = mutable
+
+        # Add data to main pandas.DataFrame, depending upon the input
+        # slice, and a name
+        if self.pandas_format:
+            if isinstance(key, tuple):
+                try:
+                    # Pass directly through to loc. This line raises a
+                    # FutureWarning if key[0] is a slice. The future behavior
+                    # is TypeError, which is already handled correctly below.
+                    self.data.loc[key[0], key[1]] = new
+                except (KeyError, TypeError):
+                    # TypeError for single integer, slice (pandas 2.0). KeyError
+                    # for list, array. Assume key[0] is integer
+                    # (including list or slice).
+                    self.data.loc[self.data.index[key[0]], key[1]] = new
+
+                self._update_data_types(key[1])
+                self.meta[key[1]] = {}
+                return
+            elif not isinstance(new, dict):
+                # Make it a dict to simplify downstream processing
+                new = {'data': new}
+
+            # Input dict must have data in 'data',
+            # the rest of the keys are presumed to be metadata
+            in_data = new.pop('data')
+
+            # Assign data and any extra metadata. pandas stores a copy of the
+            # input within the DataFrame.
+            self.data[key] = in_data
+            self._update_data_types(key)
+
+            self.meta[key] = new
+
+        else:
+            # xarray format chosen for Instrument object
+            if not isinstance(new, dict):
+                new = {'data': new}
+            in_data = new.pop('data')
+
+            epoch_names = self._get_epoch_name_from_data()
+            if len(epoch_names) == 0:
+                raise ValueError(' '.join(('Unsupported time index name,',
+                                           '"Epoch" or "time".')))
+            else:
+                if len(epoch_names) > 1:
+                    pysat.logger.error("".join(["Multiple standard time index ",
+                                                "names found, defaulting to ",
+                                                epoch_names[0]]))
+                epoch_name = epoch_names[0]
+
+            if isinstance(key, tuple):
+                # User provided more than one thing in assignment location
+                # something like, index integers and a variable name,
+                # self[idx, 'variable'] = stuff
+                # or, self[idx1, idx2, idx3, 'variable'] = stuff.
+                # Construct dictionary of dimensions and locations for
+                # xarray standards.
+                indict = {}
+                for i, dim in enumerate(self[key[-1]].dims):
+                    indict[dim] = key[i]
+                try:
+                    # Try loading as values
+                    self.data[key[-1]].loc[indict] = in_data
+                except (TypeError, KeyError):
+                    # Try loading indexed as integers
+                    self.data[key[-1]][indict] = in_data
+
+                self._update_data_types(key[-1])
+                self.meta[key[-1]] = new
+                return
+            elif isinstance(key, str):
+                # Assigning basic variables. Data taken from this Instrument is
+                # copied, so that two variables never share the same memory.
+                in_data = self._copy_shared_data(in_data)
+                if isinstance(in_data, (xr.DataArray, tuple)):
+                    # If xarray or tuple input, take as is
+                    self.data[key] = in_data
+                elif len(np.shape(in_data)) <= 1:
+                    # If not an xarray input, but still iterable, then we
+                    # go through to process the input
+                    if key in self.variables and (
+                            np.shape(in_data) == np.shape(self.data[key])):
+                        # The ND input has the same shape as the current data
+                        # and can be assigned directly without adjusting the
+                        # dimensions. Only works with existing data.
+                        self.data[key] = (self.data[key].dims, in_data)
+                    elif np.shape(in_data) == np.shape(self.index):
+                        # 1D input has the correct length for storage along
+                        # 'Epoch'.
+                        self.data[key] = (epoch_name, in_data)
+                    elif len(np.shape(in_data)) == 0 or len(in_data) == 1:
+                        # Only a single number, or single in iterable.
+                        if key in self.variables:
+                            # If it already exists, assign as defined.
+                            in_data = np.squeeze(in_data)
+                            if np.shape(self.data[key]) == np.shape(in_data):
+                                self.data[key] = in_data
+                            else:
+                                raise ValueError(' '.join(('Shape of input',
+                                                           'does not match',
+                                                           'existing shape of',
+                                                           key)))
+                        else:
+                            # Otherwise broadcast over time.
+                            warnings.warn(' '.join(('Input for {:}'.format(key),
+                                                    'is a single value.',
+                                                    'Broadcast over epoch.')))
+                            in_data = pysat.utils.listify(in_data)
+                            self.data[key] = (epoch_name,
+                                              in_data * len(self.index))
+                    elif len(in_data) == 0:
+                        # Provided an empty iterable, make everything NaN
+                        warnings.warn(' '.join(('Input for {:} is'.format(key),
+                                                'empty. Setting to broadcast',
+                                                'as NaN over epoch.')))
+                        self.data[key] = (epoch_name,
+                                          [np.nan] * len(self.index))
+                    else:
+                        raise ValueError(' '.join(('Input for {:}'.format(key),
+                                                   'does not match expected',
+                                                   'dimensions. Value not',
+                                                   'set.')))
+                else:
+                    # Multidimensional input that is not an xarray.  The user
+                    # needs to provide everything that is required for success.
+                    # Passes the data through to get appropriate error from
+                    # xarray.
+                    self.data[key] = in_data
+
+            elif hasattr(key, '__iter__'):
+                # Multiple input strings (keys) are provided, but not in tuple
+                # form. Recurse back into this function, setting each input
+                # individually.
+                for keyname in key:
+                    self.data[keyname] = in_data[keyname]
+                    self.meta._data_types[keyname] = self.data[
+                        keyname].values.dtype.type
+
+            # Attach metadata
+            self.meta[key] = new
+
+        return
+
     def today(self):
         """Get today's date (UTC), with no hour, minute, second, etc.
 
@@ -2862,6 +3451,107 @@ class Instrument(object):
 
         return
 
+    def inspect(self, date=None, fname=None):
+        """Get the variables, dimensions, and time coverage of data files.
+
+        Parameters
+        ----------
+        date : dt.datetime or NoneType
+            Date of the files to inspect, covering the same period as a daily
+            `load` (default=None)
+        fname : str or NoneType
+            Filename to inspect, as listed in `files` (default=None)
+
+        Returns
+        -------
+        info : dict
+            Dict with the 'variables', 'dims', 'dtypes', 'start', 'stop',
+            'num_samples', 'meta', and per-file information in 'files'. See
+            `pysat.utils.io.combine_file_info` for details.
+
+        Raises
+        ------
+        ValueError
+            If both or neither of `date` and `fname` are supplied, or if no
+            files are found
+
+        Note
+        ----
+        Uses the instrument module `inspect` function, if available, which
+        should read only the file headers and epoch.  Otherwise, each file
+        is loaded using the instrument module `load` function and summarized,
+        which is no faster than loading the data.  The metadata then
+        includes the variables from every file.
+
+        Examples
+        --------
+        ::
+
+            inst = pysat.Instrument('pysat', 'netcdf', ...)
+            info = inst.inspect(date=dt.datetime(2009, 1, 1))
+            print(info['start'], info['stop'], info['num_samples'])
+
+        """
+        if date is not None and fname is None:
+            date = pysat.utils.time.filter_datetime_input(date)
+            fnames = self.files[date:date + dt.timedelta(days=1)]
+        elif fname is not None and date is None:
+            fnames = [fname]
+        else:
+            raise ValueError('Must supply either a date or a filename.')
+
+        if len(fnames) == 0:
+            raise ValueError('No files found to inspect.')
+
+        load_fnames = [os.path.join(self.files.data_path, ifile)
+                       for ifile in fnames]
+
+        if self._inspect_rtn.__name__.find('_pass_func') != 0:
+            info = self._inspect_rtn(load_fnames, tag=self.tag,
+                                     inst_id=self.inst_id,
+                                     **self.kwargs['inspect'])
+        else:
+            # No instrument-specific inspection, load and summarize each file
+            load_kwargs = {key: self.kwargs['load'][key]
+                           for key in self.kwargs['load'].keys()
+                           if key != 'use_header'}
+            file_info = list()
+            meta = None
+            for load_fname in load_fnames:
+                data, file_meta = self._load_rtn([load_fname], tag=self.tag,
+                                                 inst_id=self.inst_id,
+                                                 **load_kwargs)
+
+                # Keep the metadata for variables from every file
+                if meta is None:
+                    meta = file_meta
+                else:
+                    meta.merge(file_meta)
+
+                index = self._index(data)
+                if self.pandas_format:
+                    variables = list(data.columns)
+                    dims = {'time': len(index)}
+                else:
+                    variables = pysat.utils.io.xarray_vars_no_time(data)
+                    dims = dict(data.sizes)
+
+                file_info.append({
+                    'variables': variables, 'dims': dims, 'epoch_dim': 'time',
+                    'dtypes': {var: data[var].dtype for var in variables},
+                    'num_samples': len(index),
+                    'start': index.min() if len(index) > 0 else None,
+                    'stop': index.max() if len(index) > 0 else None})
+
+            info = pysat.utils.io.combine_file_info(load_fnames, file_info,
+                                                    meta)
+
+        # Ensure units and name are named consistently with `self.meta`
+        info['meta'].accept_default_labels(self.meta)
+
+        return info
+
+    @pysat.utils.profiling.profile_method
     def load(self, yr=None, doy=None, end_yr=None, end_doy=None, date=None,
              end_date=None, fname=None, stop_fname=None, verifyPad=False,
              **kwargs):
@@ -2970,7 +3660,7 @@ class Instrument(object):
                                    'Deprecated in pysat 3.3.0+. Remove ',
                                    '`use_header` kwarg (now same as ',
                                    '`use_header=True`) to stop this warning.']),
-                          DeprecationWarning, stacklevel=2)
+                          DeprecationWarning, stacklevel=3)
         else:
             use_header = True
 
@@ -2984,10 +3674,10 @@ class Instrument(object):
                             'expected, please confirm that data is present ',
                             'on the system and that ',
                             "pysat.params['data_dirs'] is set correctly."))
-            warnings.warn(estr, UserWarning, stacklevel=2)
+            warnings.warn(estr, UserWarning, stacklevel=3)
             estr = ''.join(("In pysat version 3.3.0+ the subsequent ",
                             'IndexError will not be raised.'))
-            warnings.warn(estr, DeprecationWarning, stacklevel=2)
+            warnings.warn(estr, DeprecationWarning, stacklevel=3)
             # Uncomment line below, pysat 3.3.0+
             # return
 
@@ -3101,6 +3791,9 @@ class Instrument(object):
 
         self.orbits._reset()
 
+        # Start a new memory report for the files loaded below
+        self.memory_report = dict() if self.memory_policy == 'compact' else None
+
         # If `pad` or `multi_file_day` is True, need to load three days/files
         loop_pad = self.pad if self.pad is not None else dt.timedelta(seconds=0)
 
@@ -3180,15 +3873,16 @@ class Instrument(object):
                 sort_method = 'sortby'
                 sort_args = ['time']
 
-            if not self._index(self._prev_data).is_monotonic_increasing:
-                self._prev_data = getattr(self._prev_data,
-                                          sort_method)(*sort_args)
-            if not self._index(self._curr_data).is_monotonic_increasing:
-                self._curr_data = getattr(self._curr_data,
-                                          sort_method)(*sort_args)
-            if not self._index(self._next_data).is_monotonic_increasing:
-                self._next_data = getattr(self._next_data,
-                                          sort_method)(*sort_args)
+            with self._profile_stage('sort'):
+                if not self._index(self._prev_data).is_monotonic_increasing:
+                    self._prev_data = getattr(self._prev_data,
+                                              sort_method)(*sort_args)
+                if not self._index(self._curr_data).is_monotonic_increasing:
+                    self._curr_data = getattr(self._curr_data,
+                                              sort_method)(*sort_args)
+                if not self._index(self._next_data).is_monotonic_increasing:
+                    self._next_data = getattr(self._next_data,
+                                              sort_method)(*sort_args)
 
             # Make tracking indexes consistent with new loads, as date loading
             # and file loading have to be treated differently due to change in
@@ -3206,8 +3900,10 @@ class Instrument(object):
             # Attach data to object
             if not self._empty(self._curr_data):
                 # The data being added isn't empty, so copy the data values
-                # and the meta data values
-                self.data = self._curr_data.copy()
+                # and the meta data values. Memory-mapped variables are given
+                # a new copy-on-write map instead of being read into memory.
+                self.data = pysat.utils.memory.copy_mapped_data(
+                    self._curr_data)
                 self.meta = self._curr_meta.copy()
             else:
                 # If a new default/empty Meta is added here then it creates
@@ -3239,49 +3935,51 @@ class Instrument(object):
                                            "by file.")))
 
             # Pad data based upon passed parameter
-            cdata = list()
-            include = None
-            if not self._empty(self._prev_data) and not self.empty:
-                # __getitem__ is used to handle any pandas/xarray differences in
-                # data slicing
-                pdata = self.__getitem__(slice(first_pad, self.index[0]),
-                                         data=self._prev_data)
-                if not self._empty(pdata):
-                    # Test the data index, slicing if necessary
-                    pindex = self._index(data=pdata)
-                    if len(pindex) > 0:
-                        if pindex[-1] == self.index[0]:
-                            pdata = self.__getitem__(slice(-1), data=pdata)
-                        cdata.append(pdata)
-                        include = 1
-
-            if not self._empty(self._next_data) and not self.empty:
-                # __getitem__ is used to handle any pandas/xarray differences in
-                # data slicing
-                ndata = self.__getitem__(slice(self.index[-1], last_pad),
-                                         data=self._next_data)
-                if not self._empty(ndata):
-                    # Test the data index, slicing if necessary
-                    nindex = self._index(data=ndata)
-                    if len(nindex) > 1:
-                        if nindex[0] == self.index[-1]:
-                            ndata = self.__getitem__(
-                                slice(1, len(nindex)), data=ndata)
-                        cdata.append(ndata)
-                        if include is None:
-                            include = 0
-
-            # Concatonate the current, previous, and next data
-            if len(cdata) > 0:
-                self.concat_data(cdata, include=include)
-
-            if len(self.index) > 0:
-                self.data = self[first_pad:last_pad]
-
-                # Want exclusive end slicing behavior from above
-                if not self.empty:
-                    if (self.index[-1] == last_pad) and (not want_last_pad):
-                        self.data = self[:-1]
+            with self._profile_stage('pad_concat'):
+                cdata = list()
+                include = None
+                if not self._empty(self._prev_data) and not self.empty:
+                    # __getitem__ is used to handle any pandas/xarray
+                    # differences in data slicing
+                    pdata = self.__getitem__(slice(first_pad, self.index[0]),
+                                             data=self._prev_data)
+                    if not self._empty(pdata):
+                        # Test the data index, slicing if necessary
+                        pindex = self._index(data=pdata)
+                        if len(pindex) > 0:
+                            if pindex[-1] == self.index[0]:
+                                pdata = self.__getitem__(slice(-1), data=pdata)
+                            cdata.append(pdata)
+                            include = 1
+
+                if not self._empty(self._next_data) and not self.empty:
+                    # __getitem__ is used to handle any pandas/xarray
+                    # differences in data slicing
+                    ndata = self.__getitem__(slice(self.index[-1], last_pad),
+                                             data=self._next_data)
+                    if not self._empty(ndata):
+                        # Test the data index, slicing if necessary
+                        nindex = self._index(data=ndata)
+                        if len(nindex) > 1:
+                            if nindex[0] == self.index[-1]:
+                                ndata = self.__getitem__(
+                                    slice(1, len(nindex)), data=ndata)
+                            cdata.append(ndata)
+                            if include is None:
+                                include = 0
+
+                # Concatonate the current, previous, and next data
+                if len(cdata) > 0:
+                    self.concat_data(cdata, include=include)
+
+                if len(self.index) > 0:
+                    self.data = self[first_pad:last_pad]
+
+                    # Want exclusive end slicing behavior from above
+                    if not self.empty:
+                        if (self.index[-1] == last_pad
+                                and not want_last_pad):
+                            self.data = self[:-1]
         else:
             # If self.pad is False, load single day
             self.data, meta = self._load_data(date=self.date, fid=self._fid,
@@ -3296,22 +3994,24 @@ class Instrument(object):
                 pysat.logger.info(estr)
 
         if not self.empty:
-            # Check for partial metadata, define the remaining variables.
-            warn_missing_vars = []
-            default_warn = "".join(["Metadata set to defaults, as they were ",
-                                    "missing in the Instrument."])
-            for var in self.vars_no_time:
-                if var not in self.meta:
-                    warn_missing_vars.append(var)
-                    self.meta[var] = {self.meta.labels.name: var,
-                                      self.meta.labels.notes: default_warn}
-
-            if len(warn_missing_vars) > 0:
-                default_warn = "".join(["Metadata for variables [{:s}] set to ",
-                                        "defaults, as they were ",
-                                        "missing in the Instrument."])
-                default_warn = default_warn.format(', '.join(warn_missing_vars))
-                warnings.warn(default_warn, stacklevel=2)
+            with self._profile_stage('meta_defaults'):
+                # Check for partial metadata, define the remaining variables.
+                warn_missing_vars = []
+                default_warn = "".join(["Metadata set to defaults, as they ",
+                                        "were missing in the Instrument."])
+                for var in self.vars_no_time:
+                    if var not in self.meta:
+                        warn_missing_vars.append(var)
+                        self.meta[var] = {self.meta.labels.name: var,
+                                          self.meta.labels.notes: default_warn}
+
+                if len(warn_missing_vars) > 0:
+                    default_warn = "".join(["Metadata for variables [{:s}] ",
+                                            "set to defaults, as they were ",
+                                            "missing in the Instrument."])
+                    default_warn = default_warn.format(
+                        ', '.join(warn_missing_vars))
+                    warnings.warn(default_warn, stacklevel=3)
 
         # If loading by file and there is data, set the yr, doy, and date
         if not self._load_by_date and not self.empty:
@@ -3337,47 +4037,52 @@ class Instrument(object):
                                            'set inst.strict_time_flag=False',
                                            'before loading data')))
             else:
-                warnings.warn(message, stacklevel=2)
+                warnings.warn(message, stacklevel=3)
 
         # Transfer any extra attributes in meta to the Instrument object.
         # Metadata types need to be initialized before preprocess is run.
         # TODO(#1020): Remove warning and logic when kwarg is removed
-        if use_header or ('use_header' in self.kwargs['load']
-                          and self.kwargs['load']['use_header']):
-            self.meta.transfer_attributes_to_header()
-        else:
-            self.meta.transfer_attributes_to_instrument(self)
+        with self._profile_stage('meta_transfer'):
+            if use_header or ('use_header' in self.kwargs['load']
+                              and self.kwargs['load']['use_header']):
+                self.meta.transfer_attributes_to_header()
+            else:
+                self.meta.transfer_attributes_to_instrument(self)
 
-        # Transfer loaded data types to meta.
-        self.meta.mutable = True
-        if self.meta._data_types is None:
-            self.meta._data_types = {}
-        for key in self.variables:
-            data_type = self.data[key].dtype.type
-            self.meta._data_types[key] = data_type
+            # Transfer loaded data types to meta.
+            self.meta.mutable = True
+            if self.meta._data_types is None:
+                self.meta._data_types = {}
+            for key in self.variables:
+                data_type = self.data[key].dtype.type
+                self.meta._data_types[key] = data_type
 
-        self.meta.mutable = False
+            self.meta.mutable = False
         sys.stdout.flush()
 
         # Apply the instrument preprocess routine, if data present
         if not self.empty:
-            # Does not require self as input, as it is a partial func
-            self._preprocess_rtn(**self.kwargs['preprocess'])
+            with self._profile_stage('preprocess'):
+                # Does not require self as input, as it is a partial func
+                self._preprocess_rtn(**self.kwargs['preprocess'])
 
         # Clean data, if data is present and cleaning requested
         if (not self.empty) & (self.clean_level != 'none'):
-            self._clean_rtn(**self.kwargs['clean'])
+            with self._profile_stage('clean'):
+                self._clean_rtn(**self.kwargs['clean'])
 
         # Apply custom functions via the nanokernel in `self.custom`
         if not self.empty:
-            self.custom_apply_all()
+            with self._profile_stage('custom'):
+                self.custom_apply_all()
 
         # Remove the excess data padding, if any applied
         if (self.pad is not None) & (not self.empty) & (not verifyPad):
-            self.data = self[first_time: last_time]
-            if not self.empty:
-                if (self.index[-1] == last_time) & (not want_last_pad):
-                    self.data = self[:-1]
+            with self._profile_stage('pad_trim'):
+                self.data = self[first_time: last_time]
+                if not self.empty:
+                    if (self.index[-1] == last_time) & (not want_last_pad):
+                        self.data = self[:-1]
 
         return
 
@@ -3522,12 +4227,9 @@ class Instrument(object):
                           '{:}'.format(new_dates[-1].strftime('%d %b %Y')),
                           '(inclusive).']))
 
-            # Determine which dates are missing
-            missing_inds = [i for i, req_dates in enumerate(new_dates)
-                            if req_dates not in local_files.index]
-
             # Extract only the missing dates
-            new_dates = new_dates[missing_inds]
+            new_dates = pds.DatetimeIndex(new_dates)
+            new_dates = new_dates[~new_dates.isin(local_files.index)]
             pysat.logger.info(' '.join(('Found {:} days'.format(len(new_dates)),
                                         'with new files.')))
         else:
@@ -3537,19 +4239,13 @@ class Instrument(object):
                                         'looking for updated files and gaps at',
                                         'all times.']))
 
-            new_dates = []
-            for date in remote_files.index:
-                if date not in local_files:
-                    new_dates.append(date)
-
-            # Now compare filenames between common dates as it may be a new
+            # Also compare filenames between common dates as it may be a new
             # version or revision.  This will have a problem with filenames
             # that are faking daily data from monthly.
-            for date in local_files.index:
-                if date in remote_files.index:
-                    if remote_files[date] != local_files[date]:
-                        new_dates.append(date)
-            new_dates = np.sort(new_dates)
+            file_diff = pysat.utils.files.diff_file_lists(
+                local_files, remote_files)
+            new_dates = file_diff['new'].index.append(
+                file_diff['updated'].index).sort_values()
             pysat.logger.info(' '.join(('Found {:} days'.format(len(new_dates)),
                                         'with new or updated files.')))
 
@@ -3565,7 +4261,8 @@ class Instrument(object):
         return
 
     def download(self, start=None, stop=None, date_array=None,
-                 **kwargs):
+                 chunk_size=None, workers=1, retries=0, retry_delay=1.0,
+                 resume=False, **kwargs):
         """Download data for given Instrument object from start to stop.
 
         Parameters
@@ -3579,6 +4276,19 @@ class Instrument(object):
         date_array : list-like or NoneType
             Sequence of dates to download date for. Takes precedence over
             start and stop inputs (default=None)
+        chunk_size : int or NoneType
+            Number of dates passed to each call of the instrument download
+            routine, or None to download all dates in one call (default=None)
+        workers : int
+            Maximum number of chunks downloaded at the same time (default=1)
+        retries : int
+            Number of times a failed chunk is tried again (default=0)
+        retry_delay : float
+            Seconds to wait before the first retry of a chunk, doubling for
+            each later retry (default=1.0)
+        resume : bool
+            If True, record completed chunks in a journal and skip dates
+            completed by an earlier, interrupted request (default=False)
         **kwargs : dict
             Dictionary of keywords that may be options for specific instruments.
             The keyword arguments 'user' and 'password' are expected for remote
@@ -3597,9 +4307,16 @@ class Instrument(object):
         If Instrument bounds are set to defaults they are updated
         after files are downloaded.
 
+        The file list is updated as each chunk finishes, so files from
+        finished chunks are listed even if the request is interrupted.  If a
+        chunk still fails after all retries, the remaining chunks are
+        downloaded and the error is raised.  With `resume=True` the next
+        request for the same dates only downloads the chunks that did not
+        finish.
+
         See Also
         --------
-        pandas.DatetimeIndex
+        pandas.DatetimeIndex, pysat.utils.download.run_download
 
         """
 
@@ -3654,14 +4371,28 @@ class Instrument(object):
 
         # Download the data, if enough data is requested
         if len(date_array) > 0:
-            self._download_rtn(date_array, **kwargs)
-
             # Get the current file date range
             first_date = self.files.start_date
             last_date = self.files.stop_date
 
-            pysat.logger.info('Updating pysat file list')
-            self.files.refresh()
+            if resume:
+                journal = pysat.utils.download.DownloadJournal(os.path.join(
+                    self.files.home_path, self.files.stored_file_name.replace(
+                        'stored_file_info', 'download_journal')))
+            else:
+                journal = None
+
+            def _update_file_list(chunk):
+                # Include the files from each chunk as it finishes, so they
+                # are available even if a later chunk fails
+                pysat.logger.info('Updating pysat file list')
+                self.files.refresh()
+                return
+
+            pysat.utils.download.run_download(
+                self._download_rtn, date_array, chunk_size=chunk_size,
+                workers=workers, retries=retries, retry_delay=retry_delay,
+                journal=journal, chunk_callback=_update_file_list, **kwargs)
 
             # If instrument object has default bounds, update them
             if len(self.bounds[0]) == 1:
@@ -3785,6 +4516,44 @@ class Instrument(object):
 
         return
 
+    def _copy_shared_data(self, in_data):
+        """Copy xarray input that shares memory with the loaded data.
+
+        Parameters
+        ----------
+        in_data : any
+            Input for a single variable, such as a DataArray, a tuple of
+            dimensions and data, or array-like data
+
+        Returns
+        -------
+        any
+            `in_data`, or a deep copy of `in_data` if its values may share
+            memory with a variable in `self.data`
+
+        Note
+        ----
+        Only the memory bounds of the arrays are compared, so inputs that
+        overlap a variable without sharing any values are also copied.
+
+        """
+        values = in_data
+        if isinstance(values, tuple) and len(values) > 1:
+            values = values[1]
+
+        if isinstance(values, xr.DataArray):
+            values = values.data
+        elif isinstance(values, (pds.Series, pds.Index)):
+            values = values.values
+
+        if isinstance(values, np.ndarray):
+            for var in self.data.variables.values():
+                if isinstance(var.data, np.ndarray) and np.may_share_memory(
+                        values, var.data):
+                    return copy_mod.deepcopy(in_data)
+
+        return in_data
+
     def _update_data_types(self, key):
         """Update the data types in pysat.Meta object.
 
@@ -3833,6 +4602,11 @@ def _kwargs_keys_to_func_name(kwargs_key):
     return func_name
 
 
+# Supported keywords for each Instrument routine, discarded along with the
+# routine when a module is reloaded or the routine is replaced
+_supported_keywords_cache = weakref.WeakKeyDictionary()
+
+
 def _get_supported_keywords(local_func):
     """Get a dict of supported keywords.
 
@@ -3852,7 +4626,24 @@ def _get_supported_keywords(local_func):
     includes keywords that have not already been set as part of the
     functools.partial instantiation.
 
+    Results are cached for each function, and are recalculated if the
+    function defaults change.
+
     """
+    # Methods share the keywords of the underlying function
+    cache_func = getattr(local_func, '__func__', local_func)
+    cache_check = (getattr(cache_func, '__defaults__', None),
+                   getattr(cache_func, 'keywords', None))
+
+    try:
+        cached = _supported_keywords_cache.get(cache_func)
+    except TypeError:
+        # Objects that don't support weak references are not cached
+        cached = None
+
+    if cached is not None and all([cached[0][i] is check for i, check
+                                   in enumerate(cache_check)]):
+        return dict(cached[1])
 
     # Account for keywords that are treated by Instrument as args
     pre_kws = _reserved_keywords.copy()
@@ -3901,6 +4692,11 @@ def _get_supported_keywords(local_func):
     # Create the output dict
     out_dict = {akey: func_defaults[i] for i, akey in enumerate(func_args)}
 
+    try:
+        _supported_keywords_cache[cache_func] = (cache_check, dict(out_dict))
+    except TypeError:
+        pass
+
     return out_dict
 
 
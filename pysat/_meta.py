@@ -391,8 +391,11 @@ class Meta(object):
                 if new_name != iname:
                     input_data[new_name] = input_data.pop(iname)
 
-            # Time to actually add the metadata
+            # Time to actually add the metadata, setting all variables for
+            # each label at once
             for ikey in input_data:
+                set_vars = list()
+                set_vals = list()
                 for i, var in enumerate(data_vars):
                     to_be_set = input_data[ikey][i]
                     good_set = True
@@ -456,9 +459,17 @@ class Meta(object):
                         self.labels.update(iattr, ikey, itype)
                         self._label_setter(ikey, ikey, type(to_be_set))
 
-                    # Set the data
+                    # Collect the data
                     if good_set:
-                        self._data.loc[var, ikey] = to_be_set
+                        set_vars.append(var)
+                        set_vals.append(to_be_set)
+
+                # Set the data
+                if len(set_vars) == 1:
+                    self._data.loc[set_vars[0], ikey] = set_vals[0]
+                elif len(set_vars) > 1:
+                    self._data.loc[set_vars, ikey] = pds.Series(
+                        set_vals, index=set_vars, dtype=object)
         elif isinstance(input_data, pds.Series):
             # Outputs from Meta object are a Series. Thus, this takes in input
             # from a Meta object. Set data using standard assignment via a dict.
@@ -706,6 +717,7 @@ class Meta(object):
         else:
             var_types = pysat.utils.listify(data_type)
 
+        var_defaults = list()
         for i, var in enumerate(data_vars):
             # Use the label defaults if this variable doesn't need to consider
             # the data type
@@ -721,8 +733,25 @@ class Meta(object):
             if name_idx is not None:
                 data_default[name_idx] = var
 
-            # Update the meta data to the desired defaults
-            self._data.loc[var, labels] = data_default
+            var_defaults.append(data_default)
+
+        # Update the meta data to the desired defaults.  New variables are
+        # added in a single concatenation instead of one row at a time.
+        new_vars = [var for var in data_vars if var not in self._data.index]
+        if len(new_vars) < len(data_vars):
+            for var, data_default in zip(data_vars, var_defaults):
+                if var not in new_vars:
+                    self._data.loc[var, labels] = data_default
+
+        if len(new_vars) > 0:
+            new_data = pds.DataFrame([data_default for var, data_default
+                                      in zip(data_vars, var_defaults)
+                                      if var in new_vars], index=new_vars,
+                                     columns=labels, dtype=object)
+            mutable = self.mutable
+            self.mutable = True
+            self._data = pds.concat([self._data, new_data])
+            self.mutable = mutable
 
         return
 
@@ -1385,20 +1414,13 @@ class Meta(object):
 
         """
 
-        export_dict = {}
+        # Convert all variables at once. The index holds the stored,
+        # case-preserved variable names.
+        export_dict = self.data.to_dict(orient='index')
 
-        # First Order Data
-        for key in self.data.index:
-            if preserve_case:
-                case_key = self.var_case_name(key)
-            else:
-                case_key = key.lower()
-
-            # Translate each key if a translation is provided
-            export_dict[case_key] = {}
-            meta_dict = self.data.loc[key].to_dict()
-            for orig_key in meta_dict:
-                export_dict[case_key][orig_key] = meta_dict[orig_key]
+        if not preserve_case:
+            export_dict = {key.lower(): meta_dict
+                           for key, meta_dict in export_dict.items()}
 
         return export_dict
 
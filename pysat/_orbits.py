@@ -9,9 +9,11 @@
 # unlimited.
 # ----------------------------------------------------------------------------
 
+from concurrent import futures
 import copy
 import datetime as dt
 import functools
+import importlib
 import numpy as np
 import pandas as pds
 import weakref
@@ -141,6 +143,11 @@ class Orbits(object):
         self._current = 0
         self.orbit_index = index
 
+        # Orbit breaks for recently loaded data, kept across loads so that
+        # stepping back and forth between days doesn't recalculate them
+        self._breaks_cache = dict()
+        self._max_cached_breaks = 4
+
     def __repr__(self):
         """Print the basic Orbits properties."""
 
@@ -190,7 +197,11 @@ class Orbits(object):
         key_check = []
         for key in self.__dict__.keys():
             if key in other.__dict__.keys():
-                if key not in ['_full_day_data', 'inst', '_det_breaks']:
+                if key == '_breaks_cache':
+                    # The cache of orbit breaks doesn't define the object
+                    continue
+
+                elif key not in ['_full_day_data', 'inst', '_det_breaks']:
                     # Standard equality comparison
                     test = np.all(self.__dict__[key] == other.__dict__[key])
                     checks.append(test)
@@ -350,7 +361,13 @@ class Orbits(object):
         return
 
     def _reset(self):
-        """Create null arrays for storing orbit info."""
+        """Create null arrays for storing orbit info.
+
+        Note
+        ----
+        Orbit breaks cached for previously loaded data are retained.
+
+        """
 
         self._orbit_breaks = []
         self.num = 0
@@ -390,17 +407,86 @@ class Orbits(object):
         # Also store the data so that grabbing different orbits does not
         # require reloads of whole dataset.
         if len(self._orbit_breaks) == 0:
-            # Determine orbit breaks
-            self._det_breaks()
+            # Determine orbit breaks, reusing those found for the same data
+            if not self._get_cached_breaks():
+                self._det_breaks()
+                self._cache_breaks()
 
-            # Store a copy of data
-            self._full_day_data = self.inst.data.copy()
+            # Store a reference to the data. Orbits are slices of this data,
+            # which is replaced rather than altered by `Instrument.load`.
+            self._full_day_data = self.inst.data
 
             # Set current orbit counter to zero (default)
             self._current = 0
 
         return
 
+    def _get_breaks_key(self):
+        """Get the data used to identify orbit breaks for the loaded data.
+
+        Returns
+        -------
+        key : tuple or NoneType
+            Loaded date, data range, and orbit period used to look up the
+            orbit breaks, or None if the orbit breaks can't be cached
+        values : tuple or NoneType
+            Time index and orbit index values used to validate the orbit
+            breaks, or None if the orbit breaks can't be cached
+
+        """
+        if self.orbit_index not in self.inst.variables:
+            return None, None
+
+        index = self.inst.index
+        key = (self.inst.date, index[0], index[-1], len(index),
+               self.orbit_period)
+        values = (index.values, np.asarray(self.inst[self.orbit_index]))
+
+        return key, values
+
+    def _get_cached_breaks(self):
+        """Set the orbit breaks from the cache, if they match the loaded data.
+
+        Returns
+        -------
+        bool
+            True if the orbit breaks and number of orbits were set from the
+            cache, False if they need to be determined
+
+        """
+        key, values = self._get_breaks_key()
+        if key is None or key not in self._breaks_cache:
+            return False
+
+        cached_values, breaks, num = self._breaks_cache[key]
+        for cached, value in zip(cached_values, values):
+            if cached.shape != value.shape or not np.array_equal(
+                    cached, value, equal_nan=(value.dtype.kind == 'f')):
+                return False
+
+        self._orbit_breaks = breaks
+        self.num = num
+
+        return True
+
+    def _cache_breaks(self):
+        """Store the orbit breaks determined for the loaded data."""
+
+        key, values = self._get_breaks_key()
+        if key is None:
+            return
+
+        # Copy the values, since the loaded data may be altered by the user
+        self._breaks_cache.pop(key, None)
+        self._breaks_cache[key] = (tuple(value.copy() for value in values),
+                                   self._orbit_breaks, self.num)
+
+        # Remove the oldest entries, which are first in the dict
+        while len(self._breaks_cache) > self._max_cached_breaks:
+            del self._breaks_cache[next(iter(self._breaks_cache))]
+
+        return
+
     def _equa_breaks(self, orbit_index_period=24.0):
         """Determine where breaks in an equatorial satellite orbit occur.
 
@@ -912,6 +998,102 @@ class Orbits(object):
 
         return
 
+    def map(self, func, *args, workers=1, **kwargs):
+        """Apply a function to each orbit within the Instrument bounds.
+
+        Parameters
+        ----------
+        func : function
+            Function called as `func(inst, *args, **kwargs)` for each orbit,
+            where `inst` is an Instrument with the orbit data loaded
+        *args : list
+            Arguments passed to `func`
+        workers : int
+            Number of processes used to apply `func`.  If one, the orbits are
+            processed in the current process. (default=1)
+        **kwargs : dict
+            Keyword arguments passed to `func`
+
+        Returns
+        -------
+        results : list
+            Output of `func` for each orbit, in orbit order
+
+        Raises
+        ------
+        ValueError
+            If `workers` is less than one, or if `workers` is greater than one
+            and the Instrument bounds are set by file
+
+        Note
+        ----
+        The orbits are loaded by a new Instrument with the same settings, so
+        the data and iteration state of this Instrument are not changed.
+
+        With more than one worker, the dates within the bounds are split into
+        contiguous blocks.  Each worker creates a new Instrument with the same
+        settings and iterates over the orbits of its block, using the same
+        bounds step and width, also loading the dates on either side so that
+        orbits spanning the edges of the block are complete.
+        An orbit is processed by the worker whose block contains the first
+        time of the orbit.  The instrument module must be importable, and
+        `func`, its arguments, and any custom functions must be picklable.
+
+        Examples
+        --------
+        ::
+
+            def orbit_mean(inst, var):
+                return inst[var].mean()
+
+            inst.bounds = (dt.datetime(2009, 1, 1), dt.datetime(2009, 12, 31))
+            means = inst.orbits.map(orbit_mean, 'mlt', workers=8)
+
+        """
+        if workers < 1:
+            raise ValueError('`workers` must be at least one.')
+
+        if workers == 1:
+            local_inst = self.inst.clone()
+            local_inst.bounds = self.inst.bounds
+            return [func(orbit_inst, *args, **kwargs)
+                    for orbit_inst in local_inst.orbits]
+
+        if self.inst._iter_type != 'date':
+            raise ValueError(''.join(['Orbits may only be mapped by more than',
+                                      ' one worker for bounds set by date.']))
+
+        # Split the dates into contiguous blocks, one for each worker
+        dates = pds.DatetimeIndex(self.inst._iter_list)
+        blocks = [block for block in np.array_split(np.arange(len(dates)),
+                                                    workers) if len(block) > 0]
+
+        # Set the Instrument settings, with the module imported by the workers
+        inst_kwargs = self.inst._get_clone_kwargs()
+        inst_kwargs['tag'] = self.inst.tag
+        inst_kwargs['inst_id'] = self.inst.inst_id
+        if inst_kwargs['inst_module'] is not None:
+            inst_kwargs['inst_module'] = inst_kwargs['inst_module'].__name__
+
+        results = list()
+        with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            jobs = list()
+            for i, block in enumerate(blocks):
+                load_dates = list(dates[max(block[0] - 1, 0):block[-1] + 2])
+                keep_start = None if i == 0 else dates[block[0]]
+                keep_stop = None if i == len(blocks) - 1 else dates[
+                    block[-1] + 1]
+                jobs.append(executor.submit(_map_orbit_block, inst_kwargs,
+                                            self.inst.bounds, load_dates,
+                                            keep_start, keep_stop, func, args,
+                                            kwargs))
+
+            # Gather the results in order, raising any errors from the workers
+            for job in jobs:
+                results.extend(job.result())
+
+        return results
+
     def next(self):
         """Load the next orbit into associated `Instrument.data` object.
 
@@ -951,7 +1133,7 @@ class Orbits(object):
                     # The end of the user's desired orbit occurs tomorrow, need
                     # to form a complete orbit save this current orbit, load
                     # the next day, combine data, select the correct orbit
-                    temp_orbit_data = self.inst.copy()
+                    temp_orbit_data = self.inst.data
                     try:
                         # Loading next day/file clears orbit breaks info
                         self.inst.next()
@@ -960,8 +1142,10 @@ class Orbits(object):
                             # orbit, grab the first one
                             final_val = self.inst.index[0] - dt.timedelta(
                                 microseconds=1)
-                            self.inst.concat_data(temp_orbit_data[:final_val],
-                                                  prepend=True)
+                            self.inst.concat_data(
+                                self.inst.__getitem__(slice(None, final_val),
+                                                      data=temp_orbit_data),
+                                prepend=True)
                             self._get_basic_orbit(1)
                         else:
                             # No data, go back a day and grab the last orbit.
@@ -977,7 +1161,7 @@ class Orbits(object):
             elif self._current == (self.num):
                 # At the last orbit, need to be careful about getting the next
                 # orbit save this current orbit and load the next day
-                temp_orbit_data = self.inst.copy()
+                temp_orbit_data = self.inst.data
 
                 # Load next day, which clears orbit breaks info
                 self.inst.next()
@@ -990,7 +1174,8 @@ class Orbits(object):
                     # Check if data padding is really needed, only works when
                     # loading by date
                     if self.inst._iter_type == 'date':
-                        delta = self.inst.date - temp_orbit_data.index[-1]
+                        delta = (self.inst.date
+                                 - self.inst._index(temp_orbit_data)[-1])
                         if delta >= self.orbit_period:
                             # The end of the previous orbit is more than an
                             # orbit away from today we don't have to worry
@@ -999,9 +1184,11 @@ class Orbits(object):
                     if pad_next:
                         # The orbit went across day break, stick old orbit onto
                         # new data and grab second orbit (first is old)
+                        final_val = self.inst.index[0] - dt.timedelta(
+                            microseconds=1)
                         self.inst.concat_data(
-                            temp_orbit_data[:self.inst.index[0]
-                                            - dt.timedelta(microseconds=1)],
+                            self.inst.__getitem__(slice(None, final_val),
+                                                  data=temp_orbit_data),
                             prepend=True)
 
                         # Select second orbit of combined data
@@ -1191,3 +1378,57 @@ class Orbits(object):
             self.prev()
 
         return
+
+
+def _map_orbit_block(inst_kwargs, bounds, load_dates, keep_start, keep_stop,
+                     func, args, kwargs):
+    """Apply a function to the orbits that start within a block of dates.
+
+    Parameters
+    ----------
+    inst_kwargs : dict
+        Keyword arguments used to create the Instrument, with the name of the
+        instrument module in 'inst_module'
+    bounds : tuple
+        Instrument bounds, which set the step and width of each load
+    load_dates : list
+        Dates within the bounds to iterate over
+    keep_start : pds.Timestamp or NoneType
+        Earliest first time of the orbits to process, or None to start with
+        the first orbit
+    keep_stop : pds.Timestamp or NoneType
+        First time after the orbits to process, or None to end with the last
+        orbit
+    func : function
+        Function called as `func(inst, *args, **kwargs)` for each orbit
+    args : tuple
+        Arguments passed to `func`
+    kwargs : dict
+        Keyword arguments passed to `func`
+
+    Returns
+    -------
+    results : list
+        Output of `func` for each orbit, in orbit order
+
+    """
+    inst_kwargs = dict(inst_kwargs)
+    if inst_kwargs['inst_module'] is not None:
+        inst_kwargs['inst_module'] = importlib.import_module(
+            inst_kwargs['inst_module'])
+
+    inst = pysat.Instrument(**inst_kwargs)
+    # Use the full bounds, so that each load has the same width, and only
+    # iterate over the dates of this block
+    inst.bounds = bounds
+    inst._iter_list = inst._iter_list[inst._iter_list.isin(load_dates)]
+
+    results = list()
+    for orbit_inst in inst.orbits:
+        if keep_stop is not None and orbit_inst.index[0] >= keep_stop:
+            break
+
+        if keep_start is None or orbit_inst.index[0] >= keep_start:
+            results.append(func(orbit_inst, *args, **kwargs))
+
+    return results
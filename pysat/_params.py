@@ -9,9 +9,12 @@
 # unlimited.
 # ----------------------------------------------------------------------------
 
+from contextlib import contextmanager
 import copy
 import json
 import os
+import threading
+import time
 
 from portalocker import Lock
 
@@ -37,6 +40,9 @@ class Parameters(object):
 
     Attributes
     ----------
+    check_interval : float
+        Minimum time in seconds between checks for changes to the settings
+        file made by other processes (default=1.0)
     data : dict
         pysat user settings dictionary
     defaults : dict
@@ -44,7 +50,9 @@ class Parameters(object):
         {'clean_level': 'clean', 'directory_format':
         os.path.join('{platform}', '{name}', '{tag}', '{inst_id}'),
         'ignore_empty_files': False, 'update_files': True,
-        'file_timeout': 10, 'user_modules' : {}, 'warn_empty_file_list': False}
+        'file_timeout': 10, 'file_list_timeout': 600, 'file_list_ttl': 0,
+        'file_inventory': False, 'file_inventory_checksum': False,
+        'user_modules' : {}, 'warn_empty_file_list': False}
     file_path : str
         Location of file used to store settings
     non_defaults : list
@@ -65,20 +73,36 @@ class Parameters(object):
     current working directory and then in the home '~/.pysat' directory.
 
     All pysat parameters are automatically stored whenever a parameter is
-    assigned or modified. The default parameters and values tracked by this
-    class are grouped by type below.
+    assigned or modified. Several assignments may be stored at once using
+    `batch`. Parameters are read from memory, and are reloaded when the
+    settings file was changed by another process. The default parameters and
+    values tracked by this class are grouped by type below.
 
     Values that map to the corresponding keywords on pysat.Instrument:
     clean_level, directory_format, ignore_empty_files, and update_files.  See
     the Instrument docstring for more information on these keywords.
 
-    Values that map to internal pysat settings: file_timeout, user_modules, and
-    warn_empty_file_list.
+    Values that map to internal pysat settings: file_timeout,
+    file_list_timeout, file_list_ttl, file_inventory, file_inventory_checksum,
+    user_modules, and warn_empty_file_list.
 
     Stored pysat parameters without a working default value: data_dirs.
 
     file_timeout -  Time in seconds that pysat will wait to modify a busy file
 
+    file_list_timeout - Time in seconds that pysat will wait for another
+    process to finish updating a stored Instrument file list
+
+    file_list_ttl - Age in seconds below which a stored Instrument file list is
+    reused instead of searching the data directories when an Instrument is
+    created with the same file search settings, 0 to always search
+
+    file_inventory - Keep a persistent inventory of the size, modification
+    time, and time coverage of each Instrument file
+
+    file_inventory_checksum - Also record the checksum of each file in the
+    inventory, which requires reading every new or changed file
+
     user_modules - Stores information on modules registered by pysat
 
     warn_empty_file_list - Raise a warning when no Instrument files are found
@@ -93,6 +117,14 @@ class Parameters(object):
         sfname = 'pysat_settings.json'
         self.data = {}
         self.file_path = None
+        self.check_interval = 1.0
+
+        # Hidden state for batched writes and settings file change checks
+        self._batch_depth = 0
+        self._batch_pending = False
+        self._file_stamp = None
+        self._stored_data = None
+        self._last_check = time.monotonic()
 
         # Define default parameters and values
         dir_format = os.path.join('{platform}', '{name}', '{tag}', '{inst_id}')
@@ -100,6 +132,10 @@ class Parameters(object):
                     'directory_format': dir_format,
                     'ignore_empty_files': False,
                     'file_timeout': 10,
+                    'file_list_timeout': 600,
+                    'file_list_ttl': 0,
+                    'file_inventory': False,
+                    'file_inventory_checksum': False,
                     'update_files': True,
                     'user_modules': {},
                     'warn_empty_file_list': False}
@@ -147,19 +183,8 @@ class Parameters(object):
             # Initialize new settings file. Method below includes a .store call
             self.clear_and_restart()
 
-        # Load parameters in thread-safe manner.
-        # Can't use user set file_timeout since we don't know what it is yet.
-        # Can't use NetworkLock in pysat.utils either since this object (params)
-        # doesn't exist yet.
-        with Lock(self.file_path, 'r', timeout=10) as fout:
-            self.data = json.load(fout)
-            fout.flush()
-            try:
-                # In case of network file system
-                os.fsync(fout.fileno())
-            except OSError:
-                # Not a network file system
-                pass
+        # Load the parameters stored in the settings file
+        self._load()
 
         return
 
@@ -229,6 +254,7 @@ class Parameters(object):
 
     def __getitem__(self, item):
         """Get item from Parameters."""
+        self._reload_if_changed()
         return self.data[item]
 
     def __setitem__(self, key, value):
@@ -251,6 +277,93 @@ class Parameters(object):
         # Store updated parameters to disk
         self.store()
 
+    def _load(self):
+        """Load the parameters from the settings file."""
+
+        # Load parameters in thread-safe manner, holding the lock file shared
+        # with `store` so the settings file is never replaced while open.
+        # Can't use user set file_timeout since we don't know what it is yet.
+        # Can't use NetworkLock in pysat.utils either since this object (params)
+        # doesn't exist yet.
+        lock = Lock(self._lock_path, 'a', timeout=10)
+        try:
+            lock.acquire()
+        except OSError:
+            # The lock file can't be created without write access to the
+            # settings directory. Since `store` replaces the settings file at
+            # once, it may still be read without the lock.
+            lock = None
+
+        try:
+            with open(self.file_path, 'r') as fout:
+                self._file_stamp = self._get_file_stamp(
+                    os.fstat(fout.fileno()))
+                self.data = json.load(fout)
+        finally:
+            if lock is not None:
+                lock.release()
+
+        # Use the default values for any parameters missing from a settings
+        # file written by an earlier version of pysat
+        for key in self.defaults.keys():
+            if key not in self.data.keys():
+                self.data[key] = copy.deepcopy(self.defaults[key])
+
+        self._stored_data = copy.deepcopy(self.data)
+
+        return
+
+    @property
+    def _lock_path(self):
+        """Get the name of the lock file used to read and store settings."""
+        return '.'.join([self.file_path, 'lock'])
+
+    @staticmethod
+    def _get_file_stamp(fstat):
+        """Get the values used to identify a version of the settings file.
+
+        Parameters
+        ----------
+        fstat : os.stat_result
+            Settings file status
+
+        Returns
+        -------
+        tuple
+            File inode, modification time in nanoseconds, and size. As the
+            file is replaced on each store, the inode changes with each write.
+
+        """
+        return (fstat.st_ino, fstat.st_mtime_ns, fstat.st_size)
+
+    def _reload_if_changed(self):
+        """Reload the parameters if the settings file changed on disk.
+
+        Note
+        ----
+        The settings file modification time, size, and inode are checked at
+        most once every `check_interval` seconds, and never within a `batch`
+        or while `self.data` has changes that have not been stored.
+
+        """
+        now = time.monotonic()
+        if self._batch_depth > 0 \
+                or (now - self._last_check) < self.check_interval \
+                or self.data != self._stored_data:
+            return
+
+        self._last_check = now
+        try:
+            stamp = self._get_file_stamp(os.stat(self.file_path))
+        except OSError:
+            # The settings file is missing, keep the current parameters
+            return
+
+        if stamp != self._file_stamp:
+            self._load()
+
+        return
+
     def _set_data_dirs(self, path=None, store=True):
         """Set the top level directories pysat uses to store and load data.
 
@@ -332,11 +445,57 @@ class Parameters(object):
 
         return
 
+    @contextmanager
+    def batch(self):
+        """Store all parameter changes made within a block at once.
+
+        Note
+        ----
+        Parameters assigned within the block are available immediately, but
+        are only written to the settings file when the outermost block ends.
+        Changes made to the settings file by other processes are not loaded
+        within the block.
+
+        Examples
+        --------
+        ::
+
+            with pysat.params.batch():
+                pysat.params['data_dirs'] = path
+                pysat.params['update_files'] = False
+
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_pending:
+                self.store()
+
+        return
+
     def store(self):
-        """Store parameters using the filename specified in `self.file_path`."""
+        """Store parameters using the filename specified in `self.file_path`.
+
+        Note
+        ----
+        Within a `batch`, the parameters are stored when the batch ends.
+        Otherwise, the parameters are written to a temporary file that then
+        replaces the settings file, so other processes never read a partially
+        written file. The replacement holds the same lock file as loading, so
+        the settings file is never replaced while another process reads it.
+
+        """
 
-        # Store settings in file
-        with Lock(self.file_path, 'w', self['file_timeout']) as fout:
+        if self._batch_depth > 0:
+            self._batch_pending = True
+            return
+
+        # Store settings in a temporary file and move it into place
+        temp_name = '.'.join([self.file_path, str(os.getpid()),
+                              str(threading.get_ident()), 'tmp'])
+        with open(temp_name, 'w') as fout:
             json.dump(self.data, fout)
 
             # Ensure write is fully complete even for network file systems
@@ -348,4 +507,11 @@ class Parameters(object):
                 # Not a network file system
                 pass
 
+        with Lock(self._lock_path, 'a', timeout=self['file_timeout']):
+            os.replace(temp_name, self.file_path)
+            self._file_stamp = self._get_file_stamp(os.stat(self.file_path))
+
+        self._stored_data = copy.deepcopy(self.data)
+        self._batch_pending = False
+
         return
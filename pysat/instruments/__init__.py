@@ -4,8 +4,8 @@
 Each instrument is contained within a subpackage of this set.
 """
 
-__all__ = ['pysat_ndtesting', 'pysat_netcdf', 'pysat_testing',
-           'pysat_testmodel']
+__all__ = ['pysat_ndtesting', 'pysat_netcdf', 'pysat_parquet',
+           'pysat_testing', 'pysat_testmodel', 'pysat_zarr']
 
 for inst in __all__:
     exec("from pysat.instruments import {x}".format(x=inst))
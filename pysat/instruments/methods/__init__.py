@@ -5,4 +5,5 @@ Each set of methods is contained within a subpackage of this set.
 """
 
 from pysat.instruments.methods import general  # noqa: F401
+from pysat.instruments.methods import pysat_files  # noqa: F401
 from pysat.instruments.methods import testing  # noqa: F401
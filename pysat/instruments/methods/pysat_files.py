@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+# -*- coding: utf-8 -*-
+"""Provides routines shared by the Instruments that load pysat-written files."""
+
+import warnings
+
+
+def init(self, pandas_format=True):
+    """Initialize the Instrument object with instrument specific values.
+
+    Parameters
+    ----------
+    self : pysat.Instrument
+        Instrument class object
+    pandas_format : bool
+        Flag specifying if data is stored in a pandas DataFrame (True) or
+        xarray Dataset (False). (default=True)
+
+    """
+
+    self.acknowledgements = "Acknowledgements missing from file"
+    self.references = "References missing from file"
+    self.pandas_format = pandas_format
+
+    return
+
+
+def clean(self):
+    """Clean the file data.
+
+    Parameters
+    ----------
+    self : pysat.Instrument
+        Instrument class object
+
+    """
+    return
+
+
+def preprocess(self):
+    """Extract Instrument attrs from file attrs loaded to `Meta.header`.
+
+    Parameters
+    ----------
+    self : pysat.Instrument
+        Instrument class object
+
+    """
+
+    if hasattr(self.meta, "header"):
+        for iattr in ['platform', 'name', 'tag', 'inst_id', 'acknowledgements',
+                      'references']:
+            if hasattr(self.meta.header, iattr):
+                setattr(self, iattr, getattr(self.meta.header, iattr))
+
+    return
+
+
+def build_download(file_type):
+    """Build the `download` function for a pysat file Instrument.
+
+    Parameters
+    ----------
+    file_type : str
+        File type used in the warning message
+
+    Returns
+    -------
+    download : function
+        Download function that warns that downloads are not supported
+
+    """
+
+    def download(date_array, tag, inst_id, data_path=None):
+        """Download data from the remote repository; not supported.
+
+        Parameters
+        ----------
+        date_array : array-like
+            list of datetimes to download data for. The sequence of dates need
+            not be contiguous.
+        tag : str
+            Tag identifier used for particular dataset. This input is provided
+            by pysat. (default='')
+        inst_id : str
+            Satellite ID string identifier used for particular dataset. This
+            input is provided by pysat. (default='')
+        data_path : str or NoneType
+            Path to directory to download data to. (default=None)
+
+        Warnings
+        --------
+        UserWarning
+            Always, since downloads are not supported.
+
+        """
+
+        warnings.warn("".join(["Downloads are not currently supported for ",
+                               "pysat {:s} files".format(file_type)]))
+        return
+
+    return download
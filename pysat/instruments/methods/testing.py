@@ -10,7 +10,9 @@
 # ----------------------------------------------------------------------------
 """Standard functions for the test instruments."""
 
+from concurrent import futures
 import datetime as dt
+import itertools
 import os
 
 import numpy as np
@@ -585,15 +587,18 @@ def generate_times(fnames, num, freq='1s', start_time=None):
             start_date = date
         index = pds.date_range(start=start_date, end=end_date, freq=freq)
         index = index[0:num]
-        indices.extend(index)
-        uts.extend(index.hour * 3600 + index.minute * 60 + index.second
-                   + index.microsecond * 1e-6 + 86400. * loop)
-
-    # Combine index times together
-    index = pds.DatetimeIndex(indices)
-
-    # Make UTS an array
-    uts = np.array(uts)
+        indices.append(index.values)
+        uts.append(np.asarray(index.hour * 3600 + index.minute * 60
+                              + index.second + index.microsecond * 1e-6
+                              + 86400. * loop))
+
+    # Combine index times and UTS together as arrays
+    if len(indices) == 0:
+        index = pds.DatetimeIndex([])
+        uts = np.array([])
+    else:
+        index = pds.DatetimeIndex(np.concatenate(indices))
+        uts = np.concatenate(uts)
 
     return uts, index, dates
 
@@ -729,6 +734,206 @@ def create_files(inst, start, stop, freq='1D', use_doy=True,
     return
 
 
+def _write_archive_files(data_path, files, num_samples, num_vars,
+                         file_period, content):
+    """Write a set of synthetic archive files.
+
+    Parameters
+    ----------
+    data_path : str
+        Directory for the files
+    files : pds.DataFrame
+        File names in the 'fname' column, indexed by file time, with True in
+        the 'empty' column for files written without data
+    num_samples : int
+        Number of times in each file with data
+    num_vars : int
+        Number of data variables in each file with data
+    file_period : pds.DateOffset
+        Time covered by each file
+    content : str or NoneType
+        Text written to the files that are not empty, if `num_samples` is zero
+
+    """
+    for ftime, fname, empty in zip(files.index, files['fname'].values,
+                                   files['empty'].values):
+        fname = os.path.join(data_path, fname)
+        if empty or num_samples == 0:
+            with open(fname, 'w') as fout:
+                if content is not None and not empty:
+                    fout.write(content)
+            continue
+
+        # Spread the samples evenly over the time covered by the file
+        ftime = pds.Timestamp(ftime)
+        step = ((ftime + file_period) - ftime) / num_samples
+        index = ftime + pds.to_timedelta(step.value * np.arange(num_samples),
+                                         unit='ns')
+        uts = (index - index.normalize()).total_seconds().values
+        epoch = ((index - pds.Timestamp(1970, 1, 1))
+                 // pds.Timedelta(milliseconds=1)).values
+
+        data = {'Epoch': ('Epoch', epoch.astype(np.int64),
+                          {'units': 'Milliseconds since 1970-1-1 00:00:00',
+                           'long_name': 'Epoch'})}
+        data['uts'] = ('Epoch', uts, {'units': 's',
+                                      'long_name': 'Universal Time'})
+        for i in range(num_vars):
+            data['dummy{:d}'.format(i)] = (
+                'Epoch', np.mod(uts / 3600.0 + i, 24.0),
+                {'units': 'hours', 'long_name': 'dummy{:d}'.format(i)})
+
+        xr.Dataset(data).to_netcdf(fname, format='NETCDF4')
+    return
+
+
+def create_archive(inst, start, stop, freq='1D',
+                   root_fname=''.join(['pysat_archive_{year:04d}{month:02d}',
+                                       '{day:02d}_{hour:02d}{minute:02d}',
+                                       '{second:02d}_v{version:02d}.nc']),
+                   versions=None, revisions=None, cycles=None, gaps=None,
+                   missing_fraction=0.0, empty_fraction=0.0, num_samples=0,
+                   num_vars=1, content=None, workers=1, seed=None):
+    """Create a synthetic archive of data files for scaling tests.
+
+    Parameters
+    ----------
+    inst : pysat.Instrument
+        A test instrument, used to generate file path
+    start : dt.datetime
+        The time for the first file to create
+    stop : dt.datetime
+        The time for the last file to create
+    freq : str
+        Frequency of file output, with several files a day created by
+        frequencies shorter than a day.  Codes correspond to pandas.date_range
+        codes (default='1D')
+    root_fname : str
+        The format of the file name to create. Supports standard pysat template
+        variables 'year', 'month', 'day', 'hour', 'minute', 'second', 'version',
+        'revision', 'cycle'. (default='pysat_archive_{year:04d}{month:02d}
+        {day:02d}_{hour:02d}{minute:02d}{second:02d}_v{version:02d}.nc')
+    versions : list or NoneType
+        Versions to create for each file time, or None to create version 1
+        (default=None)
+    revisions : list or NoneType
+        Revisions to create for each file time and version, or None to create
+        revision 0 (default=None)
+    cycles : list or NoneType
+        Cycles to create for each file time, version, and revision, or None to
+        create cycle 0 (default=None)
+    gaps : list or NoneType
+        List of (start, stop) tuples, where no files are created for times
+        from start up to, but not including, stop, or None to create files at
+        all times (default=None)
+    missing_fraction : float
+        Fraction of file times, chosen at random, without any files
+        (default=0.0)
+    empty_fraction : float
+        Fraction of files, chosen at random, written without any data
+        (default=0.0)
+    num_samples : int
+        Number of times in each netCDF file, spread evenly over the time
+        covered by the file.  If zero, placeholder files are created.
+        (default=0)
+    num_vars : int
+        Number of data variables in each netCDF file (default=1)
+    content : str or NoneType
+        Custom text to write to placeholder files that are not empty
+        (default=None)
+    workers : int
+        Number of processes used to write the files (default=1)
+    seed : int or NoneType
+        Seed for the random selection of missing and empty files (default=None)
+
+    Returns
+    -------
+    files : pds.Series
+        Names of the created files, relative to `inst.files.data_path`,
+        indexed by file time
+
+    Raises
+    ------
+    ValueError
+        If `workers` is less than one
+
+    Note
+    ----
+    Files with data may be loaded with the 'pysat_netcdf' Instrument, using
+    `root_fname` as the `file_format`.  Each file contains the universal time
+    'uts' and the data variables 'dummy0', 'dummy1', etc.
+
+    Examples
+    --------
+    ::
+
+        # Create a year of hourly files with data at 1 s cadence, where a
+        # second version exists for every file and a week of data is missing
+        import datetime as dt
+        inst = pysat.Instrument('pysat', 'netcdf')
+        create_archive(inst, dt.datetime(2008, 1, 1),
+                       dt.datetime(2008, 12, 31, 23), freq='1h',
+                       versions=[1, 2], num_samples=3600, workers=8,
+                       gaps=[(dt.datetime(2008, 6, 1),
+                              dt.datetime(2008, 6, 8))])
+
+    """
+    if workers < 1:
+        raise ValueError('`workers` must be at least one.')
+
+    if versions is None:
+        versions = [1]
+
+    if revisions is None:
+        revisions = [0]
+
+    if cycles is None:
+        cycles = [0]
+
+    rng = np.random.default_rng(seed)
+
+    # Define the file times, removing the gaps and missing files
+    dates = pds.DatetimeIndex(putime.create_date_range(start, stop, freq=freq))
+    keep = np.ones(shape=len(dates), dtype=bool)
+    for gap_start, gap_stop in ([] if gaps is None else gaps):
+        keep &= (dates < gap_start) | (dates >= gap_stop)
+    keep &= rng.random(len(dates)) >= missing_fraction
+    dates = dates[keep]
+
+    # Create a file for each combination of version, revision, and cycle
+    vrc = list(itertools.product(versions, revisions, cycles))
+    fnames = [root_fname.format(year=date.year, month=date.month,
+                                day=date.day, hour=date.hour,
+                                minute=date.minute, second=date.second,
+                                version=version, revision=revision,
+                                cycle=cycle)
+              for date in dates for version, revision, cycle in vrc]
+    files = pds.DataFrame({'fname': fnames,
+                           'empty': rng.random(len(fnames)) < empty_fraction},
+                          index=dates.repeat(len(vrc)))
+
+    os.makedirs(inst.files.data_path, exist_ok=True)
+    file_period = pds.tseries.frequencies.to_offset(freq)
+    if workers == 1 or len(files) <= 1:
+        _write_archive_files(inst.files.data_path, files, num_samples,
+                             num_vars, file_period, content)
+    else:
+        chunks = np.array_split(np.arange(len(files)), workers)
+        # HDF5 is not thread-safe, so netCDF files are written by processes
+        with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            jobs = [executor.submit(_write_archive_files,
+                                    inst.files.data_path, files.iloc[chunk],
+                                    num_samples, num_vars, file_period,
+                                    content)
+                    for chunk in chunks if len(chunk) > 0]
+
+            # Raise any errors from the workers
+            for job in jobs:
+                job.result()
+
+    return files['fname']
+
+
 def non_monotonic_index(index):
     """Adjust the index to be non-monotonic.
 
@@ -48,7 +48,7 @@ def load(fnames, tag='', inst_id='', sim_multi_file_right=False,
          sim_multi_file_left=False, root_date=None, non_monotonic_index=False,
          non_unique_index=False, start_time=None, num_samples=864,
          sample_rate='100s', test_load_kwarg=None, max_latitude=90.0,
-         num_extra_time_coords=0):
+         num_extra_time_coords=0, num_image_pixels=7, num_profile_heights=5):
     """Load the test files.
 
     Parameters
@@ -91,6 +91,10 @@ def load(fnames, tag='', inst_id='', sim_multi_file_right=False,
         theta is a linear periodic signal bounded by [0, 2 * pi) (default=90.0)
     num_extra_time_coords : int
         Number of extra time coordinates to include. (default=0)
+    num_image_pixels : int
+        Number of pixels along each side of the fake images. (default=7)
+    num_profile_heights : int
+        Number of heights in the fake profiles. (default=5)
 
     Returns
     -------
@@ -201,17 +205,17 @@ def load(fnames, tag='', inst_id='', sim_multi_file_right=False,
                                    dtype=np.int64))
 
     # Add dummy coords
-    data.coords['x'] = (('x'), np.arange(7))
-    data.coords['y'] = (('y'), np.arange(7))
-    data.coords['z'] = (('z'), np.arange(5))
+    data.coords['x'] = (('x'), np.arange(num_image_pixels))
+    data.coords['y'] = (('y'), np.arange(num_image_pixels))
+    data.coords['z'] = (('z'), np.arange(num_profile_heights))
 
-    # Add extra time coords
+    # Add extra time coords, offsetting each time by one more microsecond
+    # than the previous time
     for i in range(num_extra_time_coords):
         ckey = 'time{:d}'.format(i)
         tindex = data.indexes[epoch_name][:-1 * (i + 1)]
-        data.coords[ckey] = (
-            (ckey), [itime + dt.timedelta(microseconds=1 + i)
-                     for i, itime in enumerate(tindex)])
+        data.coords[ckey] = ((ckey), tindex + pds.to_timedelta(
+            np.arange(1, len(tindex) + 1), unit='us'))
 
     # Create altitude 'profile' at each location to simulate remote data
     num = len(data['uts'])
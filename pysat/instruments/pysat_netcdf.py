@@ -49,10 +49,10 @@ Examples
 
 import datetime as dt
 import functools
-import warnings
 
 import pysat
 from pysat.instruments.methods import general
+from pysat.instruments.methods import pysat_files as mm_files
 
 logger = pysat.logger
 
@@ -73,32 +73,9 @@ _test_download_ci = {'': {'': False}}
 
 # ----------------------------------------------------------------------------
 # Instrument methods
-def init(self, pandas_format=True):
-    """Initialize the Instrument object with instrument specific values."""
-
-    self.acknowledgements = "Acknowledgements missing from file"
-    self.references = "References missing from file"
-    self.pandas_format = pandas_format
-
-    return
-
-
-def clean(self):
-    """Clean the file data."""
-    return
-
-
-def preprocess(self):
-    """Extract Instrument attrs from file attrs loaded to `Meta.header`."""
-
-    if hasattr(self.meta, "header"):
-        for iattr in ['platform', 'name', 'tag', 'inst_id', 'acknowledgements',
-                      'references']:
-            if hasattr(self.meta.header, iattr):
-                setattr(self, iattr, getattr(self.meta.header, iattr))
-
-    return
-
+init = mm_files.init
+clean = mm_files.clean
+preprocess = mm_files.preprocess
 
 # ----------------------------------------------------------------------------
 # Instrument functions
@@ -108,37 +85,14 @@ supported_tags = {inst_id: {tag: format_str for tag in tags.keys()}
                   for inst_id in inst_ids.keys()}
 list_files = functools.partial(general.list_files, format_str=format_str,
                                supported_tags=supported_tags)
-
-
-def download(date_array, tag, inst_id, data_path=None):
-    """Download data from the remote repository; not supported.
-
-    Parameters
-    ----------
-    date_array : array-like
-        list of datetimes to download data for. The sequence of dates need not
-        be contiguous.
-    tag : str
-        Tag identifier used for particular dataset. This input is provided by
-        pysat. (default='')
-    inst_id : str
-        Satellite ID string identifier used for particular dataset. This input
-        is provided by pysat. (default='')
-    data_path : str or NoneType
-        Path to directory to download data to. (default=None)
-
-    """
-
-    warnings.warn("".join(["Downloads are not currently supported for ",
-                           "pysat netCDF files"]))
-    return
+download = mm_files.build_download('netCDF')
 
 
 def load(fnames, tag='', inst_id='', strict_meta=False, file_format='NETCDF4',
          epoch_name=None, epoch_unit='ms', epoch_origin='unix',
          pandas_format=True, decode_timedelta=False, meta_kwargs=None,
          meta_processor=None, meta_translation=None,
-         drop_meta_labels=None, decode_times=None):
+         drop_meta_labels=None, decode_times=None, mmap=False):
     """Load pysat-created NetCDF data and meta data.
 
     Parameters
@@ -209,6 +163,14 @@ def load(fnames, tag='', inst_id='', strict_meta=False, file_format='NETCDF4',
         then `epoch_name` will be converted to datetime using `epoch_unit`
         and `epoch_origin`. If None, will be set to False for backwards
         compatibility. For xarray only. (default=None)
+    mmap : bool
+        If True, memory-map the contiguous, uncompressed numeric variables
+        instead of reading them into memory. Changes to the loaded data are
+        copied on write and never change the file. Fill values are not
+        replaced. Files written with `unlimited_time=True` (the default) are
+        chunked and are always read into memory. Mapping NETCDF4 files
+        requires `h5py`, without which the file is read into memory.
+        (default=False)
 
     Returns
     -------
@@ -231,6 +193,64 @@ def load(fnames, tag='', inst_id='', strict_meta=False, file_format='NETCDF4',
                                              meta_processor=meta_processor,
                                              meta_translation=meta_translation,
                                              drop_meta_labels=drop_meta_labels,
-                                             decode_times=decode_times)
+                                             decode_times=decode_times,
+                                             mmap=mmap)
 
     return data, mdata
+
+
+def inspect(fnames, tag='', inst_id='', epoch_name=None, epoch_unit='ms',
+            epoch_origin='unix', meta_kwargs=None, meta_processor=None,
+            meta_translation=None, drop_meta_labels=None):
+    """Get the variables, time coverage, and metadata of pysat netCDF files.
+
+    Parameters
+    ----------
+    fnames : array-like
+        iterable of filename strings, full path, to data files to be inspected.
+        This input is nominally provided by pysat itself.
+    tag : str
+        Tag name used to identify particular data set to be inspected.
+        This input is nominally provided by pysat itself. (default='')
+    inst_id : str
+        Instrument ID used to identify particular data set to be inspected.
+        This input is nominally provided by pysat itself. (default='')
+    epoch_name : str or NoneType
+        Data key for epoch variable. If None, uses 'time' if present in the
+        file, and 'Epoch' otherwise. (default=None)
+    epoch_unit : str
+        The pandas-defined unit of the epoch variable ('D', 's', 'ms', 'us',
+        'ns'). (default='ms')
+    epoch_origin : str or timestamp-convertable
+        Origin of epoch calculation, following convention for
+        `pandas.to_datetime`. (default='unix')
+    meta_kwargs : dict or NoneType
+        Dict to specify custom Meta initialization or None to use Meta
+        defaults (default=None)
+    meta_processor : function or NoneType
+        If not None, a dict containing all of the loaded metadata will be
+        passed to `meta_processor` which should return a filtered version
+        of the input dict. (default=None)
+    meta_translation : dict or NoneType
+        Translation table used to map metadata labels in the file to
+        those used by the returned `meta`. If None, will use
+        `default_from_netcdf_translation_table`. (default=None)
+    drop_meta_labels : list or NoneType
+        List of variable metadata labels that should be dropped. Applied
+        to metadata as loaded from the file. (default=None)
+
+    Returns
+    -------
+    info : dict
+        Information about the files, see `pysat.utils.io.inspect_netcdf`
+
+    """
+    info = pysat.utils.io.inspect_netcdf(fnames, epoch_name=epoch_name,
+                                         epoch_unit=epoch_unit,
+                                         epoch_origin=epoch_origin,
+                                         meta_kwargs=meta_kwargs,
+                                         meta_processor=meta_processor,
+                                         meta_translation=meta_translation,
+                                         drop_meta_labels=drop_meta_labels)
+
+    return info
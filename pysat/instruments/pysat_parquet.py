@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""General Instrument for loading pysat-written Parquet files.
+
+Properties
+----------
+platform
+    'pysat', will be updated if file contains a platform attribute
+name
+    'parquet', will be updated if file contains a name attribute
+tag
+   '', will be updated if file contains a tag attribute
+inst_id
+   '', will be updated if file contains an inst_id attribute
+
+Note
+----
+Only tested against pysat created Parquet files. Requires the optional
+dependency `pyarrow`.
+
+Examples
+--------
+::
+
+    import pysat
+
+    # Load a test Instrument
+    inst = pysat.Instrument("pysat", "testing")
+    inst.load(date=inst.inst_module._test_dates[''][''])
+
+    # Create a Parquet file
+    fname = "test_pysat_file_%Y%j.parquet"
+    pysat.utils.io.inst_to_parquet(inst, fname=inst.date.strftime(fname))
+
+    # Load the Parquet file
+    file_inst = pysat.Instrument(
+        "pysat", "parquet", temporary_file_list=True, directory_format="./",
+        file_format="test_pysat_file_{year:04}{day:03}.parquet")
+    file_inst.load(date=inst.inst_module._test_dates[''][''])
+
+"""
+
+import datetime as dt
+import functools
+
+import pysat
+from pysat.instruments.methods import general
+from pysat.instruments.methods import pysat_files as mm_files
+
+logger = pysat.logger
+
+# ----------------------------------------------------------------------------
+# Instrument attributes
+platform = 'pysat'
+name = 'parquet'
+tags = {'': ''}
+inst_ids = {'': tag for tag in tags.keys()}
+
+# ----------------------------------------------------------------------------
+# Instrument testing attributes
+
+_test_dates = {'': {'': dt.datetime(2009, 1, 1)}}
+_test_download = {'': {'': False}}
+_test_download_ci = {'': {'': False}}
+
+
+# ----------------------------------------------------------------------------
+# Instrument methods
+init = mm_files.init
+clean = mm_files.clean
+preprocess = mm_files.preprocess
+
+# ----------------------------------------------------------------------------
+# Instrument functions
+format_str = '_'.join([platform, name, '{year:04d}', '{month:02d}',
+                       '{day:02d}.parquet'])
+supported_tags = {inst_id: {tag: format_str for tag in tags.keys()}
+                  for inst_id in inst_ids.keys()}
+list_files = functools.partial(general.list_files, format_str=format_str,
+                               supported_tags=supported_tags)
+download = mm_files.build_download('Parquet')
+
+
+def load(fnames, tag='', inst_id='', epoch_name='time', epoch_unit='ms',
+         epoch_origin='unix', pandas_format=True, variables=None,
+         meta_kwargs=None, meta_processor=None, meta_translation=None,
+         drop_meta_labels=None):
+    """Load pysat-created Parquet data and meta data.
+
+    Parameters
+    ----------
+    fnames : array-like
+        iterable of filename strings, full path, to data files to be loaded.
+        This input is nominally provided by pysat itself.
+    tag : str
+        Tag name used to identify particular data set to be loaded.
+        This input is nominally provided by pysat itself. (default='')
+    inst_id : str
+        Instrument ID used to identify particular data set to be loaded.
+        This input is nominally provided by pysat itself. (default='')
+    epoch_name : str
+        Data key for epoch variable.  The epoch variable is expected to be an
+        array of integer or float values denoting time elapsed from an origin
+        specified by `epoch_origin` with units specified by `epoch_unit`. This
+        epoch variable will be converted to a `DatetimeIndex` for consistency
+        across pysat instruments.  (default='time')
+    epoch_unit : str
+        The pandas-defined unit of the epoch variable ('D', 's', 'ms', 'us',
+        'ns'). (default='ms')
+    epoch_origin : str or timestamp-convertable
+        Origin of epoch calculation, following convention for
+        `pandas.to_datetime`. (default='unix')
+    pandas_format : bool
+        Flag specifying if data is stored in a pandas DataFrame (True) or
+        xarray Dataset (False). (default=True)
+    variables : list-like, str, or NoneType
+        Variables to load from the file(s).  Only the selected variables and
+        the epoch are read. If None, all variables are loaded. (default=None)
+    meta_kwargs : dict or NoneType
+        Dict to specify custom Meta initialization or None to use Meta
+        defaults (default=None)
+    meta_processor : function or NoneType
+        If not None, a dict containing all of the loaded metadata will be
+        passed to `meta_processor` which should return a filtered version
+        of the input dict. The returned dict is loaded into a pysat.Meta
+        instance and returned as `meta`. (default=None)
+    meta_translation : dict or NoneType
+        Translation table used to map metadata labels in the file to
+        those used by the returned `meta`. Keys are labels from file
+        and values are labels in `meta`. If None, will use
+        `default_from_netcdf_translation_table`. To disable all translation,
+        input an empty dict. (default=None)
+    drop_meta_labels : list or NoneType
+        List of variable metadata labels that should be dropped. Applied
+        to metadata as loaded from the file. (default=None)
+
+    Returns
+    -------
+    data : pds.DataFrame or xr.Dataset
+        Data to be assigned to the pysat.Instrument.data object.
+    mdata : pysat.Meta
+        Pysat Meta data for each data variable.
+
+    """
+    data, mdata = pysat.utils.io.load_parquet(
+        fnames, epoch_name=epoch_name, epoch_unit=epoch_unit,
+        epoch_origin=epoch_origin, pandas_format=pandas_format,
+        variables=variables, meta_kwargs=meta_kwargs,
+        meta_processor=meta_processor, meta_translation=meta_translation,
+        drop_meta_labels=drop_meta_labels)
+
+    return data, mdata
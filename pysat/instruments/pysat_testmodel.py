@@ -40,7 +40,8 @@ preprocess = mm_test.preprocess
 
 
 def load(fnames, tag='', inst_id='', start_time=None, num_samples=96,
-         test_load_kwarg=None):
+         test_load_kwarg=None, num_latitude=None, num_longitude=None,
+         num_levels=None):
     """Load the test files.
 
     Parameters
@@ -63,6 +64,16 @@ def load(fnames, tag='', inst_id='', start_time=None, num_samples=96,
         Keyword used for pysat unit testing to ensure that functionality for
         custom keywords defined in instrument support functions is working
         correctly. (default=None)
+    num_latitude : int or NoneType
+        Number of latitudes in the model grid. If None, uses 21 for the default
+        tag and 72 for the 'pressure_levels' tag. (default=None)
+    num_longitude : int or NoneType
+        Number of longitudes in the model grid. If None, uses 72 for the
+        default tag and 144 for the 'pressure_levels' tag. (default=None)
+    num_levels : int or NoneType
+        Number of altitudes or pressure levels in the model grid. If None, uses
+        41 for the default tag and 57 for the 'pressure_levels' tag.
+        (default=None)
 
     Returns
     -------
@@ -85,59 +96,47 @@ def load(fnames, tag='', inst_id='', start_time=None, num_samples=96,
 
     # Define range of simulated model as well as data, depending upon tag.
     if tag == '':
-        latitude = np.linspace(-50, 50, 21)
-        longitude = np.linspace(0, 360, 72, endpoint=False)
-        altitude = np.linspace(300, 500, 41)
+        latitude = np.linspace(-50, 50, num_latitude or 21)
+        longitude = np.linspace(0, 360, num_longitude or 72, endpoint=False)
+        altitude = np.linspace(300, 500, num_levels or 41)
         data = xr.Dataset({'uts': (('time'), np.mod(uts, 86400.))},
                           coords={epoch_name: index, 'latitude': latitude,
                                   'longitude': longitude, 'altitude': altitude})
 
     else:
-        latitude = np.linspace(-88.75, 88.75, 72)
-        longitude = np.linspace(-180., 177.5, 144)
-        lev = np.linspace(-7, 7, 57)
-        ilev = np.linspace(-6.875, 7.125, 57)
+        latitude = np.linspace(-88.75, 88.75, num_latitude or 72)
+        longitude = np.linspace(-180., 180., num_longitude or 144,
+                                endpoint=False)
+        lev = np.linspace(-7, 7, num_levels or 57)
+        ilev = np.linspace(-6.875, 7.125, num_levels or 57)
 
         data = xr.Dataset({'uts': ((epoch_name), np.mod(uts, 86400.))},
                           coords={epoch_name: index, 'latitude': latitude,
                                   'longitude': longitude, 'lev': lev,
                                   'ilev': ilev})
 
-        # Simulate altitude values at the model nodes.
-        # Start by initializing the memory.
-        dummy0 = (data['uts'] * data['ilev'] * data['latitude']
-                  * data['longitude'])
-        dummy0 *= 0
-
         # Provide a 2D linear gradient across latitude and longitude
-        inc_arr = (np.linspace(0, 1, 72)[:, np.newaxis]
-                   * np.linspace(0, 1, 144)[np.newaxis, :])
-
-        # Calculate and assign altitude values
-        for i in np.arange(len(data['ilev'])):
-            for j in np.arange(len(data['uts'])):
-                dummy0[j, i, :, :] = i * 10. + j + inc_arr
-        dummy0.data *= 100000.
+        inc_arr = (np.linspace(0, 1, len(latitude))[:, np.newaxis]
+                   * np.linspace(0, 1, len(longitude))[np.newaxis, :])
+
+        # Get the time and level positions, shaped to broadcast against the
+        # (time, ilev, latitude, longitude) data
+        itime = np.arange(len(uts), dtype=float)[:, np.newaxis, np.newaxis,
+                                                 np.newaxis]
+        ilevel = np.arange(len(ilev), dtype=float)[np.newaxis, :, np.newaxis,
+                                                   np.newaxis]
+
+        # Simulate altitude values at the model nodes
         data['altitude'] = ((epoch_name, 'ilev', 'latitude', 'longitude'),
-                            dummy0.data)
+                            (ilevel * 10. + itime + inc_arr) * 100000.)
 
         # Create fake 4D ion drift data set
-        dummy0 = (data['uts'] * data['ilev'] * data['latitude']
-                  * data['longitude'])
-        dummy0 *= 0
-
-        # Calculate and assign fake data values
-        for i in np.arange(len(data['ilev'])):
-            for j in np.arange(len(data['uts'])):
-                dummy0[j, i, :, :] = 2. * i * (np.sin(2 * np.pi * j / 24.)
-                                               + inc_arr)
         data['dummy_drifts'] = ((epoch_name, 'ilev', 'latitude', 'longitude'),
-                                dummy0.data)
+                                2. * ilevel * (np.sin(2 * np.pi * itime / 24.)
+                                               + inc_arr))
 
-    slt = np.zeros([len(uts), len(longitude)])
-    for i, ut in enumerate(uts):
-        for j, long in enumerate(longitude):
-            slt[i, j] = np.mod(ut / 3600.0 + long / 15.0, 24.0)
+    slt = np.mod(uts[:, np.newaxis] / 3600.0 + longitude[np.newaxis, :] / 15.0,
+                 24.0)
     data['slt'] = ((epoch_name, 'longitude'), slt)
     data['mlt'] = ((epoch_name, 'longitude'), np.mod(slt + 0.2, 24.0))
 
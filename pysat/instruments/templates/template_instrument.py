@@ -404,3 +404,36 @@ def list_remote_files(tag, inst_id, user=None, password=None):
     """
 
     return
+
+
+# Optional function
+def inspect(fnames, tag='', inst_id=''):
+    """Get the variables, time coverage, and metadata of files.
+
+    Parameters
+    ----------
+    fnames : array-like
+        Iterable of filename strings, full path, to data files to be inspected.
+        This input is nominally provided by pysat itself.
+    tag : str
+        Tag name used to identify particular data set to be inspected.
+        This input is nominally provided by pysat itself. (default='')
+    inst_id : str
+        Satellite ID used to identify particular data set to be inspected.
+        This input is nominally provided by pysat itself. (default='')
+
+    Returns
+    -------
+    info : dict
+        Information about the files, created by
+        `pysat.utils.io.combine_file_info`
+
+    Note
+    ----
+    If not defined, `Instrument.inspect` loads each file to get this
+    information.  Only the file headers and time variable should be read.
+    For netCDF files, use `pysat.utils.io.inspect_netcdf`.
+
+    """
+
+    return pysat.utils.io.inspect_netcdf(fnames)
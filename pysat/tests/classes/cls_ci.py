@@ -61,8 +61,9 @@ class CICleanSetup(object):
 
             # Restore pysat and directory paths
             reload(pysat)
-            pysat.params.restore_defaults()
-            pysat.params['data_dirs'] = self.saved_path
+            with pysat.params.batch():
+                pysat.params.restore_defaults()
+                pysat.params['data_dirs'] = self.saved_path
 
         del self.ci_env, self.saved_path
         return
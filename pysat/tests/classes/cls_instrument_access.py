@@ -887,6 +887,141 @@ class InstAccessTests(object):
         assert self.testInst.meta['doubleMLT'].long_name == 'double trouble'
         return
 
+    def test_setting_data_with_meta_leaves_input(self):
+        """Test setting data with meta does not alter the input dict."""
+
+        self.testInst.load(self.ref_time.year, self.ref_doy)
+        in_dict = {'data': 2. * self.testInst['mlt'].values, 'units': 'hours'}
+        self.testInst['doubleMLT'] = in_dict
+
+        testing.assert_lists_equal(['data', 'units'], list(in_dict.keys()))
+        assert self.testInst.meta['doubleMLT'].units == 'hours'
+        return
+
+    def test_setting_data_without_copy(self):
+        """Test that xarray data views the assigned array."""
+
+        self.testInst.load(self.ref_time.year, self.ref_doy)
+        in_data = 2. * self.testInst['mlt'].values
+        self.testInst['doubleMLT'] = in_data
+
+        if self.testInst.pandas_format:
+            # pandas always stores its own copy
+            assert not np.shares_memory(self.testInst['doubleMLT'].values,
+                                        in_data)
+        else:
+            assert np.shares_memory(self.testInst['doubleMLT'].values,
+                                    in_data)
+        return
+
+    @pytest.mark.parametrize("as_dict", [True, False])
+    def test_setting_data_with_copy(self, as_dict):
+        """Test that data assigned with `copy=True` is isolated.
+
+        Parameters
+        ----------
+        as_dict : bool
+            Assign the data within a metadata dict if True
+
+        """
+
+        self.testInst.load(self.ref_time.year, self.ref_doy)
+        in_data = 2. * self.testInst['mlt'].values
+        new_data = {'data': in_data, 'units': 'hours'} if as_dict else in_data
+        self.testInst.set_data('doubleMLT', new_data, copy=True)
+        in_data[:] = -1.0
+
+        assert not np.shares_memory(self.testInst['doubleMLT'].values,
+                                    in_data)
+        assert np.all(self.testInst['doubleMLT'] == 2. * self.testInst['mlt'])
+        return
+
+    @pytest.mark.parametrize("use_values", [True, False])
+    @pytest.mark.parametrize("use_assign", [True, False])
+    def test_setting_data_from_variable(self, use_values, use_assign):
+        """Test that assigning an Instrument variable does not alias it.
+
+        Parameters
+        ----------
+        use_values : bool
+            Assign the array of variable values if True, or the variable
+        use_assign : bool
+            Assign the variable through `assign` if True, or `__setitem__`
+
+        """
+
+        self.testInst.load(self.ref_time.year, self.ref_doy)
+        in_data = self.testInst['mlt']
+        if use_values:
+            in_data = in_data.values
+
+        if use_assign:
+            self.testInst.assign({'mlt2': in_data})
+        else:
+            self.testInst['mlt2'] = in_data
+        self.testInst[0:3, 'mlt2'] = -1.0
+
+        assert self.testInst['mlt'][0] != -1.0
+        assert self.testInst['mlt2'][0] == -1.0
+        return
+
+    def test_assign_multiple_variables(self):
+        """Test bulk assignment matches assignment by name."""
+
+        self.testInst.load(self.ref_time.year, self.ref_doy)
+        self.out = self.testInst.copy()
+        new_data = {'doubleMLT': 2. * self.testInst['mlt'].values,
+                    'tripleMLT': 3. * self.testInst['mlt'].values,
+                    'mlt': self.testInst['mlt'].values + 1.}
+        new_meta = {'doubleMLT': {'units': 'hours',
+                                  'long_name': 'double trouble'},
+                    'mlt': {'notes': 'shifted'}}
+
+        self.testInst.assign(new_data, meta=new_meta)
+        for var in new_data.keys():
+            if var in new_meta.keys():
+                self.out[var] = {'data': new_data[var], **new_meta[var]}
+            else:
+                self.out[var] = new_data[var]
+
+        assert self.testInst == self.out
+        assert self.testInst.meta['doubleMLT', 'units'] == 'hours'
+        assert self.testInst.meta['tripleMLT', 'long_name'] == 'tripleMLT'
+        assert self.testInst.meta['mlt', 'notes'] == 'shifted'
+        assert self.testInst.meta._data_types['tripleMLT'] == np.float64
+        return
+
+    def test_assign_with_copy(self):
+        """Test that data assigned in bulk with `copy=True` is isolated."""
+
+        self.testInst.load(self.ref_time.year, self.ref_doy)
+        in_data = 2. * self.testInst['mlt'].values
+        self.testInst.assign({'doubleMLT': in_data}, copy=True)
+        in_data[:] = -1.0
+
+        assert np.all(self.testInst['doubleMLT'] == 2. * self.testInst['mlt'])
+        return
+
+    def test_assign_no_variables(self):
+        """Test that bulk assignment without variables makes no changes."""
+
+        self.testInst.load(self.ref_time.year, self.ref_doy)
+        self.out = self.testInst.copy()
+        self.testInst.assign({})
+
+        assert self.testInst == self.out
+        return
+
+    def test_assign_bad_meta(self):
+        """Test bulk assignment raises ValueError for meta without data."""
+
+        self.testInst.load(self.ref_time.year, self.ref_doy)
+        testing.eval_bad_input(self.testInst.assign, ValueError,
+                               'Metadata provided for variables without data',
+                               input_args=[{'doubleMLT': 2.0}],
+                               input_kwargs={'meta': {'tripleMLT': {}}})
+        return
+
     def test_setting_partial_data(self):
         """Test setting partial data by index."""
 
@@ -113,6 +113,9 @@ class InstIterationTests(object):
             for (istart, istop) in zip(start, stop):
                 out.extend(pds.date_range(istart, istop, **kwargs).tolist())
 
+            # Dates in overlapping seasons are only iterated over once
+            out = sorted(set(out))
+
         if dates:
             file_dates = [filter_datetime_input(ftime)
                           for ftime in self.testInst.files.files.index]
@@ -342,6 +342,15 @@ class InstPropertyTests(object):
         assert inst_copy == self.testInst
         return
 
+    def test_clone(self):
+        """Test `Instrument.clone()` without a new tag or inst_id."""
+
+        inst_clone = self.testInst.clone()
+        assert inst_clone == self.testInst
+        assert inst_clone is not self.testInst
+        assert inst_clone.empty
+        return
+
     def test_copy_from_reference(self):
         """Test `.copy()` if invoked from a `weakref.proxy` of Instrument."""
 
@@ -675,6 +675,41 @@ class TestBasics(object):
                                    'in available file list', [test_str])
         return
 
+    def test_get_index_range(self):
+        """Ensure `get_index_range` locates files in a range of times."""
+        start = self.testInst.files.files.index[10]
+        stop = self.testInst.files.files.index[20]
+        idx = self.testInst.files.get_index_range(start, stop)
+
+        assert idx == (10, 20)
+        assert np.all(self.testInst.files[start:stop]
+                      == self.testInst.files.files.iloc[10:20])
+
+        # Test a range starting and ending between file times
+        idx = self.testInst.files.get_index_range(
+            start + dt.timedelta(seconds=1), stop + dt.timedelta(seconds=1))
+        assert idx == (11, 21)
+        return
+
+    def test_get_index_range_new_file_list(self):
+        """Ensure `get_index_range` uses an updated file list."""
+        start = self.testInst.files.files.index[0]
+        stop = self.testInst.files.files.index[20]
+        assert self.testInst.files.get_index_range(start, stop) == (0, 20)
+
+        self.testInst.files.files = self.testInst.files.files.iloc[5:10]
+        assert self.testInst.files.get_index_range(start, stop) == (0, 5)
+        return
+
+    def test_get_index_range_unsorted(self):
+        """Ensure `get_index_range` raises an error for unsorted files."""
+        self.testInst.files.files = self.testInst.files.files.iloc[::-1]
+        testing.eval_bad_input(self.testInst.files.get_index_range, ValueError,
+                               'File times are not in increasing order',
+                               [self.testInst.files.files.index[-1],
+                                self.testInst.files.files.index[0]])
+        return
+
     def test_default_directory_format(self):
         """Ensure default directory format from params is used."""
         files = pysat.Files(self.testInst)
@@ -808,6 +843,149 @@ class TestInstWithFiles(object):
         assert (np.all(self.testInst.files.files.index == dates))
         return
 
+    def test_refresh_with_file_list_ttl(self):
+        """Check that a recent stored file list is reused by new Instruments."""
+        ttl = pysat.params['file_list_ttl']
+        pysat.params['file_list_ttl'] = 3600
+        dates = pysat.utils.time.create_date_range(self.start, self.stop,
+                                                   freq='100min')
+
+        try:
+            # Store the file list with the search settings
+            self.testInst.files.refresh()
+
+            # Add files without updating the stored file list
+            create_files(self.testInst, self.stop, self.stop2, freq='100min',
+                         use_doy=False, root_fname=self.root_fname,
+                         version=self.version)
+            self.testInst = pysat.Instrument(
+                inst_module=pysat.instruments.pysat_testing,
+                clean_level='clean', update_files=True,
+                file_format=self.root_fname,
+                temporary_file_list=self.temporary_file_list)
+
+            if self.temporary_file_list:
+                # Without a stored file list, the directories are searched
+                assert len(self.testInst.files.files) > len(dates)
+            else:
+                assert np.all(self.testInst.files.files.index == dates)
+
+            # A direct refresh always searches the directories
+            self.testInst.files.refresh()
+            assert len(self.testInst.files.files) > len(dates)
+        finally:
+            pysat.params['file_list_ttl'] = ttl
+        return
+
+    def test_refresh_with_file_inventory(self):
+        """Check that the file inventory is updated by refresh."""
+        pysat.params['file_inventory'] = True
+
+        try:
+            self.testInst = pysat.Instrument(
+                inst_module=pysat.instruments.pysat_testing,
+                clean_level='clean', update_files=True,
+                file_format=self.root_fname,
+                temporary_file_list=self.temporary_file_list)
+
+            if self.temporary_file_list:
+                # The inventory is only kept with a stored file list
+                assert self.testInst.files.inventory is None
+            else:
+                inventory = self.testInst.files.inventory
+                records = inventory.get()
+                assert list(records.index) == sorted(
+                    self.testInst.files.files.values)
+                assert (records['size'] == 0).all()
+                assert records['first_time'].isnull().all()
+                assert inventory.changed(self.testInst.files.data_path,
+                                         records.index) == []
+                os.remove(inventory.fname)
+        finally:
+            pysat.params['file_inventory'] = False
+        return
+
+    def test_file_list_ttl_with_other_format(self):
+        """Check that a stored file list isn't reused for another format."""
+        ttl = pysat.params['file_list_ttl']
+        pysat.params['file_list_ttl'] = 3600
+
+        try:
+            self.testInst.files.refresh(use_cache=True)
+            assert len(self.testInst.files.files) > 0
+
+            # An Instrument with the same name that searches for other files
+            self.testInst = pysat.Instrument(
+                inst_module=pysat.instruments.pysat_testing,
+                clean_level='clean', update_files=True,
+                file_format=self.root_fname.replace('gold', 'silver'),
+                temporary_file_list=self.temporary_file_list)
+            assert len(self.testInst.files.files) == 0
+        finally:
+            pysat.params['file_list_ttl'] = ttl
+        return
+
+    def test_refresh_without_ttl_does_not_lock(self, monkeypatch):
+        """Check that the file list lock is only used with a positive TTL.
+
+        Parameters
+        ----------
+        monkeypatch : pytest.MonkeyPatch
+            Fixture used to replace the lock class
+
+        """
+
+        def no_lock(*args, **kwargs):
+            raise AssertionError('The file list lock was used.')
+
+        monkeypatch.setattr(pysat.utils, 'NetworkLock', no_lock)
+        self.testInst.files.refresh(use_cache=True)
+        assert len(self.testInst.files.files) > 0
+        return
+
+    def test_refresh_without_ttl_skips_settings(self):
+        """Check that the search settings are only stored with a TTL."""
+        settings_name = os.path.join(
+            self.testInst.files.home_path,
+            '.'.join([self.testInst.files.stored_file_name, 'json']))
+        assert not os.path.isfile(settings_name)
+
+        ttl = pysat.params['file_list_ttl']
+        pysat.params['file_list_ttl'] = 3600
+
+        try:
+            self.testInst.files.refresh()
+            assert os.path.isfile(settings_name) != self.temporary_file_list
+        finally:
+            pysat.params['file_list_ttl'] = ttl
+
+        # Settings that may no longer match the stored list are removed
+        self.testInst.files.refresh()
+        assert not os.path.isfile(settings_name)
+        return
+
+    def test_stored_list_expires(self):
+        """Check that an old stored file list is not current."""
+        ttl = pysat.params['file_list_ttl']
+        pysat.params['file_list_ttl'] = 60
+
+        try:
+            self.testInst.files.refresh()
+            assert self.testInst.files._stored_list_is_current() \
+                != self.temporary_file_list
+
+            # Age the stored file list past the TTL
+            stored_name = os.path.join(self.testInst.files.home_path,
+                                       self.testInst.files.stored_file_name)
+            if os.path.isfile(stored_name):
+                old_time = os.path.getmtime(stored_name) - 120
+                os.utime(stored_name, (old_time, old_time))
+
+            assert not self.testInst.files._stored_list_is_current()
+        finally:
+            pysat.params['file_list_ttl'] = ttl
+        return
+
     def test_refresh_on_unchanged_files(self):
         """Make sure new refresh does not duplicate files."""
         dates = pysat.utils.time.create_date_range(self.start, self.stop,
@@ -1313,6 +1491,24 @@ class TestFilesRaceCondition(object):
         proc_pool.map(create_instrument, range(processes))
         return
 
+    def test_race_condition_with_file_list_ttl(self):
+        """Test concurrent Instrument creation sharing a stored file list."""
+        ttl = pysat.params['file_list_ttl']
+        pysat.params['file_list_ttl'] = 3600
+
+        try:
+            with Pool(5) as proc_pool:
+                proc_pool.map(create_instrument, range(5))
+
+            self.testInst = pysat.Instrument(
+                inst_module=pysat.instruments.pysat_testing,
+                clean_level='clean', update_files=True,
+                temporary_file_list=self.temporary_file_list)
+            assert len(self.testInst.files.files) > 0
+        finally:
+            pysat.params['file_list_ttl'] = ttl
+        return
+
 
 class TestCIonly(CICleanSetup):
     """Tests where we mess with local settings.
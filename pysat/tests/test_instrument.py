@@ -13,6 +13,7 @@
 
 import datetime as dt
 from importlib import reload
+import logging
 import numpy as np
 import pandas as pds
 import pytest
@@ -232,6 +233,43 @@ class TestBasicsNDXarray(TestBasics):
         assert np.all(self.testInst['doubleMLT'] == 2. * self.testInst['mlt'])
         return
 
+    def test_assign_multidimensional_data(self):
+        """Test bulk assignment of multi-dimensional data."""
+
+        self.testInst.load(self.ref_time.year, self.ref_doy)
+        self.testInst.assign({
+            'profiles': 2. * self.testInst['profiles'].values,
+            'double_images': (self.testInst['images'].dims,
+                              2. * self.testInst['images'].values),
+            'new_mlt': self.testInst['mlt']})
+
+        assert self.testInst['double_images'].dims \
+            == self.testInst['images'].dims
+        assert np.all(self.testInst['double_images']
+                      == 2. * self.testInst['images'])
+        assert not np.shares_memory(self.testInst['new_mlt'].values,
+                                    self.testInst['mlt'].values)
+        return
+
+    def test_assign_new_data_without_copy(self):
+        """Test that new arrays are assigned without being copied."""
+
+        self.testInst.load(self.ref_time.year, self.ref_doy)
+        new_values = 2. * self.testInst['mlt'].values
+        self.testInst['double_mlt'] = new_values
+
+        assert np.shares_memory(self.testInst['double_mlt'].values, new_values)
+        return
+
+    def test_assign_bad_shape(self):
+        """Test bulk assignment raises ValueError for unexpected shapes."""
+
+        self.testInst.load(self.ref_time.year, self.ref_doy)
+        testing.eval_bad_input(self.testInst.assign, ValueError,
+                               'does not match expected dimensions',
+                               input_args=[{'bad': np.ones(shape=(2, 3))}])
+        return
+
     def test_xarray_not_empty_notime(self):
         """Test that xarray empty is False even if there is no time data."""
         # Load data and confirm it exists
@@ -302,6 +340,50 @@ class TestBasicsNDXarray(TestBasics):
         assert str(verr).find(estr) > 0
         return
 
+    @pytest.mark.parametrize("start,stop", [(0, 5), (2, None), (None, 3)])
+    def test_data_access_by_slicing_extra_time(self, start, stop):
+        """Test slicing by row and datetime with secondary time indexes.
+
+        Parameters
+        ----------
+        start : int or NoneType
+            Start of the row slice
+        stop : int or NoneType
+            End of the row slice
+
+        """
+        self.testInst.kwargs['load']['num_extra_time_coords'] = 2
+        self.testInst.load(date=self.ref_time)
+        row_slice = slice(start, stop)
+        time_dims = ['time', 'time0', 'time1']
+        out = self.testInst[row_slice]
+        assert out.identical(self.testInst.data.isel(
+            {dim: row_slice for dim in time_dims}))
+
+        # Datetime slices are inclusive and use the labels of each index
+        time_slice = slice(None if start is None else self.testInst.index[
+            start], None if stop is None else self.testInst.index[stop])
+        out = self.testInst[time_slice]
+        assert out.identical(self.testInst.data.sel(
+            {dim: time_slice for dim in time_dims}))
+        assert self.testInst[time_slice, 'mlt'].identical(
+            self.testInst.data['mlt'].sel(time=time_slice))
+        return
+
+    def test_data_access_by_datetime_extra_time(self, caplog):
+        """Test datetime selection only uses the indexes with that time."""
+        self.testInst.kwargs['load']['num_extra_time_coords'] = 1
+        self.testInst.load(date=self.ref_time)
+
+        with caplog.at_level(logging.WARNING, logger='pysat'):
+            out = self.testInst[self.ref_time]
+
+        assert out.identical(self.testInst.data.sel(time=self.ref_time))
+        assert caplog.text.find("Removing ['time0'] dimensions") >= 0
+        assert self.testInst[self.ref_time, 'mlt'].identical(
+            self.testInst.data['mlt'].sel(time=self.ref_time))
+        return
+
     @pytest.mark.parametrize("changed,fixed",
                              [(0, slice(1, None)),
                               ([0, 1, 2, 3], slice(4, None)),
@@ -532,6 +614,172 @@ class TestInstGeneral(object):
         return
 
 
+class TestInstClone(object):
+    """Unit tests for cloning Instruments."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+
+        self.testInst = pysat.Instrument(
+            platform='pysat', name='testing', num_samples=10,
+            clean_level='clean', pad={'minutes': 5},
+            custom=[{'function': pysat.utils.update_fill_values,
+                     'kwargs': {'variables': 'mlt'}}])
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+
+        del self.testInst
+        return
+
+    def test_clone_new_tag(self):
+        """Test that a clone with a new tag keeps the other settings."""
+
+        inst_clone = self.testInst.clone(tag='no_download')
+
+        assert inst_clone.tag == 'no_download'
+        assert inst_clone.inst_module is self.testInst.inst_module
+        assert repr(inst_clone) == repr(self.testInst).replace(
+            "tag=''", "tag='no_download'")
+        assert not inst_clone._test_download
+        return
+
+    def test_clone_bad_tag(self):
+        """Test that a clone with an unknown tag raises a ValueError."""
+
+        testing.eval_bad_input(self.testInst.clone, ValueError,
+                               "'bad' is not one of the supported tags",
+                               input_kwargs={'tag': 'bad'})
+        return
+
+    def test_clone_user_directory_format(self):
+        """Test that a user-supplied directory format is kept by a clone."""
+
+        dir_format = '{platform}_{name}'
+        self.testInst = pysat.Instrument(platform='pysat', name='testing',
+                                         directory_format=dir_format)
+        inst_clone = self.testInst.clone(tag='no_download')
+
+        assert inst_clone.directory_format == dir_format
+        assert inst_clone.files.data_path == self.testInst.files.data_path
+        return
+
+    def test_clone_empty(self):
+        """Test that an empty Instrument may be cloned."""
+
+        inst_clone = pysat.Instrument().clone()
+
+        assert inst_clone.platform == ''
+        assert inst_clone.inst_module is None
+        return
+
+    def test_supported_keywords_reload(self):
+        """Test that cached supported keywords are updated on reload."""
+
+        assert self.testInst.kwargs_supported['load']['num_samples'] == 86400
+
+        def new_load(fnames, tag='', inst_id='', num_samples=7):
+            return
+
+        # Replace the routine and confirm the new defaults are used
+        pysat.instruments.pysat_testing.load = new_load
+        try:
+            inst = pysat.Instrument('pysat', 'testing')
+            assert inst.kwargs_supported['load']['num_samples'] == 7
+        finally:
+            reload(pysat.instruments.pysat_testing)
+
+        inst = self.testInst.clone()
+        assert inst.kwargs_supported['load']['num_samples'] == 86400
+        return
+
+
+class TestInstInspect(object):
+    """Unit tests for `Instrument.inspect` without a module `inspect`."""
+
+    @pytest.mark.parametrize("name", ['testing', 'ndtesting'])
+    @pytest.mark.parametrize("by_fname", [True, False])
+    def test_inspect_matches_load(self, name, by_fname):
+        """Test that the inspected information matches the loaded data.
+
+        Parameters
+        ----------
+        name : str
+            Name of the pysat test Instrument
+        by_fname : bool
+            Inspect by filename if True, or by date if False
+
+        """
+        inst = pysat.Instrument('pysat', name, num_samples=10)
+        date = inst.inst_module._test_dates['']['']
+        inst.load(date=date)
+
+        if by_fname:
+            info = inst.inspect(fname=inst.files[date])
+        else:
+            info = inst.inspect(date=date)
+
+        testing.assert_lists_equal(list(inst.vars_no_time), info['variables'])
+        assert info['num_samples'] == len(inst.index)
+        assert info['start'] == inst.index[0]
+        assert info['stop'] == inst.index[-1]
+        assert len(info['files'].index) == 1
+        assert info['meta'] == inst.meta
+        return
+
+    def test_inspect_meta_from_all_files(self):
+        """Test that the inspected metadata includes variables in any file."""
+        date = pysat.instruments.pysat_testing._test_dates['']['']
+        inst = pysat.Instrument('pysat', 'testing', num_samples=10,
+                                file_date_range=pds.date_range(
+                                    date, date + dt.timedelta(days=1),
+                                    freq='12h'))
+        load_rtn = inst._load_rtn
+        load_calls = list()
+
+        def drop_from_second_file(fnames, **kwargs):
+            data, meta = load_rtn(fnames, **kwargs)
+            load_calls.append(fnames)
+            if len(load_calls) == 2:
+                data = data.drop(columns='mlt')
+                meta.drop('mlt')
+            return data, meta
+
+        inst._load_rtn = drop_from_second_file
+        info = inst.inspect(date=date)
+
+        assert len(info['files'].index) == 2
+        assert 'mlt' in info['variables']
+        assert 'mlt' in info['meta']
+        return
+
+    @pytest.mark.parametrize("kwargs", [{}, {'date': dt.datetime(2009, 1, 1),
+                                             'fname': 'fake_file.txt'}])
+    def test_inspect_bad_input(self, kwargs):
+        """Test the error raised without exactly one of `date` and `fname`.
+
+        Parameters
+        ----------
+        kwargs : dict
+            Kwargs for `Instrument.inspect`
+
+        """
+        inst = pysat.Instrument('pysat', 'testing', num_samples=10)
+        testing.eval_bad_input(inst.inspect, ValueError,
+                               'Must supply either a date or a filename',
+                               input_kwargs=kwargs)
+        return
+
+    def test_inspect_no_files(self):
+        """Test the error raised when there are no files to inspect."""
+        inst = pysat.Instrument('pysat', 'testing', num_samples=10)
+        testing.eval_bad_input(inst.inspect, ValueError,
+                               'No files found to inspect',
+                               input_kwargs={'date': dt.datetime(1900, 1, 1)})
+        return
+
+
 class TestDeprecation(object):
     """Unit test for deprecation warnings."""
 
@@ -429,6 +429,28 @@ class TestDataPadding(object):
         self.eval_index_start_end()
         return
 
+    def test_data_padding_iteration(self, monkeypatch):
+        """Test iteration with data padding reads each day once."""
+        loads = list()
+        load_data = pysat.Instrument._load_data
+
+        def count_loads(inst, *args, **kwargs):
+            loads.append(kwargs.get('date'))
+            return load_data(inst, *args, **kwargs)
+
+        monkeypatch.setattr(pysat.Instrument, '_load_data', count_loads)
+
+        self.testInst.bounds = (self.ref_time,
+                                self.ref_time + dt.timedelta(days=3))
+        for inst in self.testInst:
+            assert inst.index[0] == inst.date
+            assert inst.index[-1] < inst.date + dt.timedelta(days=1)
+            assert inst.index.is_unique
+
+        assert len(loads) == self.testInst.iteration_plan.num_file_reads
+        assert len(loads) == 6
+        return
+
     def test_data_padding_uniqueness(self):
         """Test index after data padding is unique."""
 
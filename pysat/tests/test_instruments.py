@@ -151,6 +151,41 @@ class TestInstruments(InstLibTests):
 
         return
 
+    @pytest.mark.parametrize("tag", ['', 'pressure_levels'])
+    def test_testmodel_grid_size(self, tag):
+        """Test operation of the testmodel grid size keywords.
+
+        Parameters
+        ----------
+        tag : str
+            Instrument tag
+
+        """
+        self.test_inst = pysat.Instrument('pysat', 'testmodel', tag=tag,
+                                          num_samples=4, num_latitude=3,
+                                          num_longitude=5, num_levels=6)
+        self.test_inst.load(date=self.test_inst.inst_module._test_dates[''][
+            tag])
+        zname = 'altitude' if tag == '' else 'ilev'
+
+        assert self.test_inst.data.sizes['latitude'] == 3
+        assert self.test_inst.data.sizes['longitude'] == 5
+        assert self.test_inst.data.sizes[zname] == 6
+        assert self.test_inst['slt'].shape == (4, 5)
+        return
+
+    def test_ndtesting_image_size(self):
+        """Test operation of the ndtesting image and profile size keywords."""
+        self.test_inst = pysat.Instrument('pysat', 'ndtesting', num_samples=4,
+                                          num_image_pixels=3,
+                                          num_profile_heights=2)
+        self.test_inst.load(date=self.test_inst.inst_module._test_dates[''][
+            ''])
+
+        assert self.test_inst['images'].shape == (4, 3, 3)
+        assert self.test_inst['profiles'].shape == (4, 2)
+        return
+
     @pytest.mark.second
     @pytest.mark.parametrize("clean_level", ['clean', 'dusty', 'dirty'])
     @pytest.mark.parametrize("change", [True, False])
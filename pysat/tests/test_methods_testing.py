@@ -11,7 +11,10 @@
 """Tests the `pysat.instruments.methods.testing` methods."""
 
 import datetime as dt
+import os
+import pandas as pds
 import pytest
+import tempfile
 
 import pysat
 from pysat.instruments.methods import testing as mm_test
@@ -91,3 +94,127 @@ class TestMethodsTesting(object):
         delta_time = [dt.timedelta(seconds=sec) for sec in uts]
         assert (index.to_pydatetime() - delta_time == dates).all
         return
+
+    def test_generate_times_multiple_files(self):
+        """Test that times for multiple files are combined in order."""
+        fnames = list(self.test_inst.files.files.values[0:3])
+        uts, index, dates = mm_test.generate_times(fnames, 10, freq='1h')
+
+        assert len(uts) == 30
+        assert isinstance(index, pds.DatetimeIndex)
+        assert index.is_monotonic_increasing
+        assert list(uts[9:11]) == [9 * 3600.0, 86400.0]
+        assert list(index[[0, 10, 20]]) == dates
+        return
+
+    def test_generate_times_no_files(self):
+        """Test that no times are generated without files."""
+        uts, index, dates = mm_test.generate_times([], 10)
+
+        assert len(uts) == 0
+        assert len(index) == 0
+        assert dates == []
+        return
+
+
+class TestCreateArchive(object):
+    """Unit tests for the synthetic archive generator."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.root_fname = ''.join(['archive_{year:04d}{month:02d}{day:02d}_',
+                                   '{hour:02d}_v{version:02d}.nc'])
+        self.test_inst = pysat.Instrument('pysat', 'netcdf',
+                                          data_dir=self.tempdir.name,
+                                          file_format=self.root_fname)
+        self.start = dt.datetime(2009, 1, 1)
+        self.stop = dt.datetime(2009, 1, 2, 23)
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+        self.tempdir.cleanup()
+        del self.tempdir, self.root_fname, self.test_inst, self.start
+        del self.stop
+        return
+
+    def test_create_archive_placeholders(self):
+        """Test the creation of versioned placeholder files with a gap."""
+        gap = (dt.datetime(2009, 1, 1, 6), dt.datetime(2009, 1, 2))
+        fnames = mm_test.create_archive(self.test_inst, self.start, self.stop,
+                                        freq='1h', root_fname=self.root_fname,
+                                        versions=[1, 2], gaps=[gap])
+
+        assert len(fnames) == 60
+        assert sorted(os.listdir(self.test_inst.files.data_path)) == sorted(
+            fnames)
+        assert fnames.index[0] == self.start
+        assert fnames.index[-1] == self.stop
+        assert not ((fnames.index >= gap[0]) & (fnames.index < gap[1])).any()
+
+        # Only the latest version is used by the Instrument
+        self.test_inst.files.refresh()
+        assert len(self.test_inst.files.files) == 30
+        assert self.test_inst.files.files.str.endswith('_v02.nc').all()
+        return
+
+    def test_create_archive_random_files(self):
+        """Test that the missing and empty files are reproducible."""
+        kwargs = {'freq': '1h', 'root_fname': self.root_fname,
+                  'missing_fraction': 0.25, 'empty_fraction': 0.25,
+                  'content': 'data', 'seed': 5}
+        fnames = mm_test.create_archive(self.test_inst, self.start, self.stop,
+                                        **kwargs)
+        sizes = [os.path.getsize(os.path.join(
+            self.test_inst.files.data_path, fname)) for fname in fnames]
+
+        assert 0 < len(fnames) < 48
+        assert 0 < sizes.count(0) < len(fnames)
+        assert list(fnames) == list(mm_test.create_archive(
+            self.test_inst, self.start, self.stop, **kwargs))
+
+        # Empty files are not used by the Instrument
+        self.test_inst.files.ignore_empty_files = True
+        self.test_inst.files.refresh()
+        assert len(self.test_inst.files.files) == len(fnames) - sizes.count(0)
+        return
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_create_archive_data(self, workers):
+        """Test that files with data may be loaded by an Instrument.
+
+        Parameters
+        ----------
+        workers : int
+            Number of processes used to write the files
+
+        """
+        fnames = mm_test.create_archive(self.test_inst, self.start, self.stop,
+                                        freq='6h', root_fname=self.root_fname,
+                                        num_samples=360, num_vars=2,
+                                        empty_fraction=0.25, workers=workers,
+                                        seed=1)
+
+        # Empty files are not used by the Instrument
+        self.test_inst.files.ignore_empty_files = True
+        self.test_inst.files.refresh()
+        assert len(self.test_inst.files.files) == len(fnames) - 1
+
+        self.test_inst.load(date=self.start)
+        assert self.test_inst.index[0] >= self.start
+        assert self.test_inst.index[-1] < self.start + dt.timedelta(days=1)
+        assert (self.test_inst.index[1] - self.test_inst.index[0]
+                == dt.timedelta(minutes=1))
+        for var in ['uts', 'dummy0', 'dummy1']:
+            assert var in self.test_inst.variables
+        return
+
+    def test_create_archive_bad_workers(self):
+        """Test that the number of workers must be positive."""
+        testing.eval_bad_input(mm_test.create_archive, ValueError,
+                               "`workers` must be at least one",
+                               input_args=[self.test_inst, self.start,
+                                           self.stop],
+                               input_kwargs={"workers": 0})
+        return
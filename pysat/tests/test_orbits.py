@@ -99,6 +99,28 @@ def assert_reversible_orbit_symmetric(inst, iterations):
     return
 
 
+def get_orbit_span(inst, var=None, scale=1.0):
+    """Get the time range of an orbit, used to test `Orbits.map`.
+
+    Parameters
+    ----------
+    inst : pysat.Instrument
+        The instrument with orbit data loaded
+    var : str or NoneType
+        Variable to sum, if not None (default=None)
+    scale : float
+        Value multiplying the variable sum (default=1.0)
+
+    Returns
+    -------
+    tuple
+        First and last time of the orbit and the scaled variable sum
+
+    """
+    total = None if var is None else float(inst[var].sum()) * scale
+    return (inst.index[0], inst.index[-1], total)
+
+
 class TestOrbitsUserInterface(object):
     """Tests the user interface for orbits, including error handling."""
 
@@ -203,6 +225,45 @@ class TestOrbitsUserInterface(object):
         assert out_str.find("Orbit Lind: local time") < 0
         return
 
+    def test_orbit_map_args(self):
+        """Test that arguments are passed to the mapped function."""
+
+        self.in_kwargs['orbit_info'] = {'index': 'mlt'}
+        self.testInst = pysat.Instrument(*self.in_args, **self.in_kwargs)
+        self.testInst.bounds = (self.stime, self.stime)
+        out = self.testInst.orbits.map(get_orbit_span, 'mlt', scale=2.0)
+
+        # The Instrument is not changed by mapping
+        assert self.testInst.empty
+        control = [2.0 * float(inst['mlt'].sum())
+                   for inst in self.testInst.orbits]
+        assert [orbit[2] for orbit in out] == control
+        return
+
+    def test_orbit_map_bad_workers(self):
+        """Test that orbits must be mapped by at least one worker."""
+
+        self.in_kwargs['orbit_info'] = {'index': 'mlt'}
+        self.testInst = pysat.Instrument(*self.in_args, **self.in_kwargs)
+        testing.eval_bad_input(self.testInst.orbits.map, ValueError,
+                               "`workers` must be at least one",
+                               input_args=[get_orbit_span],
+                               input_kwargs={'workers': 0})
+        return
+
+    def test_orbit_map_file_bounds(self):
+        """Test that orbits may not be mapped in parallel by file."""
+
+        self.in_kwargs['orbit_info'] = {'index': 'mlt'}
+        self.testInst = pysat.Instrument(*self.in_args, **self.in_kwargs)
+        self.testInst.bounds = (self.testInst.files[self.stime],
+                                self.testInst.files[self.stime])
+        testing.eval_bad_input(self.testInst.orbits.map, ValueError,
+                               "bounds set by date",
+                               input_args=[get_orbit_span],
+                               input_kwargs={'workers': 2})
+        return
+
 
 class TestSpecificUTOrbits(object):
     """Run the tests for specific behaviour in the MLT orbits."""
@@ -464,6 +525,101 @@ class TestGeneralOrbitsMLT(object):
         assert self.testInst.orbits != self.testInst
         return
 
+    @pytest.mark.parametrize("step,width", [(None, None),
+                                            ('2D', dt.timedelta(days=2)),
+                                            ('3D', dt.timedelta(days=2))])
+    def test_map_in_parallel(self, step, width):
+        """Test that orbits mapped by several workers match iteration.
+
+        Parameters
+        ----------
+        step : str or NoneType
+            Step size of the bounds, or None for the default
+        width : dt.timedelta or NoneType
+            Width of the data loaded, or None for the default
+
+        """
+
+        self.testInst.bounds = (self.stime, self.stime + dt.timedelta(days=5),
+                                step, width)
+        out = self.testInst.orbits.map(get_orbit_span, workers=2)
+
+        # Orbits spanning midnight are complete and only processed once
+        control = [get_orbit_span(inst) for inst in self.testInst.orbits]
+        assert out == control
+        assert any([orbit[0].date() != orbit[1].date() for orbit in out])
+        return
+
+    def count_breaks_calls(self):
+        """Count the calls to the orbit break calculation in `self.calls`."""
+
+        self.calls = 0
+        det_breaks = self.testInst.orbits._det_breaks
+
+        def counted_breaks():
+            self.calls += 1
+            det_breaks()
+            return
+
+        self.testInst.orbits._det_breaks = counted_breaks
+        return
+
+    def test_orbit_data_not_copied(self):
+        """Test that orbits are served from the loaded data."""
+
+        self.testInst.load(date=self.stime)
+        data = self.testInst.data
+        self.testInst.orbits._calc_orbits()
+
+        assert self.testInst.orbits._full_day_data is data
+        return
+
+    def test_breaks_reused_across_days(self):
+        """Test that orbit breaks are reused when stepping across days."""
+
+        # Step to the first orbit that ends on the next day
+        self.testInst.load(date=self.stime)
+        self.testInst.orbits.next()
+        while self.testInst.date == self.stime:
+            self.testInst.orbits.next()
+
+        self.count_breaks_calls()
+        control = self.testInst.data.copy()
+
+        # Step back and forth across the day boundary
+        calls = []
+        for i in range(2):
+            self.testInst.orbits.prev()
+            self.testInst.orbits.prev()
+            self.testInst.orbits.next()
+            self.testInst.orbits.next()
+            assert self.testInst.data.equals(control)
+            calls.append(self.calls)
+
+        assert calls[0] > 0
+        assert calls[1] == calls[0]
+        return
+
+    def test_breaks_not_reused_for_changed_data(self):
+        """Test that orbit breaks are recalculated if the data changes."""
+
+        self.testInst.load(date=self.stime)
+        self.testInst.orbits.next()
+        self.count_breaks_calls()
+
+        # Reloading the same data reuses the orbit breaks
+        self.testInst.load(date=self.stime)
+        self.testInst.orbits.next()
+        assert self.calls == 0
+
+        # Altering the orbit index requires new orbit breaks
+        self.testInst.load(date=self.stime)
+        index = self.testInst.orbits.orbit_index
+        self.testInst[index] = self.testInst[index].values[::-1]
+        self.testInst.orbits.next()
+        assert self.calls > 0
+        return
+
     def test_eval_repr(self):
         """Test eval of repr recreates object."""
 
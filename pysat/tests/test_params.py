@@ -185,6 +185,118 @@ class TestBasics(object):
 
         return
 
+    def test_batch_stores_once(self):
+        """Test that parameters set in nested batches are stored at the end."""
+        test_params = Parameters(path=self.tempdir.name, create_new=True)
+        stamp = test_params._file_stamp
+
+        with test_params.batch():
+            test_params['update_files'] = False
+            with test_params.batch():
+                test_params['hi_there'] = 'hello'
+                test_params.restore_defaults()
+
+            # Values are available, but not stored, within the batch
+            assert test_params['hi_there'] == 'hello'
+            assert test_params._file_stamp == stamp
+
+        assert test_params._file_stamp != stamp
+        assert Parameters(path=self.tempdir.name)['hi_there'] == 'hello'
+        testing.assert_lists_equal(['pysat_settings.json',
+                                    'pysat_settings.json.lock'],
+                                   os.listdir(self.tempdir.name))
+        return
+
+    def test_batch_stores_after_error(self):
+        """Test that parameters set before an error in a batch are stored."""
+        test_params = Parameters(path=self.tempdir.name, create_new=True)
+
+        with pytest.raises(ValueError):
+            with test_params.batch():
+                test_params['hi_there'] = 'hello'
+                test_params['user_modules'] = {}
+
+        assert Parameters(path=self.tempdir.name)['hi_there'] == 'hello'
+        return
+
+    def test_reload_changed_file(self):
+        """Test that parameters stored by another object are reloaded."""
+        test_params = Parameters(path=self.tempdir.name, create_new=True)
+        other_params = Parameters(path=self.tempdir.name)
+        test_params.check_interval = 0.0
+
+        other_params['hi_there'] = 'hello'
+
+        # Changes are not loaded within a batch
+        with test_params.batch():
+            assert 'hi_there' not in test_params.data
+            test_params['file_timeout']
+
+        assert test_params['hi_there'] == 'hello'
+        return
+
+    def test_reload_keeps_unstored_changes(self):
+        """Test that changes not yet stored are kept when the file changes."""
+        test_params = Parameters(path=self.tempdir.name, create_new=True)
+        other_params = Parameters(path=self.tempdir.name)
+        test_params.check_interval = 0.0
+
+        other_params['hi_there'] = 'hello'
+
+        # Change the parameters in place, as done by the registry
+        test_params.data['user_modules']['platform'] = {'name': 'module'}
+        assert test_params['user_modules'] == {'platform': {'name': 'module'}}
+
+        test_params.store()
+        assert Parameters(path=self.tempdir.name)['user_modules'] \
+            == {'platform': {'name': 'module'}}
+        return
+
+    def test_load_and_store_lock(self, monkeypatch):
+        """Test that loads and stores lock a file next to the settings."""
+        locked = list()
+        timeouts = list()
+        lock = pysat._params.Lock
+
+        def record_lock(fname, *args, **kwargs):
+            locked.append(fname)
+            timeouts.append(kwargs['timeout'])
+            return lock(fname, *args, **kwargs)
+
+        monkeypatch.setattr(pysat._params, 'Lock', record_lock)
+        test_params = Parameters(path=self.tempdir.name, create_new=True)
+        test_params['file_timeout'] = 3
+        test_params['hi_there'] = 'hello'
+
+        assert len(locked) == 4
+        assert set(locked) == {'.'.join([test_params.file_path, 'lock'])}
+
+        # Loads use a fixed timeout, stores use the user setting
+        assert timeouts[0] == 10
+        assert timeouts[-1] == 3
+        return
+
+    def test_load_without_lock_access(self, monkeypatch):
+        """Test that settings are read when the lock file can't be created."""
+        test_params = Parameters(path=self.tempdir.name, create_new=True)
+        test_params['hi_there'] = 'hello'
+
+        class NoAccessLock(object):
+            """Lock that fails like a read-only settings directory."""
+
+            def __init__(self, *args, **kwargs):
+                return
+
+            def acquire(self):
+                """Fail to create the lock file."""
+                raise PermissionError('Permission denied')
+
+        monkeypatch.setattr(pysat._params, 'Lock', NoAccessLock)
+        new_params = Parameters(path=self.tempdir.name)
+
+        assert new_params['hi_there'] == 'hello'
+        return
+
     def test_bad_path_instantiation(self):
         """Ensure you can't use bad path when loading Parameters."""
         testing.eval_bad_input(Parameters, OSError,
@@ -17,6 +17,8 @@ import os
 import portalocker
 import pytest
 import shutil
+import subprocess
+import sys
 import tempfile
 
 import pysat
@@ -810,3 +812,57 @@ class TestMappedValue(object):
             assert val.upper() == utils.get_mapped_value(val, str.upper)
 
         return
+
+
+class TestLazyImports(object):
+    """Unit tests for attributes imported on first use."""
+
+    @pytest.mark.parametrize("module,attr", [
+        (pysat, 'Constellation'), (pysat.utils, 'coords'),
+        (pysat.utils, 'inventory'), (pysat.utils, 'io')])
+    def test_lazy_attr_access(self, module, attr):
+        """Test that lazily loaded attributes are available and listed.
+
+        Parameters
+        ----------
+        module : module
+            Module with a lazily loaded attribute
+        attr : str
+            Name of the lazily loaded attribute
+
+        """
+        assert attr in dir(module)
+        assert getattr(module, attr) is not None
+        return
+
+    @pytest.mark.parametrize("module", [pysat, pysat.utils])
+    def test_bad_attr_access(self, module):
+        """Test that unknown attributes still raise an AttributeError.
+
+        Parameters
+        ----------
+        module : module
+            Module with lazily loaded attributes
+
+        """
+        with pytest.raises(AttributeError) as aerr:
+            module.not_an_attribute
+
+        assert str(aerr).find('has no attribute') >= 0
+        return
+
+    def test_deferred_imports(self):
+        """Test that deferred modules are not loaded by `import pysat`."""
+        # Only check modules pysat controls, since other dependencies, such as
+        # xarray, may import modules that pysat defers
+        deferred = ['netCDF4', 'pysat._constellation', 'pysat.utils.coords',
+                    'pysat.utils.inventory', 'pysat.utils.io']
+        code = "\n".join(["import sys", "import pysat",
+                          "print([mod for mod in {:} if mod in sys.modules])",
+                          "pysat.Constellation", "pysat.utils.io",
+                          "print('netCDF4' in sys.modules)"]).format(deferred)
+        out = subprocess.run([sys.executable, '-c', code], check=True,
+                             capture_output=True, text=True).stdout.split()
+
+        assert out == ['[]', 'True']
+        return
@@ -0,0 +1,354 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Tests the `pysat.utils.download` functions and Instrument downloads."""
+
+import datetime as dt
+import logging
+import os
+import tempfile
+import threading
+
+import pandas as pds
+import pytest
+
+import pysat
+from pysat.utils import download
+from pysat.utils import testing
+
+
+class DownloadRecorder(object):
+    """Download routine that records calls and fails for selected dates.
+
+    Parameters
+    ----------
+    download_func : function or NoneType
+        Download routine called after the call is recorded, or None
+        (default=None)
+    fail_dates : list
+        Dates that raise an IOError (default=[])
+    num_fails : int
+        Number of times a chunk with a date in `fail_dates` fails (default=1)
+
+    """
+
+    def __init__(self, download_func=None, fail_dates=[], num_fails=1):
+        """Initialize the DownloadRecorder object."""
+        self.download_func = download_func
+        self.fail_dates = pds.DatetimeIndex(fail_dates)
+        self.num_fails = num_fails
+        self.calls = list()
+        self.threads = set()
+        self.lock = threading.Lock()
+        return
+
+    def __call__(self, date_array, **kwargs):
+        """Record the call and fail if requested."""
+        with self.lock:
+            self.calls.append(pds.DatetimeIndex(date_array))
+            self.threads.add(threading.get_ident())
+
+            if pds.DatetimeIndex(date_array).isin(self.fail_dates).any():
+                if self.num_fails > 0:
+                    self.num_fails -= 1
+                    raise IOError('simulated download failure')
+
+        if self.download_func is not None:
+            self.download_func(date_array, **kwargs)
+        return
+
+
+class TestSplitDates(object):
+    """Unit tests for `pysat.utils.download.split_dates`."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+        self.dates = pds.date_range('2009-01-01', '2009-01-10', freq='1D')
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+        del self.dates
+        return
+
+    @pytest.mark.parametrize("chunk_size,lengths", [
+        (None, [10]), (1, [1] * 10), (3, [3, 3, 3, 1]), (20, [10])])
+    def test_split_dates(self, chunk_size, lengths):
+        """Test the number and size of date chunks.
+
+        Parameters
+        ----------
+        chunk_size : int or NoneType
+            Number of dates in each chunk
+        lengths : list
+            Expected chunk lengths
+
+        """
+        chunks = download.split_dates(self.dates, chunk_size)
+
+        testing.assert_lists_equal(lengths, [len(chunk) for chunk in chunks])
+        assert pds.DatetimeIndex(
+            [date for chunk in chunks for date in chunk]).equals(self.dates)
+        return
+
+    def test_split_dates_bad_size(self):
+        """Test that a bad chunk size raises a ValueError."""
+        testing.eval_bad_input(download.split_dates, ValueError,
+                               'chunk_size must be a positive integer',
+                               input_args=[self.dates, 0])
+        return
+
+
+class TestRunDownload(object):
+    """Unit tests for `pysat.utils.download.run_download`."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+        self.dates = pds.date_range('2009-01-01', '2009-01-10', freq='1D')
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.journal = download.DownloadJournal(
+            os.path.join(self.tempdir.name, 'journal.txt'))
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+        self.tempdir.cleanup()
+        del self.dates, self.tempdir, self.journal
+        return
+
+    def test_single_call(self):
+        """Test that the default inputs pass all dates in one call."""
+        dates = list(self.dates)
+        recorder = DownloadRecorder()
+        download.run_download(recorder, dates, tag='test')
+
+        assert len(recorder.calls) == 1
+        assert recorder.calls[0].equals(self.dates)
+        return
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_chunked_download(self, workers):
+        """Test that all chunks are downloaded by the thread pool.
+
+        Parameters
+        ----------
+        workers : int
+            Number of download threads
+
+        """
+        recorder = DownloadRecorder()
+        download.run_download(recorder, self.dates, chunk_size=2,
+                              workers=workers)
+
+        assert len(recorder.calls) == 5
+        dates = pds.DatetimeIndex([date for call in recorder.calls
+                                   for date in call])
+        assert dates.sort_values().equals(self.dates)
+        assert len(recorder.threads) <= workers
+        return
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_chunk_callback(self, workers):
+        """Test that the callback is run in this thread after each chunk.
+
+        Parameters
+        ----------
+        workers : int
+            Number of download threads
+
+        """
+        recorder = DownloadRecorder(fail_dates=[self.dates[0]])
+        finished = list()
+
+        def chunk_callback(chunk):
+            finished.append((pds.DatetimeIndex(chunk),
+                             threading.get_ident()))
+            return
+
+        with pytest.raises(IOError):
+            download.run_download(recorder, self.dates, chunk_size=2,
+                                  workers=workers,
+                                  chunk_callback=chunk_callback)
+
+        assert len(finished) == 5
+        dates = pds.DatetimeIndex([date for chunk, _ in finished
+                                   for date in chunk])
+        assert dates.sort_values().equals(self.dates)
+        assert {thread for _, thread in finished} == {threading.get_ident()}
+        return
+
+    def test_retry_failed_chunk(self, caplog):
+        """Test that a failed chunk is retried."""
+        recorder = DownloadRecorder(fail_dates=[self.dates[4]], num_fails=2)
+
+        with caplog.at_level(logging.WARNING, logger='pysat'):
+            download.run_download(recorder, self.dates, chunk_size=5,
+                                  retries=2, retry_delay=0.0)
+
+        assert len(recorder.calls) == 4
+        assert caplog.text.count('Retrying in') == 2
+        return
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_failed_chunk_raises(self, caplog, workers):
+        """Test that remaining chunks finish before a failure is raised.
+
+        Parameters
+        ----------
+        workers : int
+            Number of download threads
+
+        """
+        recorder = DownloadRecorder(fail_dates=[self.dates[0]])
+
+        with caplog.at_level(logging.ERROR, logger='pysat'):
+            testing.eval_bad_input(
+                download.run_download, IOError, 'simulated download failure',
+                input_args=[recorder, self.dates],
+                input_kwargs={'chunk_size': 5, 'workers': workers,
+                              'journal': self.journal})
+
+        assert 'Download failed for 5 dates' in caplog.text
+        assert self.journal.completed.equals(self.dates[5:])
+        return
+
+    def test_resume_download(self):
+        """Test that a resumed download skips completed chunks."""
+        recorder = DownloadRecorder(fail_dates=[self.dates[0]])
+
+        with pytest.raises(IOError):
+            download.run_download(recorder, self.dates, chunk_size=2,
+                                  journal=self.journal)
+
+        assert len(recorder.calls) == 5
+        download.run_download(recorder, self.dates, chunk_size=2,
+                              journal=self.journal)
+
+        assert len(recorder.calls) == 6
+        assert recorder.calls[-1].equals(self.dates[:2])
+        assert not os.path.isfile(self.journal.fname)
+        return
+
+    def test_bad_workers(self):
+        """Test that a bad number of workers raises a ValueError."""
+        testing.eval_bad_input(download.run_download, ValueError,
+                               'workers must be a positive integer',
+                               input_args=[DownloadRecorder(), self.dates],
+                               input_kwargs={'workers': 0})
+        return
+
+
+class TestDownloadJournal(object):
+    """Unit tests for `pysat.utils.download.DownloadJournal`."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.journal = download.DownloadJournal(
+            os.path.join(self.tempdir.name, 'subdir', 'journal.txt'))
+        self.dates = pds.date_range('2009-01-01', '2009-01-04', freq='1D')
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+        self.tempdir.cleanup()
+        del self.tempdir, self.journal, self.dates
+        return
+
+    def test_empty_journal(self):
+        """Test that a missing journal has no completed dates."""
+        assert len(self.journal.completed) == 0
+        assert repr(self.journal).find('DownloadJournal(') > 0
+        return
+
+    def test_record_and_remove(self):
+        """Test recording and removing dates."""
+        self.journal.record(self.dates[2:])
+        self.journal.record(self.dates[:3])
+        assert self.journal.completed.equals(self.dates)
+
+        self.journal.remove(self.dates[:2])
+        assert self.journal.completed.equals(self.dates[2:])
+
+        self.journal.remove(self.dates)
+        assert not os.path.isfile(self.journal.fname)
+        return
+
+
+class TestInstrumentDownload(object):
+    """Unit tests for scheduled `Instrument.download` calls."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+        self.testInst = pysat.Instrument('pysat', 'testing', num_samples=10,
+                                         update_files=True)
+        self.recorder = DownloadRecorder(self.testInst._download_rtn)
+        self.testInst._download_rtn = self.recorder
+        self.start = dt.datetime(2009, 1, 1)
+        self.stop = dt.datetime(2009, 1, 8)
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+        download.DownloadJournal(os.path.join(
+            self.testInst.files.home_path,
+            self.testInst.files.stored_file_name.replace(
+                'stored_file_info', 'download_journal'))).clear()
+        del self.testInst, self.recorder, self.start, self.stop
+        return
+
+    def test_chunked_download_kwargs(self):
+        """Test that each chunk is passed the download kwargs."""
+        calls = list()
+
+        def download_func(date_array, **kwargs):
+            calls.append(kwargs)
+            return
+
+        self.recorder.download_func = download_func
+        self.testInst.download(self.start, self.stop, chunk_size=3, workers=2,
+                               test_download_kwarg='chunk')
+
+        assert len(calls) == 3
+        for kwargs in calls:
+            assert kwargs['test_download_kwarg'] == 'chunk'
+            assert kwargs['data_path'] == self.testInst.files.data_path
+        return
+
+    def test_resumed_download(self, caplog):
+        """Test that a failed download is resumed and the files updated."""
+        self.recorder.fail_dates = pds.DatetimeIndex([self.stop])
+
+        with caplog.at_level(logging.INFO, logger='pysat'):
+            with pytest.raises(IOError):
+                self.testInst.download(self.start, self.stop, chunk_size=2,
+                                       resume=True)
+
+            # The file list is updated after a failure
+            assert "Updating pysat file list" in caplog.text
+
+            self.testInst.download(self.start, self.stop, chunk_size=2,
+                                   resume=True)
+
+        assert "skipping 6 completed dates" in caplog.text
+        assert self.recorder.calls[-1].equals(pds.date_range(
+            self.stop - dt.timedelta(days=1), self.stop))
+        return
+
+    def test_file_list_updated_per_chunk(self, monkeypatch):
+        """Test that the file list is updated as each chunk finishes."""
+        updates = list()
+        monkeypatch.setattr(self.testInst.files, 'refresh',
+                            lambda: updates.append(len(self.recorder.calls)))
+
+        self.testInst.download(self.start, self.stop, chunk_size=2)
+
+        assert updates == [1, 2, 3, 4]
+        return
@@ -792,6 +792,43 @@ class TestFileUtils(CICleanSetup):
             suffix) > 0, "unexpected file extension in search results"
         return
 
+    def test_resume_updating_directories(self, monkeypatch):
+        """Test resuming an interrupted directory structure update."""
+        # Create files for an Instrument that lists the local files
+        inst = pysat.Instrument('pysat', 'netcdf')
+        pysat.utils.files.check_and_make_path(inst.files.data_path)
+        pimtesting.create_files(
+            inst, self.start, self.start + dt.timedelta(days=9), freq='1D',
+            use_doy=False, root_fname=inst.inst_module.format_str)
+        monkeypatch.setattr(futils, 'available_instruments', lambda: {
+            'pysat': {'netcdf': {'inst_ids_tags': {'': {'': ''}}}}})
+
+        # Interrupt the update after only some of the files have moved
+        run_file_moves = futils.run_file_moves
+
+        def interrupted_moves(plan, **kwargs):
+            run_file_moves(plan.iloc[:4], **kwargs)
+            raise KeyboardInterrupt('Stopping the update')
+
+        templ = '{platform}'
+        monkeypatch.setattr(futils, 'run_file_moves', interrupted_moves)
+        with pytest.raises(KeyboardInterrupt):
+            futils.update_data_directory_structure(new_template=templ,
+                                                   test_run=False)
+
+        # Resume the update
+        monkeypatch.setattr(futils, 'run_file_moves', run_file_moves)
+        futils.update_data_directory_structure(new_template=templ,
+                                               test_run=False)
+
+        # The stored file list includes the files moved before the interruption
+        new_inst = pysat.Instrument('pysat', 'netcdf', directory_format=templ,
+                                    update_files=False)
+        assert new_inst.files.data_path == os.path.join(self.tempdir.name,
+                                                        'pysat', '')
+        assert len(new_inst.files.files) == 10
+        return
+
     def test_get_file_information(self):
         """Test `utils.files.get_file_information` success with existing files.
 
@@ -827,6 +864,53 @@ class TestFileUtils(CICleanSetup):
 
         return
 
+    def test_get_file_information_missing(self):
+        """Test FileNotFoundError raised for missing files."""
+        testing.eval_bad_input(futils.get_file_information, FileNotFoundError,
+                               'Unable to find files',
+                               input_args=[['not_a_file.nofile']],
+                               input_kwargs={'root_dir': self.tempdir.name})
+        return
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_stat_files(self, workers):
+        """Test `utils.files.stat_files` for files in several directories.
+
+        Parameters
+        ----------
+        workers : int
+            Number of directories scanned at the same time
+
+        """
+        # Create files of different sizes in two directories
+        sub_dir = os.path.join(self.tempdir.name, 'sub')
+        os.mkdir(sub_dir)
+        paths = ['full.txt', 'empty.txt', os.path.join('sub', 'full.txt'),
+                 'missing.txt', os.path.join('none', 'missing.txt'), 'sub']
+        for path, text in zip(paths[:3], ['data', '', 'more data']):
+            with open(os.path.join(self.tempdir.name, path), 'w') as fout:
+                fout.write(text)
+
+        file_info = futils.stat_files(paths, root_dir=self.tempdir.name,
+                                      workers=workers)
+
+        assert list(file_info['exists']) == [True, True, True, False, False,
+                                             True]
+        assert list(file_info['is_file']) == [True, True, True, False, False,
+                                              False]
+        assert list(file_info['size'][:4]) == [4, 0, 9, 0]
+        assert np.isnan(file_info['content_modified_time'][3:5]).all()
+        assert np.isfinite(file_info['content_modified_time'][:3]).all()
+        return
+
+    def test_stat_files_bad_workers(self):
+        """Test ValueError raised for too few workers."""
+        testing.eval_bad_input(futils.stat_files, ValueError,
+                               '`workers` must be at least one',
+                               input_args=[['file.txt']],
+                               input_kwargs={'workers': 0})
+        return
+
     @pytest.mark.parametrize("use_cwd", [True, False])
     def test_check_and_make_path_exists(self, use_cwd):
         """Test successful pass at creating existing directory.
@@ -920,3 +1004,150 @@ class TestFileUtils(CICleanSetup):
                                input_args=[path])
 
         return
+
+
+class TestDiffFileLists(object):
+    """Unit tests for the `diff_file_lists` function."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+        self.dates = pds.date_range('2009-01-01', periods=5, freq='1D')
+        self.old_files = pds.Series(['f{:d}_v01.nc'.format(i)
+                                     for i in range(5)], index=self.dates)
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+        del self.dates, self.old_files
+        return
+
+    def test_diff_file_lists(self):
+        """Test identification of new, updated, and deleted files."""
+        new_dates = self.dates[1:].append(pds.DatetimeIndex(['2009-01-06']))
+        new_files = pds.Series(['f1_v01.nc', 'f2_v02.nc', 'f3_v01.nc',
+                                'f4_v02.nc', 'f5_v01.nc'], index=new_dates)
+
+        file_diff = futils.diff_file_lists(self.old_files, new_files)
+
+        assert list(file_diff['new'].values) == ['f5_v01.nc']
+        assert list(file_diff['updated'].values) == ['f2_v02.nc', 'f4_v02.nc']
+        assert file_diff['updated'].index.equals(self.dates[[2, 4]])
+        assert list(file_diff['deleted'].values) == ['f0_v01.nc']
+        return
+
+    def test_diff_file_lists_unchanged(self):
+        """Test that identical file lists have no differences."""
+        file_diff = futils.diff_file_lists(self.old_files,
+                                           self.old_files.copy())
+
+        for key in ['new', 'updated', 'deleted']:
+            assert len(file_diff[key]) == 0
+        return
+
+    def test_diff_file_lists_empty_old(self):
+        """Test that all files are new if the old file list is empty."""
+        file_diff = futils.diff_file_lists(pds.Series([], dtype='a'),
+                                           self.old_files)
+
+        assert file_diff['new'].equals(self.old_files)
+        assert len(file_diff['updated']) == 0
+        assert len(file_diff['deleted']) == 0
+        return
+
+
+class TestFileMoves(object):
+    """Unit tests for the `plan_file_moves` and `run_file_moves` functions."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.old_dir = os.path.join(self.tempdir.name, 'old')
+        self.new_dir = os.path.join(self.tempdir.name, 'new', 'sub')
+        os.mkdir(self.old_dir)
+
+        self.fnames = ['f{:d}.txt'.format(i) for i in range(4)]
+        self.old_files = [os.path.join(self.old_dir, fname)
+                          for fname in self.fnames]
+        self.new_files = [os.path.join(self.new_dir, fname)
+                          for fname in self.fnames]
+        for fname in self.old_files:
+            with open(fname, 'w') as fout:
+                fout.write(os.path.basename(fname))
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+        self.tempdir.cleanup()
+        del self.tempdir, self.old_dir, self.new_dir, self.fnames
+        del self.old_files, self.new_files
+        return
+
+    def test_plan_file_moves(self):
+        """Test that files on the same filesystem are planned as renames."""
+        plan = futils.plan_file_moves(self.old_files, self.new_files)
+
+        assert list(plan['source']) == self.old_files
+        assert list(plan['destination']) == self.new_files
+        assert list(plan['action']) == ['rename'] * len(self.fnames)
+        return
+
+    def test_plan_file_moves_resume(self):
+        """Test the planned actions for a partially completed move."""
+        os.makedirs(self.new_dir)
+        os.rename(self.old_files[0], self.new_files[0])
+        with open(self.new_files[1], 'w') as fout:
+            fout.write('copy')
+        os.remove(self.old_files[2])
+
+        plan = futils.plan_file_moves(self.old_files, self.new_files)
+
+        assert list(plan['action']) == ['done', 'exists', 'missing', 'rename']
+        return
+
+    def test_plan_file_moves_bad_length(self):
+        """Test ValueError raised for mismatched file lists."""
+        testing.eval_bad_input(futils.plan_file_moves, ValueError,
+                               'Number of source and destination files',
+                               input_args=[self.old_files,
+                                           self.new_files[1:]])
+        return
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    @pytest.mark.parametrize("action", ['rename', 'copy'])
+    def test_run_file_moves(self, action, workers, capsys):
+        """Test that planned files are moved and progress is reported."""
+        plan = futils.plan_file_moves(self.old_files, self.new_files)
+        plan['action'] = action
+
+        num_moved = futils.run_file_moves(plan, workers=workers)
+
+        assert num_moved == len(self.fnames)
+        assert sorted(os.listdir(self.new_dir)) == self.fnames
+        assert os.listdir(self.old_dir) == []
+        for fname in self.new_files:
+            with open(fname, 'r') as fin:
+                assert fin.read() == os.path.basename(fname)
+
+        captured = capsys.readouterr()
+        assert captured.out.find('Moved 4 of 4 files.') >= 0
+        return
+
+    def test_run_file_moves_skips_done(self):
+        """Test that only the remaining files are moved when resuming."""
+        os.makedirs(self.new_dir)
+        os.rename(self.old_files[0], self.new_files[0])
+
+        plan = futils.plan_file_moves(self.old_files, self.new_files)
+        num_moved = futils.run_file_moves(plan, verbose=False)
+
+        assert num_moved == len(self.fnames) - 1
+        assert sorted(os.listdir(self.new_dir)) == self.fnames
+        return
+
+    def test_run_file_moves_bad_workers(self):
+        """Test ValueError raised for too few workers."""
+        plan = futils.plan_file_moves(self.old_files, self.new_files)
+        testing.eval_bad_input(futils.run_file_moves, ValueError,
+                               '`workers` must be at least one',
+                               input_args=[plan], input_kwargs={'workers': 0})
+        return
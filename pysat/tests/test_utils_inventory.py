@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Tests the `pysat.utils.inventory` functions and classes."""
+
+import datetime as dt
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+
+import pandas as pds
+
+import pysat
+from pysat.instruments.methods.testing import create_files
+from pysat.utils import inventory
+
+
+class TestFileInventory(object):
+    """Unit tests for `pysat.utils.inventory.FileInventory`."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.data_path = os.path.join(self.tempdir.name, 'data')
+        os.mkdir(self.data_path)
+        self.fnames = ['f{:d}.txt'.format(i) for i in range(3)]
+        for fname in self.fnames:
+            self.write_file(fname, fname)
+
+        self.inv = inventory.FileInventory(os.path.join(
+            self.tempdir.name, 'inventory', 'test_inventory.db'))
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+        self.tempdir.cleanup()
+        del self.tempdir, self.data_path, self.fnames, self.inv
+        return
+
+    def write_file(self, fname, text):
+        """Write text to a file in the data directory.
+
+        Parameters
+        ----------
+        fname : str
+            File name
+        text : str
+            File contents
+
+        """
+        with open(os.path.join(self.data_path, fname), 'w') as fout:
+            fout.write(text)
+        return
+
+    def test_repr_and_eq(self):
+        """Test the representation and equality of inventories."""
+        assert repr(self.inv).find('FileInventory(') >= 0
+        assert self.inv == inventory.FileInventory(self.inv.fname)
+        assert self.inv != self.inv.fname
+        return
+
+    def test_sync(self):
+        """Test that existing files are recorded with their sizes."""
+        changed = self.inv.sync(self.data_path, self.fnames + ['missing.txt'])
+        records = self.inv.get()
+
+        assert changed == self.fnames
+        assert list(records.index) == self.fnames
+        assert list(records.columns) == self.inv.columns
+        assert list(records['size']) == [6, 6, 6]
+        assert records['checksum'].isnull().all()
+        return
+
+    def test_sync_changes(self):
+        """Test that only changed files are reported by a later sync."""
+        self.inv.sync(self.data_path, self.fnames)
+        self.inv.record_coverage(self.fnames[1], dt.datetime(2009, 1, 1),
+                                 dt.datetime(2009, 1, 2), 10)
+        self.inv.record_coverage(self.fnames[2], dt.datetime(2009, 1, 2),
+                                 dt.datetime(2009, 1, 3), 10)
+        self.write_file(self.fnames[1], 'new contents')
+        assert self.inv.changed(self.data_path, self.fnames) == [
+            self.fnames[1]]
+
+        changed = self.inv.sync(self.data_path, self.fnames[1:])
+        records = self.inv.get()
+
+        assert changed == [self.fnames[1]]
+        assert list(records.index) == self.fnames[1:]
+        assert records['size'].iloc[0] == 12
+        assert pds.isnull(records['first_time'].iloc[0])
+        assert records['num_samples'].iloc[1] == 10
+        return
+
+    def test_sync_checksum(self):
+        """Test that checksums are calculated when requested."""
+        self.inv.sync(self.data_path, self.fnames)
+        self.inv.sync(self.data_path, self.fnames, checksum=True)
+        records = self.inv.get()
+
+        for fname in self.fnames:
+            assert records['checksum'][fname] == hashlib.sha256(
+                fname.encode()).hexdigest()
+        return
+
+    def test_changed_unrecorded(self):
+        """Test that unrecorded and missing files are reported as changed."""
+        self.inv.sync(self.data_path, self.fnames[:1])
+
+        assert self.inv.changed(self.data_path,
+                                self.fnames + ['missing.txt']) == [
+            self.fnames[1], self.fnames[2], 'missing.txt']
+        return
+
+    def test_gaps(self):
+        """Test that gaps between the file coverage are found."""
+        self.inv.sync(self.data_path, self.fnames)
+        start = dt.datetime(2009, 1, 1)
+        for i, fname in enumerate(self.fnames):
+            self.inv.record_coverage(
+                fname, start + dt.timedelta(days=i),
+                start + dt.timedelta(days=i, hours=23 - 10 * i), 10)
+
+        gaps = self.inv.gaps()
+        assert list(gaps['start']) == [start + dt.timedelta(hours=23),
+                                       start + dt.timedelta(days=1, hours=13)]
+        assert list(gaps['stop']) == [start + dt.timedelta(days=1),
+                                      start + dt.timedelta(days=2)]
+
+        gaps = self.inv.gaps(min_gap=dt.timedelta(hours=2))
+        assert len(gaps) == 1
+        assert gaps['duration'].iloc[0] == dt.timedelta(hours=11)
+        return
+
+
+class TestInstrumentInventory(object):
+    """Unit tests for the inventory kept by `pysat.Files`."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+        self.data_paths = pysat.params['data_dirs']
+        self.tempdir = tempfile.TemporaryDirectory()
+        pysat.params['data_dirs'] = [self.tempdir.name]
+        pysat.params['file_inventory'] = True
+
+        self.testInst = pysat.Instrument('pysat', 'testing', num_samples=10)
+        self.start = pysat.instruments.pysat_testing._test_dates['']['']
+        os.makedirs(self.testInst.files.data_path, exist_ok=True)
+        create_files(self.testInst, self.start,
+                     self.start + dt.timedelta(days=2), use_doy=False,
+                     root_fname='{year:04d}-{month:02d}-{day:02d}.nofile',
+                     content='data')
+        self.testInst.files.refresh()
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+        os.remove(self.testInst.files.inventory.fname)
+        pysat.params['file_inventory'] = False
+        pysat.params['data_dirs'] = self.data_paths
+        self.tempdir.cleanup()
+        del self.data_paths, self.tempdir, self.testInst, self.start
+        return
+
+    def test_refresh_records_files(self):
+        """Test that only files found on the system are recorded."""
+        records = self.testInst.files.inventory.get()
+
+        assert len(records) == 3
+        assert list(records.index) == list(self.testInst.files[
+            self.start:self.start + dt.timedelta(days=3)])
+        return
+
+    def test_load_records_coverage(self):
+        """Test that loading a single file records its time coverage."""
+        self.testInst.load(date=self.start)
+        records = self.testInst.files.inventory.get()
+
+        assert records['first_time'].iloc[0] == self.testInst.index[0]
+        assert records['last_time'].iloc[0] == self.testInst.index[-1]
+        assert records['num_samples'].iloc[0] == 10
+        assert records['num_samples'].iloc[1:].isnull().all()
+        return
+
+    def test_load_with_inventory_error(self, caplog, monkeypatch):
+        """Test that inventory database errors don't stop the load.
+
+        Parameters
+        ----------
+        caplog : pytest.LogCaptureFixture
+            Fixture used to capture the logged warning
+        monkeypatch : pytest.MonkeyPatch
+            Fixture used to replace the coverage recording
+
+        """
+
+        def locked(*args, **kwargs):
+            raise sqlite3.OperationalError('database is locked')
+
+        monkeypatch.setattr(self.testInst.files.inventory, 'record_coverage',
+                            locked)
+
+        with caplog.at_level(logging.WARNING, logger='pysat'):
+            self.testInst.load(date=self.start)
+
+        assert len(self.testInst.index) == 10
+        assert caplog.text.find('database is locked') >= 0
+        return
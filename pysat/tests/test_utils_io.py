@@ -22,9 +22,11 @@ import warnings
 import netCDF4
 import pandas as pds
 import pytest
+import scipy.io
 
 import pysat
 from pysat.utils import io
+from pysat.utils import memory
 from pysat.utils import testing
 
 # Define `epoch_name` and `decode_times` for future changes in default values
@@ -670,6 +672,104 @@ class TestLoadNetCDF(object):
 
         return
 
+    def write_mmap_file(self, unlimited_time=False):
+        """Write the test data to a file and load it with `mmap`.
+
+        Parameters
+        ----------
+        unlimited_time : bool
+            If True, the file variables are chunked and can't be mapped.
+            (default=False)
+
+        Returns
+        -------
+        outfile : str
+            Name of the file
+
+        """
+        outfile = self.stime.strftime(os.path.join(
+            self.tempdir.name, 'pysat_test_ncdf_%Y%j.nc'))
+        self.testInst.load(date=self.stime)
+        io.inst_to_netcdf(self.testInst, fname=outfile,
+                          epoch_name=default_epoch_name,
+                          unlimited_time=unlimited_time)
+
+        self.loaded_inst, meta = io.load_netcdf(
+            outfile, pandas_format=self.testInst.pandas_format,
+            epoch_name=default_epoch_name, mmap=True,
+            **decode_times_val(self.testInst.pandas_format))
+        assert 'mlt' in meta
+        return outfile
+
+    @pytest.mark.parametrize("unlimited_time", [False, True])
+    def test_read_netcdf4_mmap(self, unlimited_time):
+        """Test `mmap` keyword when loading data from file.
+
+        Parameters
+        ----------
+        unlimited_time : bool
+            If True, the file variables are chunked and can't be mapped.
+
+        """
+        pytest.importorskip("h5py")
+        outfile = self.write_mmap_file(unlimited_time=unlimited_time)
+
+        # Only contiguous variables are mapped, and the values are unchanged
+        mlt = self.loaded_inst['mlt'].values
+        assert (memory._get_memmap_base(mlt) is None) == unlimited_time
+        assert np.all(self.testInst['mlt'].values == mlt)
+
+        # Mapped data may be changed without changing the file
+        mlt[0:3] = -1.0
+        reloaded, _ = io.load_netcdf(
+            outfile, pandas_format=self.testInst.pandas_format,
+            epoch_name=default_epoch_name, mmap=True,
+            **decode_times_val(self.testInst.pandas_format))
+        assert np.all(self.testInst['mlt'].values == reloaded['mlt'].values)
+        return
+
+    def test_copy_mapped_data(self):
+        """Test that copies of memory-mapped data are independent."""
+        pytest.importorskip("h5py")
+        self.write_mmap_file()
+
+        copied = memory.copy_mapped_data(self.loaded_inst)
+        copied['mlt'].values[0:3] = -1.0
+        assert memory._get_memmap_base(copied['mlt'].values) is not None
+        assert np.all(self.testInst['mlt'].values
+                      == self.loaded_inst['mlt'].values)
+
+        # Variables that aren't mapped are copied in memory
+        indexes = getattr(self.loaded_inst, 'indexes', [])
+        for var in self.testInst.variables:
+            if memory._get_memmap_base(self.loaded_inst[var].values) is None \
+                    and var not in indexes:
+                assert not np.shares_memory(self.loaded_inst[var].values,
+                                            copied[var].values)
+        return
+
+    def test_inst_load_mmap(self):
+        """Test changing Instrument data loaded with `mmap`."""
+        pytest.importorskip("h5py")
+        self.write_mmap_file()
+        netcdf_inst = pysat.Instrument(
+            'pysat', 'netcdf', data_dir=self.tempdir.name, update_files=True,
+            file_format='pysat_test_ncdf_{year:04}{day:03}.nc',
+            pandas_format=self.testInst.pandas_format,
+            epoch_name=default_epoch_name, mmap=True,
+            **decode_times_val(self.testInst.pandas_format))
+        netcdf_inst.load(date=self.stime)
+
+        # Data may be changed in place, without changing the stored data
+        netcdf_inst[0:3, 'mlt'] = 5.0
+        assert np.all(netcdf_inst['mlt'][0:3] == 5.0)
+        assert memory._get_memmap_base(netcdf_inst['mlt'].values) is not None
+
+        netcdf_inst.load(date=self.stime)
+        assert np.all(netcdf_inst['mlt'].values
+                      == self.testInst['mlt'].values)
+        return
+
 
 class TestLoadNetCDFXArray(TestLoadNetCDF):
     """Unit tests for `load_netcdf` using xarray data."""
@@ -764,6 +864,40 @@ class TestLoadNetCDFXArray(TestLoadNetCDF):
                 "Variable {:} not loaded correctly".format(var)
         return
 
+    @pytest.mark.parametrize("num_times", [10, None])
+    def test_read_netcdf3_mmap(self, num_times):
+        """Test `mmap` keyword when loading a NETCDF3 file.
+
+        Parameters
+        ----------
+        num_times : int or NoneType
+            Length of the time dimension, or None for an unlimited dimension
+
+        """
+        # Create a NETCDF3 file
+        outfile = os.path.join(self.tempdir.name, 'pysat_test_ncdf3.nc')
+        with scipy.io.netcdf_file(outfile, mode='w') as ncdata:
+            ncdata.createDimension('time', num_times)
+            ncdata.createVariable('time', 'i4', ('time', ))[:] = np.arange(10)
+            ncdata.createVariable('dummy', 'f8', ('time', ))[:] = np.ones(10)
+            ncdata.createVariable('dummy2', 'i4', ('time', ))[:] = np.ones(10)
+
+        # Load the file
+        self.loaded_inst, meta = io.load_netcdf(outfile, pandas_format=False,
+                                                file_format='NETCDF3_CLASSIC',
+                                                decode_times=False, mmap=True)
+
+        # Mapped data may be changed without changing the file
+        dummy = self.loaded_inst['dummy'].values
+        assert memory._get_memmap_base(dummy) is not None
+        assert np.all(dummy == 1.0)
+        dummy[0:3] = -1.0
+
+        with scipy.io.netcdf_file(outfile, mode='r', mmap=False) as ncdata:
+            assert np.all(ncdata.variables['dummy'][:] == 1.0)
+            assert np.all(ncdata.variables['dummy2'][:] == 1)
+        return
+
     def test_load_netcdf_pandas_2d_error(self):
         """Test load_netcdf error with a pandas 2D file."""
         # Create a bunch of files by year and doy
@@ -781,6 +915,486 @@ class TestLoadNetCDFXArray(TestLoadNetCDF):
         return
 
 
+class TestZarrIO(object):
+    """Unit tests for `utils.io.load_zarr` and `utils.io.inst_to_zarr`.
+
+    Subclasses test other file types and Instruments by updating the class
+    attributes.
+
+    """
+
+    # Optional dependency, file extension, and test Instrument name
+    module_name = 'zarr'
+    ext = 'zarr'
+    inst_name = 'testing'
+
+    def setup_method(self):
+        """Set up the test environment."""
+
+        pytest.importorskip(self.module_name)
+
+        # Create temporary directory
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.saved_path = pysat.params['data_dirs']
+        pysat.params['data_dirs'] = self.tempdir.name
+
+        self.testInst = pysat.Instrument(platform='pysat', name=self.inst_name,
+                                         num_samples=100, update_files=True)
+        self.stime = self.testInst.inst_module._test_dates['']['']
+        self.write_func = getattr(io, 'inst_to_{:s}'.format(self.ext))
+        self.load_func = getattr(io, 'load_{:s}'.format(self.ext))
+        return
+
+    def teardown_method(self):
+        """Clean up the test environment."""
+
+        pysat.params['data_dirs'] = self.saved_path
+
+        # Remove the temporary directory
+        self.tempdir.cleanup()
+
+        del self.testInst, self.stime, self.tempdir, self.saved_path
+        del self.write_func, self.load_func
+        return
+
+    def write_test_file(self, **kwargs):
+        """Load test data and write it to a file.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            Keyword arguments passed to the write function.
+
+        Returns
+        -------
+        outfile : str
+            Name of the output file.
+
+        """
+        outfile = os.path.join(self.tempdir.name,
+                               'pysat_test_file.{:s}'.format(self.ext))
+        self.testInst.load(date=self.stime)
+        self.write_func(self.testInst, outfile, **kwargs)
+
+        return outfile
+
+    @pytest.mark.parametrize("epoch_name", ['time', 'Epoch'])
+    def test_write_and_read(self, epoch_name):
+        """Test that data and metadata survive a write and read.
+
+        Parameters
+        ----------
+        epoch_name : str
+            Label for the epoch in the file.
+
+        """
+        outfile = self.write_test_file(epoch_name=epoch_name)
+        data, meta = self.load_func(outfile, epoch_name=epoch_name,
+                                    pandas_format=self.testInst.pandas_format)
+
+        for dkey in self.testInst.vars_no_time:
+            assert np.all(self.testInst[dkey].values == data[dkey].values), \
+                "Data mismatch for {:}".format(dkey)
+            assert dkey in meta, "Missing metadata for {:}".format(dkey)
+
+        assert np.all(self.testInst.index.values
+                      == (data.index.values if self.testInst.pandas_format
+                          else data['time'].values))
+        assert meta.header.platform == self.testInst.platform
+        assert meta[self.testInst.vars_no_time[0],
+                    meta.labels.units] == self.testInst.meta[
+                        self.testInst.vars_no_time[0], meta.labels.units]
+        return
+
+    def test_read_variable_subset(self):
+        """Test that only the requested variables are loaded."""
+        outfile = self.write_test_file()
+        data, meta = self.load_func(outfile, variables=['mlt', 'slt'],
+                                    pandas_format=self.testInst.pandas_format)
+
+        if self.testInst.pandas_format:
+            dvars = list(data.columns)
+        else:
+            dvars = list(data.data_vars)
+
+        testing.assert_lists_equal(dvars, ['mlt', 'slt'])
+        assert 'mlt' in meta
+        assert 'dummy1' not in meta
+        return
+
+    def test_read_meta_processor(self):
+        """Test that `meta_processor` is applied to the loaded metadata."""
+
+        def meta_proc(meta_dict):
+            """Update the loaded metadata.
+
+            Parameters
+            ----------
+            meta_dict : dict
+                Loaded metadata dict.
+
+            Returns
+            -------
+            meta_dict : dict
+                Updated metadata dict.
+
+            """
+            for var in meta_dict.keys():
+                meta_dict[var]['notes'] = 'processed'
+
+            return meta_dict
+
+        outfile = self.write_test_file()
+        data, meta = self.load_func(outfile, meta_processor=meta_proc,
+                                    pandas_format=self.testInst.pandas_format)
+
+        assert meta['mlt', meta.labels.notes] == 'processed'
+        return
+
+    def test_read_bad_epoch_name(self):
+        """Test that a missing epoch raises a KeyError."""
+        outfile = self.write_test_file()
+
+        testing.eval_bad_input(self.load_func, KeyError, 'Epoch label: "bad"',
+                               input_args=[outfile],
+                               input_kwargs={'epoch_name': 'bad'})
+        return
+
+    @pytest.mark.parametrize("base_attr", [True, False])
+    def test_write_base_instrument(self, base_attr):
+        """Test only the attributes missing from `base_instrument` are written.
+
+        Parameters
+        ----------
+        base_attr : bool
+            Add the custom attribute to `base_instrument` as well.
+
+        """
+        base_inst = pysat.Instrument()
+        if base_attr:
+            base_inst.custom_attr = 'base'
+
+        self.testInst.custom_attr = 'custom'
+        outfile = self.write_test_file(base_instrument=base_inst)
+        data, meta = self.load_func(outfile,
+                                    pandas_format=self.testInst.pandas_format)
+
+        if base_attr:
+            assert not hasattr(meta.header, 'custom_attr')
+        else:
+            assert meta.header.custom_attr == 'custom'
+        return
+
+    def test_missing_dependency(self, monkeypatch):
+        """Test an ImportError is raised without the optional dependency."""
+        outfile = self.write_test_file()
+        monkeypatch.setitem(sys.modules, self.module_name, None)
+
+        estr = '{:s} support requires the optional dependency `{:s}`'.format(
+            self.ext, self.module_name)
+        testing.eval_bad_input(self.load_func, ImportError, estr,
+                               input_args=[outfile])
+        testing.eval_bad_input(self.write_func, ImportError, estr,
+                               input_args=[self.testInst, outfile])
+        return
+
+    @pytest.mark.parametrize("ignore_empty_files", [True, False])
+    def test_instrument_load(self, ignore_empty_files):
+        """Test the general Instrument reads the written files.
+
+        Parameters
+        ----------
+        ignore_empty_files : bool
+            Remove empty files from the Instrument file list.
+
+        """
+        outfile = os.path.join(self.tempdir.name, self.stime.strftime(
+            'test_%Y%m%d.{:s}'.format(self.ext)))
+        self.testInst.load(date=self.stime)
+        self.write_func(self.testInst, outfile)
+
+        file_inst = pysat.Instrument(
+            'pysat', self.ext, temporary_file_list=True,
+            pandas_format=self.testInst.pandas_format,
+            directory_format=self.tempdir.name,
+            ignore_empty_files=ignore_empty_files,
+            file_format=''.join(['test_{year:04d}{month:02d}{day:02d}.',
+                                 self.ext]))
+        assert len(file_inst.files.files) == 1
+        file_inst.load(date=self.stime)
+
+        assert file_inst.platform == self.testInst.platform
+        assert file_inst.name == self.testInst.name
+        assert np.all(file_inst['mlt'] == self.testInst['mlt'])
+        return
+
+
+class TestZarrIOXArray(TestZarrIO):
+    """Unit tests for Zarr I/O using xarray data."""
+
+    inst_name = 'ndtesting'
+
+    def test_load_zarr_pandas_2d_error(self):
+        """Test `load_zarr` error with a pandas 2D store."""
+        outfile = self.write_test_file()
+
+        testing.eval_bad_input(
+            io.load_zarr, ValueError, "only supports 1D data in pandas",
+            input_args=[outfile], input_kwargs={"pandas_format": True})
+        return
+
+
+class TestParquetIO(TestZarrIO):
+    """Unit tests for `utils.io.load_parquet` and `utils.io.inst_to_parquet`."""
+
+    module_name = 'pyarrow'
+    ext = 'parquet'
+
+    def test_read_multiple_files(self):
+        """Test that data across multiple files is concatenated."""
+        outfile = self.write_test_file()
+        data, meta = io.load_parquet([outfile, outfile])
+
+        assert len(data.index) == 2 * len(self.testInst.index)
+        return
+
+    def test_write_parquet_2d_error(self):
+        """Test `inst_to_parquet` error with multi-dimensional data."""
+        self.testInst = pysat.Instrument(platform='pysat', name='ndtesting',
+                                         num_samples=10)
+
+        testing.eval_bad_input(self.write_test_file, ValueError,
+                               "only supports 1D data in parquet")
+        return
+
+
+class TestInspectNetCDF(object):
+    """Unit tests for `utils.io.inspect_netcdf`."""
+
+    def setup_method(self):
+        """Set up the test environment."""
+
+        # Create temporary directory
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.saved_path = pysat.params['data_dirs']
+        pysat.params['data_dirs'] = self.tempdir.name
+
+        self.testInst = pysat.Instrument(platform='pysat', name='testing',
+                                         num_samples=100, update_files=True)
+        self.stime = pysat.instruments.pysat_testing._test_dates['']['']
+        io.clear_inspect_cache()
+        return
+
+    def teardown_method(self):
+        """Clean up the test environment."""
+
+        pysat.params['data_dirs'] = self.saved_path
+        io.clear_inspect_cache()
+
+        # Remove the temporary directory
+        self.tempdir.cleanup()
+
+        del self.testInst, self.stime, self.tempdir, self.saved_path
+        return
+
+    def write_test_file(self, date=None):
+        """Load test data and write it to a `pysat_netcdf` file.
+
+        Parameters
+        ----------
+        date : dt.datetime or NoneType
+            Date to load and write, or None to use `self.stime`
+            (default=None)
+
+        Returns
+        -------
+        outfile : str
+            Name of the output file.
+
+        """
+        if date is None:
+            date = self.stime
+
+        outfile = os.path.join(self.tempdir.name, date.strftime(
+            'pysat_netcdf_%Y_%m_%d.nc'))
+        self.testInst.load(date=date)
+        io.inst_to_netcdf(self.testInst, outfile)
+
+        return outfile
+
+    def test_inspect_matches_load(self):
+        """Test that the inspected file information matches the loaded data."""
+        outfile = self.write_test_file()
+        info = io.inspect_netcdf(outfile)
+
+        tkwargs = decode_times_val(self.testInst.pandas_format)
+        data, meta = io.load_netcdf(outfile, epoch_name=default_epoch_name
+                                    if self.testInst.pandas_format else 'time',
+                                    pandas_format=self.testInst.pandas_format,
+                                    **tkwargs)
+
+        if self.testInst.pandas_format:
+            variables = list(data.columns)
+            index = data.index
+        else:
+            variables = io.xarray_vars_no_time(data)
+            index = data.indexes['time']
+
+        testing.assert_lists_equal(variables, info['variables'])
+        testing.assert_lists_equal(variables, list(info['dtypes'].keys()))
+
+        assert info['num_samples'] == len(index)
+        assert info['start'] == index[0]
+        assert info['stop'] == index[-1]
+        assert info['meta'] == meta
+        assert info['meta'].header == meta.header
+        assert list(info['files'].index) == [outfile]
+        return
+
+    def test_inspect_multiple_files(self):
+        """Test that file information is combined across files."""
+        outfiles = [self.write_test_file(),
+                    self.write_test_file(self.stime + dt.timedelta(days=1))]
+        info = io.inspect_netcdf(outfiles)
+        single = io.inspect_netcdf(outfiles[0])
+
+        assert info['num_samples'] == 2 * single['num_samples']
+        assert info['start'] == single['start']
+        assert info['stop'] > single['stop']
+        assert list(info['files'].index) == outfiles
+        assert info['files']['num_samples'].sum() == info['num_samples']
+
+        for dim in single['dims'].keys():
+            if dim in ['Epoch', 'time']:
+                assert info['dims'][dim] == 2 * single['dims'][dim]
+            else:
+                assert info['dims'][dim] == single['dims'][dim]
+        return
+
+    def test_inspect_cache(self, monkeypatch):
+        """Test that unchanged files are not read again."""
+        outfile = self.write_test_file()
+        info = io.inspect_netcdf(outfile)
+
+        def no_read(*args, **kwargs):
+            raise AssertionError('file was read again')
+
+        monkeypatch.setattr(io.netCDF4, 'Dataset', no_read)
+        assert io.inspect_netcdf(outfile)['num_samples'] == info['num_samples']
+
+        # Clearing the cache requires the file to be read again
+        io.clear_inspect_cache()
+        testing.eval_bad_input(io.inspect_netcdf, AssertionError,
+                               'file was read again', input_args=[outfile])
+        return
+
+    def test_inspect_cache_copies(self):
+        """Test that changing inspected information doesn't change the cache."""
+        outfile = self.write_test_file()
+        info = io._inspect_netcdf_file(outfile, None, 'ms', 'unix')
+        num_vars = len(info['variables'])
+
+        info['variables'].append('not_a_variable')
+        info['mdict'].clear()
+
+        info = io._inspect_netcdf_file(outfile, None, 'ms', 'unix')
+        assert len(info['variables']) == num_vars
+        assert len(info['mdict']) > 0
+        return
+
+    def test_inspect_cache_size(self, monkeypatch):
+        """Test that only the most recently inspected files are cached."""
+        monkeypatch.setattr(io, '_inspect_cache_size', 2)
+        outfiles = [self.write_test_file(self.stime + dt.timedelta(days=i))
+                    for i in range(3)]
+
+        io.inspect_netcdf(outfiles[:2])
+        io.inspect_netcdf(outfiles[0])
+        io.inspect_netcdf(outfiles[2])
+
+        cached = [key[0] for key in io._inspect_cache.keys()]
+        assert cached == [os.path.abspath(outfiles[i]) for i in [0, 2]]
+        return
+
+    def test_inspect_cache_updated_file(self):
+        """Test that modified files are read again."""
+        outfile = self.write_test_file()
+        info = io.inspect_netcdf(outfile)
+
+        # Rewrite the file with fewer samples and a new modification time
+        self.testInst.data = self.testInst[:10]
+        io.inst_to_netcdf(self.testInst, outfile)
+        fstat = os.stat(outfile)
+        os.utime(outfile, ns=(fstat.st_atime_ns, fstat.st_mtime_ns + 1000))
+
+        assert io.inspect_netcdf(outfile)['num_samples'] == 10
+        assert info['num_samples'] == 100
+        return
+
+    def test_inspect_meta_translation(self):
+        """Test that the inspected metadata is processed like a load."""
+        outfile = self.write_test_file()
+        info = io.inspect_netcdf(outfile, drop_meta_labels=['units'])
+
+        assert self.testInst.variables[0] in info['meta']
+        assert np.all(info['meta'][self.testInst.vars_no_time[0],
+                                   info['meta'].labels.units] == '')
+        return
+
+    def test_inspect_bad_epoch(self):
+        """Test the error raised for an unknown epoch variable."""
+        outfile = self.write_test_file()
+
+        testing.eval_bad_input(io.inspect_netcdf, KeyError,
+                               'Epoch label: "not_epoch" was not found',
+                               input_args=[outfile],
+                               input_kwargs={'epoch_name': 'not_epoch'})
+        return
+
+    def test_inspect_no_files(self):
+        """Test the error raised when no files are supplied."""
+        testing.eval_bad_input(io.inspect_netcdf, ValueError,
+                               'Must supply at least one filename',
+                               input_args=[[]])
+        return
+
+    def test_instrument_inspect(self):
+        """Test `Instrument.inspect` using the `pysat_netcdf` module hook."""
+        outfile = self.write_test_file()
+        file_inst = pysat.Instrument(
+            'pysat', 'netcdf', temporary_file_list=True,
+            directory_format=self.tempdir.name,
+            pandas_format=self.testInst.pandas_format)
+
+        for kwargs in [{'date': self.stime},
+                       {'fname': os.path.basename(outfile)}]:
+            info = file_inst.inspect(**kwargs)
+
+            assert info['num_samples'] == len(self.testInst.index)
+            assert info['start'] == self.testInst.index[0]
+            assert info['stop'] == self.testInst.index[-1]
+            assert list(info['files'].index) == [outfile]
+        return
+
+
+class TestInspectNetCDFXArray(TestInspectNetCDF):
+    """Unit tests for `utils.io.inspect_netcdf` using xarray data."""
+
+    def setup_method(self):
+        """Set up the test environment."""
+
+        # Create temporary directory
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.saved_path = pysat.params['data_dirs']
+        pysat.params['data_dirs'] = self.tempdir.name
+
+        self.testInst = pysat.Instrument(platform='pysat', name='ndtesting',
+                                         num_samples=100, update_files=True)
+        self.stime = pysat.instruments.pysat_ndtesting._test_dates['']['']
+        io.clear_inspect_cache()
+        return
+
+
 class TestNetCDF4Integration(object):
     """Integration tests for the netCDF4 I/O utils."""
 
@@ -1632,6 +2246,47 @@ class TestMetaTranslation(object):
 
         return
 
+    @pytest.mark.parametrize('meta_trans', [None, {'desc': ['tdub'],
+                                                   'fill': ['fill_test']}])
+    def test_compile_export_meta(self, meta_trans):
+        """Test the export pipeline matches the separate processing steps.
+
+        Parameters
+        ----------
+        meta_trans : dict or NoneType
+            Translation table for the metadata labels
+
+        """
+        epoch_name = self.test_inst.index.name
+        ref_inst = self.test_inst.copy()
+
+        # Get the metadata using the separate processing steps
+        ref_meta = ref_inst.meta.to_dict()
+        ref_meta[epoch_name] = io.return_epoch_metadata(ref_inst, epoch_name)
+        ref_meta = io.add_netcdf4_standards_to_metadict(ref_inst, ref_meta,
+                                                        epoch_name)
+        if meta_trans is not None:
+            meta_trans.update({key: val for key, val in
+                               io.default_to_netcdf_translation_table(
+                                   ref_inst).items()
+                               if key not in meta_trans})
+        ref_meta = io.apply_table_translation_to_file(ref_inst, ref_meta,
+                                                      meta_trans)
+
+        self.out = io.compile_export_meta(self.test_inst, epoch_name,
+                                          trans_table=meta_trans)
+
+        testing.assert_lists_equal(list(self.out.keys()),
+                                   list(ref_meta.keys()))
+        for var in ref_meta.keys():
+            testing.assert_lists_equal(list(self.out[var].keys()),
+                                       list(ref_meta[var].keys()))
+            for label in ref_meta[var].keys():
+                assert testing.nan_equal(self.out[var][label],
+                                         ref_meta[var][label]), \
+                    'Value differs for {}, {}'.format(var, label)
+        return
+
     def test_remove_netcdf4_standards(self, caplog):
         """Test for removing simplified SPDF ISTP/IACG NetCDF standards."""
 
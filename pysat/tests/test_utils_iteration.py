@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Tests the `pysat.utils.iteration` classes."""
+
+import datetime as dt
+
+import pandas as pds
+
+import pysat
+from pysat.utils import iteration
+from pysat.utils import testing
+
+
+class TestIterationPlan(object):
+    """Unit tests for `pysat.utils.iteration.IterationPlan`."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+        self.dates = pds.date_range('2009-01-01', '2009-01-10', freq='1D')
+        self.file_list = pds.Series(
+            [date.strftime('%Y-%m-%d.nofile') for date in self.dates],
+            index=self.dates)
+        self.width = pds.tseries.frequencies.to_offset('1D')
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+        del self.dates, self.file_list, self.width
+        return
+
+    def test_date_plan(self):
+        """Test the loads and intervals for a date plan with two seasons."""
+        iter_list = self.dates[[0, 1, 2, 5, 6]]
+        plan = iteration.IterationPlan('date', iter_list, self.width,
+                                       self.file_list)
+
+        assert len(plan) == 5
+        assert plan.steps['start'].tolist() == list(iter_list)
+        assert plan.steps['files'].tolist()[0] == ['2009-01-01.nofile']
+        assert plan.intervals == [(self.dates[0], self.dates[3]),
+                                  (self.dates[5], self.dates[7])]
+        assert not plan.steps['reuse'].any()
+        assert plan.num_file_reads == 5
+        return
+
+    def test_date_plan_cache(self):
+        """Test that a cached date plan reuses neighbouring files."""
+        plan = iteration.IterationPlan('date', self.dates[1:4], self.width,
+                                       self.file_list, cache=True)
+
+        assert plan.steps['files'].tolist()[0] == list(self.file_list[0:3])
+        assert plan.steps['reuse'].tolist() == [False, True, True]
+        assert plan.steps['shared'].tolist() == [0, 2, 2]
+        assert plan.files == list(self.file_list[0:5])
+        assert plan.num_file_reads == 5
+        return
+
+    def test_date_plan_cache_gap(self):
+        """Test that the cache is not reused across a gap between loads."""
+        plan = iteration.IterationPlan('date', self.dates[[1, 2, 6]],
+                                       self.width, self.file_list, cache=True)
+
+        assert plan.steps['reuse'].tolist() == [False, True, False]
+        assert plan.num_file_reads == 7
+        return
+
+    def test_file_plan(self):
+        """Test the loads and intervals for a file plan with a wide load."""
+        iter_list = list(self.file_list.values[[0, 2, 6]])
+        plan = iteration.IterationPlan('file', iter_list, 2, self.file_list,
+                                       cache=True)
+
+        assert plan.steps['stop'].tolist() == list(
+            self.file_list.values[[1, 3, 7]])
+        assert plan.steps['reuse'].tolist() == [False, True, False]
+        assert plan.intervals == [(self.file_list.iloc[0],
+                                   self.file_list.iloc[3]),
+                                  (self.file_list.iloc[6],
+                                   self.file_list.iloc[7])]
+        return
+
+    def test_plan_iteration(self):
+        """Test iteration over the plan steps."""
+        plan = iteration.IterationPlan('date', self.dates[:2], self.width,
+                                       self.file_list, cache=True)
+
+        assert list(plan) == [(self.dates[0], self.dates[1], False),
+                              (self.dates[1], self.dates[2], True)]
+        return
+
+    def test_empty_plan(self):
+        """Test a plan without any loads."""
+        plan = iteration.IterationPlan('date', [], self.width, self.file_list)
+
+        assert len(plan) == 0
+        assert plan.intervals == []
+        assert plan.files == []
+        assert plan.num_file_reads == 0
+        return
+
+    def test_bad_iter_type(self):
+        """Test ValueError raised for an unknown iteration type."""
+        testing.eval_bad_input(iteration.IterationPlan, ValueError,
+                               'Unknown iteration type',
+                               input_args=['orbit', self.dates, self.width,
+                                           self.file_list])
+        return
+
+
+class TestInstrumentIterationPlan(object):
+    """Unit tests for `pysat.Instrument.iteration_plan`."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+        self.testInst = pysat.Instrument('pysat', 'testing', num_samples=10,
+                                         update_files=True)
+        self.start = dt.datetime(2009, 1, 1)
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+        del self.testInst, self.start
+        return
+
+    def test_overlapping_seasons(self):
+        """Test that overlapping seasons are loaded once and in order."""
+        self.testInst.bounds = ([self.start + dt.timedelta(days=2),
+                                 self.start],
+                                [self.start + dt.timedelta(days=4),
+                                 self.start + dt.timedelta(days=3)])
+        plan = self.testInst.iteration_plan
+
+        assert plan.steps['start'].tolist() == list(pds.date_range(
+            self.start, self.start + dt.timedelta(days=4)))
+        assert len(plan.intervals) == 1
+
+        dates = [inst.date for inst in self.testInst]
+        assert dates == plan.steps['start'].tolist()
+        return
+
+    def test_overlapping_fname_seasons(self):
+        """Test that overlapping file seasons are loaded once and in order."""
+        fnames = self.testInst.files.files
+        self.testInst.bounds = ([fnames.iloc[2], fnames.iloc[0]],
+                                [fnames.iloc[4], fnames.iloc[3]])
+
+        assert self.testInst.iteration_plan.steps['start'].tolist() == list(
+            fnames.iloc[0:5])
+        return
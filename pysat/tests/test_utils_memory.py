@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Tests the `pysat.utils.memory` functions and Instrument memory policy."""
+
+import numpy as np
+import os
+import pandas as pds
+import pytest
+import tempfile
+
+import pysat
+from pysat.utils import memory
+from pysat.utils import testing
+
+
+class TestCompactValues(object):
+    """Unit tests for `pysat.utils.memory.compact_values`."""
+
+    @pytest.mark.parametrize("values,fill_val,shrink_ints,out_type", [
+        (np.array([1.0, np.nan, 3.0]), -1, False, np.float32),
+        (np.array([1.0, np.nan, 300.0]), -1, True, np.float32),
+        (np.array([1.0, np.nan, 3.0]), np.nan, False, np.float32),
+        (np.array([1.5, np.nan, 3.0]), -1, False, np.float32),
+        (np.array([1.0, 2.0, 3.0]), -1, False, np.float32),
+        (np.array([1.1, 2.0, 3.0]), None, False, np.float64),
+        (np.array([1, 2, 3], dtype=np.int64), None, False, np.int64),
+        (np.array([1, 2, 3], dtype=np.int64), None, True, np.int8),
+        (np.array([1, 2, 3], dtype=np.int64), -999, True, np.int16),
+        (np.array([1, 2, 3], dtype=np.uint32), None, True, np.uint8),
+        (np.array([1, 2, 3], dtype=np.int8), None, True, np.int8),
+        (np.array(['a', 'b']), None, True, np.str_)])
+    def test_compact_values(self, values, fill_val, shrink_ints, out_type):
+        """Test the output type and values for compacted data.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Input data values
+        fill_val : int, float, or NoneType
+            Input fill value
+        shrink_ints : bool
+            Input flag for casting integers to smaller types
+        out_type : type
+            Expected output type
+
+        """
+        out = memory.compact_values(values, fill_val, shrink_ints=shrink_ints)
+
+        assert out.dtype.type == out_type
+        assert np.array_equal(out, values, equal_nan=True)
+        return
+
+
+class TestCompactData(object):
+    """Unit tests for compacting pandas Instrument data."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+        self.testInst = pysat.Instrument('pysat', 'testing', num_samples=100,
+                                         memory_policy='compact')
+        self.ref_time = pysat.instruments.pysat_testing._test_dates['']['']
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+        del self.testInst, self.ref_time
+        return
+
+    def test_default_policy(self):
+        """Test that data is not compacted by default."""
+        self.testInst.memory_policy = 'default'
+        self.testInst.load(date=self.ref_time)
+
+        assert self.testInst.memory_report is None
+        assert self.testInst['int64_dummy'].dtype == np.int64
+        return
+
+    def test_bad_policy(self):
+        """Test that an unknown memory policy raises a ValueError."""
+        with pytest.raises(ValueError) as verr:
+            self.testInst.memory_policy = 'tiny'
+
+        assert str(verr).find('unknown memory policy') >= 0
+        return
+
+    def test_compact_load(self):
+        """Test that a compact load preserves data and reports savings."""
+        self.testInst.load(date=self.ref_time)
+        report = self.testInst.memory_report
+
+        default_inst = pysat.Instrument('pysat', self.testInst.name,
+                                        num_samples=100)
+        default_inst.load(date=self.ref_time)
+
+        testing.assert_lists_equal(list(default_inst.variables),
+                                   list(self.testInst.variables))
+        assert sum([report[var]['bytes_saved'] for var in report]) > 0
+        assert report['int64_dummy']['bytes_saved'] == 0
+        assert self.testInst['int64_dummy'].dtype == np.int64
+
+        for var in default_inst.vars_no_time:
+            assert np.all(np.asarray(self.testInst[var])
+                          == np.asarray(default_inst[var])), \
+                "data changed for {:s}".format(var)
+
+        for var in report.keys():
+            assert report[var]['bytes'] <= report[var]['original_bytes']
+            assert self.testInst.meta._data_types[var] \
+                == self.testInst.data[var].values.dtype.type
+        return
+
+    def test_compact_before_custom(self):
+        """Test that data are compacted before custom functions are applied."""
+        dtypes = dict()
+
+        def get_dtypes(inst):
+            dtypes.update({var: inst[var].dtype for var in inst.variables})
+            return
+
+        self.testInst.custom_attach(get_dtypes)
+        self.testInst.load(date=self.ref_time)
+        report = self.testInst.memory_report
+
+        for var in report.keys():
+            assert str(dtypes[var]) == report[var]['dtype']
+        return
+
+    def test_compact_report_frame(self):
+        """Test that the memory report may be viewed as a DataFrame."""
+        self.testInst.load(date=self.ref_time)
+        table = pds.DataFrame.from_dict(self.testInst.memory_report,
+                                        orient='index')
+
+        testing.assert_lists_equal(['original_dtype', 'dtype',
+                                    'original_bytes', 'bytes', 'bytes_saved'],
+                                   list(table.columns))
+        assert np.all(table['bytes_saved']
+                      == table['original_bytes'] - table['bytes'])
+        return
+
+
+class TestCompactDataXArray(TestCompactData):
+    """Unit tests for compacting xarray Instrument data."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+        self.testInst = pysat.Instrument('pysat', 'ndtesting', num_samples=100,
+                                         memory_policy='compact')
+        self.ref_time = pysat.instruments.pysat_ndtesting._test_dates['']['']
+        return
+
+
+class TestCompactMaskedData(object):
+    """Unit tests for compacting integer data with masked values."""
+
+    def test_keep_masked_integers(self):
+        """Test masked integer data keeps the NaN values."""
+        data = pds.DataFrame({'ints': [1.0, np.nan, 3.0],
+                              'strs': ['a', 'a', 'a']})
+        meta = pysat.Meta()
+        meta['ints'] = {meta.labels.fill_val: -1}
+
+        data, report = memory.compact_data(data, meta)
+
+        assert data['ints'].dtype == np.float32
+        assert np.array_equal([1.0, np.nan, 3.0], data['ints'], equal_nan=True)
+        assert data['strs'].dtype == 'category'
+        assert report['ints']['bytes_saved'] == 12
+        return
+
+    @pytest.mark.parametrize("shrink_ints,out_type", [(False, np.int64),
+                                                      (True, np.int16)])
+    def test_shrink_integers(self, shrink_ints, out_type):
+        """Test integers are only cast to smaller types if requested.
+
+        Parameters
+        ----------
+        shrink_ints : bool
+            Input flag for casting integers to smaller types
+        out_type : type
+            Expected output type
+
+        """
+        data = pds.DataFrame({'ints': np.array([1, 2, 3], dtype=np.int64)})
+        meta = pysat.Meta()
+        meta['ints'] = {meta.labels.fill_val: -999}
+
+        data, report = memory.compact_data(data, meta, shrink_ints=shrink_ints)
+
+        assert data['ints'].dtype == out_type
+        testing.assert_lists_equal([1, 2, 3], list(data['ints']))
+        return
+
+
+class TestCopyMappedData(object):
+    """Unit tests for `pysat.utils.memory.copy_mapped_data`."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.fname = os.path.join(self.tempdir.name, 'mapped.dat')
+        np.arange(10, dtype=np.float64).tofile(self.fname)
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+
+        self.tempdir.cleanup()
+        del self.tempdir, self.fname
+        return
+
+    @pytest.mark.parametrize("pandas_format", [True, False])
+    def test_copy_unmapped_data(self, pandas_format):
+        """Test data without memory-mapped variables is copied.
+
+        Parameters
+        ----------
+        pandas_format : bool
+            Use a DataFrame if True or a Dataset if False.
+
+        """
+        data = pds.DataFrame({'a': np.arange(10.0)})
+        if not pandas_format:
+            data = data.to_xarray()
+
+        copied = memory.copy_mapped_data(data)
+
+        assert copied.equals(data)
+        assert copied is not data
+        return
+
+    @pytest.mark.parametrize("pandas_format", [True, False])
+    def test_copy_mapped_data(self, pandas_format):
+        """Test memory-mapped variables are remapped without kwarg input.
+
+        Parameters
+        ----------
+        pandas_format : bool
+            Use a DataFrame if True or a Dataset if False.
+
+        """
+        values = np.memmap(self.fname, mode='c', dtype=np.float64)
+        data = pds.DataFrame({'a': pds.Series(values, copy=False),
+                              'b': np.arange(10.0)}, copy=False)
+        if not pandas_format:
+            data = data.to_xarray()
+            data['a'].data = values
+
+        copied = memory.copy_mapped_data(data)
+        copied['a'].values[0] = -1.0
+
+        assert memory._get_memmap_base(copied['a'].values) is not None
+        assert memory._get_memmap_base(copied['b'].values) is None
+        assert data['a'].values[0] == 0.0
+        assert np.fromfile(self.fname)[0] == 0.0
+        return
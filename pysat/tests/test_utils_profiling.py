@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Tests the `pysat.utils.profiling` functions and Instrument integration."""
+
+import datetime as dt
+import json
+import os
+import tempfile
+
+import pysat
+from pysat.utils import profiling
+from pysat.utils import testing
+
+
+class TestLoadProfiler(object):
+    """Unit tests for profiling pandas Instrument loads."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+        self.testInst = pysat.Instrument('pysat', 'testing', num_samples=10)
+        self.ref_time = pysat.instruments.pysat_testing._test_dates['']['']
+        return
+
+    def teardown_method(self):
+        """Clean up the unit test environment after each method."""
+        del self.testInst, self.ref_time
+        return
+
+    def test_profile_disabled_by_default(self):
+        """Test that loads are not profiled by default."""
+        self.testInst.load(date=self.ref_time)
+
+        assert not self.testInst.profile
+        assert self.testInst.profiler is None
+        return
+
+    def test_profile_load_records(self):
+        """Test that a profiled load records the expected stages."""
+        self.testInst.profile = True
+        self.testInst.load(date=self.ref_time)
+
+        table = self.testInst.profiler.to_frame()
+        testing.assert_lists_equal(['_load_data', 'load'],
+                                   list(table['method'].unique()))
+
+        load_stages = table[table['method'] == 'load']['stage']
+        for stage in ['meta_defaults', 'meta_transfer', 'preprocess', 'clean',
+                      'custom', 'total']:
+            assert stage in load_stages.values, \
+                "missing load stage {:s}".format(stage)
+
+        data_stages = table[table['method'] == '_load_data']['stage']
+        testing.assert_lists_equal(['file_lookup', 'load_rtn', 'meta_labels',
+                                    'total'], list(data_stages.values))
+
+        # The load routine and the entire load see the same data size
+        for method, stage in [('_load_data', 'load_rtn'), ('load', 'total')]:
+            row = table[(table['method'] == method)
+                        & (table['stage'] == stage)].iloc[0]
+            assert row['rows'] == 10
+            assert row['variables'] == len(self.testInst.vars_no_time)
+            assert row['bytes'] > 0
+            assert row['duration'] >= 0.0
+        return
+
+    def test_profile_padded_load(self):
+        """Test that a padded load records each `_load_data` call."""
+        self.testInst = pysat.Instrument(self.testInst.platform,
+                                         self.testInst.name,
+                                         num_samples=86400,
+                                         pad={'minutes': 5})
+        self.testInst.profile = True
+        self.testInst.load(date=self.ref_time)
+
+        table = self.testInst.profiler.to_frame()
+        totals = table[table['stage'] == 'total']
+        assert len(totals) == 4
+        assert totals['call'].is_unique
+        assert 'pad_concat' in table['stage'].values
+        assert 'pad_trim' in table['stage'].values
+        return
+
+    def test_profile_pause(self):
+        """Test that pausing profiling retains prior records."""
+        self.testInst.profile = True
+        self.testInst.load(date=self.ref_time)
+        nrec = len(self.testInst.profiler.records)
+
+        self.testInst.profile = False
+        self.testInst.load(date=self.ref_time + dt.timedelta(days=1))
+
+        assert not self.testInst.profile
+        assert len(self.testInst.profiler.records) == nrec
+        return
+
+    def test_profile_context(self):
+        """Test the profiling context manager restores the prior state."""
+        with profiling.profile(self.testInst) as prof:
+            self.testInst.load(date=self.ref_time)
+
+        assert not self.testInst.profile
+        assert prof is self.testInst.profiler
+        assert len(prof.records) > 0
+        return
+
+    def test_summary(self):
+        """Test the per-stage summary table."""
+        self.testInst.profile = True
+        self.testInst.load(date=self.ref_time)
+        self.testInst.load(date=self.ref_time + dt.timedelta(days=1))
+
+        summary = self.testInst.profiler.summary()
+        testing.assert_lists_equal(['calls', 'total', 'mean', 'rows',
+                                    'variables', 'bytes'],
+                                   list(summary.columns))
+        assert summary.loc[('load', 'total'), 'calls'] == 2
+        return
+
+    def test_reset(self):
+        """Test that reset removes the existing records."""
+        self.testInst.profile = True
+        self.testInst.load(date=self.ref_time)
+        self.testInst.profiler.reset()
+
+        assert len(self.testInst.profiler.records) == 0
+        assert self.testInst.profiler.to_frame().empty
+        return
+
+    def test_chrome_trace(self):
+        """Test the Chrome trace export."""
+        self.testInst.profile = True
+        self.testInst.load(date=self.ref_time)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, 'trace.json')
+            trace = self.testInst.profiler.to_chrome_trace(fname)
+
+            with open(fname, 'r') as fin:
+                assert json.load(fin) == trace
+
+        assert len(trace['traceEvents']) == len(
+            self.testInst.profiler.records)
+        for event in trace['traceEvents']:
+            assert event['ph'] == 'X'
+            assert event['dur'] >= 0.0
+            assert event['cat'] in ['load', '_load_data']
+        return
+
+    def test_copy_equality(self):
+        """Test that a profiled Instrument equals its copy."""
+        self.testInst.profile = True
+        self.testInst.load(date=self.ref_time)
+
+        assert self.testInst.copy() == self.testInst
+        return
+
+
+class TestLoadProfilerXArray(TestLoadProfiler):
+    """Unit tests for profiling xarray Instrument loads."""
+
+    def setup_method(self):
+        """Set up the unit test environment for each method."""
+        self.testInst = pysat.Instrument('pysat', 'ndtesting', num_samples=10)
+        self.ref_time = pysat.instruments.pysat_ndtesting._test_dates['']['']
+        return
+
+
+class TestDataSize(object):
+    """Unit tests for `pysat.utils.profiling.data_size`."""
+
+    def test_data_size_none(self):
+        """Test that missing data has no size."""
+        assert profiling.data_size(None) == (0, 0, 0)
+        return
@@ -6,6 +6,8 @@ This includes conversion of formats, loading of files, and user-supplied info
 for the pysat data directory structure.
 """
 
+import importlib
+
 from pysat.utils._core import available_instruments  # noqa: F401
 from pysat.utils._core import display_available_instruments  # noqa: F401
 from pysat.utils._core import display_instrument_stats  # noqa: F401
@@ -16,9 +18,28 @@ from pysat.utils._core import NetworkLock  # noqa: F401
 from pysat.utils._core import scale_units  # noqa: F401
 from pysat.utils._core import stringify  # noqa: F401
 from pysat.utils._core import update_fill_values  # noqa: F401
-from pysat.utils import coords  # noqa: F401
+from pysat.utils import download  # noqa: F401
 from pysat.utils import files  # noqa: F401
-from pysat.utils import io  # noqa: F401
+from pysat.utils import iteration  # noqa: F401
+from pysat.utils import memory  # noqa: F401
+from pysat.utils import profiling  # noqa: F401
 from pysat.utils import registry  # noqa: F401
 from pysat.utils import testing  # noqa: F401
 from pysat.utils import time  # noqa: F401
+
+# Submodules imported on first use, to reduce the time needed to import pysat
+_lazy_modules = ['coords', 'inventory', 'io']
+
+
+def __getattr__(name):
+    """Import lazily loaded pysat.utils submodules on first access."""
+    if name in _lazy_modules:
+        return importlib.import_module('.'.join([__name__, name]))
+
+    raise AttributeError("module '{:s}' has no attribute '{:s}'".format(
+        __name__, name))
+
+
+def __dir__():
+    """List the module attributes, including lazily loaded submodules."""
+    return sorted(set(globals()).union(_lazy_modules))
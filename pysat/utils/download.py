@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Schedule Instrument downloads in chunks, with retries and a journal."""
+
+from concurrent import futures
+import os
+import time
+
+import numpy as np
+import pandas as pds
+
+import pysat
+
+
+class DownloadJournal(object):
+    """Record of the dates downloaded by a partially completed request.
+
+    Parameters
+    ----------
+    fname : str
+        Full path to the journal file
+
+    Attributes
+    ----------
+    fname : str
+        Full path to the journal file
+
+    Note
+    ----
+    The journal is a text file with one ISO formatted date per line.  Dates
+    are appended as each chunk of a download request completes, so a request
+    that is interrupted may be resumed without repeating finished chunks.
+
+    """
+
+    def __init__(self, fname):
+        """Initialize the DownloadJournal object."""
+        self.fname = fname
+        return
+
+    def __repr__(self):
+        """Print the basic DownloadJournal properties."""
+        return "pysat.utils.download.DownloadJournal(fname={:})".format(
+            repr(self.fname))
+
+    @property
+    def completed(self):
+        """Sorted, unique dates recorded as downloaded."""
+        if not os.path.isfile(self.fname):
+            return pds.DatetimeIndex([])
+
+        with open(self.fname, 'r') as fin:
+            dates = [line.strip() for line in fin if len(line.strip()) > 0]
+
+        return pds.DatetimeIndex(dates).unique().sort_values()
+
+    def record(self, dates):
+        """Record dates as downloaded.
+
+        Parameters
+        ----------
+        dates : array-like
+            Downloaded dates
+
+        """
+        dates = pds.DatetimeIndex(dates)
+        if len(dates) == 0:
+            return
+
+        pysat.utils.files.check_and_make_path(os.path.dirname(self.fname))
+        with open(self.fname, 'a') as fout:
+            fout.write(''.join(['{:s}\n'.format(date.isoformat())
+                                for date in dates]))
+        return
+
+    def remove(self, dates):
+        """Remove dates from the journal, deleting the file if it is empty.
+
+        Parameters
+        ----------
+        dates : array-like
+            Dates to remove
+
+        """
+        completed = self.completed
+        completed = completed[~completed.isin(pds.DatetimeIndex(dates))]
+
+        if len(completed) == 0:
+            self.clear()
+        else:
+            with open(self.fname, 'w') as fout:
+                fout.write(''.join(['{:s}\n'.format(date.isoformat())
+                                    for date in completed]))
+        return
+
+    def clear(self):
+        """Remove the journal file."""
+        if os.path.isfile(self.fname):
+            os.remove(self.fname)
+        return
+
+
+def split_dates(date_array, chunk_size=None):
+    """Split a sequence of dates into chunks.
+
+    Parameters
+    ----------
+    date_array : array-like
+        Sequence of dates
+    chunk_size : int or NoneType
+        Number of dates in each chunk, or None to use a single chunk
+        (default=None)
+
+    Returns
+    -------
+    chunks : list
+        List of `date_array` chunks.  If `chunk_size` is None, the only chunk
+        is the input `date_array`.  Otherwise, chunks are pds.DatetimeIndex
+        objects.
+
+    Raises
+    ------
+    ValueError
+        If `chunk_size` is not a positive integer
+
+    """
+    if chunk_size is None:
+        return [date_array]
+
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be a positive integer')
+
+    date_array = pds.DatetimeIndex(date_array)
+    return [date_array[i:i + chunk_size]
+            for i in np.arange(0, len(date_array), chunk_size)]
+
+
+def run_download(download_func, date_array, chunk_size=None, workers=1,
+                 retries=0, retry_delay=1.0, journal=None, chunk_callback=None,
+                 **kwargs):
+    """Download data in chunks, using a thread pool and retries.
+
+    Parameters
+    ----------
+    download_func : function
+        Instrument download routine, called as
+        `download_func(date_array, **kwargs)`
+    date_array : array-like
+        Sequence of dates to download
+    chunk_size : int or NoneType
+        Number of dates passed to each `download_func` call, or None to pass
+        all dates in a single call (default=None)
+    workers : int
+        Maximum number of chunks downloaded at the same time (default=1)
+    retries : int
+        Number of times a failed chunk is tried again (default=0)
+    retry_delay : float
+        Seconds to wait before the first retry of a chunk.  The wait doubles
+        for each later retry. (default=1.0)
+    journal : DownloadJournal or NoneType
+        Journal used to skip dates from an earlier, interrupted request and to
+        record completed chunks, or None to download all dates (default=None)
+    chunk_callback : function or NoneType
+        Function called as `chunk_callback(chunk)` once each chunk of dates
+        finishes, whether or not the download succeeded, or None
+        (default=None)
+    **kwargs : dict
+        Keyword arguments passed to `download_func`
+
+    Raises
+    ------
+    ValueError
+        If `workers` or `chunk_size` is not a positive integer
+    Exception
+        The error raised by the first chunk that failed after all retries,
+        once every other chunk has finished
+
+    Note
+    ----
+    With the default inputs `download_func` is called once with the input
+    `date_array`.  If `journal` is provided, the dates are recorded after each
+    chunk and removed from the journal once every chunk has been downloaded.
+    `chunk_callback` is always called from the calling thread.
+
+    """
+    if workers < 1:
+        raise ValueError('workers must be a positive integer')
+
+    if journal is not None:
+        # Skip dates finished by an earlier request
+        date_array = pds.DatetimeIndex(date_array)
+        request_dates = date_array
+        skip = date_array.isin(journal.completed)
+        if skip.any():
+            pysat.logger.info(''.join(['Resuming download, skipping ',
+                                       repr(int(skip.sum())),
+                                       ' completed dates']))
+            date_array = date_array[~skip]
+
+    chunks = [chunk for chunk in split_dates(date_array, chunk_size)
+              if len(chunk) > 0]
+    errors = list()
+
+    def _download_chunk(chunk):
+        """Download a chunk of dates, retrying after failures."""
+        for attempt in range(retries + 1):
+            try:
+                download_func(chunk, **kwargs)
+                return
+            except Exception as err:
+                if attempt == retries:
+                    raise
+
+                delay = retry_delay * 2**attempt
+                pysat.logger.warning(''.join([
+                    'Download failed for ', repr(len(chunk)), ' dates ',
+                    'starting ', str(pds.Timestamp(chunk[0])), ': ',
+                    str(err), '. Retrying in ', repr(delay), ' s']))
+                time.sleep(delay)
+        return
+
+    def _finish_chunk(chunk, err):
+        """Record the outcome of a chunk download."""
+        if err is None:
+            if journal is not None:
+                journal.record(chunk)
+        else:
+            pysat.logger.error(''.join([
+                'Download failed for ', repr(len(chunk)), ' dates starting ',
+                str(pds.Timestamp(chunk[0])), ': ', str(err)]))
+            errors.append(err)
+
+        if chunk_callback is not None:
+            chunk_callback(chunk)
+        return
+
+    if workers == 1 or len(chunks) <= 1:
+        # Download in the current thread
+        for chunk in chunks:
+            try:
+                _download_chunk(chunk)
+            except Exception as err:
+                _finish_chunk(chunk, err)
+            else:
+                _finish_chunk(chunk, None)
+    else:
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = {executor.submit(_download_chunk, chunk): chunk
+                       for chunk in chunks}
+            for future in futures.as_completed(pending):
+                _finish_chunk(pending[future], future.exception())
+
+    if len(errors) > 0:
+        raise errors[0]
+
+    if journal is not None:
+        journal.remove(request_dates)
+
+    return
@@ -11,6 +11,7 @@
 """Utilities for file management and parsing file names."""
 
 import collections
+from concurrent import futures
 import glob
 import numpy as np
 import os
@@ -25,6 +26,16 @@ from pysat.utils._core import listify
 from pysat.utils.time import create_datetime_index
 
 
+# Mapping of file attribute names to the attribute names used by `os.stat`
+_stat_attrs = {'content_modified_time': 'st_mtime', 'mode': 'st_mode',
+               'size': 'st_size', 'inode': 'st_ino', 'device': 'st_dev',
+               'nlink': 'st_nlink', 'uid': 'st_uid', 'gid': 'st_gid',
+               'last_access_time': 'st_atime',
+               'metadata_update_time': 'st_ctime'}
+_stat_time_attrs = ['content_modified_time', 'last_access_time',
+                    'metadata_update_time']
+
+
 # Define hidden support functions
 
 def _init_parse_filenames(files, format_str):
@@ -152,6 +163,88 @@ def _finish_parse_filenames(stored, files, format_str, bad_files):
     return stored
 
 
+def _scan_directories(dirs):
+    """List the files within a set of directories, one scan per directory.
+
+    Parameters
+    ----------
+    dirs : iterable
+        Directory paths. Paths that are not existing directories are skipped.
+
+    Returns
+    -------
+    found : set
+        Full paths of the files found directly within `dirs`
+
+    """
+    found = set()
+    for sdir in set(dirs):
+        if not os.path.isdir(sdir):
+            continue
+
+        with os.scandir(sdir) as entries:
+            found.update([os.path.join(sdir, entry.name) for entry in entries
+                          if entry.is_file()])
+
+    return found
+
+
+def _device_id(path, devices):
+    """Get the device holding a path or its nearest existing parent.
+
+    Parameters
+    ----------
+    path : str
+        Directory path, which does not need to exist yet
+    devices : dict
+        Cache of device IDs keyed by directory path, updated in place
+
+    Returns
+    -------
+    int
+        Device ID, as given by `os.stat`
+
+    """
+    if path not in devices:
+        parent = os.path.dirname(path)
+        if os.path.exists(path) or parent == path:
+            devices[path] = os.stat(path).st_dev
+        else:
+            devices[path] = _device_id(parent, devices)
+
+    return devices[path]
+
+
+def _move_file(source, destination, action):
+    """Move a single file following a planned action.
+
+    Parameters
+    ----------
+    source : str
+        Full path of the file to move
+    destination : str
+        Full path of the file after moving
+    action : str
+        'rename' to rename the file on the same filesystem, or 'copy' to copy
+        the file to another filesystem before removing the source
+
+    Note
+    ----
+    Copies are written to a temporary file that then replaces `destination`,
+    so an interrupted copy never leaves a partial file at `destination`.
+
+    """
+    if action == 'rename':
+        os.rename(source, destination)
+    else:
+        temp_name = '.'.join([destination, 'pysat_move', 'tmp'])
+        shutil.copy2(source, temp_name)
+        os.replace(temp_name, destination)
+        os.remove(source)
+
+    return
+
+
 # Define file utility functions
 
 def process_parsed_filenames(stored, two_digit_year_break=None):
@@ -632,7 +725,7 @@ def search_local_system_formatted_filename(data_path, search_str):
 
 def update_data_directory_structure(new_template, test_run=True,
                                     full_breakdown=False,
-                                    remove_empty_dirs=False):
+                                    remove_empty_dirs=False, workers=1):
     """Update pysat data directory structure to match supplied template.
 
     Translates all of pysat's managed science files to a new
@@ -657,6 +750,9 @@ def update_data_directory_structure(new_template, test_run=True,
         to another location and are now empty are deleted. Traverses
         the directory chain up to the top-level directories in
         `pysat.params['data_dirs']`. (default=False)
+    workers : int
+        Number of files moved at the same time for each Instrument.
+        (default=1)
 
     Note
     ----
@@ -666,6 +762,18 @@ def update_data_directory_structure(new_template, test_run=True,
 
         pysat.params['directory_format'] = new_template
 
+    The files for each Instrument are located with a single search of the
+    current directories. Moves within a filesystem are performed as renames,
+    while moves across filesystems are copied before the original is removed.
+    Files already found at the new location are not moved again, so an
+    interrupted update may be resumed by running it again. Once the files are
+    moved, the stored file list is replaced by a search of the new location.
+
+    See Also
+    --------
+    pysat.utils.files.plan_file_moves
+    pysat.utils.files.run_file_moves
+
     """
 
     # Import required here to avoid circular import
@@ -708,19 +816,13 @@ def update_data_directory_structure(new_template, test_run=True,
                     currdir = inst.files.data_path.split(
                         inst.files.sub_dir_path)[0]
 
-                    # Create instrument with new information
-                    new_inst = Instrument(platform=platform, name=name,
-                                          inst_id=inst_id, tag=tag,
-                                          update_files=False,
-                                          directory_format=new_template)
-
-                    # Get new formatted directory template
-                    subdir = new_inst.files.sub_dir_path
+                    # Get new formatted directory template, as done by
+                    # `pysat.Files`
+                    subdir = os.path.normpath(new_template.format(
+                        **inst.files.inst_info))
 
                     # Make new path using correct top_level data directory but
-                    # with new template. new_inst won't find files and thus
-                    # defaults to the first of all pysat data_dirs though
-                    # we know better.
+                    # with new template.
                     new_path = os.path.join(currdir, subdir, '')
                     print(' '.join(('Working on Instrument:', platform, name,
                                     tag, inst_id)))
@@ -735,16 +837,18 @@ def update_data_directory_structure(new_template, test_run=True,
                     old_files = [os.path.join(inst.files.data_path, ifile)
                                  for ifile in flist]
 
-                    # Determine which of these files exist.
-                    old_exists = [os.path.isfile(ofile) for ofile in old_files]
+                    # Determine which of these files exist, scanning each
+                    # directory once.
+                    found = _scan_directories([os.path.dirname(ofile)
+                                               for ofile in old_files])
+                    old_exists = [ofile in found for ofile in old_files]
                     idx, = np.where(old_exists)
 
-                    if len(idx) == 0:
+                    if len(idx) == 0 and len(old_files) > 0:
                         # If none of the files actually exists, likely that
                         # instruments.methods.general.list_files is appending
                         # a date to the end of the filename.
-                        exists = [os.path.isfile(ofile[:-11]) for ofile in
-                                  old_files]
+                        exists = [ofile[:-11] in found for ofile in old_files]
                         if np.all(exists):
                             flist = [ifile[:-11] for ifile in flist]
                             flist = np.unique(flist)
@@ -774,95 +878,86 @@ def update_data_directory_structure(new_template, test_run=True,
                             len(old_files)))
 
                     # Based on the files that do exist, construct new
-                    # path names with the updated directory template.
+                    # path names with the updated directory template and
+                    # plan the moves.
                     new_files = [os.path.join(currdir, subdir, ifile)
                                  for ifile in flist]
+                    plan = plan_file_moves(old_files, new_files)
 
-                    # Some instruments may have additional directories below
-                    # those expected by pysat. Get a list of all those unique
-                    # directories and create as needed.
-                    new_dirs = [os.path.split(ifile)[0] for ifile in new_files]
-                    new_dirs = np.unique(new_dirs)
-                    if not test_run:
-                        for ndir in new_dirs:
-                            # Create needed directories if actually moving files
-                            check_and_make_path(ndir)
-
-                    # Ready to iterate through list of files and move them
-                    for ofile, nfile in zip(old_files, new_files):
-                        if full_breakdown:
-                            # Print the proposed changes so user may verify
+                    if full_breakdown:
+                        # Print the proposed changes so user may verify
+                        for ofile, nfile in zip(plan['source'],
+                                                plan['destination']):
                             ostr = ''.join(('Will move: ', ofile, '\n',
                                             '       to: ', nfile))
                             print(ostr)
 
-                        if not test_run:
-                            # Move files if not in test mode
-                            if not os.path.isfile(nfile):
-                                # Move the file now
-                                shutil.move(ofile, nfile)
-                            else:
-                                # New file
-                                ostr = ''.join(nfile, ' already exists.')
-                                print(ostr)
+                    for nfile in plan['destination'][plan['action']
+                                                     == 'exists']:
+                        print(''.join((nfile, ' already exists.')))
 
                     if full_breakdown and (len(old_files) > 0):
                         # Sometimes include a newline to maintain consistent
                         # line spacing.
                         print('')
 
-                    if len(old_files) > 0:
+                    if len(old_files) > 0 and not test_run:
                         # No missing files and there are actually
                         # files on the disk to deal with.
-
-                        # Get new list of files from Instrument
-                        new_inst = Instrument(platform=platform, name=name,
-                                              inst_id=inst_id, tag=tag,
-                                              update_files=True,
-                                              directory_format=new_template)
-
-                        # Check on number of files before and after
-                        nnew = len(new_inst.files.files)
-                        nold = len(inst.files.files)
-                        if not test_run:
-                            if nnew != nold:
-                                estr = ' '.join(('Number of files before and',
-                                                 'after not the same.',
-                                                 'Something has gone wrong for',
-                                                 platform, name, tag, inst_id))
-                                raise ValueError(estr)
-
-                            print(' '.join(('All', platform, name, tag, inst_id,
-                                            'files moved and accounted for.',
-                                            '\n')))
-
-                            # Number of files checks out. Time to remove old
-                            # directories if there are no real files in there.
-                            # First, get full directory path of previous inst
-                            wpath = inst.files.data_path
-                            while wpath != currdir and (len(wpath)
-                                                        > len(currdir)):
-                                # Only continue while we are at a level
-                                # lower than the top-level pysat data directory.
-                                if len(os.listdir(wpath)) == 0:
-                                    # Directory is empty, remove it.
-                                    print(''.join((wpath, ' is empty and ',
-                                                   'could be removed.')))
-                                    if remove_empty_dirs:
-                                        shutil.rmtree(wpath)
-                                        print(''.join(('Removing: ', wpath)))
-                                else:
-                                    print(''.join(('Directory is not empty: ',
-                                                   wpath, '\nEnding cleanup.',
-                                                   '\n')))
-                                    break
-
-                                # Take off last path and start working up
-                                # the directory chain.
-                                wpath = os.path.sep.join(wpath.split(
-                                    os.path.sep)[:-2])
+                        run_file_moves(plan, workers=workers,
+                                       verbose=full_breakdown)
+
+                        # Check that every file is at the new location
+                        found = _scan_directories([
+                            os.path.dirname(nfile)
+                            for nfile in plan['destination']])
+                        nnew = np.sum(plan['destination'].isin(found))
+                        if nnew != len(plan):
+                            estr = ' '.join(('Number of files before and',
+                                             'after not the same.',
+                                             'Something has gone wrong for',
+                                             platform, name, tag, inst_id))
+                            raise ValueError(estr)
+
+                        if inst.files.write_to_disk:
+                            # Store the file list from the new location, which
+                            # includes files moved by an interrupted update.
+                            inst.files.directory_format = new_template
+                            inst.files.sub_dir_path = subdir
+                            inst.files.data_paths = [new_path]
+                            inst.files.refresh()
+
+                        print(' '.join(('All', platform, name, tag, inst_id,
+                                        'files moved and accounted for.',
+                                        '\n')))
+
+                        # Number of files checks out. Time to remove old
+                        # directories if there are no real files in there.
+                        # First, get full directory path of previous inst
+                        wpath = curr_path
+                        while wpath != currdir and (len(wpath)
+                                                    > len(currdir)):
+                            # Only continue while we are at a level
+                            # lower than the top-level pysat data directory.
+                            if len(os.listdir(wpath)) == 0:
+                                # Directory is empty, remove it.
+                                print(''.join((wpath, ' is empty and ',
+                                               'could be removed.')))
+                                if remove_empty_dirs:
+                                    shutil.rmtree(wpath)
+                                    print(''.join(('Removing: ', wpath)))
                             else:
-                                print('\n')
+                                print(''.join(('Directory is not empty: ',
+                                               wpath, '\nEnding cleanup.',
+                                               '\n')))
+                                break
+
+                            # Take off last path and start working up
+                            # the directory chain.
+                            wpath = os.path.sep.join(wpath.split(
+                                os.path.sep)[:-2])
+                        else:
+                            print('\n')
 
     return
 
@@ -954,6 +1049,103 @@ def check_and_make_path(path, expand_path=False):
     return made_dir
 
 
+def stat_files(paths, root_dir='', workers=1):
+    """Retrieve system statistics for many files, scanning each directory once.
+
+    Parameters
+    ----------
+    paths : str or list
+        Pathnames of files to get attribute information.
+    root_dir : str
+        Common root path shared by all paths, if any. (default='')
+    workers : int
+        Number of directories scanned at the same time. (default=1)
+
+    Returns
+    -------
+    file_info : dict
+        Keyed by file attribute, which uses names that mirror or are expanded
+        upon those used by `os.stat`. Each attribute maps to a np.array with a
+        value for each file in `paths`. Also includes 'exists', which is True
+        for paths found on the system, and 'is_file', which is True for paths
+        that are regular files. Times are in seconds since the epoch, and are
+        NaN for missing paths. Other attributes are zero for missing paths.
+
+    Raises
+    ------
+    ValueError
+        If `workers` is less than one
+
+    Note
+    ----
+    The statistics are taken from the `os.DirEntry` objects returned by a
+    single `os.scandir` call for each unique directory, rather than from
+    separate `os.path.isfile`, `os.path.getsize`, or `os.stat` calls for
+    each file.
+
+    See Also
+    --------
+    os.scandir, os.stat
+
+    """
+    if workers < 1:
+        raise ValueError('`workers` must be at least one.')
+
+    paths = listify(paths)
+
+    # Group the requested file names by directory
+    dir_files = collections.defaultdict(list)
+    for i, path in enumerate(paths):
+        if root_dir != '':
+            path = os.path.join(root_dir, path)
+        sdir, fname = os.path.split(path)
+        dir_files[sdir].append((i, fname))
+
+    # Initialize the output arrays
+    file_info = {'exists': np.zeros(shape=len(paths), dtype=bool),
+                 'is_file': np.zeros(shape=len(paths), dtype=bool)}
+    for attr in _stat_attrs.keys():
+        if attr in _stat_time_attrs:
+            file_info[attr] = np.full(shape=len(paths), fill_value=np.nan)
+        else:
+            file_info[attr] = np.zeros(shape=len(paths), dtype=np.int64)
+
+    def _scan_dir(sdir):
+        """Get the directory entries for the requested files in `sdir`."""
+        try:
+            with os.scandir(sdir if sdir != '' else os.curdir) as entries:
+                found = {entry.name: entry for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            found = dict()
+
+        stats = list()
+        for i, fname in dir_files[sdir]:
+            if fname in found:
+                entry = found[fname]
+                stats.append((i, entry.is_file(), entry.stat()))
+        return stats
+
+    if workers == 1 or len(dir_files) <= 1:
+        dir_stats = [_scan_dir(sdir) for sdir in dir_files.keys()]
+    else:
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            dir_stats = list(executor.map(_scan_dir, dir_files.keys()))
+
+    # Collect file attributes and store
+    for stats in dir_stats:
+        if len(stats) == 0:
+            continue
+
+        inds = [stat[0] for stat in stats]
+        file_info['exists'][inds] = True
+        file_info['is_file'][inds] = [stat[1] for stat in stats]
+        for attr, st_attr in _stat_attrs.items():
+            file_info[attr][inds] = [getattr(stat[2], st_attr)
+                                     for stat in stats]
+
+    return file_info
+
+
 def get_file_information(paths, root_dir=''):
     """Retrieve system statistics for the input path(s).
 
@@ -968,44 +1160,229 @@ def get_file_information(paths, root_dir=''):
     -------
     file_info : dict
         Keyed by file attribute, which uses names that mirror or are expanded
-        upon those used by `os.stat`. Each attribute maps to a list
-        of values for each file in `paths`.
+        upon those used by `os.stat`. Each attribute maps to an array-like
+        object with values for each file in `paths`.
+
+    Raises
+    ------
+    FileNotFoundError
+        If any of the paths do not exist
 
     See Also
     --------
-    os.stat
+    os.stat, pysat.utils.files.stat_files
 
     """
 
-    # Ensure the input is a list
-    paths = listify(paths)
+    file_info = stat_files(paths, root_dir=root_dir)
+
+    # Ensure all of the files were found
+    if not file_info['exists'].all():
+        missing = np.asarray(listify(paths))[~file_info['exists']]
+        raise FileNotFoundError(''.join(['Unable to find files: ',
+                                         repr(list(missing))]))
 
-    # Mapping of output key to the attribute name returned by `os.stat`
-    attrs = {'content_modified_time': 'st_mtime', 'mode': 'st_mode',
-             'size': 'st_size', 'inode': 'st_ino', 'device': 'st_dev',
-             'nlink': 'st_nlink', 'uid': 'st_uid', 'gid': 'st_gid',
-             'last_access_time': 'st_atime',
-             'metadata_update_time': 'st_ctime'}
-
-    # Initiliaze output dictionary.
-    file_info = {}
-    for attr in attrs.keys():
-        file_info[attr] = []
-
-    # Add common root directory to paths, if supplied.
-    if root_dir != '':
-        for i, path in enumerate(paths):
-            paths[i] = os.path.join(root_dir, path)
-
-    # Collect file attributes and store.
-    for path in paths:
-        info = os.stat(path)
-        for attr in attrs.keys():
-            file_info[attr].append(getattr(info, attrs[attr]))
+    del file_info['exists'], file_info['is_file']
 
     # Convert times to datetimes.
-    for attr in ['content_modified_time', 'last_access_time',
-                 'metadata_update_time']:
+    for attr in _stat_time_attrs:
         file_info[attr] = pds.to_datetime(file_info[attr], unit='s')
 
     return file_info
+
+
+def diff_file_lists(old_files, new_files):
+    """Compare two file lists by time index.
+
+    Parameters
+    ----------
+    old_files : pds.Series
+        File names indexed by datetime, such as a local or previously stored
+        file list
+    new_files : pds.Series
+        File names indexed by datetime, such as a remote or current file list
+
+    Returns
+    -------
+    file_diff : dict
+        Keyed by 'new', 'updated', and 'deleted'.  Each key maps to a
+        pds.Series of file names indexed by datetime. 'new' holds the
+        `new_files` at times absent from `old_files`, 'updated' holds the
+        `new_files` whose names differ from `old_files` at the same time, and
+        'deleted' holds the `old_files` at times absent from `new_files`.
+
+    Note
+    ----
+    The comparison uses index set operations rather than a loop over times.
+    If `old_files` has repeated times, the last file name at each time is
+    used to identify updated files.
+
+    """
+    in_old = new_files.index.isin(old_files.index)
+    in_new = old_files.index.isin(new_files.index)
+
+    # Align the file names at shared times
+    common = new_files[in_old]
+    old_common = old_files[in_new]
+    old_common = old_common[~old_common.index.duplicated(keep='last')]
+    old_names = old_common.reindex(common.index)
+
+    file_diff = {'new': new_files[~in_old],
+                 'updated': common[common.values != old_names.values],
+                 'deleted': old_files[~in_new]}
+
+    return file_diff
+
+
+def plan_file_moves(old_files, new_files):
+    """Plan the moves needed to relocate files.
+
+    Parameters
+    ----------
+    old_files : array-like
+        Full paths of the files at their current location
+    new_files : array-like
+        Full paths of the files at their new location, in the same order as
+        `old_files`
+
+    Returns
+    -------
+    plan : pds.DataFrame
+        One row per file, with the columns 'source', 'destination', and
+        'action'. The action is 'rename' for moves within a filesystem, 'copy'
+        for moves across filesystems, 'done' if the file is only found at the
+        destination, 'exists' if the file is found at both locations, and
+        'missing' if the file is found at neither.
+
+    Raises
+    ------
+    ValueError
+        If `old_files` and `new_files` have different lengths
+
+    Note
+    ----
+    Each source and destination directory is scanned once, rather than
+    checking each file separately. Since files that were already moved are
+    planned as 'done', an interrupted move may be resumed by planning it
+    again.
+
+    """
+    old_files = [os.path.normpath(ofile) for ofile in old_files]
+    new_files = [os.path.normpath(nfile) for nfile in new_files]
+    if len(old_files) != len(new_files):
+        raise ValueError(''.join(['Number of source and destination files ',
+                                  'must match: ', repr(len(old_files)), ' != ',
+                                  repr(len(new_files))]))
+
+    old_dirs = [os.path.dirname(ofile) for ofile in old_files]
+    new_dirs = [os.path.dirname(nfile) for nfile in new_files]
+    found = _scan_directories(old_dirs + new_dirs)
+
+    # Classify moves by filesystem, comparing the device of each source
+    # directory with the nearest existing parent of each destination
+    devices = dict()
+    actions = list()
+    for ofile, nfile, odir, ndir in zip(old_files, new_files, old_dirs,
+                                        new_dirs):
+        in_old = ofile in found
+        in_new = nfile in found
+        if in_old and in_new:
+            actions.append('exists')
+        elif in_new:
+            actions.append('done')
+        elif not in_old:
+            actions.append('missing')
+        elif _device_id(odir, devices) == _device_id(ndir, devices):
+            actions.append('rename')
+        else:
+            actions.append('copy')
+
+    plan = pds.DataFrame({'source': old_files, 'destination': new_files,
+                          'action': actions})
+
+    return plan
+
+
+def run_file_moves(plan, workers=1, verbose=True):
+    """Move files following a plan.
+
+    Parameters
+    ----------
+    plan : pds.DataFrame
+        File move plan, as returned by `plan_file_moves`. Only the 'rename'
+        and 'copy' actions move files.
+    workers : int
+        Number of files moved at the same time (default=1)
+    verbose : bool
+        If True, progress is printed after about every tenth of the files is
+        moved (default=True)
+
+    Returns
+    -------
+    num_moved : int
+        Number of files moved
+
+    Raises
+    ------
+    ValueError
+        If `workers` is less than one
+    OSError
+        If a file could not be moved. The remaining files are still moved
+        before the first error is raised.
+
+    Note
+    ----
+    Destination directories are created before any file is moved. Moves that
+    fail may be retried by planning the moves again, as files that were
+    already moved are planned as 'done'.
+
+    """
+    if workers < 1:
+        raise ValueError('`workers` must be at least one.')
+
+    moves = plan[plan['action'].isin(['rename', 'copy'])]
+    for ndir in np.unique([os.path.dirname(nfile)
+                           for nfile in moves['destination']]):
+        check_and_make_path(ndir)
+
+    num_moves = len(moves)
+    report_every = max(1, num_moves // 10)
+    errors = list()
+    num_moved = 0
+
+    def _finish_move(source, err):
+        """Record the outcome of a file move."""
+        nonlocal num_moved
+
+        if err is None:
+            num_moved += 1
+            if verbose and (num_moved % report_every == 0
+                            or num_moved == num_moves):
+                print('Moved {:d} of {:d} files.'.format(num_moved,
+                                                         num_moves))
+        else:
+            print(''.join(['Unable to move ', source, ': ', str(err)]))
+            errors.append(err)
+        return
+
+    move_args = list(zip(moves['source'], moves['destination'],
+                         moves['action']))
+    if workers == 1 or num_moves <= 1:
+        for args in move_args:
+            try:
+                _move_file(*args)
+            except OSError as err:
+                _finish_move(args[0], err)
+            else:
+                _finish_move(args[0], None)
+    else:
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = {executor.submit(_move_file, *args): args[0]
+                       for args in move_args}
+            for future in futures.as_completed(pending):
+                _finish_move(pending[future], future.exception())
+
+    if len(errors) > 0:
+        raise errors[0]
+
+    return num_moved
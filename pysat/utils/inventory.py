@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Persistent inventories of the data files of an Instrument."""
+
+from contextlib import closing
+import hashlib
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pds
+
+import pysat
+from pysat.utils.files import stat_files
+
+
+def file_checksum(fname, block_size=1048576):
+    """Calculate the SHA-256 checksum of a file.
+
+    Parameters
+    ----------
+    fname : str
+        Full path of the file
+    block_size : int
+        Number of bytes read at a time (default=1048576)
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-256 digest of the file contents
+
+    """
+    checksum = hashlib.sha256()
+    with open(fname, 'rb') as fin:
+        for block in iter(lambda: fin.read(block_size), b''):
+            checksum.update(block)
+
+    return checksum.hexdigest()
+
+
+class FileInventory(object):
+    """Inventory of data files stored in an SQLite database.
+
+    Parameters
+    ----------
+    fname : str
+        Full path of the SQLite database file, which is created if needed
+
+    Attributes
+    ----------
+    fname : str
+        Full path of the SQLite database file
+    columns : list
+        Names of the values recorded for each file: 'size' (bytes), 'mtime'
+        (content modification time in seconds since the epoch), 'checksum'
+        (SHA-256 digest of the file contents, if calculated), 'first_time'
+        and 'last_time' (the first and last times in the file data, once
+        loaded), and 'num_samples' (the number of times in the file data,
+        once loaded)
+
+    Note
+    ----
+    `pysat.Files` keeps an inventory for each Instrument when
+    `pysat.params['file_inventory']` is True. The inventory is updated with
+    the file sizes and modification times when the file list is refreshed,
+    and with the time coverage when a single file is loaded. Information in
+    the inventory may then be used without opening the data files.
+
+    The time coverage describes the data returned by the instrument load
+    routine, and so reflects any load keyword arguments used at that time.
+
+    """
+
+    columns = ['size', 'mtime', 'checksum', 'first_time', 'last_time',
+               'num_samples']
+
+    def __init__(self, fname):
+        """Initialize the FileInventory object."""
+        self.fname = fname
+
+        # Create the directory and table, if needed
+        fdir = os.path.dirname(self.fname)
+        if fdir != '':
+            os.makedirs(fdir, exist_ok=True)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(''.join(['CREATE TABLE IF NOT EXISTS files ',
+                                  '(fname TEXT PRIMARY KEY, size INTEGER, ',
+                                  'mtime REAL, checksum TEXT, ',
+                                  'first_time INTEGER, last_time INTEGER, ',
+                                  'num_samples INTEGER)']))
+        return
+
+    def __repr__(self):
+        """Print the basic FileInventory properties."""
+        return "pysat.utils.inventory.FileInventory({:})".format(
+            repr(self.fname))
+
+    def __eq__(self, other):
+        """Perform an equality check.
+
+        Parameters
+        ----------
+        other : any
+            Other object to compare for equality
+
+        Returns
+        -------
+        bool
+            True if both objects use the same database file
+
+        """
+        return isinstance(other, self.__class__) and self.fname == other.fname
+
+    def _connect(self):
+        """Open a connection to the database.
+
+        Returns
+        -------
+        sqlite3.Connection
+            Connection to the database file, waiting up to
+            `pysat.params['file_timeout']` seconds for other connections
+
+        """
+        return sqlite3.connect(self.fname,
+                               timeout=pysat.params['file_timeout'])
+
+    def sync(self, data_path, fnames, checksum=False):
+        """Update the inventory to match a file list.
+
+        Parameters
+        ----------
+        data_path : str
+            Directory containing the files
+        fnames : array-like
+            File names relative to `data_path`, such as `Files.files.values`
+        checksum : bool
+            If True, calculate the checksum of new or changed files, and of
+            files recorded without one (default=False)
+
+        Returns
+        -------
+        changed : list
+            Names of the files that are new or whose size or modification
+            time changed
+
+        Note
+        ----
+        Files that are not found on the system are not recorded, and records
+        for files not in `fnames` are removed. Changed files lose their time
+        coverage until they are loaded again.
+
+        """
+        fnames = np.unique(np.asarray(fnames, dtype=str))
+        file_info = stat_files(list(fnames), root_dir=data_path)
+        fnames = fnames[file_info['is_file']]
+        sizes = file_info['size'][file_info['is_file']]
+        mtimes = file_info['content_modified_time'][file_info['is_file']]
+
+        stored = self.get()
+        stored = stored.reindex(fnames)
+        is_same = ((stored['size'].values == sizes)
+                   & (stored['mtime'].values == mtimes))
+
+        changed = list(fnames[~is_same])
+        new_rows = list()
+        for fname, size, mtime in zip(fnames[~is_same], sizes[~is_same],
+                                      mtimes[~is_same]):
+            fsum = file_checksum(os.path.join(data_path, fname)) \
+                if checksum else None
+            new_rows.append((fname, int(size), float(mtime), fsum))
+
+        new_sums = list()
+        if checksum:
+            no_sum = is_same & stored['checksum'].isnull().values
+            new_sums = [(file_checksum(os.path.join(data_path, fname)), fname)
+                        for fname in fnames[no_sum]]
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute('CREATE TEMP TABLE keep (fname TEXT PRIMARY KEY)')
+            conn.executemany('INSERT INTO keep VALUES (?)',
+                             [(fname,) for fname in fnames])
+            conn.execute(''.join(['DELETE FROM files WHERE fname NOT IN ',
+                                  '(SELECT fname FROM keep)']))
+            conn.executemany(''.join(['INSERT OR REPLACE INTO files ',
+                                      '(fname, size, mtime, checksum) ',
+                                      'VALUES (?, ?, ?, ?)']), new_rows)
+            conn.executemany('UPDATE files SET checksum = ? WHERE fname = ?',
+                             new_sums)
+
+        return changed
+
+    def record_coverage(self, fname, first_time, last_time, num_samples):
+        """Record the time coverage of a file in the inventory.
+
+        Parameters
+        ----------
+        fname : str
+            File name, as recorded in the inventory
+        first_time : dt.datetime or pds.Timestamp
+            First time in the file data
+        last_time : dt.datetime or pds.Timestamp
+            Last time in the file data
+        num_samples : int
+            Number of times in the file data
+
+        Note
+        ----
+        Files without an inventory record are ignored.
+
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(''.join(['UPDATE files SET first_time = ?, ',
+                                  'last_time = ?, num_samples = ? ',
+                                  'WHERE fname = ?']),
+                         (pds.Timestamp(first_time).value,
+                          pds.Timestamp(last_time).value, int(num_samples),
+                          fname))
+        return
+
+    def get(self, fnames=None):
+        """Get the inventory records.
+
+        Parameters
+        ----------
+        fnames : array-like or NoneType
+            File names to select, or None to get all records (default=None)
+
+        Returns
+        -------
+        records : pds.DataFrame
+            Inventory records indexed by file name, with the columns listed
+            in `columns`. Files without records are not included.
+
+        """
+        with closing(self._connect()) as conn:
+            records = pds.read_sql_query(
+                ' '.join(['SELECT fname,', ', '.join(self.columns),
+                          'FROM files ORDER BY fname']), conn,
+                index_col='fname')
+
+        if fnames is not None:
+            records = records[records.index.isin(fnames)].copy()
+
+        for col in ['first_time', 'last_time']:
+            records[col] = pds.to_datetime(records[col], unit='ns')
+
+        records.index.name = None
+        return records
+
+    def changed(self, data_path, fnames):
+        """Find files that differ from their inventory records.
+
+        Parameters
+        ----------
+        data_path : str
+            Directory containing the files
+        fnames : array-like
+            File names relative to `data_path`
+
+        Returns
+        -------
+        changed : list
+            Names of the files that are missing, not recorded, or whose size or
+            modification time differs from the inventory
+
+        Note
+        ----
+        Only the file system metadata is used, the files are not opened.
+
+        """
+        fnames = np.asarray(fnames, dtype=str)
+        file_info = stat_files(list(fnames), root_dir=data_path)
+        stored = self.get(fnames).reindex(fnames)
+        is_same = (file_info['is_file']
+                   & (stored['size'].values == file_info['size'])
+                   & (stored['mtime'].values
+                      == file_info['content_modified_time']))
+
+        return list(fnames[~is_same])
+
+    def gaps(self, min_gap=None):
+        """Find the gaps between the time coverage of recorded files.
+
+        Parameters
+        ----------
+        min_gap : dt.timedelta, pds.Timedelta, or NoneType
+            Smallest gap to report, or None to report all gaps (default=None)
+
+        Returns
+        -------
+        gaps : pds.DataFrame
+            Gaps between consecutive files, with the columns 'start' (last
+            time of the earlier file), 'stop' (first time of the later file),
+            and 'duration'
+
+        Note
+        ----
+        Only files with a recorded time coverage are used, so files that were
+        never loaded may appear as gaps. Gaps within a file are not found.
+
+        """
+        records = self.get().dropna(subset=['first_time', 'last_time'])
+        records = records.sort_values('first_time', kind='mergesort')
+
+        starts = records['last_time'].values[:-1]
+        stops = records['first_time'].values[1:]
+        gaps = pds.DataFrame({'start': starts, 'stop': stops})
+        gaps['duration'] = gaps['stop'] - gaps['start']
+
+        if min_gap is None:
+            min_gap = pds.Timedelta(0)
+        gaps = gaps[gaps['duration'] > pds.Timedelta(min_gap)]
+
+        return gaps.reset_index(drop=True)
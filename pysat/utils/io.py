@@ -9,17 +9,26 @@
 # unlimited.
 # ----------------------------------------------------------------------------
 """Input/Output utilities for pysat data."""
+from collections import OrderedDict
 import copy
 import datetime as dt
+import json
 import netCDF4
 import numpy as np
 import os
 import pandas as pds
+import scipy.io
 import warnings
 import xarray as xr
 
 import pysat
 
+# Cache of file information used by `inspect_netcdf`, keyed by the file path
+# and epoch settings.  The least recently used files are removed once the
+# cache holds `_inspect_cache_size` files.
+_inspect_cache = OrderedDict()
+_inspect_cache_size = 1024
+
 
 def pysat_meta_to_xarray_attr(xr_data, pysat_meta, epoch_name):
     """Attach pysat metadata to xarray Dataset as attributes.
@@ -134,16 +143,12 @@ def filter_netcdf4_metadata(inst, mdata_dict, coltype, remove=False,
     elif isinstance(coltype, np.dtype):
         coltype = coltype.type
 
-    # Remove any metadata with a value of NaN not present in `export_nan`
-    filtered_dict = mdata_dict.copy()
-    for key, value in mdata_dict.items():
-        try:
-            if np.isnan(value):
-                if key not in export_nan:
-                    filtered_dict.pop(key)
-        except TypeError:
-            # If a TypeError thrown, it's not NaN because it's not a float
-            pass
+    # Remove any metadata with a value of NaN not present in `export_nan`.
+    # Only floating point values may be NaN.
+    filtered_dict = {key: value for key, value in mdata_dict.items()
+                     if key in export_nan
+                     or not isinstance(value, (float, np.floating))
+                     or not np.isnan(value)}
 
     # Coerce boolean types to integers, remove NoneType, and test for
     # consisent data type
@@ -217,53 +222,160 @@ def add_netcdf4_standards_to_metadict(inst, in_meta_dict, epoch_name,
     # Update the non-time variable meta data standards
     out_meta_dict = copy.deepcopy(in_meta_dict)
     for var in inst.vars_no_time:
-        # Get the data variable information
-        _, coltype, datetime_flag = inst._get_data_info(inst[var])
+        lower_var = var.lower()
+        out_meta_dict[lower_var] = _add_netcdf4_var_standards(
+            inst, var, out_meta_dict.get(lower_var), epoch_name,
+            check_type=check_type, export_nan=export_nan)
 
-        # Update the standard metadata values
-        meta_dict = {'Depend_0': epoch_name, 'Display_Type': 'Time Series',
-                     'Var_Type': 'data'}
+    return out_meta_dict
 
-        lower_var = var.lower()
 
-        # Update metadata based on data type.
-        if datetime_flag:
-            time_meta = return_epoch_metadata(inst, epoch_name)
-            time_meta.pop('MonoTon')
-            if inst.pandas_format:
-                # Pandas file create will set long_name to 'Epoch'
-                pass
-            else:
-                # Convert times to integers
-                inst[var] = (inst[var].values.astype(np.int64)
-                             * 1.0E-6).astype(np.int64)
+def _add_netcdf4_var_standards(inst, var, var_meta, epoch_name,
+                               check_type=None, export_nan=None):
+    """Add netCDF4 standards to and filter the metadata for one variable.
+
+    Parameters
+    ----------
+    inst : pysat.Instrument
+        Object containing data and meta data
+    var : str
+        Data variable name
+    var_meta : dict or NoneType
+        Metadata for `var`, keyed by metadata label, or None if `var` has no
+        metadata.  Updated in place.
+    epoch_name : str
+        Name for epoch or time-index variable.
+    check_type : NoneType or list
+        Passed to `pysat.utils.io.filter_netcdf4_metadata`. (default=None)
+    export_nan : NoneType or list
+        Passed to `pysat.utils.io.filter_netcdf4_metadata`. (default=None)
 
-            meta_dict.update(time_meta)
+    Returns
+    -------
+    dict
+        Filtered metadata for `var`, including the standard metadata
 
-        meta_dict['Format'] = inst._get_var_type_code(coltype)
+    """
+    # Get the data variable information
+    _, coltype, datetime_flag = inst._get_data_info(inst[var])
 
-        if not inst.pandas_format:
-            for i, dim in enumerate(list(inst[var].dims)):
-                meta_dict['Depend_{:1d}'.format(i)] = dim
-            num_dims = len(inst[var].dims)
-            if num_dims >= 2:
-                meta_dict['Display_Type'] = 'Multidimensional'
+    # Update the standard metadata values
+    meta_dict = {'Depend_0': epoch_name, 'Display_Type': 'Time Series',
+                 'Var_Type': 'data'}
 
-        # Update the meta data
-        if lower_var in out_meta_dict:
-            out_meta_dict[lower_var].update(meta_dict)
+    # Update metadata based on data type.
+    if datetime_flag:
+        time_meta = return_epoch_metadata(inst, epoch_name)
+        time_meta.pop('MonoTon')
+        if inst.pandas_format:
+            # Pandas file create will set long_name to 'Epoch'
+            pass
         else:
-            warnings.warn(''.join(['Unable to find MetaData for ',
-                                   var]))
-            out_meta_dict[lower_var] = meta_dict
+            # Convert times to integers
+            inst[var] = (inst[var].values.astype(np.int64)
+                         * 1.0E-6).astype(np.int64)
 
-        # Filter metdata for other netCDF4 requirements
-        remove = True if coltype == str else False
-        out_meta_dict[lower_var] = filter_netcdf4_metadata(
-            inst, out_meta_dict[lower_var], coltype, remove=remove,
-            check_type=check_type, export_nan=export_nan, varname=lower_var)
+        meta_dict.update(time_meta)
 
-    return out_meta_dict
+    meta_dict['Format'] = inst._get_var_type_code(coltype)
+
+    if not inst.pandas_format:
+        for i, dim in enumerate(list(inst[var].dims)):
+            meta_dict['Depend_{:1d}'.format(i)] = dim
+        num_dims = len(inst[var].dims)
+        if num_dims >= 2:
+            meta_dict['Display_Type'] = 'Multidimensional'
+
+    # Update the meta data
+    if var_meta is not None:
+        var_meta.update(meta_dict)
+    else:
+        warnings.warn(''.join(['Unable to find MetaData for ', var]))
+        var_meta = meta_dict
+
+    # Filter metdata for other netCDF4 requirements
+    remove = True if coltype == str else False
+    return filter_netcdf4_metadata(inst, var_meta, coltype, remove=remove,
+                                   check_type=check_type,
+                                   export_nan=export_nan,
+                                   varname=var.lower())
+
+
+def compile_export_meta(inst, epoch_name, check_type=None, export_nan=None,
+                        trans_table=None):
+    """Create the file metadata for each variable in a single pass.
+
+    Parameters
+    ----------
+    inst : pysat.Instrument
+        Object containing data and meta data
+    epoch_name : str
+        Name for epoch or time-index variable.
+    check_type : NoneType or list
+        List of keys associated with `meta_dict` that should have the same
+        data type as `coltype`. Passed to
+        `pysat.utils.io.filter_netcdf4_metadata`. (default=None)
+    export_nan : NoneType or list
+        Metadata parameters allowed to be NaN. Passed along to
+        `pysat.utils.io.filter_netcdf4_metadata`. (default=None)
+    trans_table : dict or NoneType
+        Keyed by current metalabels containing a list of metadata labels to
+        use within the returned dict. If None, the default translation from
+        `default_to_netcdf_translation_table` is used. (default=None)
+
+    Returns
+    -------
+    export_meta : dict
+        Variable metadata keyed by lower-case variable name, with a dict of
+        translated metadata labels and values for each variable.
+
+    Raises
+    ------
+    ValueError
+        If there is a duplicated variable label in the translation table
+
+    See Also
+    --------
+    add_netcdf4_standards_to_metadict, apply_table_translation_to_file
+
+    Note
+    ----
+    Produces the same output as `inst.meta.to_dict()` with epoch metadata
+    from `return_epoch_metadata`, processed by
+    `add_netcdf4_standards_to_metadict` and then
+    `apply_table_translation_to_file`.  Each variable is processed once,
+    without copying the full metadata dictionary between steps.
+
+    """
+    if trans_table is None:
+        trans_table = default_to_netcdf_translation_table(inst)
+
+    _check_translation_table(trans_table)
+
+    # Get the metadata for all variables from the Meta storage at once
+    meta_dicts = inst.meta.to_dict()
+    meta_dicts[epoch_name] = return_epoch_metadata(inst, epoch_name)
+
+    # Data variables receive the netCDF4 standards
+    data_vars = {var.lower(): var for var in inst.vars_no_time}
+
+    export_meta = {}
+    for lower_var, var_meta in meta_dicts.items():
+        if lower_var in data_vars:
+            var_meta = _add_netcdf4_var_standards(
+                inst, data_vars.pop(lower_var), var_meta, epoch_name,
+                check_type=check_type, export_nan=export_nan)
+
+        export_meta[lower_var] = _translate_meta_labels(var_meta, trans_table)
+
+    # Data variables without metadata only have the standard metadata
+    for lower_var, var in data_vars.items():
+        var_meta = _add_netcdf4_var_standards(inst, var, None, epoch_name,
+                                              check_type=check_type,
+                                              export_nan=export_nan)
+        export_meta[lower_var] = _translate_meta_labels(var_meta, trans_table)
+
+    return export_meta
 
 
 def remove_netcdf4_standards_from_meta(mdict, epoch_name, labels):
@@ -424,12 +536,32 @@ def apply_table_translation_to_file(inst, meta_dict, trans_table=None):
 
     """
 
-    export_dict = {}
-
     if trans_table is None:
         trans_table = default_to_netcdf_translation_table(inst)
 
-    # Confirm there are no duplicated translation labels
+    _check_translation_table(trans_table)
+
+    # Translate each metadata label if a translation is provided
+    export_dict = {key: _translate_meta_labels(meta_dict[key], trans_table)
+                   for key in meta_dict.keys()}
+
+    return export_dict
+
+
+def _check_translation_table(trans_table):
+    """Confirm there are no duplicated labels in a translation table.
+
+    Parameters
+    ----------
+    trans_table : dict
+        Keyed by current metalabels containing a list of metadata labels
+
+    Raises
+    ------
+    ValueError
+        If there is a duplicated variable label in the translation table
+
+    """
     trans_labels = list()
     for key in trans_table.keys():
         trans_labels.extend(trans_table[key])
@@ -438,18 +570,35 @@ def apply_table_translation_to_file(inst, meta_dict, trans_table=None):
         raise ValueError(''.join(['There are duplicated variable label values',
                                   ' in `trans_table`']))
 
-    # Translate each metadata label if a translation is provided
-    for key in meta_dict.keys():
-        export_dict[key] = {}
-        loop_meta_dict = meta_dict[key]
-        for orig_key in loop_meta_dict:
-            if orig_key in trans_table:
-                for translated_key in trans_table[orig_key]:
-                    export_dict[key][translated_key] = loop_meta_dict[orig_key]
-            else:
-                export_dict[key][orig_key] = loop_meta_dict[orig_key]
+    return
 
-    return export_dict
+
+def _translate_meta_labels(var_meta, trans_table):
+    """Translate the metadata labels for one variable.
+
+    Parameters
+    ----------
+    var_meta : dict
+        Metadata for a variable, keyed by metadata label
+    trans_table : dict
+        Keyed by current metalabels containing a list of metadata labels to
+        use within the returned dict
+
+    Returns
+    -------
+    out_meta : dict
+        Metadata for a variable, keyed by translated metadata label
+
+    """
+    out_meta = {}
+    for orig_key, value in var_meta.items():
+        if orig_key in trans_table:
+            for translated_key in trans_table[orig_key]:
+                out_meta[translated_key] = value
+        else:
+            out_meta[orig_key] = value
+
+    return out_meta
 
 
 def apply_table_translation_from_file(trans_table, meta_dict):
@@ -567,13 +716,154 @@ def meta_array_expander(meta_dict):
     return meta_dict
 
 
+def _assign_file_meta(meta, full_mdict, epoch_name, drop_meta_labels,
+                      meta_translation, meta_processor):
+    """Process metadata loaded from a file and assign it to `meta`.
+
+    Parameters
+    ----------
+    meta : pysat.Meta
+        Meta object that will be updated with the processed metadata.
+    full_mdict : dict
+        Metadata loaded from file, keyed by variable name with a dict of
+        file metadata labels and values for each variable.
+    epoch_name : str
+        Data key for the epoch variable, whose metadata will be removed.
+    drop_meta_labels : list
+        List of variable metadata labels that should be dropped.
+    meta_translation : dict
+        Translation table used to map metadata labels in the file to
+        those used by `meta`.
+    meta_processor : function or NoneType
+        If not None, a function that takes and returns a dict of filtered
+        metadata.
+
+    See Also
+    --------
+    load_netcdf, load_zarr, load_parquet
+
+    """
+    # Process the metadata. First, drop labels as requested.
+    for var in full_mdict:
+        for label in drop_meta_labels:
+            if label in full_mdict[var]:
+                full_mdict[var].pop(label)
+
+    # Second, remove some items pysat added for netcdf compatibility.
+    filt_mdict = remove_netcdf4_standards_from_meta(full_mdict, epoch_name,
+                                                    meta.labels)
+
+    # Translate labels from file to pysat compatible labels using
+    # `meta_translation`.
+    filt_mdict = apply_table_translation_from_file(meta_translation, filt_mdict)
+
+    # Next, allow processing by developers so they can deal with
+    # issues with specific files.
+    if meta_processor is not None:
+        filt_mdict = meta_processor(filt_mdict)
+
+    # Meta cannot take array data, if present save it as seperate meta data
+    # labels.
+    filt_mdict = meta_array_expander(filt_mdict)
+
+    # Assign filtered metadata to pysat.Meta instance
+    for key in filt_mdict:
+        meta[key] = filt_mdict[key]
+
+    return
+
+
+def _memmap_netcdf_variables(fname, data):
+    """Create copy-on-write memory maps of contiguous, uncompressed variables.
+
+    Parameters
+    ----------
+    fname : str
+        Name of the netCDF file.
+    data : netCDF4.Dataset
+        Open netCDF4 Dataset for `fname`.
+
+    Returns
+    -------
+    mmaps : dict
+        Arrays backed by the file on disk, keyed by variable name. Only
+        numeric variables that may be mapped are included.
+
+    Note
+    ----
+    The arrays are copy-on-write views of the file. Memory pages are read
+    from the file when accessed and copied into memory when changed, and the
+    file is never changed.
+
+    NETCDF3 files are mapped using the variable layout found by
+    `scipy.io.netcdf_file` and keep the big-endian byte order of the file.
+    NETCDF4 variables must have contiguous storage without any filters and
+    are mapped using the HDF5 dataset offsets provided by the optional
+    dependency `h5py`. Variables with an unlimited dimension, such as those
+    written by `inst_to_netcdf` with the default `unlimited_time=True`, are
+    chunked and can't be mapped. Without `h5py`, a warning is logged and the
+    NETCDF4 file is read into memory. Fill values are not masked.
+
+    """
+    mmaps = {}
+    if data.data_model.startswith('NETCDF3'):
+        # Find the position of each variable within the file
+        sdata = scipy.io.netcdf_file(fname, mode='r', mmap=True,
+                                     maskandscale=False)
+        layouts = {}
+        for key, var in sdata.variables.items():
+            if var.data.dtype.kind in 'biuf':
+                base = var.data
+                while isinstance(base.base, np.ndarray):
+                    base = base.base
+                layouts[key] = (var.data.shape, var.data.dtype,
+                                var.data.strides,
+                                var.data.__array_interface__['data'][0]
+                                - base.__array_interface__['data'][0])
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            sdata.close()
+
+        if len(layouts) > 0:
+            fmap = np.memmap(fname, mode='c', dtype=np.uint8)
+            for key, (shape, dtype, strides, offset) in layouts.items():
+                mmaps[key] = np.ndarray(shape, dtype=dtype, buffer=fmap,
+                                        offset=offset, strides=strides)
+    else:
+        try:
+            import h5py
+        except ImportError:
+            pysat.logger.warning(''.join(['Memory mapping NETCDF4 files ',
+                                          'requires `h5py`, loading ', fname,
+                                          ' into memory.']))
+            return mmaps
+
+        with h5py.File(fname, 'r') as h5data:
+            for key, var in data.variables.items():
+                # Only contiguous, unfiltered, numeric data may be mapped
+                if not isinstance(var.dtype, np.dtype) \
+                        or var.dtype.kind not in 'biuf' \
+                        or var.chunking() != 'contiguous' \
+                        or any(var.filters().values()) or key not in h5data:
+                    continue
+
+                offset = h5data[key].id.get_offset()
+                if offset is not None:
+                    mmaps[key] = np.memmap(fname, mode='c',
+                                           dtype=h5data[key].dtype,
+                                           offset=offset, shape=var.shape)
+
+    return mmaps
+
+
 def load_netcdf(fnames, strict_meta=False, file_format='NETCDF4',
                 epoch_name=None, epoch_unit='ms', epoch_origin='unix',
                 pandas_format=True, decode_timedelta=False,
                 combine_by_coords=True, meta_kwargs=None,
                 meta_processor=None, meta_translation=None,
                 drop_meta_labels=None, decode_times=None,
-                strict_dim_check=True):
+                strict_dim_check=True, mmap=False):
     """Load netCDF-3/4 file produced by pysat.
 
     Parameters
@@ -647,6 +937,14 @@ def load_netcdf(fnames, strict_meta=False, file_format='NETCDF4',
         Used for xarray data (`pandas_format` is False). If True, warn the user
         that the desired epoch is not present in `xarray.dims`.  If False,
         no warning is raised. (default=True)
+    mmap : bool
+        If True, memory-map the contiguous, uncompressed numeric variables
+        of each file instead of reading them into memory. The mapping is
+        copy-on-write, so changing the loaded data never changes the files.
+        Fill values are not replaced. Files written with
+        `unlimited_time=True` are chunked and are always read into memory.
+        Mapping NETCDF4 files requires `h5py`, without which the files are
+        read into memory. (default=False)
 
     Returns
     -------
@@ -682,7 +980,8 @@ def load_netcdf(fnames, strict_meta=False, file_format='NETCDF4',
                                         meta_kwargs=meta_kwargs,
                                         meta_processor=meta_processor,
                                         meta_translation=meta_translation,
-                                        drop_meta_labels=drop_meta_labels)
+                                        drop_meta_labels=drop_meta_labels,
+                                        mmap=mmap)
     else:
         data, meta = load_netcdf_xarray(fnames, strict_meta=strict_meta,
                                         file_format=file_format,
@@ -696,7 +995,8 @@ def load_netcdf(fnames, strict_meta=False, file_format='NETCDF4',
                                         meta_translation=meta_translation,
                                         drop_meta_labels=drop_meta_labels,
                                         decode_times=decode_times,
-                                        strict_dim_check=strict_dim_check)
+                                        strict_dim_check=strict_dim_check,
+                                        mmap=mmap)
 
     return data, meta
 
@@ -704,7 +1004,8 @@ def load_netcdf(fnames, strict_meta=False, file_format='NETCDF4',
 def load_netcdf_pandas(fnames, strict_meta=False, file_format='NETCDF4',
                        epoch_name='Epoch', epoch_unit='ms', epoch_origin='unix',
                        meta_kwargs=None, meta_processor=None,
-                       meta_translation=None, drop_meta_labels=None):
+                       meta_translation=None, drop_meta_labels=None,
+                       mmap=False):
     """Load netCDF-3/4 file produced by pysat in a pandas format.
 
     Parameters
@@ -755,6 +1056,14 @@ def load_netcdf_pandas(fnames, strict_meta=False, file_format='NETCDF4',
     drop_meta_labels : list or NoneType
         List of variable metadata labels that should be dropped. Applied
         to metadata as loaded from the file. (default=None)
+    mmap : bool
+        If True, memory-map the contiguous, uncompressed numeric variables
+        with a native byte order instead of reading them into memory. Data
+        from a single file are copy-on-write views of the file, and fill
+        values are not replaced. Files written with `unlimited_time=True` are
+        chunked and are always read into memory. Mapping NETCDF4 files
+        requires `h5py`, without which the file is read into memory.
+        (default=False)
 
     Returns
     -------
@@ -821,13 +1130,19 @@ def load_netcdf_pandas(fnames, strict_meta=False, file_format='NETCDF4',
             for ncattr in data.ncattrs():
                 setattr(meta.header, ncattr, data.getncattr(ncattr))
 
+            # Map the file variables, pandas requires a native byte order
+            mmaps = _memmap_netcdf_variables(fname, data) if mmap else {}
+
             # Load the metadata.  From here group unique dimensions and
             # act accordingly, 1D, 2D, 3D.
             loaded_vars = {}
             for key in data.variables.keys():
                 if len(data.variables[key].dimensions) == 1:
                     # Load 1D data variables, assuming time is the dimension.
-                    loaded_vars[key] = data.variables[key][:]
+                    if key in mmaps and mmaps[key].dtype.isnative:
+                        loaded_vars[key] = mmaps[key]
+                    else:
+                        loaded_vars[key] = data.variables[key][:]
 
                     # Load up metadata
                     meta_dict = {}
@@ -864,34 +1179,31 @@ def load_netcdf_pandas(fnames, strict_meta=False, file_format='NETCDF4',
     # Combine all of the data loaded across files together
     out = []
     for item in running_store:
-        out.append(pds.DataFrame.from_records(item, index=epoch_name))
-    data = pds.concat(out, axis=0)
-
-    # Process the metadata. First, drop labels as requested.
-    for var in full_mdict:
-        for label in drop_meta_labels:
-            if label in full_mdict[var]:
-                full_mdict[var].pop(label)
-
-    # Second, remove some items pysat added for netcdf compatibility.
-    filt_mdict = remove_netcdf4_standards_from_meta(full_mdict, epoch_name,
-                                                    meta.labels)
-    # Translate labels from file to pysat compatible labels using
-    # `meta_translation`.
-    filt_mdict = apply_table_translation_from_file(meta_translation, filt_mdict)
-
-    # Next, allow processing by developers so they can deal with
-    # issues with specific files.
-    if meta_processor is not None:
-        filt_mdict = meta_processor(filt_mdict)
+        if mmap:
+            # Build the DataFrame without copying the mapped arrays, using
+            # the same column order as `from_records`
+            index = item.pop(epoch_name).rename(epoch_name)
+            mapped = [key for key in item.keys()
+                      if pysat.utils.memory._get_memmap_base(item[key])
+                      is not None]
+            unmapped = pds.DataFrame.from_records(
+                {key: item[key] for key in item.keys() if key not in mapped},
+                index=index)
+            columns = {key: pds.Series(item[key], index=index, copy=False)
+                       if key in mapped else unmapped[key]
+                       for key in sorted(item.keys())}
+            out.append(pds.DataFrame(columns, index=index, copy=False))
+        else:
+            out.append(pds.DataFrame.from_records(item, index=epoch_name))
 
-    # Meta cannot take array data, if present save it as seperate meta data
-    # labels.
-    filt_mdict = meta_array_expander(filt_mdict)
+    if mmap and len(out) == 1:
+        data = out[0]
+    else:
+        data = pds.concat(out, axis=0)
 
-    # Assign filtered metadata to pysat.Meta instance
-    for key in filt_mdict:
-        meta[key] = filt_mdict[key]
+    # Process the metadata and assign it to `meta`
+    _assign_file_meta(meta, full_mdict, epoch_name, drop_meta_labels,
+                      meta_translation, meta_processor)
 
     return data, meta
 
@@ -901,7 +1213,7 @@ def load_netcdf_xarray(fnames, strict_meta=False, file_format='NETCDF4',
                        decode_timedelta=False, combine_by_coords=True,
                        meta_kwargs=None, meta_processor=None,
                        meta_translation=None, drop_meta_labels=None,
-                       decode_times=False, strict_dim_check=True):
+                       decode_times=False, strict_dim_check=True, mmap=False):
     """Load netCDF-3/4 file produced by pysat into an xarray Dataset.
 
     Parameters
@@ -969,6 +1281,14 @@ def load_netcdf_xarray(fnames, strict_meta=False, file_format='NETCDF4',
         Used for xarray data (`pandas_format` is False). If True, warn the user
         that the desired epoch is not present in `xarray.dims`.  If False,
         no warning is raised. (default=True)
+    mmap : bool
+        If True and a single file is loaded, memory-map the contiguous,
+        uncompressed numeric variables instead of reading them into memory.
+        These variables are copy-on-write views of the file, and fill values
+        are not replaced for any variable. Files written with
+        `unlimited_time=True` are chunked and are always read into memory.
+        Mapping NETCDF4 files requires `h5py`, without which the file is read
+        into memory. (default=False)
 
     Returns
     -------
@@ -1025,7 +1345,20 @@ def load_netcdf_xarray(fnames, strict_meta=False, file_format='NETCDF4',
     # Load the data differently for single or multiple files
     if len(fnames) == 1:
         data = xr.open_dataset(fnames[0], decode_timedelta=decode_timedelta,
-                               decode_times=decode_times)
+                               decode_times=decode_times,
+                               mask_and_scale=not mmap)
+
+        if mmap:
+            # Replace the lazily loaded variables with memory-mapped arrays,
+            # the dimension indexes have already been loaded.
+            with netCDF4.Dataset(fnames[0], mode='r') as ncdata:
+                mmaps = _memmap_netcdf_variables(fnames[0], ncdata)
+
+            for key in mmaps.keys():
+                if key in data.variables and key not in data.indexes \
+                        and data[key].dtype == mmaps[key].dtype.newbyteorder(
+                            '='):
+                    data.variables[key].data = mmaps[key]
     else:
         data = xr.open_mfdataset(fnames, decode_timedelta=decode_timedelta,
                                  decode_times=decode_times, **combine_kw)
@@ -1082,32 +1415,9 @@ def load_netcdf_xarray(fnames, strict_meta=False, file_format='NETCDF4',
     for data_attr in data.attrs.keys():
         setattr(meta.header, data_attr, getattr(data, data_attr))
 
-    # Process the metadata. First, drop labels as requested.
-    for var in full_mdict:
-        for label in drop_meta_labels:
-            if label in full_mdict[var]:
-                full_mdict[var].pop(label)
-
-    # Second, remove some items pysat added for netcdf compatibility.
-    filt_mdict = remove_netcdf4_standards_from_meta(full_mdict, epoch_name,
-                                                    meta.labels)
-
-    # Translate labels from file to pysat compatible labels using
-    # `meta_translation`.
-    filt_mdict = apply_table_translation_from_file(meta_translation, filt_mdict)
-
-    # Next, allow processing by developers so they can deal with
-    # issues with specific files.
-    if meta_processor is not None:
-        filt_mdict = meta_processor(filt_mdict)
-
-    # Meta cannot take array data, if present save it as seperate meta data
-    # labels.
-    filt_mdict = meta_array_expander(filt_mdict)
-
-    # Assign filtered metadata to pysat.Meta instance
-    for key in filt_mdict:
-        meta[key] = filt_mdict[key]
+    # Process the metadata and assign it to `meta`
+    _assign_file_meta(meta, full_mdict, epoch_name, drop_meta_labels,
+                      meta_translation, meta_processor)
 
     # Remove attributes from the data object
     data.attrs = {}
@@ -1118,43 +1428,307 @@ def load_netcdf_xarray(fnames, strict_meta=False, file_format='NETCDF4',
     return data, meta
 
 
-def return_epoch_metadata(inst, epoch_name):
-    """Create epoch or time-index metadata.
+def _inspect_netcdf_file(fname, epoch_name, epoch_unit, epoch_origin):
+    """Read the header and epoch information from a netCDF file.
 
     Parameters
     ----------
-    inst : pysat.Instrument
-        Instrument object with data and metadata.
-    epoch_name : str
-        Data key for time-index or epoch data.
+    fname : str
+        Filename to inspect.
+    epoch_name : str or NoneType
+        Data key for the epoch variable. If None, uses 'time' if present in
+        the file, and 'Epoch' otherwise.
+    epoch_unit : str
+        The pandas-defined unit of the epoch variable.
+    epoch_origin : str or timestamp-convertable
+        Origin of epoch calculation, following convention for
+        `pandas.to_datetime`.
 
     Returns
     -------
-    meta_dict : dict
-        Dictionary with epoch metadata, keyed by
-        metadata label.
+    file_info : dict
+        Dict with the file 'variables', 'dims', 'dtypes', 'epoch_dim',
+        'start', 'stop', and 'num_samples', as well as the 'epoch_name' and
+        the unprocessed 'header' and variable 'mdict' attributes.
+
+    Raises
+    ------
+    KeyError
+        If `epoch_name` is not a variable in the file
+
+    Note
+    ----
+    Results are cached using the file path, modification time, size, and
+    epoch settings, so unchanged files are only read once.  Only the most
+    recently used files are kept, and a copy of the cached information is
+    returned.
 
     """
-    # Get existing meta data
-    if epoch_name in inst.meta:
-        new_dict = inst.meta[inst.meta.var_case_name(epoch_name)].to_dict()
+    fstat = os.stat(fname)
+    cache_key = (os.path.abspath(fname), epoch_name, epoch_unit,
+                 str(epoch_origin))
+    if cache_key in _inspect_cache:
+        mtime, size, file_info = _inspect_cache[cache_key]
+        if mtime == fstat.st_mtime_ns and size == fstat.st_size:
+            _inspect_cache.move_to_end(cache_key)
+            return copy.deepcopy(file_info)
+
+    with netCDF4.Dataset(fname, mode='r') as data:
+        if epoch_name is None:
+            epoch_name = 'time' if 'time' in data.variables.keys() \
+                else 'Epoch'
+
+        if epoch_name not in data.variables.keys():
+            estr = ''.join(['Epoch label: "', epoch_name, '"',
+                            ' was not found in loaded dimensions [',
+                            ', '.join(data.variables.keys()), ']'])
+            raise KeyError(estr)
+
+        file_info = {'epoch_name': epoch_name,
+                     'header': {ncattr: data.getncattr(ncattr)
+                                for ncattr in data.ncattrs()},
+                     'mdict': {}, 'variables': [], 'dtypes': {},
+                     'dims': {dim: len(data.dimensions[dim])
+                              for dim in data.dimensions.keys()}}
+
+        # Only the attributes are read for all variables except the epoch.
+        # The 'coordinates' attribute is not metadata, and is removed by the
+        # xarray loader.
+        for key in data.variables.keys():
+            file_info['mdict'][key] = {
+                nc_key: data.variables[key].getncattr(nc_key)
+                for nc_key in data.variables[key].ncattrs()
+                if nc_key != 'coordinates'}
+
+            if key != epoch_name:
+                file_info['variables'].append(key)
+                file_info['dtypes'][key] = np.dtype(data.variables[key].dtype)
+
+        epoch_var = data.variables[epoch_name]
+        file_info['epoch_dim'] = epoch_var.dimensions[0] \
+            if len(epoch_var.dimensions) > 0 else epoch_name
+        epoch = np.asarray(epoch_var[:]).ravel()
+
+    file_info['num_samples'] = len(epoch)
+    if len(epoch) > 0:
+        edates = pds.to_datetime(epoch, unit=epoch_unit, origin=epoch_origin)
+        file_info['start'] = edates.min()
+        file_info['stop'] = edates.max()
     else:
-        new_dict = {}
+        file_info['start'] = None
+        file_info['stop'] = None
 
-    # Update basic labels, if they are missing.
-    epoch_label = 'Milliseconds since 1970-1-1 00:00:00'
-    basic_labels = [inst.meta.labels.units]
+    _inspect_cache[cache_key] = (fstat.st_mtime_ns, fstat.st_size,
+                                 copy.deepcopy(file_info))
+    _inspect_cache.move_to_end(cache_key)
+    while len(_inspect_cache) > _inspect_cache_size:
+        _inspect_cache.popitem(last=False)
 
-    for label in basic_labels:
-        if label not in new_dict or new_dict[label] == '':
-            new_dict[label] = epoch_label
+    return file_info
 
-    # Assign name
-    new_dict[inst.meta.labels.name] = epoch_name
 
-    # Update the time standards
-    time_dict = {'calendar': 'standard', 'Format': 'i8', 'Var_Type': 'data',
-                 'Time_Base': epoch_label, 'Time_Scale': 'UTC'}
+def clear_inspect_cache():
+    """Clear the cached file information used by `inspect_netcdf`."""
+    _inspect_cache.clear()
+    return
+
+
+def combine_file_info(fnames, file_info, meta):
+    """Combine the information for a set of inspected files.
+
+    Parameters
+    ----------
+    fnames : list
+        List of inspected filenames
+    file_info : list
+        List of dicts with the 'variables', 'dims', 'dtypes', 'epoch_dim',
+        'start', 'stop', and 'num_samples' for each file in `fnames`
+    meta : pysat.Meta
+        Metadata for the inspected files
+
+    Returns
+    -------
+    info : dict
+        Dict with the combined 'variables' (list), 'dims' (dict of dimension
+        sizes), 'dtypes' (dict of variable dtypes, as stored in netCDF files),
+        'start' and 'stop' (time bounds as pds.Timestamp, or None if there are
+        no samples), 'num_samples' (int), 'meta' (pysat.Meta), and 'files'
+        (pds.DataFrame with the 'start', 'stop', and 'num_samples' of each
+        file)
+
+    Note
+    ----
+    The epoch dimension sizes are summed across files, while the largest
+    size is kept for all other dimensions.
+
+    """
+    info = {'variables': [], 'dims': {}, 'dtypes': {}, 'num_samples': 0,
+            'meta': meta}
+
+    for finfo in file_info:
+        for var in finfo['variables']:
+            if var not in info['dtypes']:
+                info['variables'].append(var)
+                info['dtypes'][var] = finfo['dtypes'][var]
+
+        for dim in finfo['dims'].keys():
+            if dim == finfo['epoch_dim']:
+                info['dims'][dim] = info['dims'].get(dim, 0) \
+                    + finfo['dims'][dim]
+            else:
+                info['dims'][dim] = max(info['dims'].get(dim, 0),
+                                        finfo['dims'][dim])
+
+        info['num_samples'] += finfo['num_samples']
+
+    info['files'] = pds.DataFrame(
+        {'start': [finfo['start'] for finfo in file_info],
+         'stop': [finfo['stop'] for finfo in file_info],
+         'num_samples': [finfo['num_samples'] for finfo in file_info]},
+        index=pds.Index(list(fnames), name='fname'))
+
+    info['start'] = info['files']['start'].min()
+    info['stop'] = info['files']['stop'].max()
+    for key in ['start', 'stop']:
+        if pds.isnull(info[key]):
+            info[key] = None
+
+    return info
+
+
+def inspect_netcdf(fnames, epoch_name=None, epoch_unit='ms',
+                   epoch_origin='unix', meta_kwargs=None, meta_processor=None,
+                   meta_translation=None, drop_meta_labels=None):
+    """Get the variables, dimensions, time bounds, and metadata of files.
+
+    Parameters
+    ----------
+    fnames : str or array_like
+        Filename(s) to inspect.
+    epoch_name : str or NoneType
+        Data key for epoch variable.  The epoch variable is expected to be an
+        array of integer or float values denoting time elapsed from an origin
+        specified by `epoch_origin` with units specified by `epoch_unit`.
+        If None, uses 'time' if present in the file, and 'Epoch' otherwise,
+        matching the default labels used by `inst_to_netcdf`. (default=None)
+    epoch_unit : str
+        The pandas-defined unit of the epoch variable ('D', 's', 'ms', 'us',
+        'ns'). (default='ms')
+    epoch_origin : str or timestamp-convertable
+        Origin of epoch calculation, following convention for
+        `pandas.to_datetime`. (default='unix')
+    meta_kwargs : dict or NoneType
+        Dict to specify custom Meta initialization or None to use Meta
+        defaults (default=None)
+    meta_processor : function or NoneType
+        If not None, a dict containing all of the loaded metadata will be
+        passed to `meta_processor` which should return a filtered version
+        of the input dict. (default=None)
+    meta_translation : dict or NoneType
+        Translation table used to map metadata labels in the file to
+        those used by the returned `meta`. If None, will use
+        `default_from_netcdf_translation_table`. (default=None)
+    drop_meta_labels : list or NoneType
+        List of variable metadata labels that should be dropped. Applied
+        to metadata as loaded from the file. (default=None)
+
+    Returns
+    -------
+    info : dict
+        Information about the files, see `combine_file_info` for details
+
+    Raises
+    ------
+    ValueError
+        If no filenames are supplied
+    KeyError
+        If the epoch variable is not found in a file
+
+    Note
+    ----
+    Only the file and variable attributes and the epoch variable are read.
+    The information for recently inspected files is cached, so repeated
+    inspection of unchanged files does not access the disk beyond checking
+    the file status.  The metadata
+    processing is the same as `load_netcdf`.
+
+    See Also
+    --------
+    load_netcdf, clear_inspect_cache
+
+    """
+    fnames = pysat.utils.listify(fnames)
+    if len(fnames) == 0:
+        raise ValueError('Must supply at least one filename.')
+
+    if meta_kwargs is None:
+        meta_kwargs = {}
+
+    meta = pysat.Meta(**meta_kwargs)
+
+    if meta_translation is None:
+        meta_translation = default_from_netcdf_translation_table(meta)
+
+    if drop_meta_labels is None:
+        drop_meta_labels = []
+    else:
+        drop_meta_labels = pysat.utils.listify(drop_meta_labels)
+
+    file_info = list()
+    full_mdict = {}
+    for fname in fnames:
+        finfo = _inspect_netcdf_file(fname, epoch_name, epoch_unit,
+                                     epoch_origin)
+        file_info.append(finfo)
+
+        for ncattr in finfo['header'].keys():
+            setattr(meta.header, ncattr, finfo['header'][ncattr])
+
+        full_mdict.update(finfo['mdict'])
+
+    _assign_file_meta(meta, full_mdict, file_info[0]['epoch_name'],
+                      drop_meta_labels, meta_translation, meta_processor)
+
+    return combine_file_info(fnames, file_info, meta)
+
+
+def return_epoch_metadata(inst, epoch_name):
+    """Create epoch or time-index metadata.
+
+    Parameters
+    ----------
+    inst : pysat.Instrument
+        Instrument object with data and metadata.
+    epoch_name : str
+        Data key for time-index or epoch data.
+
+    Returns
+    -------
+    meta_dict : dict
+        Dictionary with epoch metadata, keyed by
+        metadata label.
+
+    """
+    # Get existing meta data
+    if epoch_name in inst.meta:
+        new_dict = inst.meta[inst.meta.var_case_name(epoch_name)].to_dict()
+    else:
+        new_dict = {}
+
+    # Update basic labels, if they are missing.
+    epoch_label = 'Milliseconds since 1970-1-1 00:00:00'
+    basic_labels = [inst.meta.labels.units]
+
+    for label in basic_labels:
+        if label not in new_dict or new_dict[label] == '':
+            new_dict[label] = epoch_label
+
+    # Assign name
+    new_dict[inst.meta.labels.name] = epoch_name
+
+    # Update the time standards
+    time_dict = {'calendar': 'standard', 'Format': 'i8', 'Var_Type': 'data',
+                 'Time_Base': epoch_label, 'Time_Scale': 'UTC'}
 
     if inst.index.is_monotonic_increasing:
         time_dict['MonoTon'] = 'increase'
@@ -1236,12 +1810,11 @@ def xarray_all_vars(data):
     return all_vars
 
 
-def inst_to_netcdf(inst, fname, base_instrument=None, epoch_name=None,
-                   mode='w', zlib=False, complevel=4, shuffle=True,
-                   preserve_meta_case=False, check_type=None, export_nan=None,
-                   export_pysat_info=True, unlimited_time=True,
-                   meta_translation=None, meta_processor=None):
-    """Store pysat data in a netCDF4 file.
+def _prepare_export_meta(inst, fname, epoch_name, base_instrument=None,
+                         check_type=None, export_nan=None,
+                         export_pysat_info=True, meta_translation=None,
+                         meta_processor=None):
+    """Prepare the global attributes and variable metadata for file output.
 
     Parameters
     ----------
@@ -1249,59 +1822,27 @@ def inst_to_netcdf(inst, fname, base_instrument=None, epoch_name=None,
         Instrument object with loaded data to save
     fname : str
         Output filename with full path
+    epoch_name : str
+        Label in file for datetime index of `inst`
     base_instrument : pysat.Instrument or NoneType
         Class used as a comparison, only attributes that are present with
-        `inst` and not on `base_instrument` are written to netCDF. Using None
+        `inst` and not on `base_instrument` are written to file. Using None
         assigns an unmodified pysat.Instrument object. (default=None)
-    epoch_name : str or NoneType
-        Label in file for datetime index of `inst`. If None, uses
-        'Epoch' for pandas data formats, and uses 'time' for xarray formats.
-    mode : str
-        Write (‘w’) or append (‘a’) mode. If mode=’w’, any existing file at
-        this location will be overwritten. If mode=’a’, existing variables will
-        be overwritten. (default='w')
-    zlib : bool
-        Flag for engaging zlib compression, if True compression is used
-        (default=False)
-    complevel : int
-        An integer flag between 1 and 9 describing the level of compression
-        desired. Ignored if zlib=False. (default=4)
-    shuffle : bool
-        The HDF5 shuffle filter will be applied before compressing the data.
-        This significantly improves compression. Ignored if zlib=False.
-        (default=True)
-    preserve_meta_case : bool
-        Flag specifying the case of the meta data variable strings. If True,
-        then the variable strings within the MetaData object (which
-        preserves case) are used to name variables in the written netCDF
-        file. If False, then the variable strings used to access data from
-        the pysat.Instrument object are used instead. (default=False)
     check_type : list or NoneType
         List of keys associated with `meta_dict` that should have the same
-        data type as `coltype`.  These will be removed from the filtered
-        output if they differ.  If None, this check will default to
+        data type as `coltype`.  If None, this check will default to
         include fill, min, and max values. (default=None)
     export_nan : list or NoneType
-        By default, the metadata variables where a value of NaN is allowed
-        and written to the netCDF4 file is maintained by the Meta object
-        attached to the pysat.Instrument object. A list supplied here
-        will override the settings provided by Meta, and all parameters
-        included will be written to the file. If not listed
-        and a value is NaN then that attribute simply won't be included in
-        the netCDF4 file. (default=None)
+        Metadata parameters allowed to be NaN. If None, uses the settings
+        provided by `inst.meta`. (default=None)
     export_pysat_info : bool
         Appends the platform, name, tag, and inst_id to the metadata
         if True. Otherwise these attributes are lost. (default=True)
-    unlimited_time : bool
-        Flag specifying whether or not the epoch/time dimension should be
-        unlimited; it is when the flag is True. (default=True)
     meta_translation : dict or NoneType
-        The keys in the input dict are used to map
-        metadata labels for `inst` to one or more values used when writing
-        the file. E.g., `{meta.labels.fill_val: ['FillVal', '_FillValue']}`
-        would result in both 'FillVal' and '_FillValue' being used to store
-        variable fill values in the netCDF file. Overrides use of
-        `inst._meta_translation_table`.
+        The keys in the input dict are used to map metadata labels for `inst`
+        to one or more values used when writing the file. If None, uses
+        `inst._meta_translation_table` or the default translation table.
+        (default=None)
     meta_processor : function or NoneType
         If not None, a dict containing all of the metadata will be
         passed to `meta_processor` which should return a processed version
@@ -1309,50 +1850,24 @@ def inst_to_netcdf(inst, fname, base_instrument=None, epoch_name=None,
         `inst._export_meta_post_processing` function then that
         function is used for `meta_processor`. (default=None)
 
-    Note
-    ----
-    Depending on which kwargs are specified, the input class, `inst`, will
-    be modified.
-
-    Stores 1-D data along dimension 'Epoch' - the date time index.
+    Returns
+    -------
+    attrb_dict : dict
+        Global file attributes
+    export_meta : dict
+        Variable metadata keyed by lower-case variable name, with a dict of
+        translated metadata labels and values for each variable.
 
-    - The name of the main variable column is used to prepend subvariable
-      names within netCDF, var_subvar_sub
-    - A netCDF4 dimension is created for each main variable column
-      with higher order data; first dimension Epoch
-    - The index organizing the data stored as a dimension variable
-      and `long_name` will be set to 'Epoch'.
-    - `from_netcdf` uses the variable dimensions to reconstruct data
-      structure
+    Raises
+    ------
+    ValueError
+        If there are multiple variables with the same name but different case.
 
-    All attributes attached to instrument meta are written to netCDF attrs
-    with the exception of 'Date_End', 'Date_Start', 'File', 'File_Date',
-    'Generation_Date', and 'Logical_File_ID'. These are defined within
-    to_netCDF at the time the file is written, as per the adopted standard,
-    SPDF ISTP/IACG Modified for NetCDF. Atrributes 'Conventions' and
-    'Text_Supplement' are given default values if not present.
+    See Also
+    --------
+    inst_to_netcdf, inst_to_zarr, inst_to_parquet
 
     """
-    # Check epoch name information
-    if epoch_name is None:
-        if inst.pandas_format:
-            dstr = ''.join(['Assigning "Epoch" for time label when written',
-                            ' to file. In the future, the default will ',
-                            'be updated to "time."'])
-            warnings.warn(dstr, DeprecationWarning, stacklevel=2)
-            epoch_name = 'Epoch'
-        else:
-            pysat.logger.debug('Assigning "time" for time index.')
-            epoch_name = 'time'
-
-    # Ensure there is data to write
-    if inst.empty:
-        pysat.logger.warning('Empty Instrument, not writing {:}'.format(fname))
-        return
-
-    # Ensure directory path leading up to filename exists
-    pysat.utils.files.check_and_make_path(os.path.split(fname)[0])
-
     # Check export NaNs first
     if export_nan is None:
         dstr = '`export_nan` not defined, using `self.meta._export_nan`.'
@@ -1374,6 +1889,8 @@ def inst_to_netcdf(inst, fname, base_instrument=None, epoch_name=None,
     # to the main input Instrument will be written to the netCDF4
     if base_instrument is None:
         base_attrb = dir(pysat.Instrument())
+    else:
+        base_attrb = dir(base_instrument)
 
     # Store any non standard attributes. Compare this Instrument's attributes
     # to the standard, filtering out any 'private' attributes (those that start
@@ -1471,19 +1988,11 @@ def inst_to_netcdf(inst, fname, base_instrument=None, epoch_name=None,
         if key not in meta_translation:
             meta_translation[key] = def_meta_trans[key]
 
-    # Get current metadata in dictionary form and add epoch metadata
-    export_meta = inst.meta.to_dict()
-    export_meta[epoch_name] = return_epoch_metadata(inst, epoch_name)
-
-    # Ensure the metadata is set and updated to netCDF4 standards
-    export_meta = add_netcdf4_standards_to_metadict(inst, export_meta,
-                                                    epoch_name,
-                                                    check_type=check_type,
-                                                    export_nan=export_nan)
-
-    # Translate labels in export_meta into labels the user actually specified
-    export_meta = apply_table_translation_to_file(inst, export_meta,
-                                                  meta_translation)
+    # Get current metadata, updated to netCDF4 standards and translated into
+    # the labels the user actually specified
+    export_meta = compile_export_meta(inst, epoch_name, check_type=check_type,
+                                      export_nan=export_nan,
+                                      trans_table=meta_translation)
 
     # Apply instrument specific post-processing to the `export_meta`
     if meta_processor is None:
@@ -1493,39 +2002,166 @@ def inst_to_netcdf(inst, fname, base_instrument=None, epoch_name=None,
     if meta_processor is not None:
         export_meta = meta_processor(export_meta)
 
-    # Handle output differently, depending on data format.
-    if inst.pandas_format:
-        # General process for writing data:
-        # 1) take care of the EPOCH information,
-        # 2) iterate over the variable colums in Instrument.data and check
-        #    the type of data,
-        #    - if 1D column:
-        #      A) do simple write (type is not an object)
-        #      B) if it is an object, then check if writing strings
-        #      C) if not strings, write object
-        #    - if column is a Series of Frames, write as 2D variables
-        # 3) metadata must be filtered before writing to netCDF4, since
-        #    string variables can't have a fill value
-        with netCDF4.Dataset(fname, mode=mode, format='NETCDF4') as out_data:
-            # Attach the global attributes
-            out_data.setncatts(attrb_dict)
+    return attrb_dict, export_meta
 
-            # Specify the number of items, to reduce function calls.
-            num = len(inst.index)
 
-            # Write out the datetime index
-            if unlimited_time:
-                out_data.createDimension(epoch_name, None)
-            else:
-                out_data.createDimension(epoch_name, num)
-            cdfkey = out_data.createVariable(epoch_name, 'i8',
-                                             dimensions=(epoch_name),
-                                             zlib=zlib,
-                                             complevel=complevel,
-                                             shuffle=shuffle)
+def inst_to_netcdf(inst, fname, base_instrument=None, epoch_name=None,
+                   mode='w', zlib=False, complevel=4, shuffle=True,
+                   preserve_meta_case=False, check_type=None, export_nan=None,
+                   export_pysat_info=True, unlimited_time=True,
+                   meta_translation=None, meta_processor=None):
+    """Store pysat data in a netCDF4 file.
 
-            # Attach epoch metadata
-            cdfkey.setncatts(export_meta[epoch_name])
+    Parameters
+    ----------
+    inst : pysat.Instrument
+        Instrument object with loaded data to save
+    fname : str
+        Output filename with full path
+    base_instrument : pysat.Instrument or NoneType
+        Class used as a comparison, only attributes that are present with
+        `inst` and not on `base_instrument` are written to netCDF. Using None
+        assigns an unmodified pysat.Instrument object. (default=None)
+    epoch_name : str or NoneType
+        Label in file for datetime index of `inst`. If None, uses
+        'Epoch' for pandas data formats, and uses 'time' for xarray formats.
+    mode : str
+        Write (‘w’) or append (‘a’) mode. If mode=’w’, any existing file at
+        this location will be overwritten. If mode=’a’, existing variables will
+        be overwritten. (default='w')
+    zlib : bool
+        Flag for engaging zlib compression, if True compression is used
+        (default=False)
+    complevel : int
+        An integer flag between 1 and 9 describing the level of compression
+        desired. Ignored if zlib=False. (default=4)
+    shuffle : bool
+        The HDF5 shuffle filter will be applied before compressing the data.
+        This significantly improves compression. Ignored if zlib=False.
+        (default=True)
+    preserve_meta_case : bool
+        Flag specifying the case of the meta data variable strings. If True,
+        then the variable strings within the MetaData object (which
+        preserves case) are used to name variables in the written netCDF
+        file. If False, then the variable strings used to access data from
+        the pysat.Instrument object are used instead. (default=False)
+    check_type : list or NoneType
+        List of keys associated with `meta_dict` that should have the same
+        data type as `coltype`.  These will be removed from the filtered
+        output if they differ.  If None, this check will default to
+        include fill, min, and max values. (default=None)
+    export_nan : list or NoneType
+        By default, the metadata variables where a value of NaN is allowed
+        and written to the netCDF4 file is maintained by the Meta object
+        attached to the pysat.Instrument object. A list supplied here
+        will override the settings provided by Meta, and all parameters
+        included will be written to the file. If not listed
+        and a value is NaN then that attribute simply won't be included in
+        the netCDF4 file. (default=None)
+    export_pysat_info : bool
+        Appends the platform, name, tag, and inst_id to the metadata
+        if True. Otherwise these attributes are lost. (default=True)
+    unlimited_time : bool
+        Flag specifying whether or not the epoch/time dimension should be
+        unlimited; it is when the flag is True. (default=True)
+    meta_translation : dict or NoneType
+        The keys in the input dict are used to map
+        metadata labels for `inst` to one or more values used when writing
+        the file. E.g., `{meta.labels.fill_val: ['FillVal', '_FillValue']}`
+        would result in both 'FillVal' and '_FillValue' being used to store
+        variable fill values in the netCDF file. Overrides use of
+        `inst._meta_translation_table`.
+    meta_processor : function or NoneType
+        If not None, a dict containing all of the metadata will be
+        passed to `meta_processor` which should return a processed version
+        of the input dict. If None and `inst` has a valid
+        `inst._export_meta_post_processing` function then that
+        function is used for `meta_processor`. (default=None)
+
+    Note
+    ----
+    Depending on which kwargs are specified, the input class, `inst`, will
+    be modified.
+
+    Stores 1-D data along dimension 'Epoch' - the date time index.
+
+    - The name of the main variable column is used to prepend subvariable
+      names within netCDF, var_subvar_sub
+    - A netCDF4 dimension is created for each main variable column
+      with higher order data; first dimension Epoch
+    - The index organizing the data stored as a dimension variable
+      and `long_name` will be set to 'Epoch'.
+    - `from_netcdf` uses the variable dimensions to reconstruct data
+      structure
+
+    All attributes attached to instrument meta are written to netCDF attrs
+    with the exception of 'Date_End', 'Date_Start', 'File', 'File_Date',
+    'Generation_Date', and 'Logical_File_ID'. These are defined within
+    to_netCDF at the time the file is written, as per the adopted standard,
+    SPDF ISTP/IACG Modified for NetCDF. Atrributes 'Conventions' and
+    'Text_Supplement' are given default values if not present.
+
+    """
+    # Check epoch name information
+    if epoch_name is None:
+        if inst.pandas_format:
+            dstr = ''.join(['Assigning "Epoch" for time label when written',
+                            ' to file. In the future, the default will ',
+                            'be updated to "time."'])
+            warnings.warn(dstr, DeprecationWarning, stacklevel=2)
+            epoch_name = 'Epoch'
+        else:
+            pysat.logger.debug('Assigning "time" for time index.')
+            epoch_name = 'time'
+
+    # Ensure there is data to write
+    if inst.empty:
+        pysat.logger.warning('Empty Instrument, not writing {:}'.format(fname))
+        return
+
+    # Ensure directory path leading up to filename exists
+    pysat.utils.files.check_and_make_path(os.path.split(fname)[0])
+
+    # Prepare the global attributes and variable metadata for export
+    attrb_dict, export_meta = _prepare_export_meta(
+        inst, fname, epoch_name, base_instrument=base_instrument,
+        check_type=check_type, export_nan=export_nan,
+        export_pysat_info=export_pysat_info,
+        meta_translation=meta_translation, meta_processor=meta_processor)
+
+    # Handle output differently, depending on data format.
+    if inst.pandas_format:
+        # General process for writing data:
+        # 1) take care of the EPOCH information,
+        # 2) iterate over the variable colums in Instrument.data and check
+        #    the type of data,
+        #    - if 1D column:
+        #      A) do simple write (type is not an object)
+        #      B) if it is an object, then check if writing strings
+        #      C) if not strings, write object
+        #    - if column is a Series of Frames, write as 2D variables
+        # 3) metadata must be filtered before writing to netCDF4, since
+        #    string variables can't have a fill value
+        with netCDF4.Dataset(fname, mode=mode, format='NETCDF4') as out_data:
+            # Attach the global attributes
+            out_data.setncatts(attrb_dict)
+
+            # Specify the number of items, to reduce function calls.
+            num = len(inst.index)
+
+            # Write out the datetime index
+            if unlimited_time:
+                out_data.createDimension(epoch_name, None)
+            else:
+                out_data.createDimension(epoch_name, num)
+            cdfkey = out_data.createVariable(epoch_name, 'i8',
+                                             dimensions=(epoch_name),
+                                             zlib=zlib,
+                                             complevel=complevel,
+                                             shuffle=shuffle)
+
+            # Attach epoch metadata
+            cdfkey.setncatts(export_meta[epoch_name])
 
             # Attach the time index to the data
             cdfkey[:] = (inst.index.values.astype(np.int64)
@@ -1646,3 +2282,620 @@ def inst_to_netcdf(inst, fname, base_instrument=None, epoch_name=None,
         xr_data.close()
 
     return
+
+
+def _json_default(obj):
+    """Convert objects not supported by `json` into serializable types.
+
+    Parameters
+    ----------
+    obj : any
+        Object that could not be serialized by the default JSON encoder.
+
+    Returns
+    -------
+    out : any
+        JSON serializable version of `obj`.
+
+    """
+    if isinstance(obj, np.generic):
+        return obj.item()
+    elif isinstance(obj, np.ndarray):
+        return obj.tolist()
+    elif isinstance(obj, (dt.datetime, dt.date)):
+        return obj.isoformat()
+
+    return str(obj)
+
+
+def _import_pyarrow():
+    """Import the optional `pyarrow` modules needed for parquet files.
+
+    Returns
+    -------
+    pa : module
+        The `pyarrow` module.
+    pq : module
+        The `pyarrow.parquet` module.
+
+    Raises
+    ------
+    ImportError
+        If `pyarrow` is not installed.
+
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as ierr:
+        raise ImportError(''.join(['parquet support requires the optional ',
+                                   'dependency `pyarrow`: ', str(ierr)]))
+
+    return pa, pq
+
+
+def _import_zarr():
+    """Import the optional `zarr` module needed for Zarr stores.
+
+    Returns
+    -------
+    zarr : module
+        The `zarr` module.
+
+    Raises
+    ------
+    ImportError
+        If `zarr` is not installed.
+
+    """
+    try:
+        import zarr
+    except ImportError as ierr:
+        raise ImportError(''.join(['zarr support requires the optional ',
+                                   'dependency `zarr`: ', str(ierr)]))
+
+    return zarr
+
+
+def load_zarr(fnames, epoch_name='time', epoch_unit='ms', epoch_origin='unix',
+              pandas_format=True, variables=None, decode_timedelta=False,
+              meta_kwargs=None, meta_processor=None, meta_translation=None,
+              drop_meta_labels=None):
+    """Load a Zarr store produced by pysat.
+
+    Parameters
+    ----------
+    fnames : str or array_like
+        Zarr store name(s) to load.
+    epoch_name : str
+        Data key for epoch variable.  The epoch variable is expected to be an
+        array of integer or float values denoting time elapsed from an origin
+        specified by `epoch_origin` with units specified by `epoch_unit`. This
+        epoch variable will be converted to a `DatetimeIndex` for consistency
+        across pysat instruments.  (default='time')
+    epoch_unit : str
+        The pandas-defined unit of the epoch variable ('D', 's', 'ms', 'us',
+        'ns'). (default='ms')
+    epoch_origin : str or timestamp-convertable
+        Origin of epoch calculation, following convention for
+        `pandas.to_datetime`. (default='unix')
+    pandas_format : bool
+        Flag specifying if data is stored in a pandas DataFrame (True) or
+        xarray Dataset (False). (default=True)
+    variables : list-like, str, or NoneType
+        Variables to load from the store(s).  Only the selected variables
+        and the epoch are read. If None, all variables are loaded.
+        (default=None)
+    decode_timedelta : bool
+        If True, variables with unit attributes that are 'timelike' ('hours',
+        'minutes', etc) are converted to `np.timedelta64`. (default=False)
+    meta_kwargs : dict or NoneType
+        Dict to specify custom Meta initialization or None to use Meta
+        defaults (default=None)
+    meta_processor : function or NoneType
+        If not None, a dict containing all of the loaded metadata will be
+        passed to `meta_processor` which should return a filtered version
+        of the input dict. The returned dict is loaded into a pysat.Meta
+        instance and returned as `meta`. (default=None)
+    meta_translation : dict or NoneType
+        Translation table used to map metadata labels in the file to
+        those used by the returned `meta`. Keys are labels from file
+        and values are labels in `meta`. If None, will use
+        `default_from_netcdf_translation_table`. To disable all translation,
+        input an empty dict. (default=None)
+    drop_meta_labels : list or NoneType
+        List of variable metadata labels that should be dropped. Applied
+        to metadata as loaded from the file. (default=None)
+
+    Returns
+    -------
+    data : pandas.DataFrame or xarray.Dataset
+        Class holding file data
+    meta : pysat.Meta
+        Class holding file meta data
+
+    Raises
+    ------
+    KeyError
+        If epoch/time dimension could not be identified.
+    ValueError
+        When attempting to load data with more than 1 dimension into pandas.
+
+    See Also
+    --------
+    inst_to_zarr, load_netcdf
+
+    Note
+    ----
+    Requires the optional dependency `zarr`.  Multiple stores are combined
+    lazily using `xarray.open_mfdataset`.
+
+    """
+    _import_zarr()
+
+    # Ensure inputs are in the correct format
+    fnames = pysat.utils.listify(fnames)
+
+    # Initialize local variables
+    if meta_kwargs is None:
+        meta_kwargs = {}
+
+    meta = pysat.Meta(**meta_kwargs)
+
+    if meta_translation is None:
+        # Assign default translation using `meta`
+        meta_translation = default_from_netcdf_translation_table(meta)
+
+    # Drop metadata labels initialization
+    if drop_meta_labels is None:
+        drop_meta_labels = []
+    else:
+        drop_meta_labels = pysat.utils.listify(drop_meta_labels)
+
+    # Open the stores. Fill values are kept as metadata, not applied as masks.
+    open_kwargs = {'engine': 'zarr', 'decode_times': False,
+                   'decode_timedelta': decode_timedelta,
+                   'mask_and_scale': False}
+    if len(fnames) == 1:
+        data = xr.open_dataset(fnames[0], **open_kwargs)
+    else:
+        data = xr.open_mfdataset(fnames, combine='by_coords', **open_kwargs)
+
+    if epoch_name not in data.variables:
+        estr = ''.join(['Epoch label: "', epoch_name, '"',
+                        ' was not found in loaded dimensions [',
+                        ', '.join(xarray_all_vars(data)), ']'])
+        raise KeyError(estr)
+
+    # Select the desired variables, coordinates are retained
+    if variables is not None:
+        data = data[pysat.utils.listify(variables)]
+
+    # Copy the variable attributes from the data object to the metadata
+    full_mdict = {}
+    for key in xarray_all_vars(data):
+        full_mdict[key] = dict(data[key].attrs)
+        data[key].attrs = {}
+
+    # Copy the file attributes from the data object to the metadata
+    for data_attr in data.attrs.keys():
+        setattr(meta.header, data_attr, data.attrs[data_attr])
+
+    data.attrs = {}
+
+    # Convert the epoch to datetime objects
+    edates = pds.to_datetime(data[epoch_name].values, unit=epoch_unit,
+                             origin=epoch_origin)
+
+    if pandas_format:
+        for key in data.data_vars:
+            if len(data[key].dims) > 1:
+                raise ValueError(' '.join(('pysat only supports 1D',
+                                           'data in pandas. Please use',
+                                           'xarray for this file.')))
+
+        data = data.to_dataframe()
+        data.index = pds.DatetimeIndex(edates, name=epoch_name)
+    else:
+        if epoch_name != 'time':
+            if 'time' in data.variables:
+                estr = ''.join(["'time' already present in file. Can't ",
+                                "rename ", epoch_name, " to 'time'."])
+                raise ValueError(estr)
+            data = data.rename({epoch_name: 'time'})
+
+        data['time'] = xr.DataArray(edates, coords=data['time'].coords)
+
+    # Process the metadata and assign it to `meta`
+    _assign_file_meta(meta, full_mdict, epoch_name, drop_meta_labels,
+                      meta_translation, meta_processor)
+
+    return data, meta
+
+
+def inst_to_zarr(inst, fname, base_instrument=None, epoch_name='time',
+                 mode='w', chunks=None, preserve_meta_case=False,
+                 check_type=None, export_nan=None, export_pysat_info=True,
+                 meta_translation=None, meta_processor=None):
+    """Store pysat data in a Zarr store.
+
+    Parameters
+    ----------
+    inst : pysat.Instrument
+        Instrument object with loaded data to save
+    fname : str
+        Output store name with full path
+    base_instrument : pysat.Instrument or NoneType
+        Class used as a comparison, only attributes that are present with
+        `inst` and not on `base_instrument` are written to the store. Using
+        None assigns an unmodified pysat.Instrument object. (default=None)
+    epoch_name : str
+        Label in file for datetime index of `inst`. (default='time')
+    mode : str
+        Persistence mode passed to `xarray.Dataset.to_zarr`, 'w' overwrites
+        an existing store and 'w-' fails if it exists. (default='w')
+    chunks : int, dict, or NoneType
+        Chunk sizes for the stored data, using the same format as
+        `xarray.Dataset.chunk`.  An int specifies the number of samples per
+        chunk along the epoch dimension.  If None, the chunking is chosen
+        by zarr. (default=None)
+    preserve_meta_case : bool
+        Flag specifying the case of the meta data variable strings. If True,
+        then the variable strings within the MetaData object (which
+        preserves case) are used to name variables in the written store.
+        If False, then the variable strings used to access data from
+        the pysat.Instrument object are used instead. (default=False)
+    check_type : list or NoneType
+        List of keys associated with `meta_dict` that should have the same
+        data type as `coltype`.  These will be removed from the filtered
+        output if they differ.  If None, this check will default to
+        include fill, min, and max values. (default=None)
+    export_nan : list or NoneType
+        Metadata parameters allowed to be NaN.  If None, uses the settings
+        provided by `inst.meta`. (default=None)
+    export_pysat_info : bool
+        Appends the platform, name, tag, and inst_id to the metadata
+        if True. Otherwise these attributes are lost. (default=True)
+    meta_translation : dict or NoneType
+        The keys in the input dict are used to map metadata labels for `inst`
+        to one or more values used when writing the file. Overrides use of
+        `inst._meta_translation_table`. (default=None)
+    meta_processor : function or NoneType
+        If not None, a dict containing all of the metadata will be
+        passed to `meta_processor` which should return a processed version
+        of the input dict. If None and `inst` has a valid
+        `inst._export_meta_post_processing` function then that
+        function is used for `meta_processor`. (default=None)
+
+    See Also
+    --------
+    load_zarr, inst_to_netcdf
+
+    Note
+    ----
+    Requires the optional dependency `zarr`.  Metadata is translated and
+    stored as variable attributes in the same manner as `inst_to_netcdf`, and
+    the epoch is stored as milliseconds since 1970-01-01.
+
+    """
+    _import_zarr()
+
+    # Ensure there is data to write
+    if inst.empty:
+        pysat.logger.warning('Empty Instrument, not writing {:}'.format(fname))
+        return
+
+    # Ensure directory path leading up to filename exists
+    pysat.utils.files.check_and_make_path(os.path.split(fname)[0])
+
+    # Prepare the global attributes and variable metadata for export
+    attrb_dict, export_meta = _prepare_export_meta(
+        inst, fname, epoch_name, base_instrument=base_instrument,
+        check_type=check_type, export_nan=export_nan,
+        export_pysat_info=export_pysat_info,
+        meta_translation=meta_translation, meta_processor=meta_processor)
+
+    # Create a separate xarray.Dataset, ensuring the Instrument data is
+    # unchanged.
+    if inst.pandas_format:
+        xr_data = xr.Dataset.from_dataframe(inst.data.rename_axis('time'))
+    else:
+        xr_data = xr.Dataset(inst.data)
+
+    # Convert datetime values into integer milliseconds
+    for var in xr_data.variables:
+        if xr_data[var].dtype.kind == 'M':
+            xr_data[var] = (xr_data[var].dims,
+                            (xr_data[var].values.astype(np.int64)
+                             * 1.0E-6).astype(np.int64))
+
+    # Update 'time' dimension to `epoch_name`
+    if epoch_name != 'time':
+        xr_data = xr_data.rename({'time': epoch_name})
+
+    # Transfer metadata
+    pysat_meta_to_xarray_attr(xr_data, export_meta, epoch_name)
+
+    # Zarr can't encode string fill values, which remain in the other fill
+    # value attributes
+    for var in xr_data.variables:
+        if xr_data[var].dtype.kind in 'OSU':
+            xr_data[var].attrs.pop('_FillValue', None)
+
+    # If the case needs to be preserved, update Dataset variables.
+    if preserve_meta_case:
+        for var in xarray_vars_no_time(xr_data, time_label=epoch_name):
+            case_var = inst.meta.var_case_name(var)
+
+            if case_var != var:
+                xr_data = xr_data.rename({var: case_var})
+
+    # Add general attributes
+    xr_data.attrs = attrb_dict
+
+    # Set the chunking
+    if chunks is not None:
+        if not isinstance(chunks, dict):
+            chunks = {epoch_name: chunks}
+        xr_data = xr_data.chunk(chunks)
+
+    # Write the Zarr store
+    xr_data.to_zarr(fname, mode=mode)
+
+    return
+
+
+def load_parquet(fnames, epoch_name='time', epoch_unit='ms',
+                 epoch_origin='unix', pandas_format=True, variables=None,
+                 meta_kwargs=None, meta_processor=None, meta_translation=None,
+                 drop_meta_labels=None):
+    """Load Apache Parquet file(s) produced by pysat.
+
+    Parameters
+    ----------
+    fnames : str or array_like
+        Filename(s) to load.
+    epoch_name : str
+        Data key for epoch variable.  The epoch variable is expected to be an
+        array of integer or float values denoting time elapsed from an origin
+        specified by `epoch_origin` with units specified by `epoch_unit`. This
+        epoch variable will be converted to a `DatetimeIndex` for consistency
+        across pysat instruments.  (default='time')
+    epoch_unit : str
+        The pandas-defined unit of the epoch variable ('D', 's', 'ms', 'us',
+        'ns'). (default='ms')
+    epoch_origin : str or timestamp-convertable
+        Origin of epoch calculation, following convention for
+        `pandas.to_datetime`. (default='unix')
+    pandas_format : bool
+        Flag specifying if data is stored in a pandas DataFrame (True) or
+        xarray Dataset (False). (default=True)
+    variables : list-like, str, or NoneType
+        Variables to load from the file(s).  Only the selected columns and
+        the epoch are read. If None, all variables are loaded. (default=None)
+    meta_kwargs : dict or NoneType
+        Dict to specify custom Meta initialization or None to use Meta
+        defaults (default=None)
+    meta_processor : function or NoneType
+        If not None, a dict containing all of the loaded metadata will be
+        passed to `meta_processor` which should return a filtered version
+        of the input dict. The returned dict is loaded into a pysat.Meta
+        instance and returned as `meta`. (default=None)
+    meta_translation : dict or NoneType
+        Translation table used to map metadata labels in the file to
+        those used by the returned `meta`. Keys are labels from file
+        and values are labels in `meta`. If None, will use
+        `default_from_netcdf_translation_table`. To disable all translation,
+        input an empty dict. (default=None)
+    drop_meta_labels : list or NoneType
+        List of variable metadata labels that should be dropped. Applied
+        to metadata as loaded from the file. (default=None)
+
+    Returns
+    -------
+    data : pandas.DataFrame or xarray.Dataset
+        Class holding file data
+    meta : pysat.Meta
+        Class holding file meta data
+
+    Raises
+    ------
+    KeyError
+        If epoch/time column could not be identified.
+
+    See Also
+    --------
+    inst_to_parquet, load_netcdf
+
+    Note
+    ----
+    Requires the optional dependency `pyarrow`.
+
+    """
+    pa, pq = _import_pyarrow()
+
+    # Ensure inputs are in the correct format
+    fnames = pysat.utils.listify(fnames)
+
+    if variables is None:
+        columns = None
+    else:
+        columns = [epoch_name] + [var for var
+                                  in pysat.utils.listify(variables)
+                                  if var != epoch_name]
+
+    # Initialize local variables
+    if meta_kwargs is None:
+        meta_kwargs = {}
+
+    meta = pysat.Meta(**meta_kwargs)
+
+    if meta_translation is None:
+        # Assign default translation using `meta`
+        meta_translation = default_from_netcdf_translation_table(meta)
+
+    # Drop metadata labels initialization
+    if drop_meta_labels is None:
+        drop_meta_labels = []
+    else:
+        drop_meta_labels = pysat.utils.listify(drop_meta_labels)
+
+    # Read the selected columns from each file, along with the pysat metadata
+    # stored in the file schema.
+    full_mdict = {}
+    tables = []
+    for fname in fnames:
+        schema = pq.read_schema(fname)
+        if epoch_name not in schema.names:
+            estr = ''.join(['Epoch label: "', epoch_name, '"',
+                            ' was not found in loaded dimensions [',
+                            ', '.join(schema.names), ']'])
+            raise KeyError(estr)
+
+        table = pq.read_table(fname, columns=columns)
+
+        if schema.metadata is not None and b'pysat' in schema.metadata:
+            file_meta = json.loads(schema.metadata[b'pysat'])
+            for attr, val in file_meta['global'].items():
+                setattr(meta.header, attr, val)
+
+            for key, mdict in file_meta['variables'].items():
+                if key in table.column_names:
+                    full_mdict[key] = mdict
+
+        tables.append(table.replace_schema_metadata(None))
+
+    # Combine all of the data loaded across files together
+    data = pa.concat_tables(tables).to_pandas()
+    epoch = data.pop(epoch_name)
+    data.index = pds.DatetimeIndex(pds.to_datetime(epoch.values,
+                                                   unit=epoch_unit,
+                                                   origin=epoch_origin),
+                                   name=epoch_name)
+
+    if not pandas_format:
+        data = xr.Dataset.from_dataframe(data.rename_axis('time'))
+
+    # Process the metadata and assign it to `meta`
+    _assign_file_meta(meta, full_mdict, epoch_name, drop_meta_labels,
+                      meta_translation, meta_processor)
+
+    return data, meta
+
+
+def inst_to_parquet(inst, fname, base_instrument=None, epoch_name='time',
+                    compression='snappy', preserve_meta_case=False,
+                    check_type=None, export_nan=None, export_pysat_info=True,
+                    meta_translation=None, meta_processor=None):
+    """Store pysat data in an Apache Parquet file.
+
+    Parameters
+    ----------
+    inst : pysat.Instrument
+        Instrument object with loaded data to save
+    fname : str
+        Output filename with full path
+    base_instrument : pysat.Instrument or NoneType
+        Class used as a comparison, only attributes that are present with
+        `inst` and not on `base_instrument` are written to file. Using
+        None assigns an unmodified pysat.Instrument object. (default=None)
+    epoch_name : str
+        Label in file for datetime index of `inst`. (default='time')
+    compression : str or NoneType
+        Compression codec passed to `pyarrow.parquet.write_table`, e.g.,
+        'snappy', 'zstd', 'gzip', or None. (default='snappy')
+    preserve_meta_case : bool
+        Flag specifying the case of the meta data variable strings. If True,
+        then the variable strings within the MetaData object (which
+        preserves case) are used to name columns in the written file.
+        If False, then the variable strings used to access data from
+        the pysat.Instrument object are used instead. (default=False)
+    check_type : list or NoneType
+        List of keys associated with `meta_dict` that should have the same
+        data type as `coltype`.  These will be removed from the filtered
+        output if they differ.  If None, this check will default to
+        include fill, min, and max values. (default=None)
+    export_nan : list or NoneType
+        Metadata parameters allowed to be NaN.  If None, uses the settings
+        provided by `inst.meta`. (default=None)
+    export_pysat_info : bool
+        Appends the platform, name, tag, and inst_id to the metadata
+        if True. Otherwise these attributes are lost. (default=True)
+    meta_translation : dict or NoneType
+        The keys in the input dict are used to map metadata labels for `inst`
+        to one or more values used when writing the file. Overrides use of
+        `inst._meta_translation_table`. (default=None)
+    meta_processor : function or NoneType
+        If not None, a dict containing all of the metadata will be
+        passed to `meta_processor` which should return a processed version
+        of the input dict. If None and `inst` has a valid
+        `inst._export_meta_post_processing` function then that
+        function is used for `meta_processor`. (default=None)
+
+    Raises
+    ------
+    ValueError
+        If `inst` contains data with more than one dimension.
+
+    See Also
+    --------
+    load_parquet, inst_to_netcdf
+
+    Note
+    ----
+    Requires the optional dependency `pyarrow`.  The global attributes and
+    translated variable metadata are stored as JSON in the file schema, and
+    the epoch is stored as milliseconds since 1970-01-01.
+
+    """
+    pa, pq = _import_pyarrow()
+
+    # Ensure there is data to write
+    if inst.empty:
+        pysat.logger.warning('Empty Instrument, not writing {:}'.format(fname))
+        return
+
+    # Parquet is a columnar format, ensure all data is 1D along time
+    if not inst.pandas_format:
+        for var in inst.vars_no_time:
+            if inst[var].dims != ('time',):
+                raise ValueError(' '.join(('pysat only supports 1D data in',
+                                           'parquet files. Please use zarr',
+                                           'or netCDF for this Instrument.')))
+
+    # Ensure directory path leading up to filename exists
+    pysat.utils.files.check_and_make_path(os.path.split(fname)[0])
+
+    # Prepare the global attributes and variable metadata for export
+    attrb_dict, export_meta = _prepare_export_meta(
+        inst, fname, epoch_name, base_instrument=base_instrument,
+        check_type=check_type, export_nan=export_nan,
+        export_pysat_info=export_pysat_info,
+        meta_translation=meta_translation, meta_processor=meta_processor)
+
+    # Build the table columns, starting with the epoch in milliseconds
+    columns = {epoch_name: (inst.index.values.astype(np.int64)
+                            * 1.0E-6).astype(np.int64)}
+    var_meta = {epoch_name: export_meta[epoch_name]}
+    for key in inst.vars_no_time:
+        if preserve_meta_case:
+            # Use the variable case stored in the MetaData object
+            case_key = inst.meta.var_case_name(key)
+        else:
+            # Use variable names used by user when working with data
+            case_key = key
+
+        values = inst[key].values
+        if values.dtype.kind == 'M':
+            values = (values.astype(np.int64) * 1.0E-6).astype(np.int64)
+
+        columns[case_key] = values
+        var_meta[case_key] = export_meta[key.lower()]
+
+    # Attach the metadata to the table schema and write the file
+    table = pa.table(columns)
+    table = table.replace_schema_metadata({b'pysat': json.dumps(
+        {'global': attrb_dict, 'variables': var_meta}, default=_json_default)})
+    pq.write_table(table, fname, compression=compression)
+
+    return
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Iteration plans for Instrument bounds."""
+
+import numpy as np
+import pandas as pds
+
+
+class IterationPlan(object):
+    """Ordered list of the data loads performed when iterating an Instrument.
+
+    Parameters
+    ----------
+    iter_type : str
+        Type of iteration, 'date' or 'file'
+    iter_list : array-like
+        Sorted, unique start dates or start file names for each load
+    width : pds.DateOffset or int
+        Width of each load, as an offset for date iteration or a number of
+        files for file iteration
+    file_list : pds.Series
+        File names indexed by datetime, as found in `Files.files`
+    cache : bool
+        True if each load also reads the neighbouring loads and keeps them in
+        the Instrument data cache, as happens when data padding or
+        `multi_file_day` is used (default=False)
+
+    Attributes
+    ----------
+    iter_type : str
+        Type of iteration, 'date' or 'file'
+    width : pds.DateOffset or int
+        Width of each load
+    cache : bool
+        True if loads use the Instrument data cache
+    steps : pds.DataFrame
+        One row per load, with the columns 'start' and 'stop' (the first date
+        and exclusive end date, or the first and last file name), 'files'
+        (the file names read by the load, including neighbouring files for
+        cached loads), 'shared' (the number of files also read by the previous
+        load), and 'reuse' (True if the previous load's data cache is reused,
+        so only the newly needed neighbour is read)
+    intervals : list
+        Sorted list of (start, stop) tuples covering the merged load windows,
+        using the same conventions as the 'start' and 'stop' step columns
+
+    Note
+    ----
+    Plans are normally obtained through `Instrument.iteration_plan`, and
+    iterating over an Instrument follows its plan.
+
+    """
+
+    def __init__(self, iter_type, iter_list, width, file_list, cache=False):
+        """Initialize the IterationPlan object."""
+        self.iter_type = iter_type
+        self.width = width
+        self.cache = cache
+
+        if iter_type == 'date':
+            starts = pds.DatetimeIndex(iter_list)
+            stops = pds.DatetimeIndex([start + width for start in starts])
+
+            # Locate the files within each load window, extended by one
+            # window on each side for cached loads
+            if cache:
+                lo_times = pds.DatetimeIndex([start - width
+                                              for start in starts])
+                hi_times = pds.DatetimeIndex([stop + width for stop in stops])
+            else:
+                lo_times = starts
+                hi_times = stops
+            lo_inds = file_list.index.searchsorted(lo_times, side='left')
+            hi_inds = file_list.index.searchsorted(hi_times, side='left')
+
+            # Consecutive loads shift the data cache forward
+            reuse = np.zeros(shape=len(starts), dtype=bool)
+            reuse[1:] = starts[1:] == stops[:-1]
+        elif iter_type == 'file':
+            fnames = pds.Index(file_list.values)
+            file_inds = fnames.get_indexer(pds.Index(iter_list))
+            stop_inds = np.clip(file_inds + width - 1, 0, len(fnames) - 1)
+            starts = pds.Index(iter_list)
+            stops = fnames[stop_inds] if len(fnames) > 0 else pds.Index([])
+
+            pad = width if cache else 0
+            lo_inds = np.clip(file_inds - pad, 0, len(fnames))
+            hi_inds = np.clip(file_inds + width + pad, 0, len(fnames))
+
+            reuse = np.zeros(shape=len(starts), dtype=bool)
+            reuse[1:] = file_inds[1:] == file_inds[:-1] + width
+        else:
+            raise ValueError('Unknown iteration type: {:}'.format(
+                repr(iter_type)))
+
+        if not cache:
+            reuse[:] = False
+
+        # Count the files read by both a load and the load before it
+        shared = np.zeros(shape=len(starts), dtype=int)
+        if len(starts) > 1:
+            shared[1:] = np.clip(np.minimum(hi_inds[1:], hi_inds[:-1])
+                                 - np.maximum(lo_inds[1:], lo_inds[:-1]), 0,
+                                 None)
+
+        self.steps = pds.DataFrame({
+            'start': list(starts), 'stop': list(stops),
+            'files': [list(file_list.values[lo:hi])
+                      for lo, hi in zip(lo_inds, hi_inds)],
+            'shared': shared, 'reuse': reuse})
+
+        # Merge overlapping or adjacent load windows
+        self.intervals = list()
+        if iter_type == 'date':
+            for start, stop in zip(starts, stops):
+                if len(self.intervals) > 0 and start <= self.intervals[-1][1]:
+                    self.intervals[-1] = (self.intervals[-1][0],
+                                          max(stop, self.intervals[-1][1]))
+                else:
+                    self.intervals.append((start, stop))
+        else:
+            last_ind = -2
+            for start, ind, stop_ind in zip(starts, file_inds, stop_inds):
+                if len(self.intervals) > 0 and ind <= last_ind + 1:
+                    if stop_ind > last_ind:
+                        self.intervals[-1] = (self.intervals[-1][0],
+                                              fnames[stop_ind])
+                        last_ind = stop_ind
+                else:
+                    self.intervals.append((start, fnames[stop_ind]))
+                    last_ind = stop_ind
+
+        return
+
+    def __repr__(self):
+        """Print the basic IterationPlan properties."""
+        out_str = "".join(["pysat.utils.iteration.IterationPlan(iter_type=",
+                           repr(self.iter_type), ", ", repr(len(self)),
+                           " loads over ", repr(len(self.intervals)),
+                           " intervals)"])
+        return out_str
+
+    def __len__(self):
+        """Get the number of loads in the plan."""
+        return len(self.steps)
+
+    def __iter__(self):
+        """Iterate over the plan steps as (start, stop, reuse) tuples."""
+        for start, stop, reuse in zip(self.steps['start'], self.steps['stop'],
+                                      self.steps['reuse']):
+            yield start, stop, bool(reuse)
+
+    @property
+    def files(self):
+        """Sorted list of the unique file names read by the plan."""
+        if len(self.steps) == 0:
+            return list()
+
+        return sorted(set(np.concatenate([np.asarray(files, dtype=object)
+                                          for files in self.steps['files']])))
+
+    @property
+    def num_file_reads(self):
+        """Number of file reads, after data cache reuse."""
+        if len(self.steps) == 0:
+            return 0
+
+        nfiles = self.steps['files'].apply(len).values
+        return int(np.sum(np.where(self.steps['reuse'].values,
+                                   nfiles - self.steps['shared'].values,
+                                   nfiles)))
@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Reduce the memory footprint of loaded Instrument data."""
+
+import numpy as np
+import pandas as pds
+
+import pysat
+
+
+def compact_values(values, fill_val=None, shrink_ints=False):
+    """Cast numeric values to a smaller dtype that holds them exactly.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Numeric data values
+    fill_val : int, float, or NoneType
+        Fill value for `values`, or None if unknown (default=None)
+    shrink_ints : bool
+        If True, cast integers to the smallest integer type with the same
+        signedness that holds all values and `fill_val`. (default=False)
+
+    Returns
+    -------
+    new_values : np.ndarray
+        `values` cast to a smaller dtype, or `values` if no exact cast is
+        available
+
+    Note
+    ----
+    Float64 values are cast to float32 if no precision is lost, which undoes
+    the upcasting of float32 data or of integer data with masked values that
+    were replaced by NaN.  Integers keep their type unless `shrink_ints` is
+    True, since arithmetic on smaller integer types may overflow.
+
+    """
+    values = np.asarray(values)
+
+    if values.size == 0 or values.dtype.kind not in 'iuf':
+        return values
+
+    if values.dtype.kind == 'f':
+        if values.dtype.itemsize > 4:
+            new_values = values.astype(np.float32)
+            if np.array_equal(new_values, values, equal_nan=True):
+                return new_values
+
+        return values
+
+    # Integer values
+    if not shrink_ints:
+        return values
+
+    int_fill = isinstance(fill_val, (int, np.integer)) and not isinstance(
+        fill_val, bool)
+    check_vals = np.append(values, fill_val) if int_fill else values
+    new_type = _min_int_type(check_vals, signed=values.dtype.kind == 'i')
+    if np.dtype(new_type).itemsize < values.dtype.itemsize:
+        return values.astype(new_type)
+
+    return values
+
+
+def _min_int_type(values, signed=True):
+    """Get the smallest integer type that holds the input values.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Integer-valued data
+    signed : bool
+        If True, only consider signed integer types.  If False, unsigned
+        integer types are used for non-negative values. (default=True)
+
+    Returns
+    -------
+    int_type : type
+        Smallest numpy integer type for `values`
+
+    """
+    min_val = int(np.min(values))
+    max_val = int(np.max(values))
+    if signed or min_val < 0:
+        int_types = [np.int8, np.int16, np.int32, np.int64]
+    else:
+        int_types = [np.uint8, np.uint16, np.uint32, np.uint64]
+
+    for int_type in int_types:
+        type_info = np.iinfo(int_type)
+        if type_info.min <= min_val and max_val <= type_info.max:
+            return int_type
+
+    return values.dtype.type
+
+
+def compact_data(data, meta=None, shrink_ints=False):
+    """Reduce the memory used by Instrument data.
+
+    Parameters
+    ----------
+    data : pds.DataFrame or xr.Dataset
+        Instrument data
+    meta : pysat.Meta or NoneType
+        Metadata for `data`, used to get the fill value of each variable, or
+        None if not available (default=None)
+    shrink_ints : bool
+        If True, cast integers to smaller integer types as well.
+        (default=False)
+
+    Returns
+    -------
+    data : pds.DataFrame or xr.Dataset
+        Instrument data with numeric variables cast to smaller dtypes, and
+        pandas string columns with repeated values cast as categoricals
+    report : dict
+        Dict with variable names as keys and dicts as values.  Each variable
+        dict has the keys 'original_dtype', 'dtype', 'original_bytes',
+        'bytes', and 'bytes_saved'.
+
+    See Also
+    --------
+    compact_values
+
+    Note
+    ----
+    String columns are cast as categoricals when they have at most half as
+    many unique values as rows and the categorical uses less memory.
+    xarray string variables and the time index are not changed.
+
+    """
+    report = dict()
+
+    if isinstance(data, pds.DataFrame):
+        variables = list(data.columns)
+    else:
+        variables = [var for var in data.data_vars]
+
+    new_vars = dict()
+    for var in variables:
+        fill_val = None
+        if meta is not None and var in meta:
+            fill_val = meta[var, meta.labels.fill_val]
+
+        if isinstance(data, pds.DataFrame):
+            col = data[var]
+            orig_dtype = col.dtype
+            orig_bytes = int(col.memory_usage(index=False, deep=True))
+
+            if orig_dtype == object:
+                new_col = col
+                if col.nunique() <= len(col) / 2:
+                    new_col = col.astype('category')
+            elif orig_dtype.kind in 'iuf':
+                new_col = pds.Series(compact_values(col.values, fill_val,
+                                                    shrink_ints=shrink_ints),
+                                     index=col.index, name=var, copy=False)
+            else:
+                new_col = col
+
+            new_dtype = new_col.dtype
+            new_bytes = int(new_col.memory_usage(index=False, deep=True))
+        else:
+            orig_dtype = data[var].dtype
+            orig_bytes = int(data[var].nbytes)
+
+            if orig_dtype.kind in 'iuf':
+                new_values = compact_values(data[var].values, fill_val,
+                                            shrink_ints=shrink_ints)
+            else:
+                new_values = data[var].values
+
+            new_col = (data[var].dims, new_values, data[var].attrs)
+            new_dtype = new_values.dtype
+            new_bytes = int(new_values.nbytes)
+
+        if new_bytes < orig_bytes:
+            new_vars[var] = new_col
+        else:
+            new_dtype = orig_dtype
+            new_bytes = orig_bytes
+
+        report[var] = {'original_dtype': str(orig_dtype),
+                       'dtype': str(new_dtype),
+                       'original_bytes': orig_bytes, 'bytes': new_bytes,
+                       'bytes_saved': orig_bytes - new_bytes}
+
+    if len(new_vars) > 0:
+        if isinstance(data, pds.DataFrame):
+            data = pds.DataFrame({var: new_vars[var] if var in new_vars
+                                  else data[var] for var in variables},
+                                 index=data.index)
+        else:
+            data = data.assign(new_vars)
+
+    total = sum([report[var]['bytes_saved'] for var in report.keys()])
+    pysat.logger.info(''.join(['Compacted ', repr(len(new_vars)), ' of ',
+                               repr(len(variables)), ' variables, saving ',
+                               repr(total), ' bytes']))
+
+    return data, report
+
+
+def _get_memmap_base(values):
+    """Get the memory map holding the values of an array.
+
+    Parameters
+    ----------
+    values : any
+        Array of variable values
+
+    Returns
+    -------
+    np.memmap or NoneType
+        Memory map of a file that holds `values`, or None if `values` is not
+        a view of a memory-mapped file
+
+    """
+    if not isinstance(values, np.ndarray):
+        return None
+
+    base = values
+    while isinstance(base.base, np.ndarray):
+        base = base.base
+
+    return base if isinstance(base, np.memmap) else None
+
+
+def _remap_values(values):
+    """Create a new copy-on-write memory map for memory-mapped values.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        View of a memory-mapped file
+
+    Returns
+    -------
+    np.ndarray
+        The same view of a new copy-on-write map of the file, so that
+        changing either array doesn't change the other
+
+    """
+    base = _get_memmap_base(values)
+    new_base = np.memmap(base.filename, mode='c', dtype=base.dtype,
+                         offset=base.offset, shape=base.shape)
+    offset = (values.__array_interface__['data'][0]
+              - base.__array_interface__['data'][0])
+
+    return np.ndarray(values.shape, dtype=values.dtype, buffer=new_base,
+                      offset=offset, strides=values.strides)
+
+
+def copy_mapped_data(data):
+    """Copy data that may contain memory-mapped variables.
+
+    Parameters
+    ----------
+    data : pds.DataFrame or xr.Dataset
+        Data that may include memory-mapped variables, such as data loaded
+        with `load_netcdf` and `mmap=True`
+
+    Returns
+    -------
+    pds.DataFrame or xr.Dataset
+        Deep copy of `data`, where each memory-mapped variable is given a new
+        copy-on-write map of the file instead of being read into memory, or
+        `data.copy()` if no variables are memory-mapped
+
+    Note
+    ----
+    Changing the values of the copy doesn't change `data` or the file, and
+    only the memory pages that are changed are copied.
+
+    """
+    if isinstance(data, pds.DataFrame):
+        mapped = [_get_memmap_base(data[key].values) is not None
+                  for key in data.columns]
+    else:
+        mapped = [_get_memmap_base(var.data) is not None
+                  for var in data.variables.values()]
+
+    if not any(mapped):
+        return data.copy()
+
+    if isinstance(data, pds.DataFrame):
+        columns = {}
+        for key in data.columns:
+            values = data[key].values
+            if _get_memmap_base(values) is None:
+                columns[key] = data[key].copy()
+            else:
+                columns[key] = pds.Series(_remap_values(values),
+                                          index=data.index, name=key,
+                                          copy=False)
+
+        return pds.DataFrame(columns, index=data.index.copy(),
+                             columns=data.columns.copy(), copy=False)
+
+    new_data = data.copy(deep=False)
+    for key, var in new_data.variables.items():
+        if key in new_data.indexes:
+            # Indexes are immutable
+            continue
+
+        if _get_memmap_base(var.data) is None:
+            var.data = var.copy(deep=True).data
+        else:
+            var.data = _remap_values(var.data)
+
+    return new_data
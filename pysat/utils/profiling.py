@@ -0,0 +1,337 @@
+#!/usr/bin/env python
+# Full license can be found in License.md
+# Full author list can be found in .zenodo.json file
+# DOI:10.5281/zenodo.1199703
+#
+# Review Status for Classified or Controlled Information by NRL
+# -------------------------------------------------------------
+# DISTRIBUTION STATEMENT A: Approved for public release. Distribution is
+# unlimited.
+# ----------------------------------------------------------------------------
+"""Timing instrumentation for the pysat Instrument load pipeline."""
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+import pandas as pds
+
+
+class LoadProfiler(object):
+    """Record per-stage timing and data size for Instrument loads.
+
+    Attributes
+    ----------
+    enabled : bool
+        If True, stages are recorded; if False, the Instrument skips all
+        profiling work.
+    records : list
+        List of dicts, one per completed stage, with keys 'call', 'method',
+        'stage', 'start', 'duration', 'rows', 'variables', and 'bytes'.
+        'start' and 'duration' are in seconds, with 'start' measured
+        relative to the creation (or last reset) of the profiler.
+
+    Note
+    ----
+    The profiler is normally created by setting `Instrument.profile` to True
+    or by using the `profile` context manager in this module.  Each call to
+    `Instrument.load` or `Instrument._load_data` receives a unique call number
+    and records a 'total' stage spanning the entire method.
+
+    """
+
+    def __init__(self):
+        """Initialize the LoadProfiler object."""
+        self.enabled = True
+        self.reset()
+        return
+
+    def __repr__(self):
+        """Print the basic LoadProfiler properties."""
+        out_str = "".join(["pysat.utils.profiling.LoadProfiler(), ",
+                           "enabled=", repr(self.enabled), ", ",
+                           repr(len(self.records)), " records"])
+        return out_str
+
+    def __eq__(self, other):
+        """Perform equality check.
+
+        Parameters
+        ----------
+        other : any
+            Other object to compare for equality
+
+        Returns
+        -------
+        bool
+            True if both profilers hold the same state and records.
+
+        """
+        if not isinstance(other, self.__class__):
+            return False
+
+        return (self.enabled == other.enabled
+                and self.records == other.records)
+
+    def reset(self):
+        """Remove all existing records and restart the profiler clock."""
+        self.records = list()
+        self._num_calls = 0
+        self._call_stack = list()
+        self._ref_time = time.perf_counter()
+        return
+
+    @contextlib.contextmanager
+    def call(self, method, inst=None):
+        """Time an entire profiled method call.
+
+        Parameters
+        ----------
+        method : str
+            Name of the method being profiled, e.g., 'load' or '_load_data'
+        inst : pysat.Instrument or NoneType
+            Instrument whose data is measured at the end of the call, or None
+            to skip the data measurements. (default=None)
+
+        Yields
+        ------
+        record : dict
+            Record for the 'total' stage. Assigning a pandas DataFrame or
+            xarray Dataset to the 'data' key overrides the data measured
+            from `inst`.
+
+        """
+        self._num_calls += 1
+        self._call_stack.append((self._num_calls, method))
+
+        try:
+            with self.stage('total', inst=inst) as record:
+                yield record
+        finally:
+            self._call_stack.pop()
+
+        return
+
+    @contextlib.contextmanager
+    def stage(self, name, inst=None):
+        """Time a single stage of a profiled method call.
+
+        Parameters
+        ----------
+        name : str
+            Stage name
+        inst : pysat.Instrument or NoneType
+            Instrument whose data is measured at the end of the stage, or None
+            to skip the data measurements. (default=None)
+
+        Yields
+        ------
+        record : dict
+            Record for this stage. Assigning a pandas DataFrame or xarray
+            Dataset to the 'data' key overrides the data measured from `inst`.
+
+        """
+        if len(self._call_stack) > 0:
+            call_num, method = self._call_stack[-1]
+        else:
+            call_num, method = 0, ''
+
+        record = {'call': call_num, 'method': method, 'stage': name}
+        start = time.perf_counter()
+
+        try:
+            yield record
+        finally:
+            duration = time.perf_counter() - start
+
+            # Measure the data after the timer is stopped
+            data = record.pop('data', None)
+            if data is None and inst is not None:
+                data = inst.data
+
+            record['start'] = start - self._ref_time
+            record['duration'] = duration
+            record['rows'], record['variables'], record['bytes'] = data_size(
+                data)
+            self.records.append(record)
+
+        return
+
+    def to_frame(self):
+        """Create a table of the profiling records.
+
+        Returns
+        -------
+        table : pds.DataFrame
+            Table with one row per recorded stage, in order of completion
+
+        """
+        columns = ['call', 'method', 'stage', 'start', 'duration', 'rows',
+                   'variables', 'bytes']
+        table = pds.DataFrame(self.records, columns=columns)
+
+        return table
+
+    def summary(self):
+        """Summarize the time spent and data size for each stage.
+
+        Returns
+        -------
+        table : pds.DataFrame
+            Table indexed by method and stage with the number of calls, total
+            and mean duration in seconds, and the maximum rows, variables, and
+            bytes seen at the end of each stage
+
+        """
+        table = self.to_frame().groupby(['method', 'stage'], sort=False).agg(
+            calls=('duration', 'size'), total=('duration', 'sum'),
+            mean=('duration', 'mean'), rows=('rows', 'max'),
+            variables=('variables', 'max'), bytes=('bytes', 'max'))
+
+        return table
+
+    def to_chrome_trace(self, fname=None):
+        """Export the records in the Chrome trace event format.
+
+        Parameters
+        ----------
+        fname : str or NoneType
+            Output JSON filename, or None to only return the trace
+            (default=None)
+
+        Returns
+        -------
+        trace : dict
+            Trace events that may be viewed in `chrome://tracing` or Perfetto
+
+        """
+        pid = os.getpid()
+        tid = threading.get_ident()
+        events = list()
+        for record in self.records:
+            args = {key: record[key] for key in ['call', 'rows', 'variables',
+                                                 'bytes']}
+            events.append({'name': record['stage'], 'cat': record['method'],
+                           'ph': 'X', 'ts': record['start'] * 1.0e6,
+                           'dur': record['duration'] * 1.0e6, 'pid': pid,
+                           'tid': tid, 'args': args})
+
+        trace = {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+        if fname is not None:
+            with open(fname, 'w') as fout:
+                json.dump(trace, fout)
+
+        return trace
+
+
+def data_size(data):
+    """Measure the number of rows, variables, and bytes in a data object.
+
+    Parameters
+    ----------
+    data : pds.DataFrame, xr.Dataset, or NoneType
+        Instrument data object
+
+    Returns
+    -------
+    rows : int
+        Number of time samples, 0 if `data` is None
+    variables : int
+        Number of data variables, 0 if `data` is None
+    nbytes : int
+        Shallow size of the data in bytes, 0 if `data` is None
+
+    """
+    if data is None:
+        return 0, 0, 0
+
+    if isinstance(data, pds.DataFrame):
+        rows = len(data.index)
+        variables = len(data.columns)
+        nbytes = int(data.memory_usage(index=True, deep=False).sum())
+    else:
+        rows = int(data.sizes.get('time', 0))
+        variables = len([var for var in data.variables.keys()
+                         if var != 'time'])
+        nbytes = int(data.nbytes)
+
+    return rows, variables, nbytes
+
+
+def profile_method(func):
+    """Decorate an Instrument method so its calls are profiled when enabled.
+
+    Parameters
+    ----------
+    func : function
+        Instrument method to profile
+
+    Returns
+    -------
+    wrapper : function
+        Method that calls `func` directly if profiling is disabled, or within
+        `LoadProfiler.call` if profiling is enabled
+
+    Note
+    ----
+    The wrapper adds a frame to the call stack, so warnings raised within the
+    decorated method need `stacklevel=3` to point to the user's code.
+
+    """
+
+    @functools.wraps(func)
+    def wrapper(inst, *args, **kwargs):
+        if inst.profiler is None or not inst.profiler.enabled:
+            return func(inst, *args, **kwargs)
+
+        with inst.profiler.call(func.__name__, inst=inst) as record:
+            output = func(inst, *args, **kwargs)
+
+            # Methods such as `_load_data` return the data instead of
+            # assigning it to the Instrument
+            if isinstance(output, tuple):
+                record['data'] = output[0]
+
+        return output
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def profile(inst):
+    """Profile Instrument loads within a context.
+
+    Parameters
+    ----------
+    inst : pysat.Instrument
+        Instrument object to profile
+
+    Yields
+    ------
+    profiler : LoadProfiler
+        Profiler attached to `inst`, which remains available through
+        `inst.profiler` after the context exits
+
+    Examples
+    --------
+    ::
+
+        inst = pysat.Instrument('pysat', 'testing')
+        with pysat.utils.profiling.profile(inst) as prof:
+            inst.load(2009, 1)
+        print(prof.summary())
+
+    """
+    was_enabled = inst.profile
+    inst.profile = True
+
+    try:
+        yield inst.profiler
+    finally:
+        inst.profile = was_enabled
+
+    return
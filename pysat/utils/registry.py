@@ -56,7 +56,6 @@ A full suite of instrument support modules may be registered at once using
 import importlib
 
 import pysat
-import pysat.tests.classes.cls_instrument_library as itc
 
 
 def load_saved_modules():
@@ -140,74 +139,82 @@ def register(module_names, overwrite=False):
 
     """
 
-    for mod_name in module_names:
-        # First, ensure module string directs to something importable
-        try:
-            inst_module = importlib.import_module(mod_name)
-        except Exception:
-            # Log then preserve trace and propagate error
-            estr = ' '.join(('There was a problem trying to import', mod_name))
-            pysat.logger.error(estr)
-            raise
-
-        # Second, check that module is itself pysat compatible
-        validate = itc.InstLibTests()
-
-        # Work with test code, create dummy structure to make things work
-        class Foo(object):
-            pass
-        validate.inst_loc = Foo()
-
-        # Parse string to get package part and instrument module part
-        parse = mod_name.split('.')
-
-        # Module name without package
-        mod_part = parse[-1]
-
-        # The package preamble
-        pack_part = parse[:-1]
-
-        # Assign package info to Test class
-        validate.inst_loc.__name__ = '.'.join(pack_part)
-
-        # Run tests
-        validate.test_modules_standard(mod_part)
-        validate.test_standard_function_presence(mod_part)
-
-        # Registry is a dict of dicts with platform, name, and module string.
-        # Get the platform and name identifiers from imported module
-        platform = inst_module.platform
-        name = inst_module.name
-
-        # Only register module if not already present. Multiple names are
-        # allowed for a single platform
-        if platform not in pysat.params['user_modules']:
-            # setup `of dict` part of dict of dicts
-            pysat.params.data['user_modules'][platform] = {}
-
-        # Only register name if it is not present under platform
-        if name not in pysat.params['user_modules'][platform]:
-            pysat.logger.info('Registering user module {}'.format(mod_name))
-            # Add to current user modules structure and store it to disk
-            pysat.params.data['user_modules'][platform][name] = mod_name
-            store()
-        else:
-            # Platform/name combination already registered. Check to see if
-            # this is a new package or just a redundant assignment
-            if mod_name != pysat.params['user_modules'][platform][name]:
-                # New assignment, check for overwrite flag
-                if not overwrite:
-                    estr = ' '.join(('An instrument has already been ',
-                                     'registered for platform:', platform,
-                                     'and name:', name,
-                                     'which maps to:', mod_name, 'To assign',
-                                     'a new module the overwrite flag',
-                                     'must be enabled.'))
-                    raise ValueError(estr)
-                else:
-                    # Overwrite with new module information
-                    pysat.params.data['user_modules'][platform][name] = mod_name
-                    store()
+    # Store the registry once, after all modules are processed
+    with pysat.params.batch():
+        for mod_name in module_names:
+            # First, ensure module string directs to something importable
+            try:
+                inst_module = importlib.import_module(mod_name)
+            except Exception:
+                # Log then preserve trace and propagate error
+                estr = ' '.join(('There was a problem trying to import',
+                                 mod_name))
+                pysat.logger.error(estr)
+                raise
+
+            # Second, check that module is itself pysat compatible.  The test
+            # classes require pytest, so they are only imported when needed.
+            import pysat.tests.classes.cls_instrument_library as itc
+            validate = itc.InstLibTests()
+
+            # Work with test code, create dummy structure to make things work
+            class Foo(object):
+                pass
+            validate.inst_loc = Foo()
+
+            # Parse string to get package part and instrument module part
+            parse = mod_name.split('.')
+
+            # Module name without package
+            mod_part = parse[-1]
+
+            # The package preamble
+            pack_part = parse[:-1]
+
+            # Assign package info to Test class
+            validate.inst_loc.__name__ = '.'.join(pack_part)
+
+            # Run tests
+            validate.test_modules_standard(mod_part)
+            validate.test_standard_function_presence(mod_part)
+
+            # Registry is a dict of dicts with platform, name, and module
+            # string. Get the platform and name identifiers from imported
+            # module
+            platform = inst_module.platform
+            name = inst_module.name
+
+            # Only register module if not already present. Multiple names are
+            # allowed for a single platform
+            if platform not in pysat.params['user_modules']:
+                # setup `of dict` part of dict of dicts
+                pysat.params.data['user_modules'][platform] = {}
+
+            # Only register name if it is not present under platform
+            if name not in pysat.params['user_modules'][platform]:
+                pysat.logger.info('Registering user module {}'.format(mod_name))
+                # Add to current user modules structure and store it to disk
+                pysat.params.data['user_modules'][platform][name] = mod_name
+                store()
+            else:
+                # Platform/name combination already registered. Check to see if
+                # this is a new package or just a redundant assignment
+                if mod_name != pysat.params['user_modules'][platform][name]:
+                    # New assignment, check for overwrite flag
+                    if not overwrite:
+                        estr = ' '.join(('An instrument has already been ',
+                                         'registered for platform:', platform,
+                                         'and name:', name,
+                                         'which maps to:', mod_name,
+                                         'To assign a new module the',
+                                         'overwrite flag',
+                                         'must be enabled.'))
+                        raise ValueError(estr)
+                    else:
+                        # Overwrite with new module information
+                        pysat.params.data['user_modules'][platform][
+                            name] = mod_name
+                        store()
 
     return
 
@@ -309,34 +316,37 @@ def remove(platforms, names):
                         "instruments under each platform."))
         raise ValueError(estr)
 
-    # iterate over inputs and remove modules
-    for platform, name in zip(platforms, names):
-        if platform in pysat.params['user_modules']:
-            if name is None:
-                # remove platform entirely
-                pysat.params['user_modules'].pop(platform)
-                # store
-                store()
-            else:
-                # name supplied, remove single module
-                if name in pysat.params['user_modules'][platform]:
-                    # remove module
-                    pysat.params['user_modules'][platform].pop(name)
-                else:
-                    # name not in platform
-                    estr = ''.join((platform, ', ', name, ': not a registered ',
-                                    'instrument module.'))
-                    pysat.logger.info(estr)
-                # remove platform if no remaining instruments
-                if len(pysat.params['user_modules'][platform]) == 0:
+    # Store the registry once, after all modules are removed
+    with pysat.params.batch():
+        # iterate over inputs and remove modules
+        for platform, name in zip(platforms, names):
+            if platform in pysat.params['user_modules']:
+                if name is None:
+                    # remove platform entirely
                     pysat.params['user_modules'].pop(platform)
-                # store
-                store()
-        else:
-            # info string if module not registered
-            estr = ''.join((platform, ': is not a registered ',
-                            'instrument platform.'))
-            # platform not in registered modules
-            pysat.logger.info(estr)
+                    # store
+                    store()
+                else:
+                    # name supplied, remove single module
+                    if name in pysat.params['user_modules'][platform]:
+                        # remove module
+                        pysat.params['user_modules'][platform].pop(name)
+                    else:
+                        # name not in platform
+                        estr = ''.join((platform, ', ', name,
+                                        ': not a registered ',
+                                        'instrument module.'))
+                        pysat.logger.info(estr)
+                    # remove platform if no remaining instruments
+                    if len(pysat.params['user_modules'][platform]) == 0:
+                        pysat.params['user_modules'].pop(platform)
+                    # store
+                    store()
+            else:
+                # info string if module not registered
+                estr = ''.join((platform, ': is not a registered ',
+                                'instrument platform.'))
+                # platform not in registered modules
+                pysat.logger.info(estr)
 
     return